@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
 import re
 from dataclasses import dataclass
@@ -34,6 +36,33 @@ class CfxStatusPayload:
     source_note: str | None = None
 
 
+@dataclass
+class SourceCache:
+    """HTTP validators and the last parsed payload for one status source."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+    fingerprint: str | None = None
+    payload: CfxStatusPayload | None = None
+
+    def request_headers(self) -> dict[str, str]:
+        """Return conditional request headers once a payload has been parsed."""
+        if self.payload is None:
+            return {}
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def remember(self, headers, fingerprint: str, payload: CfxStatusPayload) -> None:
+        self.etag = headers.get("ETag")
+        self.last_modified = headers.get("Last-Modified")
+        self.fingerprint = fingerprint
+        self.payload = payload
+
+
 class StatusPageError(RuntimeError):
     """Raised when the Rockstar status page cannot be fetched or parsed."""
 
@@ -72,6 +101,10 @@ class CfxStatus(DashboardIntegration, commands.Cog):
     MIN_POLL_INTERVAL_MINUTES = 1
     MAX_POLL_INTERVAL_MINUTES = 60
     REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+    EDIT_CONCURRENCY = 4
+    # Seconds a poll may go without touching a panel whose Cfx.re status is unchanged. The periodic
+    # rewrite is what finds a panel message someone deleted, so it can be posted again.
+    UNCHANGED_EDIT_INTERVAL = 900
     REQUEST_HEADERS: ClassVar[dict[str, str]] = {
         "Accept": "application/json,text/html,application/xhtml+xml",
         "User-Agent": ("Mozilla/5.0 (compatible; Red-DiscordBot CfxStatus; +https://github.com/TaakoOfficial/TaakosCogs)"),
@@ -111,6 +144,11 @@ class CfxStatus(DashboardIntegration, commands.Cog):
             last_poll_at=0,
         )
         self._session: aiohttp.ClientSession | None = None
+        self._sources: dict[str, SourceCache] = {}
+        self._status_task: asyncio.Task[CfxStatusPayload] | None = None
+        self._edit_budget = asyncio.Semaphore(self.EDIT_CONCURRENCY)
+        # Guild ID -> (panel message ID, status embed digest, when that embed was written), kept in memory only.
+        self._rendered: dict[int, tuple[int, str, int]] = {}
         self.status_loop.start()
 
     async def cog_unload(self) -> None:
@@ -158,11 +196,21 @@ class CfxStatus(DashboardIntegration, commands.Cog):
             log.exception("Unexpected error while polling Cfx.re service status")
             error = "I could not check the Cfx.re service status right now."
 
-        for guild, settings in due_guilds:
-            try:
-                await self._update_status_message(guild, settings, payload, error)
-            except Exception:
-                log.exception("Failed to update Cfx.re status for guild %s", guild.id)
+        await asyncio.gather(
+            *(self._refresh_guild(guild, settings, payload, error) for guild, settings in due_guilds),
+        )
+
+    async def _refresh_guild(
+        self,
+        guild: discord.Guild,
+        settings: dict,
+        payload: CfxStatusPayload | None,
+        error: str | None,
+    ) -> None:
+        try:
+            await self._update_status_message(guild, settings, payload, error, skip_unchanged=True)
+        except Exception:
+            log.exception("Failed to update Cfx.re status for guild %s", guild.id)
 
     @status_loop.before_loop
     async def before_status_loop(self) -> None:
@@ -341,7 +389,16 @@ class CfxStatus(DashboardIntegration, commands.Cog):
         await ctx.send(embed=self.build_status_embed(payload))
 
     async def fetch_status(self) -> CfxStatusPayload:
-        """Fetch Cfx.re status from the fastest official source available."""
+        """Fetch Cfx.re status from the fastest official source available.
+
+        Concurrent callers share one request, and sources are revalidated with
+        ETag/Last-Modified so an unchanged status is neither downloaded nor parsed again.
+        """
+        if self._status_task is None or self._status_task.done():
+            self._status_task = asyncio.create_task(self._fetch_status_once())
+        return await asyncio.shield(self._status_task)
+
+    async def _fetch_status_once(self) -> CfxStatusPayload:
         errors = []
 
         try:
@@ -361,20 +418,31 @@ class CfxStatus(DashboardIntegration, commands.Cog):
 
     async def _fetch_statuspage_status(self) -> CfxStatusPayload:
         """Fetch Cfx.re status from the official Statuspage JSON API."""
+        cache = self._sources.setdefault(self.CFX_SUMMARY_API_URL, SourceCache())
         session = await self._get_session()
         try:
-            async with session.get(self.CFX_SUMMARY_API_URL) as response:
+            async with session.get(self.CFX_SUMMARY_API_URL, headers=cache.request_headers()) as response:
+                if response.status == 304 and cache.payload is not None:
+                    return cache.payload
                 if response.status != 200:
                     raise StatusPageError(
                         f"Cfx.re's Statuspage API returned HTTP {response.status}.",
                     )
-                data = await response.json(content_type=None)
+                body = await response.read()
+                headers = response.headers
         except asyncio.TimeoutError as error:
             raise StatusPageError("Cfx.re's Statuspage API timed out.") from error
         except aiohttp.ClientError as error:
             raise StatusPageError(
                 "I could not reach Cfx.re's Statuspage API.",
             ) from error
+
+        fingerprint = hashlib.sha256(body).hexdigest()
+        if fingerprint == cache.fingerprint and cache.payload is not None:
+            cache.remember(headers, fingerprint, cache.payload)
+            return cache.payload
+        try:
+            data = json.loads(body)
         except ValueError as error:
             raise StatusPageError(
                 "Cfx.re's Statuspage API returned invalid JSON.",
@@ -388,24 +456,31 @@ class CfxStatus(DashboardIntegration, commands.Cog):
 
         page = data.get("page") if isinstance(data, dict) else {}
         updated_at = page.get("updated_at") if isinstance(page, dict) else None
-        return CfxStatusPayload(
+        payload = CfxStatusPayload(
             updated_at=updated_at,
             components=components,
             source_name="Cfx.re Statuspage",
             source_url=self.CFX_STATUS_PAGE_URL,
             source_note="Official Cfx.re JSON API",
         )
+        cache.remember(headers, fingerprint, payload)
+        return payload
 
     async def _fetch_rockstar_status(self) -> CfxStatusPayload:
         """Fetch and parse the Cfx.re section of the Rockstar status page."""
+        cache = self._sources.setdefault(self.ROCKSTAR_STATUS_PAGE_URL, SourceCache())
         session = await self._get_session()
         try:
-            async with session.get(self.ROCKSTAR_STATUS_PAGE_URL) as response:
+            async with session.get(self.ROCKSTAR_STATUS_PAGE_URL, headers=cache.request_headers()) as response:
+                if response.status == 304 and cache.payload is not None:
+                    return cache.payload
                 if response.status != 200:
                     raise StatusPageError(
                         f"Rockstar's service-status page returned HTTP {response.status}.",
                     )
-                html = await response.text()
+                body = await response.read()
+                html = body.decode(response.get_encoding(), errors="replace")
+                headers = response.headers
         except asyncio.TimeoutError as error:
             raise StatusPageError(
                 "Rockstar's service-status page timed out.",
@@ -418,11 +493,16 @@ class CfxStatus(DashboardIntegration, commands.Cog):
         if not html.strip():
             raise StatusPageError("Rockstar's service-status page returned no content.")
 
+        fingerprint = hashlib.sha256(body).hexdigest()
+        if fingerprint == cache.fingerprint and cache.payload is not None:
+            cache.remember(headers, fingerprint, cache.payload)
+            return cache.payload
         payload = self.parse_status_page(html)
         if not payload.components:
             raise StatusPageError(
                 "I reached Rockstar's service-status page, but could not find the Cfx.re status section.",
             )
+        cache.remember(headers, fingerprint, payload)
         return payload
 
     async def _get_session(self) -> aiohttp.ClientSession:
@@ -479,7 +559,7 @@ class CfxStatus(DashboardIntegration, commands.Cog):
             details.append(f"Refresh: every {poll_interval_minutes} minutes")
         details.append(f"Source: {payload.source_name}")
         embed.add_field(name="Panel Info", value="\n".join(details), inline=False)
-        embed.set_footer(text="Cfx.re status panel | Last checked")
+        embed.set_footer(text="Cfx.re status panel | Last updated")
         return embed
 
     def build_error_embed(
@@ -506,7 +586,7 @@ class CfxStatus(DashboardIntegration, commands.Cog):
                 value=f"Every {poll_interval_minutes} minutes",
                 inline=False,
             )
-        embed.set_footer(text="Cfx.re status panel | Last checked")
+        embed.set_footer(text="Cfx.re status panel | Last updated")
         return embed
 
     def build_settings_embed(
@@ -560,6 +640,7 @@ class CfxStatus(DashboardIntegration, commands.Cog):
         *,
         force_post: bool = False,
         allow_error_embed: bool = False,
+        skip_unchanged: bool = False,
     ):
         """Post or edit the configured status panel for a guild."""
         if settings is None:
@@ -587,12 +668,25 @@ class CfxStatus(DashboardIntegration, commands.Cog):
                 interval,
             )
 
+        digest = self._render_digest(embed)
+        now_ts = self._utc_timestamp()
         message = None
         message_id = settings.get("status_message_id")
         if message_id and not force_post:
             partial = channel.get_partial_message(int(message_id))
+            rendered = self._rendered.get(guild.id)
+            if (
+                skip_unchanged
+                and rendered is not None
+                and rendered[:2] == (int(message_id), digest)
+                and now_ts - rendered[2] < self.UNCHANGED_EDIT_INTERVAL
+            ):
+                # The poll still counts as done, so the guild is not due again until its next interval.
+                await self.config.guild(guild).last_poll_at.set(now_ts)
+                return partial
             try:
-                message = await partial.edit(embed=embed)
+                async with self._edit_budget:
+                    message = await partial.edit(embed=embed)
             except discord.NotFound:
                 message = None
             except discord.Forbidden as discord_error:
@@ -606,7 +700,8 @@ class CfxStatus(DashboardIntegration, commands.Cog):
 
         if message is None:
             try:
-                message = await channel.send(embed=embed)
+                async with self._edit_budget:
+                    message = await channel.send(embed=embed)
             except discord.Forbidden as discord_error:
                 raise commands.CommandError(
                     f"I do not have permission to post in {channel.mention}.",
@@ -617,9 +712,17 @@ class CfxStatus(DashboardIntegration, commands.Cog):
                 ) from discord_error
             await self.config.guild(guild).status_message_id.set(message.id)
 
-        await self.config.guild(guild).last_poll_at.set(self._utc_timestamp())
+        self._rendered[guild.id] = (message.id, digest, now_ts)
+        await self.config.guild(guild).last_poll_at.set(now_ts)
         return message
 
+    @staticmethod
+    def _render_digest(embed: discord.Embed) -> str:
+        """Hash the status embed's content; its "updated" timestamp is left out so a re-poll alone is no change."""
+        payload = embed.to_dict()
+        payload.pop("timestamp", None)
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
     def _configured_channel(
         self,
         guild: discord.Guild,
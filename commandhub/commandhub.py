@@ -61,6 +61,7 @@ class CommandHub(DashboardIntegration, commands.Cog):
         log.info("CommandHub loaded with %d configured guild(s).", len(await self.store.all_guild_ids()))
 
     def cog_unload(self) -> None:
+        self.registry.cancel()
         for debouncer in self._debouncers.values():
             debouncer.cancel()
         for guild_id, name in tuple(self._registered):
@@ -78,12 +79,12 @@ class CommandHub(DashboardIntegration, commands.Cog):
     @commands.Cog.listener()
     async def on_cog_add(self, cog: commands.Cog) -> None:
         if cog is not self:
-            await self.registry.refresh()
+            self.registry.schedule_cog(cog)
 
     @commands.Cog.listener()
     async def on_cog_remove(self, cog: commands.Cog) -> None:
         if cog is not self:
-            await self.registry.refresh()
+            self.registry.schedule_cog(cog, removed=True)
 
     async def send_interaction(self, interaction: discord.Interaction, message: str, *, ephemeral: bool) -> None:
         if interaction.response.is_done():
@@ -949,7 +950,8 @@ class CommandHub(DashboardIntegration, commands.Cog):
             f"Prefix: {counts[CommandSource.PREFIX]} | Hybrid: {counts[CommandSource.HYBRID]} | "
             f"Native: {counts[CommandSource.APPLICATION]} | SlashLink: {counts[CommandSource.SLASHLINK]}\n"
             f"Unavailable configured: {unavailable} | Active views: {len(self._active_views)}\n"
-            f"Registry age: {age} | Unsupported types: {', '.join(sorted(self.registry.unsupported_types)) or 'none'}\n"
+            f"Registry age: {age} | Normalizations: {self.registry.normalizations} | "
+            f"Unsupported types: {', '.join(sorted(self.registry.unsupported_types)) or 'none'}\n"
             f"Last sync: {state['last_success'] or 'never'} | Last error: {state['last_error'] or 'none'}",
         )
 
@@ -991,7 +993,7 @@ class CommandHub(DashboardIntegration, commands.Cog):
     ) -> list[app_commands.Choice[str]]:
         del interaction
         choices: list[app_commands.Choice[str]] = []
-        for command in self.registry.search(current):
+        for command in self.registry.search(current, limit=50):
             value = command.qualified_name
             if len(value) <= 100:
                 choices.append(app_commands.Choice(name=value[:100], value=value))
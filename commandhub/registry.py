@@ -14,6 +14,7 @@ from discord.ext import commands as dpy_commands
 from redbot.core import app_commands, commands
 
 from .models import CommandParameter, CommandSource, HubCommand, ParameterKind
+from .utils import CommandSearchIndex
 
 if TYPE_CHECKING:
     from .integrations import SlashLinkAdapter
@@ -184,46 +185,194 @@ def normalize_application(command: app_commands.Command[Any, ..., Any], parents:
     )
 
 
+REGISTRY_DEBOUNCE_SECONDS = 1.0
+
+
+def _cog_app_roots(tree: Any, cog: Any) -> list[Any]:
+    """Return the top-level application commands of a cog that the tree currently holds.
+
+    Red keeps a cog's slash commands out of the tree until they are enabled with
+    ``[p]slash enable``, so the cog's own list alone would expose disabled ones.
+    """
+    if getattr(cog, "__cog_is_app_commands_group__", False):
+        group = getattr(cog, "app_command", None)
+        roots = [group] if group is not None else []
+    else:
+        get_app_commands = getattr(cog, "get_app_commands", None)
+        roots = list(get_app_commands()) if callable(get_app_commands) else []
+    return [
+        root
+        for root in roots
+        if tree.get_command(root.name, type=getattr(root, "type", discord.AppCommandType.chat_input)) is root
+    ]
+
+
 class CommandRegistry:
-    def __init__(self, bot: Any, slashlink: SlashLinkAdapter) -> None:
+    """Normalized command index kept current by per-cog incremental updates.
+
+    A full ``refresh`` walks every loaded command. Cog load and unload events
+    instead queue that cog and apply the queue after a short quiet period, so a
+    burst of cog loads at startup costs one pass over only the affected cogs.
+    Normalized records are memoised by command object identity, so unchanged
+    commands are never re-inspected. The search index is updated alongside.
+    """
+
+    def __init__(self, bot: Any, slashlink: SlashLinkAdapter, *, debounce: float = REGISTRY_DEBOUNCE_SECONDS) -> None:
         self.bot = bot
         self.slashlink = slashlink
+        self.debounce = debounce
         self.commands: dict[str, HubCommand] = {}
         self.refreshed_at: datetime | None = None
         self.lock = asyncio.Lock()
         self.counts = dict.fromkeys(CommandSource, 0)
         self.unsupported_types: set[str] = set()
+        self.index = CommandSearchIndex(())
+        self.normalizations = 0
+        self._normalized: dict[int, tuple[Any, HubCommand]] = {}
+        self._cog_keys: dict[str, set[str]] = {}
+        self._pending: dict[str, Any | None] = {}
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task[None] | None = None
 
     async def refresh(self) -> None:
         async with self.lock:
+            self._cancel_timer()
+            self._pending.clear()
             found: dict[str, HubCommand] = {}
+            seen: dict[int, tuple[Any, HubCommand]] = {}
             for command in self.bot.walk_commands():
-                normalized = normalize_prefix(command)
+                normalized = self._normalize_prefix(command, seen)
                 found[normalized.key] = normalized
             for root in self.bot.tree.get_commands():
-                self._walk_application(root, (), found)
+                self._walk_application(root, (), found, seen)
             if self.slashlink.check_compatibility():
-                for item in await self.slashlink.get_linked_commands():
-                    normalized = await self._normalize_slashlink(item)
-                    if normalized:
-                        found[normalized.key] = normalized
+                await self._collect_slashlink(found)
+            self._normalized = seen
             self.commands = found
-            self.counts = {source: sum(item.source is source for item in found.values()) for source in CommandSource}
-            self.unsupported_types = {
-                parameter.kind.value
-                for item in found.values()
-                for parameter in item.parameters
-                if parameter.kind is ParameterKind.UNSUPPORTED
-            }
-            self.refreshed_at = datetime.now(timezone.utc)
+            self.index = await asyncio.to_thread(CommandSearchIndex, list(found.values()))
+            self._cog_keys = {}
+            for key, item in found.items():
+                if item.cog_name:
+                    self._cog_keys.setdefault(item.cog_name, set()).add(key)
+            self._summarize()
             log.info("Command registry refreshed with %d commands.", len(found))
 
-    def _walk_application(self, command: Any, parents: tuple[str, ...], found: dict[str, HubCommand]) -> None:
+    def schedule_cog(self, cog: Any, *, removed: bool = False) -> None:
+        """Queue one cog's commands to be added or dropped after the debounce window."""
+        self._pending[cog.qualified_name] = None if removed else cog
+        self._cancel_timer()
+        self._flush_timer = asyncio.get_running_loop().call_later(self.debounce, self._start_flush)
+
+    def _start_flush(self) -> None:
+        self._flush_timer = None
+        # A flush that has started is never cancelled by later schedules; it drains whatever is queued.
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self.flush())
+        else:
+            self._flush_timer = asyncio.get_running_loop().call_later(self.debounce, self._start_flush)
+
+    async def flush(self) -> None:
+        """Apply queued cog changes, touching only those cogs' commands."""
+        async with self.lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            slashlink_changed = False
+            for cog_name, cog in pending.items():
+                self._drop_cog(cog_name)
+                if cog is not None:
+                    self._add_cog(cog)
+                slashlink_changed = slashlink_changed or cog_name == "SlashLink"
+            if slashlink_changed:
+                for key in [key for key, item in self.commands.items() if item.source is CommandSource.SLASHLINK]:
+                    del self.commands[key]
+                    self.index.discard(key)
+                if self.slashlink.check_compatibility():
+                    linked: dict[str, HubCommand] = {}
+                    await self._collect_slashlink(linked)
+                    self.commands.update(linked)
+                    for item in linked.values():
+                        self.index.add(item)
+            self._summarize()
+            log.debug("Command registry applied %d cog change(s); %d commands.", len(pending), len(self.commands))
+
+    def cancel(self) -> None:
+        self._cancel_timer()
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = None
+        self._pending.clear()
+
+    def _cancel_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _drop_cog(self, cog_name: str) -> None:
+        for key in self._cog_keys.pop(cog_name, ()):
+            item = self.commands.get(key)
+            if item is not None and item.cog_name in (cog_name, None):
+                del self.commands[key]
+                self.index.discard(key)
+                self._normalized.pop(id(item.callback), None)
+
+    def _add_cog(self, cog: Any) -> None:
+        found: dict[str, HubCommand] = {}
+        for command in cog.walk_commands():
+            normalized = self._normalize_prefix(command, self._normalized)
+            found[normalized.key] = normalized
+        for root in _cog_app_roots(self.bot.tree, cog):
+            self._walk_application(root, (), found, self._normalized)
+        self.commands.update(found)
+        for item in found.values():
+            self.index.add(item)
+        self._cog_keys[cog.qualified_name] = set(found)
+
+    def _normalize_prefix(self, command: Any, seen: dict[int, tuple[Any, HubCommand]]) -> HubCommand:
+        cached = self._normalized.get(id(command))
+        if cached is not None and cached[0] is command:
+            normalized = cached[1]
+            normalized.enabled = command.enabled
+        else:
+            normalized = normalize_prefix(command)
+            self.normalizations += 1
+        seen[id(command)] = (command, normalized)
+        return normalized
+
+    def _summarize(self) -> None:
+        self.counts = {source: sum(item.source is source for item in self.commands.values()) for source in CommandSource}
+        self.unsupported_types = {
+            parameter.kind.value
+            for item in self.commands.values()
+            for parameter in item.parameters
+            if parameter.kind is ParameterKind.UNSUPPORTED
+        }
+        self.refreshed_at = datetime.now(timezone.utc)
+
+    async def _collect_slashlink(self, found: dict[str, HubCommand]) -> None:
+        for item in await self.slashlink.get_linked_commands():
+            normalized = await self._normalize_slashlink(item)
+            if normalized:
+                found[normalized.key] = normalized
+
+    def _walk_application(
+        self,
+        command: Any,
+        parents: tuple[str, ...],
+        found: dict[str, HubCommand],
+        seen: dict[int, tuple[Any, HubCommand]],
+    ) -> None:
         if isinstance(command, app_commands.Group):
             for child in command.commands:
-                self._walk_application(child, (*parents, command.name), found)
+                self._walk_application(child, (*parents, command.name), found, seen)
         elif isinstance(command, app_commands.Command) and not command.extras.get("commandhub", False):
-            normalized = normalize_application(command, parents)
+            cached = self._normalized.get(id(command))
+            if cached is not None and cached[0] is command:
+                normalized = cached[1]
+            else:
+                normalized = normalize_application(command, parents)
+                self.normalizations += 1
+            seen[id(command)] = (command, normalized)
             # Hybrid entries use the prefix adapter, which preserves Red's full pipeline.
             hybrid_key = f"{CommandSource.HYBRID.value}:{normalized.qualified_name.casefold()}"
             if hybrid_key not in found:
@@ -256,7 +405,5 @@ class CommandRegistry:
             return [command] if command else []
         return [item for item in self.commands.values() if item.qualified_name.casefold() == folded]
 
-    def search(self, query: str) -> list[HubCommand]:
-        from .utils import rank_commands
-
-        return rank_commands(self.commands.values(), query)
+    def search(self, query: str, *, limit: int | None = None) -> list[HubCommand]:
+        return self.index.search(query, limit=limit)
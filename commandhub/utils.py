@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import heapq
+import itertools
 import re
 from typing import TYPE_CHECKING, TypeVar
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable, Iterable, Sequence
+    from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
 
     from .models import Hub, HubCommand
 
@@ -51,37 +54,238 @@ def paginate(items: Sequence[T], page: int, per_page: int = 25) -> tuple[list[T]
     return list(items[start : start + per_page]), current, pages
 
 
+SEARCH_GRAM_SIZE = 3
+_NO_MATCH = 5
+
+
+def _command_fields(command: HubCommand) -> tuple[str, str, str, str, str]:
+    return (
+        command.qualified_name.casefold(),
+        command.display_name.casefold(),
+        command.description.casefold(),
+        (command.cog_name or "").casefold(),
+        (command.category or "").casefold(),
+    )
+
+
+def _score_fields(fields: tuple[str, str, str, str, str], needle: str) -> tuple[int, int]:
+    qualified, display, description, cog_name, category = fields
+    if qualified == needle or display == needle:
+        rank = 0
+    elif qualified.startswith(needle) or display.startswith(needle):
+        rank = 1
+    elif needle in qualified or needle in display:
+        rank = 2
+    elif needle in description:
+        rank = 3
+    elif needle in cog_name or needle in category:
+        rank = 4
+    else:
+        return _NO_MATCH, 0
+    position = min(position for field in fields if (position := field.find(needle)) >= 0)
+    return rank, position
+
+
 def rank_commands(commands: Iterable[HubCommand], query: str) -> list[HubCommand]:
     needle = query.casefold().strip()
     if not needle:
         return sorted(commands, key=lambda item: item.qualified_name.casefold())
+    scored = []
+    for index, command in enumerate(commands):
+        fields = _command_fields(command)
+        rank, position = _score_fields(fields, needle)
+        if rank < _NO_MATCH:
+            scored.append((rank, position, fields[0], index, command))
+    scored.sort()
+    return [item[-1] for item in scored]
+
+
+class CommandSearchIndex:
+    """Pre-folded command fields with a name prefix list and n-gram map.
+
+    Fields are case-folded once, when a command is added. Qualified and display
+    names are kept in a sorted list that serves as a prefix trie and in a map
+    from every 1- to 3-character substring to the commands containing it.
+    Exact and prefix matches always rank first, then name infixes, then
+    descriptions, then cog and category names, so a limited query stops at the
+    first tier that fills the limit. Cog and category matches are scored once
+    per distinct pair rather than once per command. Results match
+    ``rank_commands`` exactly. Commands can be added and discarded one at a
+    time, so callers can keep an index current without rebuilding it.
+    """
+
+    def __init__(self, commands: Iterable[HubCommand] = ()) -> None:
+        self._commands: dict[int, HubCommand] = {}
+        self._fields: dict[int, tuple[str, str, str, str, str]] = {}
+        self._slots: dict[str, int] = {}
+        self._next_slot = 0
+        self._grams: dict[str, set[int]] = {}
+        self._names: list[tuple[str, int]] = []
+        self._alphabetical: list[tuple[str, int]] = []
+        self._groups: dict[tuple[str, str], list[tuple[str, int]]] = {}
+        self._group_labels: tuple[dict[str, set[tuple[str, str]]], dict[str, set[tuple[str, str]]]] = ({}, {})
+        self._descriptions: tuple[str, list[int], list[int]] | None = None
+        for command in commands:
+            self._insert(command, ordered=False)
+        self._names.sort()
+        self._alphabetical.sort()
+        for members in self._groups.values():
+            members.sort()
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def add(self, command: HubCommand) -> None:
+        """Index a command, replacing any command with the same key."""
+        self.discard(command.key)
+        self._insert(command, ordered=True)
+
+    def discard(self, key: str) -> None:
+        """Remove the command with ``key`` if it is indexed."""
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return
+        del self._commands[slot]
+        self._descriptions = None
+        fields = self._fields.pop(slot)
+        for gram in self._name_grams(fields):
+            posting = self._grams[gram]
+            posting.discard(slot)
+            if not posting:
+                del self._grams[gram]
+        for name in {fields[0], fields[1]}:
+            _remove_sorted(self._names, (name, slot))
+        _remove_sorted(self._alphabetical, (fields[0], slot))
+        pair = (fields[3], fields[4])
+        group = self._groups[pair]
+        _remove_sorted(group, (fields[0], slot))
+        if not group:
+            del self._groups[pair]
+            for labels, label in zip(self._group_labels, pair, strict=True):
+                labels[label].discard(pair)
+                if not labels[label]:
+                    del labels[label]
+
+    def _insert(self, command: HubCommand, *, ordered: bool) -> None:
+        slot = self._next_slot
+        self._next_slot += 1
+        fields = _command_fields(command)
+        self._slots[command.key] = slot
+        self._commands[slot] = command
+        self._fields[slot] = fields
+        self._descriptions = None
+        for gram in self._name_grams(fields):
+            self._grams.setdefault(gram, set()).add(slot)
+        pair = (fields[3], fields[4])
+        group = self._groups.get(pair)
+        if group is None:
+            group = self._groups[pair] = []
+            for labels, label in zip(self._group_labels, pair, strict=True):
+                labels.setdefault(label, set()).add(pair)
+        add = bisect.insort if ordered else list.append
+        for name in {fields[0], fields[1]}:
+            add(self._names, (name, slot))
+        add(self._alphabetical, (fields[0], slot))
+        add(group, (fields[0], slot))
+
+    @staticmethod
+    def _name_grams(fields: tuple[str, str, str, str, str]) -> set[str]:
+        return {
+            name[start : start + size]
+            for name in {fields[0], fields[1]}
+            for size in range(1, SEARCH_GRAM_SIZE + 1)
+            for start in range(len(name) - size + 1)
+        }
+
+    def _description_table(self) -> tuple[str, list[int], list[int]]:
+        """Return every description joined into one string, with start offsets and slots."""
+        if self._descriptions is None:
+            offsets, slots, cursor = [], [], 0
+            for slot, fields in self._fields.items():
+                offsets.append(cursor)
+                slots.append(slot)
+                cursor += len(fields[2]) + 1
+            self._descriptions = ("\0".join(fields[2] for fields in self._fields.values()), offsets, slots)
+        return self._descriptions
+
+    def _name_candidates(self, needle: str) -> set[int]:
+        if len(needle) <= SEARCH_GRAM_SIZE:
+            return self._grams.get(needle, set())
+        postings = []
+        for start in range(len(needle) - SEARCH_GRAM_SIZE + 1):
+            posting = self._grams.get(needle[start : start + SEARCH_GRAM_SIZE])
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        return set.intersection(*postings)
+
+    def search(self, query: str, *, limit: int | None = None) -> list[HubCommand]:
+        """Rank matching commands, scoring each candidate once."""
+        needle = query.casefold().strip()
+        if not needle:
+            order = self._alphabetical if limit is None else self._alphabetical[:limit]
+            return [self._commands[slot] for _name, slot in order]
+        if limit is None:
+            limit = len(self._commands)
+
+        # Exact and prefix name matches rank 0 or 1 at position 0.
+        scored: dict[int, tuple[int, int, str, int]] = {}
+        for position in range(bisect.bisect_left(self._names, (needle,)), len(self._names)):
+            name, slot = self._names[position]
+            if not name.startswith(needle):
+                break
+            rank = 0 if name == needle else 1
+            if slot not in scored or rank < scored[slot][0]:
+                scored[slot] = (rank, 0, self._fields[slot][0], slot)
+        # Every other name match is an infix, rank 2.
+        if len(scored) < limit:
+            for slot in self._name_candidates(needle):
+                if slot not in scored:
+                    rank, position = _score_fields(self._fields[slot], needle)
+                    if rank < _NO_MATCH:
+                        scored[slot] = (rank, position, self._fields[slot][0], slot)
+        # Description matches, rank 3, found by scanning one joined string.
+        if len(scored) < limit:
+            descriptions, offsets, slots = self._description_table()
+            found = descriptions.find(needle)
+            while found >= 0:
+                entry = bisect.bisect_right(offsets, found) - 1
+                slot = slots[entry]
+                if slot not in scored:
+                    fields = self._fields[slot]
+                    scored[slot] = (3, _score_fields(fields, needle)[1], fields[0], slot)
+                following = entry + 1
+                found = descriptions.find(needle, offsets[following]) if following < len(offsets) else -1
+        ranked = heapq.nsmallest(limit, scored.values()) if limit < len(scored) else sorted(scored.values())
+        # Cog and category matches, rank 4, share one position per distinct pair.
+        if len(ranked) < limit:
+            pair_positions: dict[tuple[str, str], int] = {}
+            for labels in self._group_labels:
+                for label, pairs in labels.items():
+                    found = label.find(needle)
+                    if found >= 0:
+                        for pair in pairs:
+                            pair_positions[pair] = min(found, pair_positions.get(pair, found))
+            groups = [_group_keys(position, self._groups[pair], scored) for pair, position in pair_positions.items()]
+            ranked.extend(itertools.islice(heapq.merge(*groups), limit - len(ranked)))
+        return [self._commands[item[-1]] for item in ranked]
+
+
+def _group_keys(
+    position: int,
+    members: list[tuple[str, int]],
+    excluded: dict[int, tuple[int, int, str, int]],
+) -> Iterator[tuple[int, int, str, int]]:
+    for name, slot in members:
+        if slot not in excluded:
+            yield 4, position, name, slot
+
 
-    def score(command: HubCommand) -> tuple[int, int, str]:
-        qualified = command.qualified_name.casefold()
-        display = command.display_name.casefold()
-        fields = (
-            qualified,
-            display,
-            command.description.casefold(),
-            (command.cog_name or "").casefold(),
-            (command.category or "").casefold(),
-        )
-        if qualified == needle or display == needle:
-            rank = 0
-        elif qualified.startswith(needle) or display.startswith(needle):
-            rank = 1
-        elif needle in qualified or needle in display:
-            rank = 2
-        elif needle in fields[2]:
-            rank = 3
-        elif any(needle in field for field in fields[3:]):
-            rank = 4
-        else:
-            rank = 5
-        position = min((field.find(needle) for field in fields if needle in field), default=10_000)
-        return rank, position, qualified
-
-    return [command for command in sorted(commands, key=score) if score(command)[0] < 5]
+def _remove_sorted(items: list[T], value: T) -> None:
+    position = bisect.bisect_left(items, value)
+    if position < len(items) and items[position] == value:
+        del items[position]
 
 
 def hub_scope_allows(
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 import discord
 
-from commandhub.utils import paginate, rank_commands
+from commandhub.utils import CommandSearchIndex, paginate
 
 from .argument_modal import ArgumentModal
 from .command_select import CommandSelect
@@ -61,6 +61,7 @@ class HubView(discord.ui.View):
         self.page = hub.default_page
         self.search_query: str | None = None
         self.search_results: list[HubCommand] = []
+        self.search_index: CommandSearchIndex | None = None
         self.message: discord.InteractionMessage | None = None
         self.rebuild()
 
@@ -165,9 +166,10 @@ class HubView(discord.ui.View):
         await interaction.response.send_modal(SearchModal(self))
 
     async def apply_search(self, interaction: discord.Interaction, query: str) -> None:
-        all_commands = [item for values in self.commands_by_category.values() for item in values]
+        if self.search_index is None:
+            self.search_index = CommandSearchIndex(item for values in self.commands_by_category.values() for item in values)
         self.search_query = query.strip()
-        self.search_results = rank_commands(all_commands, self.search_query)
+        self.search_results = self.search_index.search(self.search_query)
         self.page = 0
         await self.update(interaction)
 
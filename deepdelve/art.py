@@ -2,25 +2,142 @@
 
 from __future__ import annotations
 
+import io
 import re
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import discord
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
 BESTIARY_ASSET_DIR = Path(__file__).resolve().parent / "assets" / "bestiary"
+PORTRAIT_CACHE_BYTES = 4 * 1024 * 1024
+THUMBNAIL_SIZE = 256
 
 
+@lru_cache(maxsize=512)
 def bestiary_slug(name: str) -> str:
     """Return the stable filename slug used by bestiary portraits."""
     return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
 
 
+def _art_name(enemy: Mapping[str, Any]) -> str:
+    return str(enemy.get("art_name") or enemy.get("base_name") or enemy.get("name") or "")
+
+
+class BestiaryArtRegistry:
+    """Index bestiary portraits once and serve hot portraits from memory.
+
+    Portrait bytes are kept in a least-recently-used cache capped at
+    ``max_bytes``. Every ``discord.File`` handed out wraps its own stream over
+    the shared immutable bytes, so concurrent renders never reopen the asset.
+    """
+
+    def __init__(self, directory: Path = BESTIARY_ASSET_DIR, *, max_bytes: int = PORTRAIT_CACHE_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max(0, int(max_bytes))
+        self.hits = 0
+        self.misses = 0
+        self._paths: dict[str, Path] = {}
+        self._portraits: OrderedDict[str, bytes] = OrderedDict()
+        self._cached_bytes = 0
+        self._thumbnails: dict[str, bytes] = {}
+        self.reload()
+
+    def reload(self) -> None:
+        """Re-index the asset directory and drop every cached portrait."""
+        self._paths = {path.stem: path for path in sorted(self.directory.glob("*.webp")) if path.is_file()}
+        self._portraits.clear()
+        self._cached_bytes = 0
+        self._thumbnails.clear()
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    @property
+    def cached_bytes(self) -> int:
+        """Return the number of full-size portrait bytes held in memory."""
+        return self._cached_bytes
+
+    @property
+    def thumbnail_count(self) -> int:
+        """Return how many compact embed thumbnails have been pre-rendered."""
+        return len(self._thumbnails)
+
+    def path_for(self, enemy: Mapping[str, Any]) -> Path | None:
+        """Resolve an encounter to its indexed portrait path."""
+        name = _art_name(enemy)
+        return self._paths.get(bestiary_slug(name)) if name else None
+
+    def portrait_bytes(self, slug: str) -> bytes | None:
+        """Return a portrait's bytes, loading and caching them on first use."""
+        data = self._portraits.get(slug)
+        if data is not None:
+            self._portraits.move_to_end(slug)
+            self.hits += 1
+            return data
+        path = self._paths.get(slug)
+        if path is None:
+            return None
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        self.misses += 1
+        if len(data) <= self.max_bytes:
+            self._portraits[slug] = data
+            self._cached_bytes += len(data)
+            while self._cached_bytes > self.max_bytes:
+                _evicted, evicted_data = self._portraits.popitem(last=False)
+                self._cached_bytes -= len(evicted_data)
+        return data
+
+    def build_thumbnails(self, size: int = THUMBNAIL_SIZE) -> int:
+        """Pre-render compact portraits for embed thumbnails when Pillow is installed.
+
+        This decodes every portrait, so callers should run it off the event loop.
+        """
+        if Image is None:
+            return 0
+        thumbnails = {}
+        for slug, path in self._paths.items():
+            try:
+                with Image.open(path) as image:
+                    image.thumbnail((size, size))
+                    buffer = io.BytesIO()
+                    image.save(buffer, format="WEBP", quality=82, method=4)
+            except (OSError, ValueError):
+                continue
+            if buffer.tell() < path.stat().st_size:
+                thumbnails[slug] = buffer.getvalue()
+        self._thumbnails = thumbnails
+        return len(thumbnails)
+
+    def file_for(self, enemy: Mapping[str, Any], *, thumbnail: bool = False) -> discord.File | None:
+        """Build a Discord attachment for an encounter from the in-memory cache."""
+        path = self.path_for(enemy)
+        if path is None:
+            return None
+        data = self._thumbnails.get(path.stem) if thumbnail else None
+        if data is None:
+            data = self.portrait_bytes(path.stem)
+        if data is None:
+            return None
+        return discord.File(io.BytesIO(data), filename=path.name)
+
+
+BESTIARY_ART = BestiaryArtRegistry()
+
+
 def combat_art_path(enemy: Mapping[str, Any]) -> Path | None:
     """Resolve an encounter to its portrait, including modified variants."""
-    name = str(enemy.get("art_name") or enemy.get("base_name") or enemy.get("name") or "")
-    if not name:
-        return None
-    path = BESTIARY_ASSET_DIR / f"{bestiary_slug(name)}.webp"
-    return path if path.is_file() else None
+    return BESTIARY_ART.path_for(enemy)
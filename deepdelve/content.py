@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import random
+from functools import lru_cache
+from itertools import accumulate
 from typing import Any
 
 from .expansion_content import EXTENDED_BOSSES, EXTENDED_ENEMIES
@@ -507,8 +509,7 @@ def xp_for_level(level: int) -> int:
 def enemy_for_floor(floor: int, rng: random.Random = random) -> dict[str, Any]:
     """Build a scaled random enemy suitable for a floor."""
     tier = min(5, max(1, (max(1, floor) - 1) // 5 + 1))
-    choices = [enemy for enemy in ENEMIES if enemy["tier"] in {tier, max(1, tier - 1)}]
-    base = dict(rng.choice(choices))
+    base = dict(rng.choice(CONTENT_TABLES["enemy_bands"][tier]))
     scale = 1 + max(0, floor - 1) * 0.085
     variance = rng.uniform(0.92, 1.08)
     for field in ("hp", "attack", "defense"):
@@ -572,21 +573,22 @@ def boss_for_floor(floor: int) -> dict[str, Any]:
     return base
 
 
-def roll_rarity(floor: int, luck: int, rng: random.Random = random) -> int:
-    """Roll a rarity index with modest floor and luck improvements."""
+@lru_cache(maxsize=4096)
+def rarity_thresholds(floor: int, luck: int) -> tuple[float, ...]:
+    """Return cumulative legendary-to-uncommon roll thresholds for a floor and luck."""
     legendary = min(5.0, 0.35 + floor * 0.06 + luck * 0.035)
     epic = min(12.0, 2.0 + floor * 0.12 + luck * 0.07)
     rare = min(25.0, 8.0 + floor * 0.18 + luck * 0.12)
     uncommon = min(42.0, 26.0 + floor * 0.2 + luck * 0.15)
+    return tuple(accumulate((legendary, epic, rare, uncommon)))
+
+
+def roll_rarity(floor: int, luck: int, rng: random.Random = random) -> int:
+    """Roll a rarity index with modest floor and luck improvements."""
     roll = rng.uniform(0, 100)
-    if roll < legendary:
-        return 4
-    if roll < legendary + epic:
-        return 3
-    if roll < legendary + epic + rare:
-        return 2
-    if roll < legendary + epic + rare + uncommon:
-        return 1
+    for offset, threshold in enumerate(rarity_thresholds(floor, luck)):
+        if roll < threshold:
+            return 4 - offset
     return 0
 
 
@@ -639,3 +641,25 @@ def item_stat_line(item: dict[str, Any]) -> str:
         if item.get(key):
             stats.append(f"+{item[key]} {label}")
     return " • ".join(stats) or "No bonuses"
+
+
+CONTENT_TABLES: dict[str, Any] = {}
+
+
+def compile_content_tables() -> dict[str, Any]:
+    """Precompute the floor-band candidate tables read by the random generators.
+
+    Each table keeps the authored ordering of its source so seeded rolls select
+    exactly the same entries as filtering the content on every call would.
+    """
+    enemy_bands = {}
+    for tier in range(1, 6):
+        band = {tier, max(1, tier - 1)}
+        enemy_bands[tier] = tuple(enemy for enemy in ENEMIES if enemy["tier"] in band)
+    CONTENT_TABLES.clear()
+    CONTENT_TABLES["enemy_bands"] = enemy_bands
+    rarity_thresholds.cache_clear()
+    return CONTENT_TABLES
+
+
+compile_content_tables()
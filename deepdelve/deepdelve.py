@@ -16,6 +16,7 @@ from typing import TYPE_CHECKING, Any
 
 import discord
 from redbot.core import Config, bank, commands
+from redbot.core.data_manager import cog_data_path
 from redbot.core.utils.chat_formatting import humanize_list
 
 from .advanced_content import (
@@ -28,7 +29,7 @@ from .advanced_content import (
     TALENT_TREES,
     TITLES,
 )
-from .art import combat_art_path
+from .art import BESTIARY_ART, combat_art_path
 from .content import (
     ACHIEVEMENTS,
     AFFIXES,
@@ -54,10 +55,13 @@ from .persistent_views import (
     DeepDelveDynamicSelect,
     persistent_custom_id,
 )
+from .render_cache import EmbedRenderCache
+from .storage import SOCIAL_KINDS, SocialStore
 from .systems import (
     ENCHANTMENTS,
     QUESTS,
     SANCTUM_ROOMS,
+    WorldBossLedger,
     abandon_dungeon,
     accept_commission,
     accept_oath,
@@ -94,6 +98,7 @@ from .systems import (
     defeat_nemesis,
     dismantle_rewards,
     enchant_cost,
+    enchantments_for,
     ending_recap,
     ensure_enemy_intent,
     ensure_legacy,
@@ -148,7 +153,6 @@ from .systems import (
     sanctum_upgrade_cost,
     scaled_daily_floor,
     season_chapter_status,
-    short_code,
     should_auto_dismantle,
     starter_options,
     subclass_options,
@@ -164,13 +168,22 @@ from .systems import (
     use_faction_service,
     use_moral_power,
     validate_content,
+    world_boss_rewards,
     world_echoes,
 )
-from .systems.migrations import GUILD_SCHEMA_VERSION, PROFILE_SCHEMA_VERSION, migrate_guild, migrate_profile
+from .systems.migrations import (
+    GUILD_SCHEMA_VERSION,
+    PROFILE_SCHEMA_VERSION,
+    migrate_guild,
+    migrate_item,
+    migrate_profile,
+)
 from .systems.progression import talent_definition
 from .systems.puzzles import puzzle_for_floor, resolve_puzzle
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
     from redbot.core.bot import Red
 
 EMBED_COLOR = 0x6C3483
@@ -178,6 +191,8 @@ SUCCESS_COLOR = 0x2ECC71
 DANGER_COLOR = 0xC0392B
 GOLD_COLOR = 0xF1C40F
 DEFAULT_DAILY_TURNS = 40
+AUCTION_PAGE_SIZE = 20
+WORLD_BOSS_CHECKPOINT_SECONDS = 15
 LOGGER = logging.getLogger("red.taakoscogs.deepdelve")
 TITLES = {**TITLES, **LIVING_TITLES}
 
@@ -447,7 +462,7 @@ class AdventureView(OwnedView):
         await interaction.response.defer()
         profile = await self.cog._get_profile(interaction.guild.id, interaction.user.id)
         await interaction.edit_original_response(
-            embed=self.cog._profile_embed(interaction.user, profile),
+            embed=self.cog._cached_profile_embed(interaction.guild.id, interaction.user, profile),
             view=AdventureView(self.cog, self.user_id),
         )
 
@@ -1407,7 +1422,13 @@ class InventorySelect(discord.ui.Select):
         if interaction.guild:
             profile = await view.cog._get_profile(interaction.guild.id, interaction.user.id)
             await interaction.edit_original_response(
-                embed=view.cog._inventory_embed(profile, view.selected_id),
+                embed=view.cog._cached_embed(
+                    interaction.guild.id,
+                    interaction.user.id,
+                    profile,
+                    ("inventory", view.selected_id),
+                    lambda: view.cog._inventory_embed(profile, view.selected_id),
+                ),
                 view=view,
             )
 
@@ -1442,7 +1463,13 @@ class EquippedItemSelect(discord.ui.Select):
         if interaction.guild:
             profile = await view.cog._get_profile(interaction.guild.id, interaction.user.id)
             await interaction.edit_original_response(
-                embed=view.cog._inventory_embed(profile, view.selected_id),
+                embed=view.cog._cached_embed(
+                    interaction.guild.id,
+                    interaction.user.id,
+                    profile,
+                    ("inventory", view.selected_id),
+                    lambda: view.cog._inventory_embed(profile, view.selected_id),
+                ),
                 view=view,
             )
 
@@ -1744,6 +1771,7 @@ class RetireConfirmView(OwnedView):
             return
         await interaction.response.defer()
         await self.cog.config.member_from_ids(interaction.guild.id, interaction.user.id).clear()
+        self.cog._render_cache.bump(interaction.guild.id, interaction.user.id)
         embed = discord.Embed(
             title="🪦 The chronicle closes",
             description=(
@@ -1761,7 +1789,7 @@ class RetireConfirmView(OwnedView):
         await interaction.response.defer()
         profile = await self.cog._get_profile(interaction.guild.id, interaction.user.id)
         await interaction.edit_original_response(
-            embed=self.cog._profile_embed(interaction.user, profile),
+            embed=self.cog._cached_profile_embed(interaction.guild.id, interaction.user, profile),
             view=AdventureView(self.cog, self.user_id),
         )
 
@@ -1808,9 +1836,9 @@ class WorldBossView(discord.ui.View):
         if not interaction.guild:
             return
         await interaction.response.defer()
-        record = await self.cog.config.guild(interaction.guild).world_boss()
+        ledger = await self.cog._world_boss_ledger(interaction.guild.id)
         await interaction.edit_original_response(
-            embed=self.cog._world_boss_embed(record),
+            embed=self.cog._world_boss_embed(ledger.record if ledger.active else {}),
             view=WorldBossView(self.cog),
         )
 
@@ -1837,6 +1865,8 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             adventure_channel=0,
             daily_turns=DEFAULT_DAILY_TURNS,
             economy_mode="internal",
+            auction_limit=100,
+            # Legacy social blobs; cog_load moves their records into the social store.
             parties={},
             auctions={},
             player_guilds={},
@@ -2017,6 +2047,10 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         self._guild_locks: dict[int, asyncio.Lock] = {}
         self._currency_names: dict[int, str] = {}
         self._world_boss_view: WorldBossView | None = None
+        self._world_bosses: dict[int, WorldBossLedger] = {}
+        self._world_boss_checkpoints: asyncio.Task | None = None
+        self._render_cache = EmbedRenderCache()
+        self._social = SocialStore(cog_data_path(self) / "social.sqlite3")
 
     @classmethod
     def _is_public_slash_response(cls, qualified_name: str) -> bool:
@@ -2042,16 +2076,31 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         self._world_boss_view = WorldBossView(self)
         self.bot.add_view(self._world_boss_view)
         self.bot.add_dynamic_items(DeepDelveDynamicButton, DeepDelveDynamicSelect)
+        await self._social.initialize()
         await self._migrate_all_data()
+        self._world_boss_checkpoints = asyncio.create_task(self._world_boss_checkpoint_loop())
+        if not BESTIARY_ART.thumbnail_count:
+            await asyncio.to_thread(BESTIARY_ART.build_thumbnails)
 
-    def cog_unload(self) -> None:
-        """Release per-session synchronization state."""
-        self._locks.clear()
-        self._guild_locks.clear()
+    async def cog_unload(self) -> None:
+        """Flush live world bosses and release per-session synchronization state."""
         self._purge_live_player_views()
         if self._world_boss_view:
             self._world_boss_view.stop()
             self._world_boss_view = None
+        checkpoints = getattr(self, "_world_boss_checkpoints", None)
+        if checkpoints:
+            checkpoints.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await checkpoints
+            self._world_boss_checkpoints = None
+        if any(ledger.dirty for ledger in getattr(self, "_world_bosses", {}).values()):
+            try:
+                await self._checkpoint_world_bosses()
+            except Exception:
+                LOGGER.exception("Failed to checkpoint DeepDelve world bosses on unload.")
+        self._locks.clear()
+        self._guild_locks.clear()
         self.bot.remove_dynamic_items(DeepDelveDynamicButton, DeepDelveDynamicSelect)
 
     def _purge_live_player_views(self) -> None:
@@ -2090,8 +2139,16 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         """Run idempotent schema upgrades for every stored guild and character."""
         all_guilds = await self.config.all_guilds()
         for guild_id, guild_data in all_guilds.items():
-            if migrate_guild(guild_data):
+            changed = migrate_guild(guild_data)
+            if any(guild_data.get(key) for key in ("auctions", *SOCIAL_KINDS.values())):
+                await self._social.import_guild(int(guild_id), guild_data)
+                for key in ("auctions", *SOCIAL_KINDS.values()):
+                    guild_data[key] = {}
+                changed = True
+            if changed:
                 await self.config.guild_from_id(int(guild_id)).set(guild_data)
+        # Listings and vaults live in SQLite now, so the Config pass above no longer reaches them.
+        await self._social.migrate_items(GUILD_SCHEMA_VERSION, migrate_item)
         all_members = await self.config.all_members()
         for guild_id, members in all_members.items():
             for user_id, profile in members.items():
@@ -2164,11 +2221,19 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         elif screen == "atlas":
             embed, view = self._atlas_embed(profile), AtlasView(self, interaction.user.id, profile)
         elif screen == "character":
-            embed, view = self._profile_embed(interaction.user, profile), GameHubView(self, interaction.user.id)
+            embed = self._cached_profile_embed(interaction.guild.id, interaction.user, profile)
+            view = GameHubView(self, interaction.user.id)
         elif screen == "morality":
             embed, view = self._morality_embed(profile), GameHubView(self, interaction.user.id)
         elif screen == "codex":
-            embed, view = self._collection_codex_embed(profile), GameHubView(self, interaction.user.id)
+            embed = self._cached_embed(
+                interaction.guild.id,
+                interaction.user.id,
+                profile,
+                "codex",
+                lambda: self._collection_codex_embed(profile),
+            )
+            view = GameHubView(self, interaction.user.id)
         elif screen == "town":
             embed, view = self._town_embed(profile), TownView(self, interaction.user.id)
         elif screen == "mail":
@@ -2211,7 +2276,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             await interaction.response.defer()
             profile = await self._get_profile(interaction.guild.id, user_id)
             await interaction.edit_original_response(
-                embed=self._profile_embed(interaction.user, profile),
+                embed=self._cached_profile_embed(interaction.guild.id, interaction.user, profile),
                 view=AdventureView(self, user_id),
             )
         elif route.startswith("gamehub:"):
@@ -2300,6 +2365,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         elif route == "retireconfirm:confirm":
             await interaction.response.defer()
             await self.config.member_from_ids(interaction.guild.id, user_id).clear()
+            self._render_cache.bump(interaction.guild.id, user_id)
             await interaction.edit_original_response(
                 embed=discord.Embed(
                     title="🪦 The chronicle closes",
@@ -2315,7 +2381,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             await interaction.response.defer()
             profile = await self._get_profile(interaction.guild.id, user_id)
             await interaction.edit_original_response(
-                embed=self._profile_embed(interaction.user, profile),
+                embed=self._cached_profile_embed(interaction.guild.id, interaction.user, profile),
                 view=AdventureView(self, user_id),
             )
         elif route == "origin:begin":
@@ -2392,7 +2458,13 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             view = InventoryView(self, user_id, profile)
             view.bind_selection(selected)
             await interaction.edit_original_response(
-                embed=self._inventory_embed(profile, selected),
+                embed=self._cached_embed(
+                    guild_id,
+                    user_id,
+                    profile,
+                    ("inventory", selected),
+                    lambda: self._inventory_embed(profile, selected),
+                ),
                 view=view,
             )
         elif route in {"armory_sort_select", "armory_filter_select", "auto_dismantle_select"}:
@@ -2462,6 +2534,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             if profile.get("created"):
                 profile["party_bonus"] = bonus
                 await proxy.set(profile)
+                self._render_cache.bump(guild_id, member_id)
 
     async def _sync_player_guild_bonuses(
         self,
@@ -2480,6 +2553,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             if profile.get("created"):
                 profile["guild_bonus"] = bonus
                 await proxy.set(profile)
+                self._render_cache.bump(guild_id, member_id)
 
     async def _get_profile(self, guild_id: int, user_id: int, *, refresh: bool = True) -> dict[str, Any]:
         proxy, profile = await self._raw_member_profile(guild_id, user_id)
@@ -2531,6 +2605,8 @@ class DeepDelve(DashboardIntegration, commands.Cog):
                 await proxy.set(profile)
         elif dirty:
             await proxy.set(profile)
+        if dirty:
+            self._render_cache.bump(guild_id, user_id)
         return profile
 
     async def _save_profile(
@@ -2553,8 +2629,36 @@ class DeepDelve(DashboardIntegration, commands.Cog):
                 profile["gold"] = await bank.set_balance(member, min(desired, maximum))
                 self._currency_names[guild_id] = await bank.get_currency_name(guild)
         await self.config.member_from_ids(guild_id, user_id).set(profile)
+        self._render_cache.bump(guild_id, user_id)
         return profile
 
+    def _cached_embed(
+        self,
+        guild_id: int,
+        user_id: int,
+        profile: dict[str, Any],
+        screen: Hashable,
+        build: Callable[[], discord.Embed],
+    ) -> discord.Embed:
+        """Reuse a heavy screen until the profile or its shared server context changes."""
+        key = (
+            screen,
+            profile.get("gold"),
+            profile.get("currency_name"),
+            profile.get("world_event", {}).get("date"),
+            tuple(sorted(profile.get("town_bonus", {}).items())),
+        )
+        return self._render_cache.render(guild_id, user_id, key, build)
+
+    def _cached_profile_embed(self, guild_id: int, user: discord.abc.User, profile: dict[str, Any]) -> discord.Embed:
+        return self._cached_embed(
+            guild_id,
+            user.id,
+            profile,
+            "profile",
+            lambda: self._profile_embed(user, profile),
+        )
+
     def _currency(self, guild_id: int | None = None) -> str:
         if guild_id is None:
             return "gold"
@@ -2616,6 +2720,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
                 },
             )
             await proxy.set(current)
+            self._render_cache.bump(guild_id, user_id)
             return True
 
     @staticmethod
@@ -3970,8 +4075,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
     @staticmethod
     def _combat_art_file(profile: dict[str, Any]) -> discord.File | None:
         """Build a fresh Discord attachment for the current encounter portrait."""
-        path = combat_art_path(profile.get("encounter") or {})
-        return discord.File(path, filename=path.name) if path else None
+        return BESTIARY_ART.file_for(profile.get("encounter") or {}, thumbnail=True)
 
     def _combat_attachments(self, profile: dict[str, Any]) -> list[discord.File]:
         art = self._combat_art_file(profile)
@@ -6531,7 +6635,13 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             await interaction.edit_original_response(embed=self._not_created_embed(), view=None)
             return
         await interaction.edit_original_response(
-            embed=self._inventory_embed(profile),
+            embed=self._cached_embed(
+                interaction.guild.id,
+                interaction.user.id,
+                profile,
+                ("inventory", None),
+                lambda: self._inventory_embed(profile),
+            ),
             view=InventoryView(self, interaction.user.id, profile),
         )
 
@@ -6541,7 +6651,13 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         await interaction.response.defer()
         profile = await self._get_profile(interaction.guild.id, interaction.user.id)
         await interaction.edit_original_response(
-            embed=self._armory_embed(profile),
+            embed=self._cached_embed(
+                interaction.guild.id,
+                interaction.user.id,
+                profile,
+                "armory",
+                lambda: self._armory_embed(profile),
+            ),
             view=ArmoryView(self, interaction.user.id, profile),
         )
 
@@ -7188,7 +7304,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
                     ephemeral=True,
                 )
                 return
-            available = [entry for entry in ENCHANTMENTS if not effect or entry[1] == effect]
+            available = enchantments_for(effect)
             if not available:
                 await interaction.followup.send("That sigil is no longer available.", ephemeral=True)
                 return
@@ -7211,101 +7327,117 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         view.bind_selection(item_id)
         await interaction.edit_original_response(embed=embed, view=view)
 
+    async def _world_boss_ledger(self, guild_id: int) -> WorldBossLedger:
+        """Return the live world-boss ledger, loading it from Config once per session."""
+        ledger = self._world_bosses.get(guild_id)
+        if ledger is None:
+            record = await self.config.guild_from_id(guild_id).world_boss()
+            ledger = self._world_bosses.setdefault(guild_id, WorldBossLedger(record))
+        return ledger
+
+    async def _checkpoint_world_bosses(self) -> None:
+        """Persist every world boss that has taken damage since its last checkpoint."""
+        for guild_id, ledger in list(self._world_bosses.items()):
+            if not ledger.dirty:
+                continue
+            async with self._guild_lock_for(guild_id):
+                if not ledger.active or self._world_bosses.get(guild_id) is not ledger:
+                    continue
+                ledger.dirty = False
+                await self.config.guild_from_id(guild_id).world_boss.set(ledger.snapshot())
+
+    async def _world_boss_checkpoint_loop(self) -> None:
+        while True:
+            await asyncio.sleep(WORLD_BOSS_CHECKPOINT_SECONDS)
+            try:
+                await self._checkpoint_world_bosses()
+            except Exception:
+                LOGGER.exception("Failed to checkpoint DeepDelve world bosses.")
+
     async def _world_boss_strike(self, interaction: discord.Interaction) -> None:
         if not interaction.guild:
             return
         await interaction.response.defer()
         guild_id = interaction.guild.id
         user_id = interaction.user.id
-        async with self._guild_lock_for(guild_id):
-            record = await self.config.guild(interaction.guild).world_boss()
-            if not record:
-                await interaction.followup.send("The world boss has already fallen.", ephemeral=True)
-                return
-            profile = await self._get_profile(guild_id, user_id)
-            if not profile["created"] or profile.get("hardcore_dead"):
-                await interaction.followup.send(
-                    "You need a living DeepDelve character to join the raid.",
-                    ephemeral=True,
-                )
-                return
-            now = datetime.now(timezone.utc)
-            last_text = record.get("last_attacks", {}).get(str(user_id))
-            if last_text:
-                elapsed = (now - datetime.fromisoformat(last_text)).total_seconds()
-                if elapsed < 30:
-                    await interaction.followup.send(
-                        f"Recover for **{round(30 - elapsed)} more seconds**.",
-                        ephemeral=True,
-                    )
-                    return
-            stats = self._stats(profile)
-            damage = random.randint(stats["attack"] * 2, stats["attack"] * 3 + stats["luck"])
-            damage = round(
-                damage * (1 + int(profile.get("guild_bonus", {}).get("worldboss_percent", 0)) / 100),
+        ledger = await self._world_boss_ledger(guild_id)
+        if not ledger.active:
+            await interaction.followup.send("The world boss has already fallen.", ephemeral=True)
+            return
+        profile = await self._get_profile(guild_id, user_id)
+        if not profile["created"] or profile.get("hardcore_dead"):
+            await interaction.followup.send(
+                "You need a living DeepDelve character to join the raid.",
+                ephemeral=True,
             )
-            record["hp"] = max(0, int(record["hp"]) - damage)
-            record.setdefault("contributions", {})[str(user_id)] = (
-                int(record.get("contributions", {}).get(str(user_id), 0)) + damage
+            return
+        stats = self._stats(profile)
+        damage = random.randint(stats["attack"] * 2, stats["attack"] * 3 + stats["luck"])
+        damage = round(
+            damage * (1 + int(profile.get("guild_bonus", {}).get("worldboss_percent", 0)) / 100),
+        )
+        now = datetime.now(timezone.utc)
+        outcome = ledger.strike(user_id, damage, now)
+        if outcome == "fallen":
+            await interaction.followup.send("The world boss has already fallen.", ephemeral=True)
+            return
+        if outcome == "cooldown":
+            await interaction.followup.send(
+                f"Recover for **{round(ledger.cooldown_remaining(user_id, now))} more seconds**.",
+                ephemeral=True,
             )
-            record.setdefault("last_attacks", {})[str(user_id)] = now.isoformat()
-            defeated = record["hp"] <= 0
-            if defeated:
-                contributions = record["contributions"]
-                total_damage = max(1, sum(int(value) for value in contributions.values()))
-                reward_lines = []
-                guild_renown: dict[str, int] = {}
-                for member_id_text, contribution in contributions.items():
-                    member_id = int(member_id_text)
-                    member = interaction.guild.get_member(member_id)
-                    if not member:
-                        continue
-                    member_profile = await self._get_profile(guild_id, member_id)
-                    starting_gold = member_profile["gold"]
-                    share = int(contribution) / total_damage
-                    reward = 200 + round(record["max_hp"] * 0.12 * share)
-                    member_profile["gold"] += reward
-                    member_profile["xp"] += 150 + round(250 * share)
-                    member_profile["season_points"] += 75
-                    if member_profile.get("player_guild_id"):
-                        guild_code = member_profile["player_guild_id"]
-                        guild_renown[guild_code] = guild_renown.get(guild_code, 0) + max(
-                            1,
-                            round(int(contribution) / 10),
-                        )
-                    levels = self._apply_level_ups(member_profile)
-                    await self._save_profile(
-                        guild_id,
-                        member_id,
-                        member_profile,
-                        starting_gold,
-                    )
-                    reward_lines.append(
-                        f"<@{member_id}> — {self._money(member_profile, reward)}"
-                        + (f" • {len(levels)} level-up(s)" if levels else ""),
-                    )
-                if guild_renown:
-                    player_guilds = await self.config.guild(interaction.guild).player_guilds()
-                    for guild_code, renown in guild_renown.items():
-                        if guild_code in player_guilds:
-                            player_guilds[guild_code]["renown"] += renown
-                    await self.config.guild(interaction.guild).player_guilds.set(player_guilds)
-                await self.config.guild(interaction.guild).world_boss.set({})
-                await self.config.guild(interaction.guild).world_boss_defeated_at.set(
-                    datetime.now(timezone.utc).isoformat(),
-                )
-                embed = discord.Embed(
-                    title=f"🏆 WORLD BOSS DEFEATED — {record['name']}",
-                    description=(f"<@{user_id}> delivers the final **{damage} damage**!\n\n" + "\n".join(reward_lines[:15])),
-                    color=GOLD_COLOR,
-                )
-                await interaction.edit_original_response(embed=embed, view=None)
-                return
-            await self.config.guild(interaction.guild).world_boss.set(record)
-        embed = self._world_boss_embed(record)
+            return
+        if outcome == "killed":
+            await self._resolve_world_boss(interaction, ledger, damage)
+            return
+        embed = self._world_boss_embed(ledger.record)
         embed.description = f"<@{user_id}> deals **{damage} raid damage**!\n\n" + embed.description
         await interaction.edit_original_response(embed=embed, view=WorldBossView(self))
 
+    async def _resolve_world_boss(self, interaction: discord.Interaction, ledger: WorldBossLedger, damage: int) -> None:
+        """Pay out a defeated world boss; only the killing strike reaches this."""
+        guild_id = interaction.guild.id
+        record = ledger.record
+        async with self._guild_lock_for(guild_id):
+            reward_lines = []
+            guild_renown: dict[str, int] = {}
+            for member_id, rewards in world_boss_rewards(record).items():
+                member = interaction.guild.get_member(member_id)
+                if not member:
+                    continue
+                member_profile = await self._get_profile(guild_id, member_id)
+                starting_gold = member_profile["gold"]
+                member_profile["gold"] += rewards["gold"]
+                member_profile["xp"] += rewards["xp"]
+                member_profile["season_points"] += rewards["season_points"]
+                if member_profile.get("player_guild_id"):
+                    guild_code = member_profile["player_guild_id"]
+                    guild_renown[guild_code] = guild_renown.get(guild_code, 0) + rewards["renown"]
+                levels = self._apply_level_ups(member_profile)
+                await self._save_profile(
+                    guild_id,
+                    member_id,
+                    member_profile,
+                    starting_gold,
+                )
+                reward_lines.append(
+                    f"<@{member_id}> — {self._money(member_profile, rewards['gold'])}"
+                    + (f" • {len(levels)} level-up(s)" if levels else ""),
+                )
+            for guild_code, renown in guild_renown.items():
+                player_guild = await self._social.get_record(guild_id, "player_guild", guild_code)
+                if player_guild:
+                    player_guild["renown"] += renown
+                    await self._social.save_record(guild_id, "player_guild", guild_code, player_guild)
+            await self.config.guild(interaction.guild).world_boss.set({})
+            await self.config.guild(interaction.guild).world_boss_defeated_at.set(ledger.defeated_at.isoformat())
+        embed = discord.Embed(
+            title=f"🏆 WORLD BOSS DEFEATED — {record['name']}",
+            description=(f"<@{interaction.user.id}> delivers the final **{damage} damage**!\n\n" + "\n".join(reward_lines[:15])),
+            color=GOLD_COLOR,
+        )
+        await interaction.edit_original_response(embed=embed, view=None)
+
     @commands.hybrid_group(name="deepdelve", aliases=["delve"], invoke_without_command=True)
     @commands.guild_only()
     async def deepdelve(self, ctx: commands.Context) -> None:
@@ -8070,7 +8202,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         if not profile["created"]:
             await ctx.send(f"{member.display_name} has not created a DeepDelve character.")
             return
-        await ctx.send(embed=self._profile_embed(member, profile))
+        await ctx.send(embed=self._cached_profile_embed(ctx.guild.id, member, profile))
 
     @deepdelve.group(name="progression", aliases=["path"], invoke_without_command=True)
     @commands.guild_only()
@@ -8319,7 +8451,13 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         if not profile:
             return
         await ctx.send(
-            embed=self._inventory_embed(profile),
+            embed=self._cached_embed(
+                ctx.guild.id,
+                ctx.author.id,
+                profile,
+                ("inventory", None),
+                lambda: self._inventory_embed(profile),
+            ),
             view=InventoryView(self, ctx.author.id, profile),
         )
 
@@ -9194,8 +9332,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         if not profile["party_id"]:
             await ctx.send("You are not in a party. Use `/deepdelve party create` or `join`.")
             return
-        parties = await self.config.guild(ctx.guild).parties()
-        party = parties.get(profile["party_id"])
+        party = await self._social.get_record(ctx.guild.id, "party", profile["party_id"])
         if not party:
             await ctx.send("Your former party no longer exists.")
             return
@@ -9223,13 +9360,16 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             await ctx.send("Leave your current party first.")
             return
         async with self._guild_lock_for(ctx.guild.id):
-            parties = await self.config.guild(ctx.guild).parties()
-            code = short_code("P", parties)
-            parties[code] = {"leader": ctx.author.id, "members": [ctx.author.id]}
-            await self.config.guild(ctx.guild).parties.set(parties)
+            code = await self._social.create_record(
+                ctx.guild.id,
+                "party",
+                "P",
+                {"leader": ctx.author.id, "members": [ctx.author.id]},
+            )
             profile["party_id"] = code
             profile["party_bonus"] = party_bonus(1)
             await self.config.member(ctx.author).set(profile)
+            self._render_cache.bump(ctx.guild.id, ctx.author.id)
         await ctx.send(f"🧭 Created party **{code}**. Others can join with `/deepdelve party join {code}`.")
 
     @party_group.command(name="join")
@@ -9244,8 +9384,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             return
         code = code.upper()
         async with self._guild_lock_for(ctx.guild.id):
-            parties = await self.config.guild(ctx.guild).parties()
-            party = parties.get(code)
+            party = await self._social.get_record(ctx.guild.id, "party", code)
             if not party:
                 await ctx.send("No party uses that code.")
                 return
@@ -9253,10 +9392,10 @@ class DeepDelve(DashboardIntegration, commands.Cog):
                 await ctx.send("That party already has four members.")
                 return
             party["members"].append(ctx.author.id)
-            parties[code] = party
-            await self.config.guild(ctx.guild).parties.set(parties)
+            await self._social.save_record(ctx.guild.id, "party", code, party)
             profile["party_id"] = code
             await self.config.member(ctx.author).set(profile)
+            self._render_cache.bump(ctx.guild.id, ctx.author.id)
             await self._sync_party_bonuses(ctx.guild.id, party["members"])
         await ctx.send(f"🧭 Joined party **{code}** with {len(party['members'])} members.")
 
@@ -9269,23 +9408,22 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             await ctx.send("You are not in a party.")
             return
         async with self._guild_lock_for(ctx.guild.id):
-            parties = await self.config.guild(ctx.guild).parties()
             code = profile["party_id"]
-            party = parties.get(code)
+            party = await self._social.get_record(ctx.guild.id, "party", code)
             if party:
                 party["members"] = [member_id for member_id in party["members"] if member_id != ctx.author.id]
                 if not party["members"]:
-                    parties.pop(code, None)
+                    await self._social.delete_record(ctx.guild.id, "party", code)
                 else:
                     if party["leader"] == ctx.author.id:
                         party["leader"] = party["members"][0]
-                    parties[code] = party
+                    await self._social.save_record(ctx.guild.id, "party", code, party)
                     await self._sync_party_bonuses(ctx.guild.id, party["members"])
-                await self.config.guild(ctx.guild).parties.set(parties)
             profile["party_id"] = ""
             profile["party_bonus"] = {}
             profile["party_role"] = ""
             await self.config.member(ctx.author).set(profile)
+            self._render_cache.bump(ctx.guild.id, ctx.author.id)
         await ctx.send("You leave the party and continue alone.")
 
     @party_group.command(name="role")
@@ -9308,6 +9446,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             return
         profile["party_role"] = role
         await self.config.member(ctx.author).set(profile)
+        self._render_cache.bump(ctx.guild.id, ctx.author.id)
         await ctx.send(f"🧭 Party role set to **{role.title()}** ({roles[role]}).")
 
     @deepdelve.group(name="auction", invoke_without_command=True)
@@ -9318,31 +9457,58 @@ class DeepDelve(DashboardIntegration, commands.Cog):
 
     @auction_group.command(name="browse")
     @commands.guild_only()
-    async def auction_browse(self, ctx: commands.Context) -> None:
-        """Browse current equipment listings."""
+    async def auction_browse(
+        self,
+        ctx: commands.Context,
+        page: int = 1,
+        rarity: str | None = None,
+        max_price: int | None = None,
+    ) -> None:
+        """Browse listings cheapest first, optionally filtered by rarity or maximum price."""
         if not await self._channel_allowed(ctx):
             return
-        auctions = await self.config.guild(ctx.guild).auctions()
-        if not auctions:
-            await ctx.send("The auction board is empty.")
+        rarity_index = None
+        if rarity:
+            rarity_index = next(
+                (index for index, details in enumerate(RARITIES) if details["name"].casefold() == rarity.casefold()),
+                None,
+            )
+            if rarity_index is None:
+                await ctx.send(f"Choose a rarity: {humanize_list([details['name'] for details in RARITIES])}.")
+                return
+        page = max(1, page)
+        listings, total = await self._social.browse_auctions(
+            ctx.guild.id,
+            offset=(page - 1) * AUCTION_PAGE_SIZE,
+            limit=AUCTION_PAGE_SIZE,
+            rarity_index=rarity_index,
+            max_price=max_price,
+        )
+        if not total:
+            filtered = rarity_index is not None or max_price is not None
+            await ctx.send("No listings match those filters." if filtered else "The auction board is empty.")
+            return
+        pages = max(1, -(-total // AUCTION_PAGE_SIZE))
+        if not listings:
+            await ctx.send(f"The auction board only has {pages} page{'s' if pages != 1 else ''}.")
             return
         currency = (
             await bank.get_currency_name(ctx.guild) if await self.config.guild(ctx.guild).economy_mode() == "bank" else "gold"
         )
         lines = []
-        for auction_id, record in list(auctions.items())[:20]:
+        for record in listings:
             item = record["item"]
             lines.append(
-                f"`{auction_id}` {RARITIES[item.get('rarity_index', 0)]['emoji']} "
+                f"`{record['id']}` {RARITIES[item.get('rarity_index', 0)]['emoji']} "
                 f"**{item['name']}** — {record['price']} {currency} • Seller <@{record['seller']}>",
             )
-        await ctx.send(
-            embed=discord.Embed(
-                title="🏛️ Lastlight Auction House",
-                description="\n".join(lines),
-                color=GOLD_COLOR,
-            ),
+        embed = discord.Embed(
+            title="🏛️ Lastlight Auction House",
+            description="\n".join(lines),
+            color=GOLD_COLOR,
         )
+        embed.set_footer(text=f"Page {page}/{pages} • {total} listing{'s' if total != 1 else ''}")
+        await ctx.send(embed=embed)
 
     @auction_group.command(name="list")
     @commands.guild_only()
@@ -9372,21 +9538,14 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             await ctx.send(f"Listing requires a non-refundable **{self._money(profile, fee)}** auction fee.")
             return
         async with self._guild_lock_for(ctx.guild.id):
-            auctions = await self.config.guild(ctx.guild).auctions()
-            if len(auctions) >= 100:
-                await ctx.send("The auction house has reached its 100-listing limit.")
+            limit = await self.config.guild(ctx.guild).auction_limit()
+            if limit and await self._social.auction_count(ctx.guild.id) >= limit:
+                await ctx.send(f"The auction house has reached this server's {limit}-listing limit.")
                 return
-            auction_id = short_code("A", auctions)
             starting_gold = profile["gold"]
             profile["gold"] -= fee
             item = profile["inventory"].pop(index)
-            auctions[auction_id] = {
-                "seller": ctx.author.id,
-                "item": item,
-                "price": price,
-                "created": datetime.now(timezone.utc).isoformat(),
-            }
-            await self.config.guild(ctx.guild).auctions.set(auctions)
+            auction_id = await self._social.add_auction(ctx.guild.id, ctx.author.id, item, price)
             await self._save_profile(ctx.guild.id, ctx.author.id, profile, starting_gold)
         await ctx.send(
             f"Listed **{item['name']}** as `{auction_id}` for **{self._money(profile, price)}**. "
@@ -9402,8 +9561,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             return
         auction_id = auction_id.upper()
         async with self._guild_lock_for(ctx.guild.id):
-            auctions = await self.config.guild(ctx.guild).auctions()
-            record = auctions.get(auction_id)
+            record = await self._social.get_auction(ctx.guild.id, auction_id)
             if not record:
                 await ctx.send("That auction no longer exists.")
                 return
@@ -9422,14 +9580,15 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             if buyer["gold"] < record["price"]:
                 await ctx.send(f"You need **{self._money(buyer, record['price'])}**.")
                 return
+            if not await self._social.take_auction(ctx.guild.id, auction_id, seller_id=seller_member.id):
+                await ctx.send("That auction no longer exists.")
+                return
             buyer_start = buyer["gold"]
             seller_start = seller["gold"]
             buyer["gold"] -= record["price"]
             seller["gold"] += record["price"]
             buyer["inventory"].append(record["item"])
             self._record_item(buyer, record["item"])
-            auctions.pop(auction_id)
-            await self.config.guild(ctx.guild).auctions.set(auctions)
             await self._save_profile(ctx.guild.id, ctx.author.id, buyer, buyer_start)
             await self._save_profile(ctx.guild.id, seller_member.id, seller, seller_start)
         await ctx.send(
@@ -9444,19 +9603,17 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         if not profile:
             return
         auction_id = auction_id.upper()
+        if len(profile["inventory"]) >= 25:
+            await ctx.send("Make room in your inventory before cancelling.")
+            return
         async with self._guild_lock_for(ctx.guild.id):
-            auctions = await self.config.guild(ctx.guild).auctions()
-            record = auctions.get(auction_id)
-            if not record or record["seller"] != ctx.author.id:
+            record = await self._social.take_auction(ctx.guild.id, auction_id, seller_id=ctx.author.id)
+            if not record:
                 await ctx.send("That is not one of your active listings.")
                 return
-            if len(profile["inventory"]) >= 25:
-                await ctx.send("Make room in your inventory before cancelling.")
-                return
             profile["inventory"].append(record["item"])
-            auctions.pop(auction_id)
-            await self.config.guild(ctx.guild).auctions.set(auctions)
             await self.config.member(ctx.author).set(profile)
+            self._render_cache.bump(ctx.guild.id, ctx.author.id)
         await ctx.send(f"Cancelled `{auction_id}` and recovered **{record['item']['name']}**.")
 
     @deepdelve.group(name="guild", invoke_without_command=True)
@@ -9466,8 +9623,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         profile = await self._require_character(ctx)
         if not profile:
             return
-        guilds = await self.config.guild(ctx.guild).player_guilds()
-        record = guilds.get(profile["player_guild_id"])
+        record = await self._social.get_record(ctx.guild.id, "player_guild", profile["player_guild_id"])
         if not record:
             await ctx.send("You are guildless. Use `/deepdelve guild create` or `join`.")
             return
@@ -9504,24 +9660,26 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             await ctx.send(f"Founding a guild costs **{self._money(profile, cost)}**.")
             return
         async with self._guild_lock_for(ctx.guild.id):
-            guilds = await self.config.guild(ctx.guild).player_guilds()
-            if any(record["name"].casefold() == name.strip().casefold() for record in guilds.values()):
+            if await self._social.name_taken(ctx.guild.id, "player_guild", name):
                 await ctx.send("A player guild already uses that name.")
                 return
-            code = short_code("G", guilds)
+            code = await self._social.create_record(
+                ctx.guild.id,
+                "player_guild",
+                "G",
+                {
+                    "name": name.strip(),
+                    "owner": ctx.author.id,
+                    "members": [ctx.author.id],
+                    "treasury": 0,
+                    "renown": 0,
+                    "level": 1,
+                    "vault": [],
+                },
+            )
             starting_gold = profile["gold"]
             profile["gold"] -= cost
             profile["player_guild_id"] = code
-            guilds[code] = {
-                "name": name.strip(),
-                "owner": ctx.author.id,
-                "members": [ctx.author.id],
-                "treasury": 0,
-                "renown": 0,
-                "level": 1,
-                "vault": [],
-            }
-            await self.config.guild(ctx.guild).player_guilds.set(guilds)
             await self._save_profile(ctx.guild.id, ctx.author.id, profile, starting_gold)
             await self._sync_player_guild_bonuses(ctx.guild.id, [ctx.author.id], 1)
         await ctx.send(f"🏰 Founded **{name.strip()}** with recruitment code `{code}`.")
@@ -9538,8 +9696,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             return
         code = code.upper()
         async with self._guild_lock_for(ctx.guild.id):
-            guilds = await self.config.guild(ctx.guild).player_guilds()
-            record = guilds.get(code)
+            record = await self._social.get_record(ctx.guild.id, "player_guild", code)
             if not record:
                 await ctx.send("No player guild uses that code.")
                 return
@@ -9547,10 +9704,10 @@ class DeepDelve(DashboardIntegration, commands.Cog):
                 await ctx.send("That guild has reached its 50-member limit.")
                 return
             record["members"].append(ctx.author.id)
-            guilds[code] = record
             profile["player_guild_id"] = code
-            await self.config.guild(ctx.guild).player_guilds.set(guilds)
+            await self._social.save_record(ctx.guild.id, "player_guild", code, record)
             await self.config.member(ctx.author).set(profile)
+            self._render_cache.bump(ctx.guild.id, ctx.author.id)
             await self._sync_player_guild_bonuses(
                 ctx.guild.id,
                 record["members"],
@@ -9570,8 +9727,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             await ctx.send("Choose a positive amount you can afford.")
             return
         async with self._guild_lock_for(ctx.guild.id):
-            guilds = await self.config.guild(ctx.guild).player_guilds()
-            record = guilds.get(profile["player_guild_id"])
+            record = await self._social.get_record(ctx.guild.id, "player_guild", profile["player_guild_id"])
             if not record:
                 await ctx.send("Your guild record no longer exists.")
                 return
@@ -9584,8 +9740,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
                 record["renown"] -= record["level"] * 1000
                 record["level"] += 1
                 levels.append(record["level"])
-            guilds[profile["player_guild_id"]] = record
-            await self.config.guild(ctx.guild).player_guilds.set(guilds)
+            await self._social.save_record(ctx.guild.id, "player_guild", profile["player_guild_id"], record)
             await self._save_profile(ctx.guild.id, ctx.author.id, profile, starting_gold)
             await self._sync_player_guild_bonuses(
                 ctx.guild.id,
@@ -9606,21 +9761,20 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             await ctx.send("You are not in a player guild.")
             return
         async with self._guild_lock_for(ctx.guild.id):
-            guilds = await self.config.guild(ctx.guild).player_guilds()
             code = profile["player_guild_id"]
-            record = guilds.get(code)
+            record = await self._social.get_record(ctx.guild.id, "player_guild", code)
             if record:
                 record["members"] = [member_id for member_id in record["members"] if member_id != ctx.author.id]
                 if not record["members"]:
-                    guilds.pop(code, None)
+                    await self._social.delete_record(ctx.guild.id, "player_guild", code)
                 else:
                     if record["owner"] == ctx.author.id:
                         record["owner"] = record["members"][0]
-                    guilds[code] = record
-                await self.config.guild(ctx.guild).player_guilds.set(guilds)
+                    await self._social.save_record(ctx.guild.id, "player_guild", code, record)
             profile["player_guild_id"] = ""
             profile["guild_bonus"] = {}
             await self.config.member(ctx.author).set(profile)
+            self._render_cache.bump(ctx.guild.id, ctx.author.id)
         await ctx.send("You leave your player guild.")
 
     @player_guild_group.command(name="leaderboard")
@@ -9629,16 +9783,12 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         """Rank player guilds by level, renown, and treasury."""
         if not await self._channel_allowed(ctx):
             return
-        guilds = await self.config.guild(ctx.guild).player_guilds()
-        rankings = sorted(
-            guilds.items(),
-            key=lambda entry: (
-                int(entry[1]["level"]),
-                int(entry[1]["renown"]),
-                int(entry[1]["treasury"]),
-            ),
-            reverse=True,
-        )[:10]
+        rankings = await self._social.ranked_records(
+            ctx.guild.id,
+            "player_guild",
+            ("level", "renown", "treasury"),
+            limit=10,
+        )
         lines = [
             f"`#{index}` **{record['name']}** — Level {record['level']} • "
             f"{record['renown']} renown • {len(record['members'])} members"
@@ -9660,8 +9810,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         if not profile or not profile["player_guild_id"]:
             await ctx.send("You are not in a player guild.")
             return
-        guilds = await self.config.guild(ctx.guild).player_guilds()
-        record = guilds.get(profile["player_guild_id"], {})
+        record = await self._social.get_record(ctx.guild.id, "player_guild", profile["player_guild_id"]) or {}
         vault = record.get("vault", [])
         lines = [f"`{item['id']}` {RARITIES[item.get('rarity_index', 0)]['emoji']} **{item['name']}**" for item in vault]
         await ctx.send(
@@ -9691,8 +9840,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             await ctx.send("That item is favorited. Unfavorite it before depositing it.")
             return
         async with self._guild_lock_for(ctx.guild.id):
-            guilds = await self.config.guild(ctx.guild).player_guilds()
-            record = guilds.get(profile["player_guild_id"])
+            record = await self._social.get_record(ctx.guild.id, "player_guild", profile["player_guild_id"])
             if not record:
                 await ctx.send("Your guild record no longer exists.")
                 return
@@ -9702,9 +9850,9 @@ class DeepDelve(DashboardIntegration, commands.Cog):
                 return
             item = profile["inventory"].pop(index)
             vault.append(item)
-            guilds[profile["player_guild_id"]] = record
-            await self.config.guild(ctx.guild).player_guilds.set(guilds)
+            await self._social.save_record(ctx.guild.id, "player_guild", profile["player_guild_id"], record)
             await self.config.member(ctx.author).set(profile)
+            self._render_cache.bump(ctx.guild.id, ctx.author.id)
         await ctx.send(f"🔐 Deposited **{item['name']}** into the guild vault.")
 
     @player_guild_group.command(name="withdraw")
@@ -9719,8 +9867,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             await ctx.send("Your inventory is full.")
             return
         async with self._guild_lock_for(ctx.guild.id):
-            guilds = await self.config.guild(ctx.guild).player_guilds()
-            record = guilds.get(profile["player_guild_id"])
+            record = await self._social.get_record(ctx.guild.id, "player_guild", profile["player_guild_id"])
             if not record or record["owner"] != ctx.author.id:
                 await ctx.send("Only the guildmaster can withdraw shared equipment.")
                 return
@@ -9734,9 +9881,9 @@ class DeepDelve(DashboardIntegration, commands.Cog):
                 return
             item = vault.pop(index)
             profile["inventory"].append(item)
-            guilds[profile["player_guild_id"]] = record
-            await self.config.guild(ctx.guild).player_guilds.set(guilds)
+            await self._social.save_record(ctx.guild.id, "player_guild", profile["player_guild_id"], record)
             await self.config.member(ctx.author).set(profile)
+            self._render_cache.bump(ctx.guild.id, ctx.author.id)
         await ctx.send(f"🔓 Withdrew **{item['name']}** from the guild vault.")
 
     @deepdelve.group(name="arena", invoke_without_command=True)
@@ -9772,17 +9919,19 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             await ctx.send("Choose a wager you can currently afford.")
             return
         async with self._guild_lock_for(ctx.guild.id):
-            arenas = await self.config.guild(ctx.guild).arenas()
-            duel_id = short_code("D", arenas)
+            duel_id = await self._social.create_record(
+                ctx.guild.id,
+                "arena",
+                "D",
+                {
+                    "challenger": ctx.author.id,
+                    "opponent": opponent.id,
+                    "wager": wager,
+                    "status": "pending",
+                },
+            )
             starting_gold = challenger["gold"]
             challenger["gold"] -= wager
-            arenas[duel_id] = {
-                "challenger": ctx.author.id,
-                "opponent": opponent.id,
-                "wager": wager,
-                "status": "pending",
-            }
-            await self.config.guild(ctx.guild).arenas.set(arenas)
             await self._save_profile(ctx.guild.id, ctx.author.id, challenger, starting_gold)
         await ctx.send(
             f"⚔️ {opponent.mention}, **{ctx.author.display_name}** challenges you as `{duel_id}` "
@@ -9796,8 +9945,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         """Accept and resolve a pending arena challenge."""
         duel_id = duel_id.upper()
         async with self._guild_lock_for(ctx.guild.id):
-            arenas = await self.config.guild(ctx.guild).arenas()
-            duel = arenas.get(duel_id)
+            duel = await self._social.get_record(ctx.guild.id, "arena", duel_id)
             if not duel or duel["status"] != "pending" or duel["opponent"] != ctx.author.id:
                 await ctx.send("That is not a pending challenge addressed to you.")
                 return
@@ -9825,8 +9973,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             loser["arena_losses"] += 1
             winner["season_points"] += 15
             winner["gold"] += duel["wager"] * 2
-            arenas.pop(duel_id)
-            await self.config.guild(ctx.guild).arenas.set(arenas)
+            await self._social.delete_record(ctx.guild.id, "arena", duel_id)
             await self._save_profile(
                 ctx.guild.id,
                 challenger_member.id,
@@ -9858,8 +10005,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         """Decline a pending challenge and refund its wager."""
         duel_id = duel_id.upper()
         async with self._guild_lock_for(ctx.guild.id):
-            arenas = await self.config.guild(ctx.guild).arenas()
-            duel = arenas.get(duel_id)
+            duel = await self._social.get_record(ctx.guild.id, "arena", duel_id)
             if not duel or duel["opponent"] != ctx.author.id:
                 await ctx.send("That is not a pending challenge addressed to you.")
                 return
@@ -9874,8 +10020,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
                     challenger,
                     starting_gold,
                 )
-            arenas.pop(duel_id)
-            await self.config.guild(ctx.guild).arenas.set(arenas)
+            await self._social.delete_record(ctx.guild.id, "arena", duel_id)
         await ctx.send("The challenge is declined and its wager refunded.")
 
     @arena_group.command(name="cancel")
@@ -9884,16 +10029,14 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         """Cancel your pending challenge and recover its escrowed wager."""
         duel_id = duel_id.upper()
         async with self._guild_lock_for(ctx.guild.id):
-            arenas = await self.config.guild(ctx.guild).arenas()
-            duel = arenas.get(duel_id)
+            duel = await self._social.get_record(ctx.guild.id, "arena", duel_id)
             if not duel or duel["challenger"] != ctx.author.id:
                 await ctx.send("That is not one of your pending challenges.")
                 return
             profile = await self._get_profile(ctx.guild.id, ctx.author.id)
             starting_gold = profile["gold"]
             profile["gold"] += duel["wager"]
-            arenas.pop(duel_id)
-            await self.config.guild(ctx.guild).arenas.set(arenas)
+            await self._social.delete_record(ctx.guild.id, "arena", duel_id)
             await self._save_profile(ctx.guild.id, ctx.author.id, profile, starting_gold)
         await ctx.send("The challenge is cancelled and its wager refunded.")
 
@@ -10169,11 +10312,14 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         if not await self._channel_allowed(ctx):
             return
         async with self._guild_lock_for(ctx.guild.id):
-            record = await self.config.guild(ctx.guild).world_boss()
-            if not record:
-                defeated_at = await self.config.guild(ctx.guild).world_boss_defeated_at()
+            ledger = await self._world_boss_ledger(ctx.guild.id)
+            record = ledger.record
+            if not ledger.active:
+                defeated_at = ledger.defeated_at or await self.config.guild(ctx.guild).world_boss_defeated_at()
                 if defeated_at:
-                    elapsed = datetime.now(timezone.utc) - datetime.fromisoformat(defeated_at)
+                    if isinstance(defeated_at, str):
+                        defeated_at = datetime.fromisoformat(defeated_at)
+                    elapsed = datetime.now(timezone.utc) - defeated_at
                     if elapsed.total_seconds() < 86400:
                         remaining = round((86400 - elapsed.total_seconds()) / 3600, 1)
                         await ctx.send(
@@ -10194,6 +10340,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
                     "last_attacks": {},
                     "spawned": datetime.now(timezone.utc).isoformat(),
                 }
+                self._world_bosses[ctx.guild.id] = WorldBossLedger(record)
                 await self.config.guild(ctx.guild).world_boss.set(record)
         await ctx.send(embed=self._world_boss_embed(record), view=WorldBossView(self))
 
@@ -10205,7 +10352,13 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         if profile:
             await self._send_art_embed(
                 ctx,
-                self._chronicle_embed(profile, ctx.guild.id),
+                self._cached_embed(
+                    ctx.guild.id,
+                    ctx.author.id,
+                    profile,
+                    "chronicle",
+                    lambda: self._chronicle_embed(profile, ctx.guild.id),
+                ),
                 "chronicle-campaign.png",
             )
 
@@ -10702,6 +10855,7 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         embed.add_field(name="Adventure Channel", value=channel_text)
         embed.add_field(name="Daily Turns", value=str(data["daily_turns"]))
         embed.add_field(name="Difficulty", value=f"{float(data.get('content_multiplier', 1.0)):.2f}×")
+        embed.add_field(name="Auction Limit", value=str(data["auction_limit"] or "Unlimited"))
         embed.add_field(
             name="Economy",
             value=(
@@ -10791,6 +10945,20 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             "Higher difficulty also modestly increases rewards.",
         )
 
+    @deepdelve_set.command(name="auctionlimit")
+    @commands.guild_only()
+    @commands.admin_or_permissions(manage_guild=True)
+    async def set_auction_limit(self, ctx: commands.Context, limit: int) -> None:
+        """Cap active auction listings for this server, or use 0 for no cap."""
+        if limit < 0:
+            await ctx.send("The auction limit cannot be negative.")
+            return
+        await self.config.guild(ctx.guild).auction_limit.set(limit)
+        if limit:
+            await ctx.send(f"The auction house now accepts up to **{limit}** active listings.")
+        else:
+            await ctx.send("The auction house no longer caps active listings.")
+
     @deepdelve_set.command(name="economy")
     @commands.guild_only()
     @commands.admin_or_permissions(manage_guild=True)
@@ -10814,12 +10982,46 @@ class DeepDelve(DashboardIntegration, commands.Cog):
                 "balance becomes each character's internal balance; Red bank balances are no longer changed.",
             )
 
+    @deepdelve_set.command(name="diagnostics", aliases=["diag"])
+    @commands.guild_only()
+    @commands.admin_or_permissions(manage_guild=True)
+    async def set_diagnostics(self, ctx: commands.Context) -> None:
+        """Show render and artwork cache efficiency since the cog loaded."""
+        renders = self._render_cache
+        embed = discord.Embed(title="🩺 DeepDelve Diagnostics", color=EMBED_COLOR)
+        embed.add_field(
+            name="Screen Render Cache",
+            value=(
+                f"Hit rate **{renders.hit_rate:.0%}**\n"
+                f"{renders.hits} hits • {renders.misses} rebuilds\n"
+                f"{len(renders)} cached screens"
+            ),
+        )
+        lookups = BESTIARY_ART.hits + BESTIARY_ART.misses
+        embed.add_field(
+            name="Bestiary Art",
+            value=(
+                f"Hit rate **{BESTIARY_ART.hits / lookups if lookups else 0:.0%}**\n"
+                f"{len(BESTIARY_ART)} portraits • {BESTIARY_ART.thumbnail_count} thumbnails\n"
+                f"{BESTIARY_ART.cached_bytes // 1024} KiB cached"
+            ),
+        )
+        ledger = self._world_bosses.get(ctx.guild.id)
+        embed.add_field(
+            name="World Boss",
+            value=(
+                ("Unsaved strikes pending" if ledger.dirty else "Checkpointed") if ledger and ledger.active else "No live raid"
+            ),
+        )
+        await ctx.send(embed=embed)
+
     @deepdelve_set.command(name="resetuser")
     @commands.guild_only()
     @commands.admin_or_permissions(manage_guild=True)
     async def reset_user(self, ctx: commands.Context, member: discord.Member) -> None:
         """Delete a member's DeepDelve profile."""
         await self.config.member(member).clear()
+        self._render_cache.bump(ctx.guild.id, member.id)
         await ctx.send(f"Deleted {member.mention}'s DeepDelve character data.")
 
     async def red_get_data_for_user(self, *, user_id: int) -> dict[str, io.BytesIO]:
@@ -10830,29 +11032,13 @@ class DeepDelve(DashboardIntegration, commands.Cog):
             data = members.get(user_id)
             if data and data.get("created"):
                 payload["profiles"][str(guild_id)] = data
+        stored_records = await self._social.user_records(user_id)
+        await self._checkpoint_world_bosses()
         all_guilds = await self.config.all_guilds()
+        for guild_id in stored_records.keys() - all_guilds.keys():
+            payload["social_records"][str(guild_id)] = stored_records[guild_id]
         for guild_id, data in all_guilds.items():
-            social: dict[str, Any] = {}
-            parties = {code: record for code, record in data.get("parties", {}).items() if user_id in record.get("members", [])}
-            auctions = {
-                code: record for code, record in data.get("auctions", {}).items() if int(record.get("seller", 0)) == user_id
-            }
-            player_guilds = {
-                code: record for code, record in data.get("player_guilds", {}).items() if user_id in record.get("members", [])
-            }
-            arenas = {
-                code: record
-                for code, record in data.get("arenas", {}).items()
-                if user_id in {int(record.get("challenger", 0)), int(record.get("opponent", 0))}
-            }
-            if parties:
-                social["parties"] = parties
-            if auctions:
-                social["auctions"] = auctions
-            if player_guilds:
-                social["player_guilds"] = player_guilds
-            if arenas:
-                social["arenas"] = arenas
+            social: dict[str, Any] = dict(stored_records.get(guild_id, {}))
             world_boss = data.get("world_boss", {})
             if str(user_id) in world_boss.get("contributions", {}):
                 social["world_boss"] = {
@@ -10878,43 +11064,26 @@ class DeepDelve(DashboardIntegration, commands.Cog):
     async def red_delete_data_for_user(self, *, requester: str, user_id: int) -> None:
         """Delete all character data belonging to a Discord user."""
         del requester
+        await self._social.delete_user_auctions(user_id)
+        stored_records = await self._social.user_records(user_id)
+        for guild_id, social in stored_records.items():
+            for kind, key, owner_key in (("party", "parties", "leader"), ("player_guild", "player_guilds", "owner")):
+                for code, record in social.get(key, {}).items():
+                    record["members"] = [member_id for member_id in record.get("members", []) if member_id != user_id]
+                    if not record["members"]:
+                        await self._social.delete_record(guild_id, kind, code)
+                        continue
+                    if record.get(owner_key) == user_id:
+                        record[owner_key] = record["members"][0]
+                    await self._social.save_record(guild_id, kind, code, record)
+            for code in social.get("arenas", {}):
+                await self._social.delete_record(guild_id, "arena", code)
+        for ledger in self._world_bosses.values():
+            ledger.forget(user_id)
+        await self._checkpoint_world_bosses()
         all_guilds = await self.config.all_guilds()
         for guild_id, data in all_guilds.items():
             guild_proxy = self.config.guild_from_id(guild_id)
-            parties = data.get("parties", {})
-            for code, record in list(parties.items()):
-                if user_id not in record.get("members", []):
-                    continue
-                record["members"] = [member_id for member_id in record["members"] if member_id != user_id]
-                if not record["members"]:
-                    parties.pop(code)
-                else:
-                    if record.get("leader") == user_id:
-                        record["leader"] = record["members"][0]
-                    parties[code] = record
-            auctions = {
-                code: record for code, record in data.get("auctions", {}).items() if int(record.get("seller", 0)) != user_id
-            }
-            player_guilds = data.get("player_guilds", {})
-            for code, record in list(player_guilds.items()):
-                if user_id not in record.get("members", []):
-                    continue
-                record["members"] = [member_id for member_id in record["members"] if member_id != user_id]
-                if not record["members"]:
-                    player_guilds.pop(code)
-                else:
-                    if record.get("owner") == user_id:
-                        record["owner"] = record["members"][0]
-                    player_guilds[code] = record
-            arenas = {
-                code: record
-                for code, record in data.get("arenas", {}).items()
-                if user_id
-                not in {
-                    int(record.get("challenger", 0)),
-                    int(record.get("opponent", 0)),
-                }
-            }
             world_boss = data.get("world_boss", {})
             world_boss.get("contributions", {}).pop(str(user_id), None)
             world_boss.get("last_attacks", {}).pop(str(user_id), None)
@@ -10924,10 +11093,6 @@ class DeepDelve(DashboardIntegration, commands.Cog):
                 boss: record for boss, record in data.get("server_firsts", {}).items() if int(record.get("user_id", 0)) != user_id
             }
             with contextlib.suppress(Exception):
-                await guild_proxy.parties.set(parties)
-                await guild_proxy.auctions.set(auctions)
-                await guild_proxy.player_guilds.set(player_guilds)
-                await guild_proxy.arenas.set(arenas)
                 await guild_proxy.world_boss.set(world_boss)
                 await guild_proxy.server_firsts.set(firsts)
                 await guild_proxy.town.set(town)
@@ -10935,5 +11100,6 @@ class DeepDelve(DashboardIntegration, commands.Cog):
         for guild_id, members in all_profiles.items():
             if user_id not in members:
                 continue
+            self._render_cache.bump(guild_id, user_id)
             with contextlib.suppress(Exception):
                 await self.config.member_from_ids(guild_id, user_id).clear()
@@ -0,0 +1,84 @@
+"""Memoised embed payloads for DeepDelve's heavy character screens."""
+
+from __future__ import annotations
+
+import copy
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import discord
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+RENDER_CACHE_OWNERS = 512
+
+
+class EmbedRenderCache:
+    """Reuse built embed payloads until the profile they render changes.
+
+    Every delver has a cheap revision counter that profile writes bump. Cached
+    screens are grouped by owner and tagged with the revision they were built
+    at, so one save drops every stale screen for that delver. Lookups return a
+    fresh ``discord.Embed`` over a private copy of the payload, leaving callers
+    free to decorate it.
+    """
+
+    def __init__(self, *, max_owners: int = RENDER_CACHE_OWNERS) -> None:
+        self.max_owners = max(1, int(max_owners))
+        self.hits = 0
+        self.misses = 0
+        self._revisions: dict[tuple[int, int], int] = {}
+        self._screens: OrderedDict[tuple[int, int], tuple[int, dict[Hashable, dict[str, Any]]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return sum(len(screens) for _revision, screens in self._screens.values())
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def revision(self, guild_id: int, user_id: int) -> int:
+        """Return the current profile revision for a delver."""
+        return self._revisions.get((guild_id, user_id), 0)
+
+    def bump(self, guild_id: int, user_id: int) -> int:
+        """Advance a delver's profile revision and drop their cached screens."""
+        owner = (guild_id, user_id)
+        self._revisions[owner] = self._revisions.get(owner, 0) + 1
+        self._screens.pop(owner, None)
+        return self._revisions[owner]
+
+    def render(
+        self,
+        guild_id: int,
+        user_id: int,
+        key: Hashable,
+        build: Callable[[], discord.Embed],
+    ) -> discord.Embed:
+        """Return the cached embed for ``key`` or build and remember it."""
+        owner = (guild_id, user_id)
+        revision = self.revision(guild_id, user_id)
+        cached = self._screens.get(owner)
+        if cached is None or cached[0] != revision:
+            cached = (revision, {})
+            self._screens[owner] = cached
+        self._screens.move_to_end(owner)
+        payload = cached[1].get(key)
+        if payload is None:
+            self.misses += 1
+            embed = build()
+            cached[1][key] = copy.deepcopy(embed.to_dict())
+            while len(self._screens) > self.max_owners:
+                self._screens.popitem(last=False)
+            return embed
+        self.hits += 1
+        return discord.Embed.from_dict(copy.deepcopy(payload))
+
+    def clear(self) -> None:
+        """Drop every cached screen and reset the hit counters."""
+        self._screens.clear()
+        self.hits = 0
+        self.misses = 0
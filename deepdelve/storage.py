@@ -0,0 +1,448 @@
+"""Indexed SQLite storage for DeepDelve's shared social records."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from .systems.social import short_code
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+SOCIAL_KINDS = {
+    "party": "parties",
+    "player_guild": "player_guilds",
+    "arena": "arenas",
+}
+SORTABLE_RECORD_FIELDS = frozenset({"level", "renown", "treasury"})
+
+
+def record_members(kind: str, record: dict[str, Any]) -> set[int]:
+    """Return every member ID a social record references."""
+    if kind == "arena":
+        return {int(record.get(key, 0)) for key in ("challenger", "opponent") if record.get(key)}
+    members = {int(member_id) for member_id in record.get("members", [])}
+    for key in ("leader", "owner"):
+        if record.get(key):
+            members.add(int(record[key]))
+    return members
+
+
+class SocialStore:
+    """Small asynchronous wrapper around DeepDelve's auction and social tables.
+
+    Auctions are indexed by price, rarity, and seller so the board can page
+    without loading every listing. Parties, player guilds, and arena duels are
+    stored as one row per record with a member index for privacy requests.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = asyncio.Lock()
+
+    async def initialize(self) -> None:
+        await asyncio.to_thread(self._initialize_sync)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=5)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA busy_timeout = 5000")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    def _initialize_sync(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                CREATE TABLE IF NOT EXISTS auctions (
+                    guild_id INTEGER NOT NULL,
+                    auction_id TEXT NOT NULL,
+                    seller_id INTEGER NOT NULL,
+                    price INTEGER NOT NULL,
+                    rarity_index INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    item_json TEXT NOT NULL,
+                    PRIMARY KEY (guild_id, auction_id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_auctions_guild_price
+                    ON auctions(guild_id, price, auction_id);
+                CREATE INDEX IF NOT EXISTS idx_auctions_guild_rarity_price
+                    ON auctions(guild_id, rarity_index, price);
+                CREATE INDEX IF NOT EXISTS idx_auctions_seller
+                    ON auctions(seller_id, guild_id);
+                CREATE TABLE IF NOT EXISTS social_records (
+                    guild_id INTEGER NOT NULL,
+                    kind TEXT NOT NULL,
+                    code TEXT NOT NULL,
+                    name TEXT NOT NULL DEFAULT '',
+                    record_json TEXT NOT NULL,
+                    PRIMARY KEY (guild_id, kind, code)
+                );
+                CREATE INDEX IF NOT EXISTS idx_social_records_name
+                    ON social_records(guild_id, kind, name);
+                CREATE TABLE IF NOT EXISTS social_members (
+                    guild_id INTEGER NOT NULL,
+                    kind TEXT NOT NULL,
+                    code TEXT NOT NULL,
+                    member_id INTEGER NOT NULL,
+                    PRIMARY KEY (guild_id, kind, code, member_id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_social_members_member
+                    ON social_members(member_id, guild_id);
+                """,
+            )
+
+    @staticmethod
+    def _auction_row(row: sqlite3.Row) -> dict[str, Any]:
+        return {
+            "id": row["auction_id"],
+            "seller": row["seller_id"],
+            "price": row["price"],
+            "created": row["created_at"],
+            "item": json.loads(row["item_json"]),
+        }
+
+    @staticmethod
+    def _insert_auction(
+        connection: sqlite3.Connection,
+        guild_id: int,
+        auction_id: str,
+        record: dict[str, Any],
+    ) -> bool:
+        item = record["item"]
+        cursor = connection.execute(
+            """
+            INSERT OR IGNORE INTO auctions (
+                guild_id, auction_id, seller_id, price, rarity_index, created_at, item_json
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                guild_id,
+                auction_id,
+                int(record["seller"]),
+                int(record["price"]),
+                int(item.get("rarity_index", 0)),
+                str(record.get("created") or datetime.now(timezone.utc).isoformat()),
+                json.dumps(item, ensure_ascii=False),
+            ),
+        )
+        return cursor.rowcount == 1
+
+    @staticmethod
+    def _write_record(
+        connection: sqlite3.Connection,
+        guild_id: int,
+        kind: str,
+        code: str,
+        record: dict[str, Any],
+        *,
+        replace: bool = True,
+    ) -> bool:
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        cursor = connection.execute(
+            f"{verb} INTO social_records (guild_id, kind, code, name, record_json) VALUES (?, ?, ?, ?, ?)",
+            (guild_id, kind, code, str(record.get("name", "")).casefold(), json.dumps(record, ensure_ascii=False)),
+        )
+        if cursor.rowcount != 1:
+            return False
+        connection.execute(
+            "DELETE FROM social_members WHERE guild_id = ? AND kind = ? AND code = ?",
+            (guild_id, kind, code),
+        )
+        connection.executemany(
+            "INSERT INTO social_members (guild_id, kind, code, member_id) VALUES (?, ?, ?, ?)",
+            [(guild_id, kind, code, member_id) for member_id in record_members(kind, record)],
+        )
+        return True
+
+    async def import_guild(self, guild_id: int, data: dict[str, Any]) -> int:
+        """Copy legacy Config auctions and social records into the store."""
+        async with self._lock:
+            return await asyncio.to_thread(self._import_guild_sync, guild_id, data)
+
+    def _import_guild_sync(self, guild_id: int, data: dict[str, Any]) -> int:
+        imported = 0
+        with self._connect() as connection:
+            for auction_id, record in data.get("auctions", {}).items():
+                if isinstance(record, dict) and record.get("item"):
+                    imported += self._insert_auction(connection, guild_id, str(auction_id), record)
+            for kind, key in SOCIAL_KINDS.items():
+                for code, record in data.get(key, {}).items():
+                    if isinstance(record, dict):
+                        imported += self._write_record(connection, guild_id, kind, str(code), record, replace=False)
+        return imported
+
+    async def migrate_items(self, version: int, migrate: Callable[[dict[str, Any]], bool]) -> int:
+        """Upgrade stored auction and guild vault items once per item schema version.
+
+        The applied version is kept in SQLite's ``user_version`` and written in
+        the same transaction as the rewritten rows.
+        """
+        async with self._lock:
+            return await asyncio.to_thread(self._migrate_items_sync, version, migrate)
+
+    def _migrate_items_sync(self, version: int, migrate: Callable[[dict[str, Any]], bool]) -> int:
+        changed = 0
+        with self._connect() as connection:
+            if int(connection.execute("PRAGMA user_version").fetchone()[0]) >= version:
+                return 0
+            for row in connection.execute("SELECT guild_id, auction_id, item_json FROM auctions").fetchall():
+                item = json.loads(row["item_json"])
+                if migrate(item):
+                    connection.execute(
+                        "UPDATE auctions SET item_json = ?, rarity_index = ? WHERE guild_id = ? AND auction_id = ?",
+                        (
+                            json.dumps(item, ensure_ascii=False),
+                            int(item.get("rarity_index", 0)),
+                            row["guild_id"],
+                            row["auction_id"],
+                        ),
+                    )
+                    changed += 1
+            rows = connection.execute(
+                "SELECT guild_id, code, record_json FROM social_records WHERE kind = 'player_guild'",
+            ).fetchall()
+            for row in rows:
+                record = json.loads(row["record_json"])
+                if [item for item in record.get("vault", []) if migrate(item)]:
+                    connection.execute(
+                        "UPDATE social_records SET record_json = ? WHERE guild_id = ? AND kind = 'player_guild' AND code = ?",
+                        (json.dumps(record, ensure_ascii=False), row["guild_id"], row["code"]),
+                    )
+                    changed += 1
+            connection.execute(f"PRAGMA user_version = {int(version)}")
+        return changed
+
+    async def auction_count(self, guild_id: int, *, seller_id: int | None = None) -> int:
+        return await asyncio.to_thread(self._auction_count_sync, guild_id, seller_id)
+
+    def _auction_count_sync(self, guild_id: int, seller_id: int | None) -> int:
+        sql = "SELECT COUNT(*) FROM auctions WHERE guild_id = ?"
+        values: list[Any] = [guild_id]
+        if seller_id is not None:
+            sql += " AND seller_id = ?"
+            values.append(seller_id)
+        with self._connect() as connection:
+            return int(connection.execute(sql, values).fetchone()[0])
+
+    async def browse_auctions(
+        self,
+        guild_id: int,
+        *,
+        offset: int = 0,
+        limit: int = 20,
+        rarity_index: int | None = None,
+        max_price: int | None = None,
+        seller_id: int | None = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Return one cheapest-first page of listings and the filtered total."""
+        return await asyncio.to_thread(
+            self._browse_auctions_sync,
+            guild_id,
+            max(0, offset),
+            max(1, min(limit, 100)),
+            rarity_index,
+            max_price,
+            seller_id,
+        )
+
+    def _browse_auctions_sync(
+        self,
+        guild_id: int,
+        offset: int,
+        limit: int,
+        rarity_index: int | None,
+        max_price: int | None,
+        seller_id: int | None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        clauses = ["guild_id = ?"]
+        values: list[Any] = [guild_id]
+        if rarity_index is not None:
+            clauses.append("rarity_index = ?")
+            values.append(rarity_index)
+        if max_price is not None:
+            clauses.append("price <= ?")
+            values.append(max_price)
+        if seller_id is not None:
+            clauses.append("seller_id = ?")
+            values.append(seller_id)
+        where = " AND ".join(clauses)
+        with self._connect() as connection:
+            total = int(connection.execute(f"SELECT COUNT(*) FROM auctions WHERE {where}", values).fetchone()[0])
+            rows = connection.execute(
+                f"SELECT * FROM auctions WHERE {where} ORDER BY price, auction_id LIMIT ? OFFSET ?",
+                [*values, limit, offset],
+            ).fetchall()
+        return [self._auction_row(row) for row in rows], total
+
+    async def get_auction(self, guild_id: int, auction_id: str) -> dict[str, Any] | None:
+        return await asyncio.to_thread(self._get_auction_sync, guild_id, auction_id)
+
+    def _get_auction_sync(self, guild_id: int, auction_id: str) -> dict[str, Any] | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT * FROM auctions WHERE guild_id = ? AND auction_id = ?",
+                (guild_id, auction_id),
+            ).fetchone()
+        return self._auction_row(row) if row is not None else None
+
+    async def add_auction(self, guild_id: int, seller_id: int, item: dict[str, Any], price: int) -> str:
+        """Insert a listing under a fresh code and return the code."""
+        record = {"seller": seller_id, "item": item, "price": price, "created": datetime.now(timezone.utc).isoformat()}
+        async with self._lock:
+            return await asyncio.to_thread(self._add_auction_sync, guild_id, record)
+
+    def _add_auction_sync(self, guild_id: int, record: dict[str, Any]) -> str:
+        with self._connect() as connection:
+            while True:
+                auction_id = short_code("A", ())
+                if self._insert_auction(connection, guild_id, auction_id, record):
+                    return auction_id
+
+    async def take_auction(self, guild_id: int, auction_id: str, *, seller_id: int | None = None) -> dict[str, Any] | None:
+        """Atomically remove a listing, returning it only to the caller that removed it."""
+        async with self._lock:
+            return await asyncio.to_thread(self._take_auction_sync, guild_id, auction_id, seller_id)
+
+    def _take_auction_sync(self, guild_id: int, auction_id: str, seller_id: int | None) -> dict[str, Any] | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT * FROM auctions WHERE guild_id = ? AND auction_id = ?",
+                (guild_id, auction_id),
+            ).fetchone()
+            if row is None or (seller_id is not None and row["seller_id"] != seller_id):
+                return None
+            cursor = connection.execute(
+                "DELETE FROM auctions WHERE guild_id = ? AND auction_id = ?",
+                (guild_id, auction_id),
+            )
+            return self._auction_row(row) if cursor.rowcount == 1 else None
+
+    async def get_record(self, guild_id: int, kind: str, code: str) -> dict[str, Any] | None:
+        return await asyncio.to_thread(self._get_record_sync, guild_id, kind, code)
+
+    def _get_record_sync(self, guild_id: int, kind: str, code: str) -> dict[str, Any] | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT record_json FROM social_records WHERE guild_id = ? AND kind = ? AND code = ?",
+                (guild_id, kind, code),
+            ).fetchone()
+        return json.loads(row["record_json"]) if row is not None else None
+
+    async def create_record(self, guild_id: int, kind: str, prefix: str, record: dict[str, Any]) -> str:
+        """Insert a social record under a fresh code and return the code."""
+        async with self._lock:
+            return await asyncio.to_thread(self._create_record_sync, guild_id, kind, prefix, record)
+
+    def _create_record_sync(self, guild_id: int, kind: str, prefix: str, record: dict[str, Any]) -> str:
+        with self._connect() as connection:
+            while True:
+                code = short_code(prefix, ())
+                if self._write_record(connection, guild_id, kind, code, record, replace=False):
+                    return code
+
+    async def save_record(self, guild_id: int, kind: str, code: str, record: dict[str, Any]) -> None:
+        async with self._lock:
+            await asyncio.to_thread(self._save_record_sync, guild_id, kind, code, record)
+
+    def _save_record_sync(self, guild_id: int, kind: str, code: str, record: dict[str, Any]) -> None:
+        with self._connect() as connection:
+            self._write_record(connection, guild_id, kind, code, record)
+
+    async def delete_record(self, guild_id: int, kind: str, code: str) -> bool:
+        async with self._lock:
+            return await asyncio.to_thread(self._delete_record_sync, guild_id, kind, code)
+
+    def _delete_record_sync(self, guild_id: int, kind: str, code: str) -> bool:
+        with self._connect() as connection:
+            connection.execute(
+                "DELETE FROM social_members WHERE guild_id = ? AND kind = ? AND code = ?",
+                (guild_id, kind, code),
+            )
+            cursor = connection.execute(
+                "DELETE FROM social_records WHERE guild_id = ? AND kind = ? AND code = ?",
+                (guild_id, kind, code),
+            )
+            return cursor.rowcount == 1
+
+    async def name_taken(self, guild_id: int, kind: str, name: str) -> bool:
+        return await asyncio.to_thread(self._name_taken_sync, guild_id, kind, name.strip().casefold())
+
+    def _name_taken_sync(self, guild_id: int, kind: str, name: str) -> bool:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT 1 FROM social_records WHERE guild_id = ? AND kind = ? AND name = ? LIMIT 1",
+                (guild_id, kind, name),
+            ).fetchone()
+        return row is not None
+
+    async def ranked_records(
+        self,
+        guild_id: int,
+        kind: str,
+        fields: tuple[str, ...],
+        *,
+        limit: int = 10,
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Return the top records ordered by numeric fields, highest first."""
+        if not set(fields) <= SORTABLE_RECORD_FIELDS:
+            raise ValueError(f"unsupported ranking fields: {fields}")
+        return await asyncio.to_thread(self._ranked_records_sync, guild_id, kind, fields, max(1, limit))
+
+    def _ranked_records_sync(
+        self,
+        guild_id: int,
+        kind: str,
+        fields: tuple[str, ...],
+        limit: int,
+    ) -> list[tuple[str, dict[str, Any]]]:
+        order = ", ".join(f"CAST(json_extract(record_json, '$.{field}') AS INTEGER) DESC" for field in fields)
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"SELECT code, record_json FROM social_records WHERE guild_id = ? AND kind = ? ORDER BY {order} LIMIT ?",
+                (guild_id, kind, limit),
+            ).fetchall()
+        return [(row["code"], json.loads(row["record_json"])) for row in rows]
+
+    async def user_records(self, user_id: int) -> dict[int, dict[str, dict[str, Any]]]:
+        """Return every auction and social record referencing a user, grouped by guild."""
+        return await asyncio.to_thread(self._user_records_sync, user_id)
+
+    def _user_records_sync(self, user_id: int) -> dict[int, dict[str, dict[str, Any]]]:
+        grouped: dict[int, dict[str, dict[str, Any]]] = {}
+        with self._connect() as connection:
+            for row in connection.execute("SELECT * FROM auctions WHERE seller_id = ?", (user_id,)):
+                record = self._auction_row(row)
+                grouped.setdefault(row["guild_id"], {}).setdefault("auctions", {})[record.pop("id")] = record
+            rows = connection.execute(
+                """
+                SELECT records.guild_id, records.kind, records.code, records.record_json
+                FROM social_members AS members
+                JOIN social_records AS records
+                  ON records.guild_id = members.guild_id
+                 AND records.kind = members.kind
+                 AND records.code = members.code
+                WHERE members.member_id = ?
+                """,
+                (user_id,),
+            ).fetchall()
+        for row in rows:
+            key = SOCIAL_KINDS.get(row["kind"], row["kind"])
+            grouped.setdefault(row["guild_id"], {}).setdefault(key, {})[row["code"]] = json.loads(row["record_json"])
+        return grouped
+
+    async def delete_user_auctions(self, user_id: int) -> int:
+        async with self._lock:
+            return await asyncio.to_thread(self._delete_user_auctions_sync, user_id)
+
+    def _delete_user_auctions_sync(self, user_id: int) -> int:
+        with self._connect() as connection:
+            cursor = connection.execute("DELETE FROM auctions WHERE seller_id = ?", (user_id,))
+            return max(cursor.rowcount, 0)
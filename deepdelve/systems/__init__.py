@@ -30,7 +30,7 @@ from .commissions import (
     research_recipe,
 )
 from .companions import active_companion, companion_bonuses, grant_companion_xp, unlock_companions
-from .content_registry import content_counts, validate_content
+from .content_registry import compile_generation_tables, content_counts, validate_content
 from .dungeon_depth import (
     apply_miniboss,
     create_rumor,
@@ -48,6 +48,7 @@ from .items import (
     apply_item_upgrade,
     dismantle_rewards,
     enchant_cost,
+    enchantments_for,
     equipment_effects,
     equipment_set_bonuses,
     item_detail,
@@ -104,6 +105,7 @@ from .quests import (
     resolve_quest,
     skill_check_chance,
 )
+from .raids import WORLD_BOSS_STRIKE_COOLDOWN, WorldBossLedger, world_boss_rewards
 from .relationships import (
     change_relationship,
     ensure_relationships,
@@ -130,6 +132,8 @@ __all__ = [
     "QUESTS",
     "SANCTUM_ROOMS",
     "TARGET_SINK_RANGE",
+    "WORLD_BOSS_STRIKE_COOLDOWN",
+    "WorldBossLedger",
     "abandon_dungeon",
     "accept_commission",
     "accept_oath",
@@ -161,6 +165,7 @@ __all__ = [
     "commission_board",
     "companion_bonuses",
     "comparison_line",
+    "compile_generation_tables",
     "content_counts",
     "create_nemesis",
     "create_rumor",
@@ -171,6 +176,7 @@ __all__ = [
     "dismantle_rewards",
     "economy_release_gate",
     "enchant_cost",
+    "enchantments_for",
     "ending_recap",
     "ensure_atlas",
     "ensure_commissions",
@@ -259,5 +265,6 @@ __all__ = [
     "use_faction_service",
     "use_moral_power",
     "validate_content",
+    "world_boss_rewards",
     "world_echoes",
 ]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections import Counter
 
+from deepdelve.content import compile_content_tables
 from deepdelve.living_content import (
     CHARACTER_ARCS,
     CONTRACT_TEMPLATES,
@@ -23,6 +24,7 @@ from deepdelve.living_content import (
     TENETS,
 )
 from deepdelve.systems.economy import reward_budget
+from deepdelve.systems.items import compile_item_tables
 
 CONTENT_MINIMUMS = {
     "campaign_scenes": 36,
@@ -70,6 +72,11 @@ def content_counts() -> dict[str, int]:
     }
 
 
+def compile_generation_tables() -> dict[str, dict]:
+    """Rebuild the precomputed enemy, rarity, and item tables after content changes."""
+    return {"content": compile_content_tables(), "items": compile_item_tables()}
+
+
 def validate_content() -> list[str]:
     """Return every content-registry violation."""
     errors = []
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import random
+from functools import lru_cache
 from typing import Any
 
 from deepdelve.advanced_content import ITEM_PREFIXES, ITEM_SETS, ITEM_SUFFIXES, LEGENDARIES
@@ -16,6 +17,40 @@ ENCHANTMENTS = (
     ("Warden Sigil", "warding", "Elite damage is reduced."),
 )
 
+ITEM_TABLES: dict[str, Any] = {}
+
+
+def compile_item_tables() -> dict[str, Any]:
+    """Precompute slot and sigil candidate tables in their authored order."""
+    legendaries: dict[str, list[dict[str, Any]]] = {}
+    for legendary in LEGENDARIES:
+        legendaries.setdefault(legendary["slot"], []).append(legendary)
+    enchantments: dict[str, list[tuple[str, str, str]]] = {}
+    for entry in ENCHANTMENTS:
+        enchantments.setdefault(entry[1], []).append(entry)
+    ITEM_TABLES.clear()
+    ITEM_TABLES["legendaries"] = {slot: tuple(choices) for slot, choices in legendaries.items()}
+    ITEM_TABLES["enchantments"] = {effect: tuple(choices) for effect, choices in enchantments.items()}
+    item_sets_for.cache_clear()
+    return ITEM_TABLES
+
+
+@lru_cache(maxsize=256)
+def item_sets_for(class_key: str, subclass: str = "") -> tuple[tuple[str, dict[str, Any]], ...]:
+    """Return the equipment sets a class and subclass can roll."""
+    return tuple(
+        (key, details)
+        for key, details in ITEM_SETS.items()
+        if class_key in details["classes"] and (not details.get("subclasses") or subclass in details["subclasses"])
+    )
+
+
+def enchantments_for(effect: str | None = None) -> tuple[tuple[str, str, str], ...]:
+    """Return every sigil, or only the sigils granting ``effect``."""
+    if not effect:
+        return ENCHANTMENTS
+    return ITEM_TABLES["enchantments"].get(effect, ())
+
 
 def apply_advanced_itemization(
     item: dict[str, Any],
@@ -52,11 +87,7 @@ def apply_advanced_itemization(
         item["effect_description"] = suffix["description"]
 
     if rarity >= 3 and rng.random() < 0.35:
-        valid_sets = [
-            (key, details)
-            for key, details in ITEM_SETS.items()
-            if class_key in details["classes"] and (not details.get("subclasses") or subclass in details["subclasses"])
-        ]
+        valid_sets = item_sets_for(class_key, subclass)
         if valid_sets:
             set_key, details = rng.choice(valid_sets)
             item["set"] = set_key
@@ -64,7 +95,7 @@ def apply_advanced_itemization(
 
     legendary_chance = 0.08 + min(0.12, floor * 0.002)
     if rarity == 4 and rng.random() < legendary_chance:
-        choices = [legendary for legendary in LEGENDARIES if legendary["slot"] == item["slot"]]
+        choices = ITEM_TABLES["legendaries"].get(item["slot"], ())
         if choices:
             legendary = dict(rng.choice(choices))
             item["name"] = legendary["name"]
@@ -203,3 +234,6 @@ def item_detail(item: dict[str, Any]) -> str:
     if item.get("cursed"):
         lines.append("🩸 Cursed — cannot be unequipped once worn until cleansed")
     return "\n".join(lines)
+
+
+compile_item_tables()
@@ -61,6 +61,11 @@ def _migrate_item_enchantment(item: dict[str, Any] | None) -> bool:
     return True
 
 
+def migrate_item(item: dict[str, Any] | None) -> bool:
+    """Upgrade one stored item in place, wherever it is kept."""
+    return _migrate_item_enchantment(item)
+
+
 def _migrate_bestiary(profile: dict[str, Any]) -> bool:
     """Merge legacy affixed creatures and add variant/floor metadata."""
     old = profile.get("bestiary", {})
@@ -243,7 +248,7 @@ def migrate_profile(profile: dict[str, Any]) -> bool:
                 discoveries.append(slot)
                 changed = True
     for item in owned_items:
-        if _migrate_item_enchantment(item):
+        if migrate_item(item):
             changed = True
     if _migrate_bestiary(profile):
         changed = True
@@ -290,7 +295,7 @@ def migrate_guild(data: dict[str, Any]) -> bool:
     stored_items = [record.get("item") for record in data.get("auctions", {}).values()]
     stored_items.extend(item for record in data.get("player_guilds", {}).values() for item in record.get("vault", []))
     for item in stored_items:
-        if _migrate_item_enchantment(item):
+        if migrate_item(item):
             changed = True
     if int(data.get("schema_version", 0)) != GUILD_SCHEMA_VERSION:
         data["schema_version"] = GUILD_SCHEMA_VERSION
@@ -0,0 +1,86 @@
+"""Server-wide world-boss raid state and reward math."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+WORLD_BOSS_STRIKE_COOLDOWN = 30
+
+
+class WorldBossLedger:
+    """Hold one server's live world boss in memory between Config checkpoints.
+
+    Strikes are applied synchronously, so concurrent raid clicks on the event
+    loop cannot interleave mid-update and never queue behind a storage write.
+    Exactly one strike, the one that takes the boss to zero health, is told it
+    landed the kill; every later strike sees a fallen boss.
+    """
+
+    def __init__(self, record: dict[str, Any] | None = None) -> None:
+        self.record: dict[str, Any] = record or {}
+        self.dirty = False
+        self.defeated_at: datetime | None = None
+
+    @property
+    def active(self) -> bool:
+        """Return whether the boss can still be struck."""
+        return bool(self.record) and self.defeated_at is None
+
+    def cooldown_remaining(self, user_id: int, now: datetime) -> float:
+        """Return how many seconds a delver must still wait before striking."""
+        last_text = self.record.get("last_attacks", {}).get(str(user_id))
+        if not last_text:
+            return 0.0
+        elapsed = (now - datetime.fromisoformat(last_text)).total_seconds()
+        return max(0.0, WORLD_BOSS_STRIKE_COOLDOWN - elapsed)
+
+    def strike(self, user_id: int, damage: int, now: datetime) -> str:
+        """Apply one strike and return ``fallen``, ``cooldown``, ``hit``, or ``killed``."""
+        if not self.active:
+            return "fallen"
+        if self.cooldown_remaining(user_id, now) > 0:
+            return "cooldown"
+        record = self.record
+        record["hp"] = max(0, int(record["hp"]) - damage)
+        contributions = record.setdefault("contributions", {})
+        contributions[str(user_id)] = int(contributions.get(str(user_id), 0)) + damage
+        record.setdefault("last_attacks", {})[str(user_id)] = now.isoformat()
+        self.dirty = True
+        if record["hp"] > 0:
+            return "hit"
+        self.defeated_at = now
+        return "killed"
+
+    def forget(self, user_id: int) -> None:
+        """Drop a delver's contribution and cooldown from the live record."""
+        contribution = self.record.get("contributions", {}).pop(str(user_id), None)
+        last_attack = self.record.get("last_attacks", {}).pop(str(user_id), None)
+        if contribution is not None or last_attack is not None:
+            self.dirty = True
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of the live record that is safe to hand to Config."""
+        if not self.record:
+            return {}
+        return {
+            **self.record,
+            "contributions": dict(self.record.get("contributions", {})),
+            "last_attacks": dict(self.record.get("last_attacks", {})),
+        }
+
+
+def world_boss_rewards(record: dict[str, Any]) -> dict[int, dict[str, int]]:
+    """Split a defeated boss's rewards by each delver's aggregated damage share."""
+    contributions = record.get("contributions", {})
+    total_damage = max(1, sum(int(value) for value in contributions.values()))
+    rewards = {}
+    for member_id_text, contribution in contributions.items():
+        share = int(contribution) / total_damage
+        rewards[int(member_id_text)] = {
+            "gold": 200 + round(int(record["max_hp"]) * 0.12 * share),
+            "xp": 150 + round(250 * share),
+            "season_points": 75,
+            "renown": max(1, round(int(contribution) / 10)),
+        }
+    return rewards
@@ -50,10 +50,12 @@ class DashboardIntegration:
             else:
                 notices.append({"message": "Fable campaign settings saved.", "category": "success"})
         settings = await self.config.guild(guild).all()
+        event_count = await self._events.event_count(guild.id)
+        source = self._fable_source(guild, settings, self._fable_csrf(kwargs), event_count)
         return {
             "status": 0,
             "notifications": notices,
-            "web_content": {"source": self._fable_source(guild, settings, self._fable_csrf(kwargs)), "expanded": True},
+            "web_content": {"source": source, "expanded": True},
         }
 
     async def _fable_save(self, guild, form):
@@ -71,7 +73,7 @@ class DashboardIntegration:
         current["milestone_categories"] = categories
         await conf.settings.set(current)
 
-    def _fable_source(self, guild, data, csrf):
+    def _fable_source(self, guild, data, csrf, event_count=0):
         settings = data.get("settings", {})
         intensity = html.escape("\n".join(settings.get("relationship_intensity_levels", [])))
         categories = html.escape("\n".join(settings.get("milestone_categories", [])))
@@ -82,7 +84,7 @@ class DashboardIntegration:
             ("Locations", len(data.get("locations", {}))),
             ("Lore entries", len(data.get("lore", {}))),
             ("Milestones", len(data.get("milestones", {}))),
-            ("RP logs", len(data.get("logs", []))),
+            ("Logged events", event_count),
             ("Mail", len(data.get("mail", {}))),
         )
         cards = "".join(f'<div class="stat"><strong>{count:,}</strong><span>{label}</span></div>' for label, count in stats)
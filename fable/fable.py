@@ -1,20 +1,26 @@
 from __future__ import annotations
 
-import asyncio
+import io
 import json
-from contextlib import suppress
-from pathlib import Path
+import logging
+import time
+from datetime import datetime, timezone
 
 import discord
 import graphviz
+from discord.ext import tasks
 from redbot.core import Config, commands
+from redbot.core.data_manager import cog_data_path
 
 from .dashboard_integration import DashboardIntegration
-from .google_sync_utils import (
-    export_to_doc,
-    export_to_sheet,
-    import_from_doc,
-    import_from_sheet,
+from .google_sync import SYNC_ERRORS, GoogleSyncManager, SyncResult
+from .google_sync_utils import SYNC_COLLECTIONS
+from .storage import EventStore
+from .visualization_utils import (
+    GraphRenderCache,
+    create_location_map,
+    create_relationship_graph,
+    focused_relationships,
 )
 
 RECOVERABLE_EXCEPTIONS = (
@@ -27,6 +33,10 @@ RECOVERABLE_EXCEPTIONS = (
     AttributeError,
 )
 
+log = logging.getLogger("red.taakoscogs.fable")
+
+TIMELINE_EVENT_LIMIT = 15
+
 
 class Fable(DashboardIntegration, commands.Cog):
     """A living world tracker for character-driven RP groups."""
@@ -65,6 +75,43 @@ class Fable(DashboardIntegration, commands.Cog):
             "mail_expiry_days": 30,
         }
         self.config.register_guild(**default_guild)
+        self._graph_renderer = GraphRenderCache()
+        self._google_sync = GoogleSyncManager()
+        self._events = EventStore(cog_data_path(self) / "events.sqlite3")
+
+    async def cog_load(self):
+        """Open the event log, move legacy Config events into it, and start scheduled sync."""
+        await self._events.initialize()
+        for guild_id, settings in (await self.config.all_guilds()).items():
+            moved = await self._migrate_legacy_events(guild_id, settings)
+            if moved:
+                log.info("Moved %s Fable event(s) for guild %s into SQLite", moved, guild_id)
+        self.sync_loop.start()
+
+    async def _migrate_legacy_events(self, guild_id: int, settings: dict) -> int:
+        """Import the old ``logs`` list and raw ``events`` dict into the event store, then clear them."""
+        legacy = [event for event in settings.get("logs") or [] if isinstance(event, dict)]
+        raw_events = settings.get("events")
+        if isinstance(raw_events, dict):
+            legacy.extend(event for event in raw_events.values() if isinstance(event, dict))
+        if not legacy:
+            return 0
+        moved = await self._events.import_guild(guild_id, legacy)
+        # Entries without a usable id are appended under fresh ids after the imported ones.
+        for event in legacy:
+            if not str(event.get("id", "")).isdigit():
+                await self._events.log_event(guild_id, event)
+                moved += 1
+        guild_conf = self.config.guild_from_id(guild_id)
+        await guild_conf.logs.set([])
+        await guild_conf.clear_raw("events")
+        return moved
+
+    async def cog_unload(self):
+        """Stop scheduled sync and the graph and Google worker pools."""
+        self.sync_loop.cancel()
+        self._graph_renderer.close()
+        self._google_sync.close()
 
     @commands.hybrid_group(
         name="fable",
@@ -1285,17 +1332,17 @@ class Fable(DashboardIntegration, commands.Cog):
                 color=0xFAA61A,
             )
             await ctx.send(embed=embed)
-        all_events = await self.config.guild(guild).events.get_attr("").get_raw()
-        event_id = max([int(eid) for eid in all_events] or [0]) + 1
-        event_data = {
-            "id": event_id,
-            "description": description,
-            "ic_date": date or "Unspecified",
-            "created_at": discord.utils.utcnow().isoformat(),
-            "created_by": str(user.id),
-            "characters": involved,
-        }
-        await self.config.guild(guild).events.set_raw(str(event_id), value=event_data)
+        event_data = await self._events.log_event(
+            guild.id,
+            {
+                "description": description,
+                "ic_date": date or "Unspecified",
+                "created_at": discord.utils.utcnow().isoformat(),
+                "created_by": str(user.id),
+                "characters": involved,
+            },
+        )
+        event_id = event_data["id"]
         embed = discord.Embed(
             title="Event Logged",
             description=description,
@@ -1309,26 +1356,20 @@ class Fable(DashboardIntegration, commands.Cog):
 
     @event.command(
         name="migrate",
-        description="Migrate old event logs to per-object storage (admin only)",
+        description="Migrate old event logs to the indexed event log (admin only)",
     )
     @commands.guild_only()
     @commands.has_permissions(administrator=True)
     async def event_migrate(self, ctx: commands.Context):
         """
-        Migrate old event logs to per-object storage. Only run once per server.
+        Move old event logs into the indexed event log.
+        This also runs automatically whenever the cog loads.
         """
-        guild = ctx.guild
-        logs = await self.config.guild(guild).logs()
-        if not isinstance(logs, list):
+        migrated = await self._migrate_legacy_events(ctx.guild.id, await self.config.guild(ctx.guild).all())
+        if not migrated:
             await ctx.send("No migration needed or already migrated.")
             return
-        migrated = 0
-        for event in logs:
-            eid = str(event["id"])
-            await self.config.guild(guild).events.set_raw(eid, value=event)
-            migrated += 1
-        await self.config.guild(guild).logs.set([])
-        await ctx.send(f"✅ Migrated {migrated} events to per-object storage.")
+        await ctx.send(f"✅ Migrated {migrated} events to the indexed event log.")
 
     @event.command(name="edit", description="Edit an event's description.")
     @commands.guild_only()
@@ -1347,10 +1388,7 @@ class Fable(DashboardIntegration, commands.Cog):
         """
         guild = ctx.guild
         user = ctx.author
-        event = await self.config.guild(guild).events.get_raw(
-            str(event_id),
-            default=None,
-        )
+        event = await self._events.get_event(guild.id, event_id)
         if not event:
             embed = discord.Embed(
                 title="❌ Event Not Found",
@@ -1370,7 +1408,7 @@ class Fable(DashboardIntegration, commands.Cog):
             await ctx.send(embed=embed)
             return
         event["description"] = new_description
-        await self.config.guild(guild).events.set_raw(str(event_id), value=event)
+        await self._events.update_event(guild.id, event)
         embed = discord.Embed(
             title="Event Updated",
             description=f"Event {event_id} description updated.",
@@ -1394,10 +1432,7 @@ class Fable(DashboardIntegration, commands.Cog):
         """
         guild = ctx.guild
         user = ctx.author
-        event = await self.config.guild(guild).events.get_raw(
-            str(event_id),
-            default=None,
-        )
+        event = await self._events.get_event(guild.id, event_id)
         if not event:
             embed = discord.Embed(
                 title="❌ Event Not Found",
@@ -1416,7 +1451,7 @@ class Fable(DashboardIntegration, commands.Cog):
             )
             await ctx.send(embed=embed)
             return
-        await self.config.guild(guild).events.clear_raw(str(event_id))
+        await self._events.delete_event(guild.id, event_id)
         embed = discord.Embed(
             title="🗑️ Event Deleted",
             description=f"Event {event_id} has been deleted.",
@@ -1428,6 +1463,35 @@ class Fable(DashboardIntegration, commands.Cog):
         )
         await ctx.send(embed=embed)
 
+    @event.command(name="history", description="Page through the events a character took part in.")
+    @commands.guild_only()
+    @commands.cooldown(1, 3, commands.BucketType.user)
+    async def event_history(self, ctx: commands.Context, character: str, before: int | None = None):
+        """
+        List a character's logged events, newest first.
+        Pass the event ID from the footer to see the next, older page.
+        Usage:
+        [p]fable event history Athena
+        [p]fable event history Athena 42
+        """
+        guild = ctx.guild
+        events, next_cursor = await self._events.character_events(guild.id, character, before=before)
+        embed = discord.Embed(title=f"📜 Events: {character}", color=0x7289DA)
+        if not events:
+            embed.description = "No logged events found."
+        for event in events:
+            others = [name for name in event["characters"] if name != character]
+            details = event["description"][:900]
+            if others:
+                details += f"\n*With {', '.join(others)}*"
+            embed.add_field(name=f"#{event['id']} • {event['ic_date']}", value=details, inline=False)
+        total = await self._events.character_event_count(guild.id, character)
+        footer = f"{total} events"
+        if next_cursor is not None:
+            footer += f" • Older: [p]fable event history {character} {next_cursor}"
+        embed.set_footer(text=footer.replace("[p]", ctx.clean_prefix))
+        await ctx.send(embed=embed)
+
     @fable.group(name="visualize", description="Create visual representations of data.")
     @commands.guild_only()
     async def visualize(self, ctx: commands.Context):
@@ -1444,6 +1508,7 @@ class Fable(DashboardIntegration, commands.Cog):
         self,
         ctx: commands.Context,
         character: str | None = None,
+        depth: commands.Range[int, 1, 3] = 1,
     ):
         """
         Generate a visual graph of character relationships.
@@ -1452,48 +1517,32 @@ class Fable(DashboardIntegration, commands.Cog):
         ----------
         character: Optional[str]
             Focus on a specific character's relationships
+        depth: int
+            How many relationship links around the focused character to include
         """
-        from .visualization_utils import create_relationship_graph
-
         guild = ctx.guild
         characters = await self.config.guild(guild).characters()
+        rel_data = {name: char.get("relationships", {}) for name, char in characters.items()}
 
-        # Filter relationships based on character if specified
+        # Only the focused character's neighbourhood is drawn, so unrelated edits reuse its cached image
         if character:
             if character not in characters:
                 await ctx.send(f"❌ Character '{character}' not found.")
                 return
-            rel_data = {character: characters[character].get("relationships", {})}
-        else:
-            rel_data = {name: char.get("relationships", {}) for name, char in characters.items()}
-
-        # Generate DOT graph
-        dot_string = create_relationship_graph(rel_data)
-
-        # Create and save the graph
-        dot = graphviz.Source(dot_string)
-        filename = f"relationships_{guild.id}"
-        try:
-            dot.render(filename, format="png", cleanup=True)
-            await ctx.send(
-                content="👥 Character Relationship Graph:",
-                file=discord.File(f"{filename}.png"),
-            )
-        except RECOVERABLE_EXCEPTIONS as e:
-            await ctx.send(f"❌ Failed to generate graph: {e}")
-        finally:
-            with suppress(OSError):
-                await asyncio.to_thread(
-                    Path(f"{filename}.png").unlink,
-                    missing_ok=True,
-                )
+            rel_data = focused_relationships(rel_data, character, depth)
+
+        await self._send_graph(
+            ctx,
+            create_relationship_graph(rel_data),
+            f"relationships_{guild.id}.png",
+            "👥 Character Relationship Graph:",
+            "graph",
+        )
 
     @visualize.command(name="locations", description="Generate a location map.")
     @commands.cooldown(1, 30, commands.BucketType.guild)
     async def visualize_locations(self, ctx: commands.Context):
         """Generate a visual map of connected locations."""
-        from .visualization_utils import create_location_map
-
         guild = ctx.guild
         locations = await self.config.guild(guild).locations()
 
@@ -1501,26 +1550,31 @@ class Fable(DashboardIntegration, commands.Cog):
             await ctx.send("No locations found.")
             return
 
-        # Generate DOT graph
-        dot_string = create_location_map(locations)
+        await self._send_graph(
+            ctx,
+            create_location_map(locations),
+            f"locations_{guild.id}.png",
+            "🗺️ Location Map:",
+            "map",
+        )
 
-        # Create and save the graph
-        dot = graphviz.Source(dot_string)
-        filename = f"locations_{guild.id}"
+    async def _send_graph(
+        self,
+        ctx: commands.Context,
+        dot_string: str,
+        filename: str,
+        content: str,
+        noun: str,
+    ) -> None:
+        """Render a DOT graph off the event loop, reusing the cached PNG when the source is unchanged."""
         try:
-            dot.render(filename, format="png", cleanup=True)
+            image = await self._graph_renderer.render(dot_string)
             await ctx.send(
-                content="🗺️ Location Map:",
-                file=discord.File(f"{filename}.png"),
+                content=content,
+                file=discord.File(io.BytesIO(image), filename=filename),
             )
-        except RECOVERABLE_EXCEPTIONS as e:
-            await ctx.send(f"❌ Failed to generate map: {e}")
-        finally:
-            with suppress(OSError):
-                await asyncio.to_thread(
-                    Path(f"{filename}.png").unlink,
-                    missing_ok=True,
-                )
+        except (graphviz.CalledProcessError, *RECOVERABLE_EXCEPTIONS) as e:
+            await ctx.send(f"❌ Failed to generate {noun}: {e}")
 
     @character.command(name="timeline", description="View a character's timeline.")
     @commands.guild_only()
@@ -1568,7 +1622,7 @@ class Fable(DashboardIntegration, commands.Cog):
         # Collect relationship events
         history = await self.config.guild(guild).relationship_history()
         for rel_key, rel_history in history.items():
-            if character in rel_key:
+            if character in rel_key.split("|"):
                 for rel in rel_history:
                     events.append(
                         {
@@ -1592,6 +1646,18 @@ class Fable(DashboardIntegration, commands.Cog):
                 },
             )
 
+        # Collect the newest logged events from the character index
+        logged, _ = await self._events.character_events(guild.id, character, limit=TIMELINE_EVENT_LIMIT)
+        for logged_event in logged:
+            events.append(
+                {
+                    "type": "Event",
+                    "title": f"Event #{logged_event['id']} ({logged_event['ic_date']})",
+                    "description": logged_event["description"],
+                    "date": logged_event["created_at"],
+                },
+            )
+
         # Collect location visits
         locations = await self.config.guild(guild).locations()
         for loc_name, loc_data in locations.items():
@@ -1615,6 +1681,56 @@ class Fable(DashboardIntegration, commands.Cog):
         )
         await ctx.send(embed=embed)
 
+    async def _export_guild(
+        self,
+        guild: discord.Guild,
+        collections: tuple[str, ...] = SYNC_COLLECTIONS,
+        progress=None,
+    ) -> SyncResult:
+        """Export the guild's changed objects and record the new journal and sync status."""
+        guild_conf = self.config.guild(guild)
+        async with self._google_sync.lock(guild.id):
+            sync = await guild_conf.sync()
+            data = {
+                collection: (
+                    await self._events.all_events(guild.id)
+                    if collection == "events"
+                    else await guild_conf.get_raw(collection, default={})
+                )
+                for collection in collections
+            }
+            try:
+                result = await self._google_sync.export(sync, data, collections, progress)
+            except (*SYNC_ERRORS, *RECOVERABLE_EXCEPTIONS) as e:
+                await guild_conf.sync.set_raw(
+                    "last_sync",
+                    value={"at": time.time(), "written": 0, "error": str(e) or type(e).__name__},
+                )
+                raise
+            await guild_conf.sync.set_raw("journal", value=result.journal)
+            await guild_conf.sync.set_raw(
+                "last_sync",
+                value={"at": time.time(), "written": result.written, "error": None},
+            )
+        return result
+
+    @tasks.loop(minutes=1)
+    async def sync_loop(self):
+        now = time.time()
+        for guild in self.bot.guilds:
+            sync = await self.config.guild(guild).sync()
+            interval = sync.get("interval_minutes", 0) if sync else 0
+            if not interval or now - (sync.get("last_sync") or {}).get("at", 0) < interval * 60:
+                continue
+            try:
+                await self._export_guild(guild)
+            except (*SYNC_ERRORS, *RECOVERABLE_EXCEPTIONS):
+                log.exception("Scheduled Google sync failed in guild %s", guild.id)
+
+    @sync_loop.before_loop
+    async def before_sync_loop(self):
+        await self.bot.wait_until_red_ready()
+
     @fable.command(name="sysetup", description="Set up Google sync (Sheet or Doc).")
     async def sysetup(
         self,
@@ -1633,12 +1749,16 @@ class Fable(DashboardIntegration, commands.Cog):
         if source_type not in ("sheet", "doc"):
             await ctx.send("Source type must be 'sheet' or 'doc'.")
             return
-        sync = {
-            "type": source_type,
-            "id": url_or_id,
-            "api_key": api_key,
-        }
-        await self.config.guild(ctx.guild).sync.set(sync)
+        async with self._google_sync.lock(ctx.guild.id):
+            previous = await self.config.guild(ctx.guild).sync() or {}
+            # A new target starts without a journal, so the first export writes everything.
+            sync = {
+                "type": source_type,
+                "id": url_or_id,
+                "api_key": api_key,
+                "interval_minutes": previous.get("interval_minutes", 0),
+            }
+            await self.config.guild(ctx.guild).sync.set(sync)
         embed = discord.Embed(
             title="Google Sync Setup Complete",
             description=f"Sync type: **{source_type}**\nID: `{url_or_id}`",
@@ -1651,34 +1771,41 @@ class Fable(DashboardIntegration, commands.Cog):
     async def syexport(self, ctx: commands.Context, data_type: str | None = None):
         """
         Export Fable data to Google Sheets or Docs.
-        Usage: [p]fable syexport [data_type]
+        Only characters, events, locations, and milestones changed since the last export are sent.
+        Usage: [p]fable syexport [characters|events|locations|milestones]
         """
         sync = await self.config.guild(ctx.guild).sync() or {}
         if not sync:
             await ctx.send("Sync is not set up. Use [p]fable sysetup first.")
             return
-        data_type = data_type or "all"
-        data = await self.config.guild(ctx.guild).all()
-        if data_type != "all":
-            data = data.get(data_type, {})
-        try:
-            if sync["type"] == "sheet":
-                export_to_sheet(sync["id"], sync["api_key"], data)
-                msg = f"Exported data to Google Sheet: `{sync['id']}`."
-            else:
-                export_to_doc(sync["id"], sync["api_key"], data)
-                msg = f"Exported data to Google Doc: `{sync['id']}`."
-            color = 0x43B581
-        except RECOVERABLE_EXCEPTIONS as e:
-            msg = f"❌ Export failed: {e}"
-            color = 0xF04747
+        if data_type and data_type != "all" and data_type not in SYNC_COLLECTIONS:
+            await ctx.send(f"Data type must be `all` or one of: {', '.join(SYNC_COLLECTIONS)}.")
+            return
+        collections = (data_type,) if data_type and data_type != "all" else SYNC_COLLECTIONS
         embed = discord.Embed(
             title="Sync Export",
-            description=msg,
-            color=color,
+            description="⏳ Comparing with the last export...",
+            color=0x7289DA,
         )
         embed.set_footer(text="Fable RP Tracker • Sync Export")
-        await ctx.send(embed=embed)
+        status = await ctx.send(embed=embed)
+
+        async def progress(done: int, total: int) -> None:
+            embed.description = f"⏳ Sent {done}/{total} changed rows..."
+            await status.edit(embed=embed)
+
+        target = f"Google {'Sheet' if sync['type'] == 'sheet' else 'Doc'}: `{sync['id']}`"
+        try:
+            result = await self._export_guild(ctx.guild, collections, progress)
+            if result.unchanged:
+                embed.description = f"Nothing changed since the last export to {target}."
+            else:
+                embed.description = f"Exported {result.written} changed rows to {target}."
+            embed.color = 0x43B581
+        except (*SYNC_ERRORS, *RECOVERABLE_EXCEPTIONS) as e:
+            embed.description = f"❌ Export failed: {e or type(e).__name__}"
+            embed.color = 0xF04747
+        await status.edit(embed=embed)
 
     @fable.command(
         name="syimport",
@@ -1693,21 +1820,32 @@ class Fable(DashboardIntegration, commands.Cog):
         if not sync:
             await ctx.send("Sync is not set up. Use [p]fable sysetup first.")
             return
+        guild_conf = self.config.guild(ctx.guild)
         try:
-            if sync["type"] == "sheet":
-                imported = import_from_sheet(sync["id"], sync["api_key"])
-            else:
-                imported = import_from_doc(sync["id"], sync["api_key"])
-            if not imported:
-                raise ValueError("No data found or invalid format.")
-            if data_type and data_type != "all":
-                await self.config.guild(ctx.guild).set_raw(data_type, value=imported)
-            else:
-                await self.config.guild(ctx.guild).set(imported)
+            async with self._google_sync.lock(ctx.guild.id):
+                imported = await self._google_sync.import_data(sync)
+                if not imported:
+                    raise ValueError("No data found or invalid format.")
+                row_based = set(imported) <= set(SYNC_COLLECTIONS)
+                if data_type and data_type != "all":
+                    # A row-based sheet without the type's rows must not replace it with an empty collection.
+                    if row_based and data_type not in imported:
+                        raise ValueError(f"That sheet has no {data_type} rows.")
+                    imported = {data_type: imported[data_type] if row_based else imported}
+                elif not row_based:
+                    await guild_conf.set({key: value for key, value in imported.items() if key != "events"})
+                    imported = {"events": imported.get("events", {})}
+                for collection, items in imported.items():
+                    if collection == "events":
+                        await self._events.import_guild(ctx.guild.id, (items or {}).values(), replace=True)
+                    else:
+                        await guild_conf.set_raw(collection, value=items)
+                # The imported data no longer matches the journal, so the next export rewrites the target.
+                await guild_conf.sync.clear_raw("journal")
             msg = f"Imported data from Google {sync['type'].capitalize()}: `{sync['id']}`."
             color = 0x43B581
-        except RECOVERABLE_EXCEPTIONS as e:
-            msg = f"❌ Import failed: {e}"
+        except (*SYNC_ERRORS, *RECOVERABLE_EXCEPTIONS) as e:
+            msg = f"❌ Import failed: {e or type(e).__name__}"
             color = 0xF04747
         embed = discord.Embed(
             title="Sync Import",
@@ -1717,6 +1855,24 @@ class Fable(DashboardIntegration, commands.Cog):
         embed.set_footer(text="Fable RP Tracker • Sync Import")
         await ctx.send(embed=embed)
 
+    @fable.command(name="syschedule", description="Export changes to Google on a schedule.")
+    @commands.guild_only()
+    @commands.admin_or_permissions(manage_guild=True)
+    async def syschedule(self, ctx: commands.Context, minutes: commands.Range[int, 0, 10080]):
+        """
+        Export changed data to the configured Google target every few minutes.
+        Use 0 to turn scheduled sync off.
+        """
+        sync = await self.config.guild(ctx.guild).sync() or {}
+        if not sync:
+            await ctx.send("Sync is not set up. Use [p]fable sysetup first.")
+            return
+        await self.config.guild(ctx.guild).sync.set_raw("interval_minutes", value=minutes)
+        if minutes:
+            await ctx.send(f"✅ Changed data will be exported every {minutes} minutes.")
+        else:
+            await ctx.send("✅ Scheduled sync is off.")
+
     @fable.command(name="systatus", description="Show Google sync status.")
     async def systatus(self, ctx: commands.Context):
         """
@@ -1726,9 +1882,22 @@ class Fable(DashboardIntegration, commands.Cog):
         if not sync:
             await ctx.send("Sync is not set up. Use [p]fable sysetup first.")
             return
+        interval = sync.get("interval_minutes", 0)
+        lines = [
+            f"Type: **{sync.get('type', '?')}**",
+            f"ID: `{sync.get('id', '?')}`",
+            f"Schedule: every {interval} minutes" if interval else "Schedule: off",
+        ]
+        last_sync = sync.get("last_sync")
+        if last_sync:
+            when = discord.utils.format_dt(datetime.fromtimestamp(last_sync["at"], tz=timezone.utc), "R")
+            if last_sync.get("error"):
+                lines.append(f"Last export {when} failed: {last_sync['error']}")
+            else:
+                lines.append(f"Last export {when}: {last_sync['written']} rows written")
         embed = discord.Embed(
             title="Google Sync Status",
-            description=f"Type: **{sync.get('type', '?')}**\nID: `{sync.get('id', '?')}`",
+            description="\n".join(lines),
             color=0x7289DA,
         )
         embed.set_footer(text="Fable RP Tracker • Sync Status")
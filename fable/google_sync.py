@@ -0,0 +1,143 @@
+"""Non-blocking, incremental Google Sheets/Docs sync for Fable."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import httplib2
+from google.auth.exceptions import GoogleAuthError
+from googleapiclient.errors import Error as GoogleAPIError
+
+from .google_sync_utils import (
+    SHEET_BATCH_SIZE,
+    SHEET_RANGE,
+    SYNC_COLLECTIONS,
+    SYNC_TIMEOUT,
+    clear_sheet,
+    get_docs_service,
+    get_sheets_service,
+    import_from_doc,
+    import_from_sheet,
+    plan_sheet_export,
+    render_doc_content,
+    write_doc,
+    write_sheet_batch,
+)
+
+SYNC_WORKERS = 2
+SYNC_ERRORS = (
+    asyncio.TimeoutError,
+    GoogleAPIError,
+    GoogleAuthError,
+    httplib2.HttpLib2Error,
+)
+
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+
+def default_service_factory(kind: str, api_key: str) -> Any:
+    """Build the Google client for a ``sheet`` or ``doc`` sync target."""
+    if kind == "sheet":
+        return get_sheets_service(api_key)
+    return get_docs_service(api_key)
+
+
+@dataclass(slots=True)
+class SyncResult:
+    """Outcome of one export, with the journal to store for the next one."""
+
+    journal: dict[str, Any]
+    written: int = 0
+    unchanged: bool = False
+
+
+class GoogleSyncManager:
+    """
+    Run Google API calls in a small worker pool, each bounded by a timeout.
+    Exports only send the objects that changed since the journal of the previous export.
+    """
+
+    def __init__(
+        self,
+        *,
+        service_factory: Callable[[str, str], Any] = default_service_factory,
+        workers: int = SYNC_WORKERS,
+        timeout: float = SYNC_TIMEOUT,
+        batch_size: int = SHEET_BATCH_SIZE,
+    ):
+        self.service_factory = service_factory
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fable-google-sync")
+        self._locks: dict[int, asyncio.Lock] = {}
+
+    def lock(self, guild_id: int) -> asyncio.Lock:
+        """Serialise manual and scheduled syncs for one guild."""
+        return self._locks.setdefault(guild_id, asyncio.Lock())
+
+    async def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await asyncio.wait_for(loop.run_in_executor(self._executor, func, *args), timeout=self.timeout)
+
+    async def export(
+        self,
+        sync: dict[str, Any],
+        data: dict[str, Any],
+        collections: tuple[str, ...] = SYNC_COLLECTIONS,
+        progress: ProgressCallback | None = None,
+    ) -> SyncResult:
+        service = await self._call(self.service_factory, sync["type"], sync["api_key"])
+        if sync["type"] == "sheet":
+            return await self._export_sheet(service, sync, data, collections, progress)
+        return await self._export_doc(service, sync, data, progress)
+
+    async def _export_sheet(
+        self,
+        service: Any,
+        sync: dict[str, Any],
+        data: dict[str, Any],
+        collections: tuple[str, ...],
+        progress: ProgressCallback | None,
+    ) -> SyncResult:
+        updates, journal, full = await self._call(plan_sheet_export, data, sync.get("journal"), collections)
+        if full:
+            await self._call(clear_sheet, service, sync["id"])
+
+        total = len(updates)
+        for start in range(0, total, self.batch_size):
+            await self._call(write_sheet_batch, service, sync["id"], updates[start : start + self.batch_size])
+            if progress:
+                await progress(min(start + self.batch_size, total), total)
+        return SyncResult(journal=journal, written=total, unchanged=not updates)
+
+    async def _export_doc(
+        self,
+        service: Any,
+        sync: dict[str, Any],
+        data: dict[str, Any],
+        progress: ProgressCallback | None,
+    ) -> SyncResult:
+        content = await self._call(render_doc_content, data)
+        digest = hashlib.sha1(content.encode("utf-8")).hexdigest()
+        journal = sync.get("journal") or {}
+        if journal.get("doc") == digest:
+            return SyncResult(journal=journal, unchanged=True)
+
+        await self._call(write_doc, service, sync["id"], content)
+        if progress:
+            await progress(1, 1)
+        return SyncResult(journal={"doc": digest}, written=1)
+
+    async def import_data(self, sync: dict[str, Any]) -> dict[str, Any] | None:
+        service = await self._call(self.service_factory, sync["type"], sync["api_key"])
+        if sync["type"] == "sheet":
+            return await self._call(import_from_sheet, sync["id"], sync["api_key"], SHEET_RANGE, service)
+        return await self._call(import_from_doc, sync["id"], sync["api_key"], service)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,34 +1,127 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
 import json
 from typing import Any
 
-# Google API imports
+import httplib2
 from google.oauth2.service_account import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
     "https://www.googleapis.com/auth/documents",
 ]
+# Seconds before a single Google API request is abandoned.
+SYNC_TIMEOUT = 60
+SYNC_COLLECTIONS = ("characters", "events", "locations", "milestones")
+SHEET_HEADER = ["collection", "key", "data"]
+SHEET_RANGE = "A:C"
+SHEET_BATCH_SIZE = 200
 
 
-# Helper to build Google Sheets service
-def get_sheets_service(api_key: str) -> Any:
+def _authorized_http(api_key: str, scope: str) -> AuthorizedHttp:
     creds = Credentials.from_service_account_info(
         json.loads(api_key),
-        scopes=[SCOPES[0]],
+        scopes=[scope],
     )
-    return build("sheets", "v4", credentials=creds)
+    return AuthorizedHttp(creds, http=httplib2.Http(timeout=SYNC_TIMEOUT))
+
+
+# Helper to build Google Sheets service
+def get_sheets_service(api_key: str) -> Any:
+    return build("sheets", "v4", http=_authorized_http(api_key, SCOPES[0]), cache_discovery=False)
 
 
 # Helper to build Google Docs service
 def get_docs_service(api_key: str) -> Any:
-    creds = Credentials.from_service_account_info(
-        json.loads(api_key),
-        scopes=[SCOPES[1]],
-    )
-    return build("docs", "v1", credentials=creds)
+    return build("docs", "v1", http=_authorized_http(api_key, SCOPES[1]), cache_discovery=False)
+
+
+def empty_sheet_journal() -> dict[str, Any]:
+    """Journal for a sheet nothing has been exported to yet; row 1 holds the header."""
+    return {"rows": {}, "free": [], "next_row": 2}
+
+
+def plan_sheet_export(
+    data: dict[str, Any],
+    journal: dict[str, Any] | None,
+    collections: tuple[str, ...] = SYNC_COLLECTIONS,
+) -> tuple[list[dict[str, Any]], dict[str, Any], bool]:
+    """
+    Diff the synced collections against the journal of the last export.
+
+    Every object owns one sheet row of ``collection, key, JSON``. Returns the value ranges to
+    write, the journal to store once they are written, and whether the sheet must be cleared
+    first because no journal exists for it yet.
+    """
+    full = not journal or "rows" not in journal
+    previous = empty_sheet_journal() if full else journal
+    rows = dict(previous["rows"])
+    free = list(previous["free"])
+    heapq.heapify(free)
+    next_row = previous["next_row"]
+    updates: list[dict[str, Any]] = []
+    if full:
+        updates.append({"range": "A1:C1", "values": [SHEET_HEADER]})
+
+    current: set[str] = set()
+    for collection in collections:
+        items = data.get(collection)
+        if not isinstance(items, dict):
+            continue
+        for key, value in items.items():
+            row_key = f"{collection}/{key}"
+            current.add(row_key)
+            encoded = json.dumps(value, sort_keys=True, default=str)
+            digest = hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+            entry = rows.get(row_key)
+            if entry and entry[1] == digest:
+                continue
+            if entry:
+                row = entry[0]
+            elif free:
+                row = heapq.heappop(free)
+            else:
+                row = next_row
+                next_row += 1
+            rows[row_key] = [row, digest]
+            updates.append({"range": f"A{row}:C{row}", "values": [[collection, str(key), encoded]]})
+
+    # Deleted objects blank their row; the row is reused by the next export that adds an object.
+    for row_key, (row, _digest) in list(rows.items()):
+        if row_key.split("/", 1)[0] in collections and row_key not in current:
+            del rows[row_key]
+            heapq.heappush(free, row)
+            updates.append({"range": f"A{row}:C{row}", "values": [["", "", ""]]})
+
+    return updates, {"rows": rows, "free": sorted(free), "next_row": next_row}, full
+
+
+def clear_sheet(service: Any, sheet_id: str) -> None:
+    service.spreadsheets().values().clear(spreadsheetId=sheet_id, range=SHEET_RANGE, body={}).execute()
+
+
+def write_sheet_batch(service: Any, sheet_id: str, updates: list[dict[str, Any]]) -> None:
+    """Write changed rows with a single ``values.batchUpdate`` request."""
+    service.spreadsheets().values().batchUpdate(
+        spreadsheetId=sheet_id,
+        body={"valueInputOption": "RAW", "data": updates},
+    ).execute()
+
+
+def parse_sheet_rows(values: list[list[str]]) -> dict[str, Any] | None:
+    """Rebuild collections from rows written by an incremental export."""
+    if not values or values[0][:3] != SHEET_HEADER:
+        return None
+    data: dict[str, Any] = {}
+    for row in values[1:]:
+        if len(row) < 3 or not row[0]:
+            continue
+        data.setdefault(row[0], {})[row[1]] = json.loads(row[2])
+    return data
 
 
 # Sheets: Export data to a sheet
@@ -53,9 +146,10 @@ def export_to_sheet(
 def import_from_sheet(
     sheet_id: str,
     api_key: str,
-    range_: str = "A1",
+    range_: str = SHEET_RANGE,
+    service: Any = None,
 ) -> dict[str, Any] | None:
-    service = get_sheets_service(api_key)
+    service = service or get_sheets_service(api_key)
     result = (
         service.spreadsheets()
         .values()
@@ -66,6 +160,10 @@ def import_from_sheet(
         .execute()
     )
     values = result.get("values", [])
+    rows = parse_sheet_rows(values)
+    if rows is not None:
+        return rows
+    # Sheets exported before row-based sync hold the whole export as JSON in A1.
     if values and values[0]:
         try:
             return json.loads(values[0][0])
@@ -115,24 +213,8 @@ def get_timeline_template(events) -> str:
     return content
 
 
-def export_to_doc(doc_id: str, api_key: str, data: dict):
-    """Export Fable data to a Google Doc with proper formatting."""
-    try:
-        import json
-
-        from google.oauth2 import service_account
-        from googleapiclient.discovery import build
-    except ImportError:
-        raise ImportError(
-            "Required Google packages not found. Run [p]fable googlehelp for setup instructions.",
-        )
-
-    credentials = service_account.Credentials.from_service_account_info(
-        json.loads(api_key),
-        scopes=["https://www.googleapis.com/auth/documents"],
-    )
-    service = build("docs", "v1", credentials=credentials)
-
+def render_doc_content(data: dict) -> str:
+    """Render the character profiles and timeline exported to a Google Doc."""
     # Start with a title
     content = "『 FABLE CHARACTER PROFILES 』\n\n"
 
@@ -146,35 +228,30 @@ def export_to_doc(doc_id: str, api_key: str, data: dict):
     if data.get("events"):
         content += "\n\n『 CHARACTER TIMELINE 』\n\n"
         content += get_timeline_template(data["events"].values())
+    return content
+
 
-    # Update the document
+def write_doc(service: Any, doc_id: str, content: str) -> None:
+    """Replace the document body with ``content`` in one ``batchUpdate``."""
     document = service.documents().get(documentId=doc_id).execute()
-    service.documents().batchUpdate(
-        documentId=doc_id,
-        body={
-            "requests": [
-                {
-                    "deleteContentRange": {
-                        "range": {
-                            "startIndex": 1,
-                            "endIndex": len(document.get("body", {}).get("content", "")) - 1,
-                        },
-                    },
-                },
-                {
-                    "insertText": {
-                        "location": {"index": 1},
-                        "text": content,
-                    },
-                },
-            ],
-        },
-    ).execute()
+    body = document.get("body", {}).get("content", [])
+    # The final newline of a document body cannot be deleted.
+    end_index = body[-1].get("endIndex", 1) - 1 if body else 0
+    requests: list[dict[str, Any]] = []
+    if end_index > 1:
+        requests.append({"deleteContentRange": {"range": {"startIndex": 1, "endIndex": end_index}}})
+    requests.append({"insertText": {"location": {"index": 1}, "text": content}})
+    service.documents().batchUpdate(documentId=doc_id, body={"requests": requests}).execute()
+
+
+def export_to_doc(doc_id: str, api_key: str, data: dict, service: Any = None) -> None:
+    """Export Fable data to a Google Doc with proper formatting."""
+    write_doc(service or get_docs_service(api_key), doc_id, render_doc_content(data))
 
 
 # Docs: Import data from a doc (read all text)
-def import_from_doc(doc_id: str, api_key: str) -> dict[str, Any] | None:
-    service = get_docs_service(api_key)
+def import_from_doc(doc_id: str, api_key: str, service: Any = None) -> dict[str, Any] | None:
+    service = service or get_docs_service(api_key)
     doc = service.documents().get(documentId=doc_id).execute()
     text = ""
     for element in doc.get("body", {}).get("content", []):
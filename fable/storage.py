@@ -0,0 +1,261 @@
+"""Indexed SQLite storage for Fable's in-character event log."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+EVENT_PAGE_SIZE = 10
+
+
+class EventStore:
+    """Per-guild event log with a monotonic id counter and a character index.
+
+    Ids come from a counter rather than ``max(id) + 1``, so a deleted event's
+    id is never handed out again. Each event's characters are indexed on log,
+    edit, and delete, and character listings page newest-first with an id
+    cursor instead of scanning the whole log.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = asyncio.Lock()
+
+    async def initialize(self) -> None:
+        await asyncio.to_thread(self._initialize_sync)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=5)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA busy_timeout = 5000")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    def _initialize_sync(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                CREATE TABLE IF NOT EXISTS events (
+                    guild_id INTEGER NOT NULL,
+                    id INTEGER NOT NULL,
+                    description TEXT NOT NULL,
+                    ic_date TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    created_by TEXT,
+                    characters TEXT NOT NULL,
+                    PRIMARY KEY (guild_id, id)
+                );
+                CREATE TABLE IF NOT EXISTS event_characters (
+                    guild_id INTEGER NOT NULL,
+                    character TEXT NOT NULL,
+                    event_id INTEGER NOT NULL,
+                    PRIMARY KEY (guild_id, character, event_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS idx_event_characters_event
+                    ON event_characters(guild_id, event_id);
+                CREATE TABLE IF NOT EXISTS event_counters (
+                    guild_id INTEGER PRIMARY KEY,
+                    next_id INTEGER NOT NULL
+                );
+                """,
+            )
+
+    @staticmethod
+    def _row(row: sqlite3.Row) -> dict[str, Any]:
+        return {
+            "id": row["id"],
+            "description": row["description"],
+            "ic_date": row["ic_date"],
+            "created_at": row["created_at"],
+            "created_by": row["created_by"],
+            "characters": json.loads(row["characters"]),
+        }
+
+    @staticmethod
+    def _write_event(connection: sqlite3.Connection, guild_id: int, event: dict[str, Any]) -> None:
+        characters = [str(name) for name in event.get("characters") or []]
+        connection.execute(
+            """
+            INSERT OR REPLACE INTO events (guild_id, id, description, ic_date, created_at, created_by, characters)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                guild_id,
+                int(event["id"]),
+                str(event.get("description") or ""),
+                str(event.get("ic_date") or "Unspecified"),
+                str(event.get("created_at") or ""),
+                str(event["created_by"]) if event.get("created_by") is not None else None,
+                json.dumps(characters),
+            ),
+        )
+        connection.execute(
+            "DELETE FROM event_characters WHERE guild_id = ? AND event_id = ?",
+            (guild_id, int(event["id"])),
+        )
+        connection.executemany(
+            "INSERT OR IGNORE INTO event_characters (guild_id, character, event_id) VALUES (?, ?, ?)",
+            [(guild_id, name, int(event["id"])) for name in characters],
+        )
+
+    @staticmethod
+    def _reserve_ids(connection: sqlite3.Connection, guild_id: int, at_least: int) -> None:
+        connection.execute(
+            """
+            INSERT INTO event_counters (guild_id, next_id) VALUES (?, ?)
+            ON CONFLICT(guild_id) DO UPDATE SET next_id = MAX(next_id, excluded.next_id)
+            """,
+            (guild_id, at_least),
+        )
+
+    async def log_event(self, guild_id: int, event: dict[str, Any]) -> dict[str, Any]:
+        """Store a new event under the guild's next id and return it with that id."""
+        async with self._lock:
+            return await asyncio.to_thread(self._log_event_sync, guild_id, event)
+
+    def _log_event_sync(self, guild_id: int, event: dict[str, Any]) -> dict[str, Any]:
+        with self._connect() as connection:
+            self._reserve_ids(connection, guild_id, 1)
+            event_id = connection.execute(
+                "SELECT next_id FROM event_counters WHERE guild_id = ?",
+                (guild_id,),
+            ).fetchone()[0]
+            connection.execute(
+                "UPDATE event_counters SET next_id = ? WHERE guild_id = ?",
+                (event_id + 1, guild_id),
+            )
+            stored = {**event, "id": event_id}
+            self._write_event(connection, guild_id, stored)
+        return stored
+
+    async def get_event(self, guild_id: int, event_id: int) -> dict[str, Any] | None:
+        return await asyncio.to_thread(self._get_event_sync, guild_id, event_id)
+
+    def _get_event_sync(self, guild_id: int, event_id: int) -> dict[str, Any] | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT * FROM events WHERE guild_id = ? AND id = ?",
+                (guild_id, event_id),
+            ).fetchone()
+        return self._row(row) if row is not None else None
+
+    async def update_event(self, guild_id: int, event: dict[str, Any]) -> None:
+        """Rewrite an existing event and its character index entries."""
+        async with self._lock:
+            await asyncio.to_thread(self._update_event_sync, guild_id, event)
+
+    def _update_event_sync(self, guild_id: int, event: dict[str, Any]) -> None:
+        with self._connect() as connection:
+            self._write_event(connection, guild_id, event)
+
+    async def delete_event(self, guild_id: int, event_id: int) -> bool:
+        async with self._lock:
+            return await asyncio.to_thread(self._delete_event_sync, guild_id, event_id)
+
+    def _delete_event_sync(self, guild_id: int, event_id: int) -> bool:
+        with self._connect() as connection:
+            cursor = connection.execute("DELETE FROM events WHERE guild_id = ? AND id = ?", (guild_id, event_id))
+            connection.execute(
+                "DELETE FROM event_characters WHERE guild_id = ? AND event_id = ?",
+                (guild_id, event_id),
+            )
+            return cursor.rowcount > 0
+
+    async def character_events(
+        self,
+        guild_id: int,
+        character: str,
+        *,
+        before: int | None = None,
+        limit: int = EVENT_PAGE_SIZE,
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        """Return one newest-first page of a character's events and the cursor for the next page."""
+        return await asyncio.to_thread(
+            self._character_events_sync,
+            guild_id,
+            character,
+            before,
+            max(1, min(limit, 100)),
+        )
+
+    def _character_events_sync(
+        self,
+        guild_id: int,
+        character: str,
+        before: int | None,
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                """
+                SELECT events.* FROM event_characters
+                JOIN events ON events.guild_id = event_characters.guild_id AND events.id = event_characters.event_id
+                WHERE event_characters.guild_id = ? AND event_characters.character = ?
+                    AND event_characters.event_id < ?
+                ORDER BY event_characters.event_id DESC
+                LIMIT ?
+                """,
+                (guild_id, character, before if before is not None else 2**63 - 1, limit + 1),
+            ).fetchall()
+        events = [self._row(row) for row in rows[:limit]]
+        next_cursor = events[-1]["id"] if len(rows) > limit else None
+        return events, next_cursor
+
+    async def character_event_count(self, guild_id: int, character: str) -> int:
+        return await asyncio.to_thread(self._character_event_count_sync, guild_id, character)
+
+    def _character_event_count_sync(self, guild_id: int, character: str) -> int:
+        with self._connect() as connection:
+            return int(
+                connection.execute(
+                    "SELECT COUNT(*) FROM event_characters WHERE guild_id = ? AND character = ?",
+                    (guild_id, character),
+                ).fetchone()[0],
+            )
+
+    async def event_count(self, guild_id: int) -> int:
+        return await asyncio.to_thread(self._event_count_sync, guild_id)
+
+    def _event_count_sync(self, guild_id: int) -> int:
+        with self._connect() as connection:
+            return int(connection.execute("SELECT COUNT(*) FROM events WHERE guild_id = ?", (guild_id,)).fetchone()[0])
+
+    async def all_events(self, guild_id: int) -> dict[str, dict[str, Any]]:
+        """Return every event keyed by id, in the shape Config used to store them."""
+        return await asyncio.to_thread(self._all_events_sync, guild_id)
+
+    def _all_events_sync(self, guild_id: int) -> dict[str, dict[str, Any]]:
+        with self._connect() as connection:
+            rows = connection.execute("SELECT * FROM events WHERE guild_id = ? ORDER BY id", (guild_id,)).fetchall()
+        return {str(row["id"]): self._row(row) for row in rows}
+
+    async def import_guild(
+        self,
+        guild_id: int,
+        events: Iterable[dict[str, Any]],
+        *,
+        replace: bool = False,
+    ) -> int:
+        """Copy events that already carry ids, keeping the counter above every imported id."""
+        records = [event for event in events if isinstance(event, dict) and str(event.get("id", "")).isdigit()]
+        async with self._lock:
+            return await asyncio.to_thread(self._import_guild_sync, guild_id, records, replace)
+
+    def _import_guild_sync(self, guild_id: int, records: list[dict[str, Any]], replace: bool) -> int:
+        with self._connect() as connection:
+            if replace:
+                connection.execute("DELETE FROM events WHERE guild_id = ?", (guild_id,))
+                connection.execute("DELETE FROM event_characters WHERE guild_id = ?", (guild_id,))
+            for record in records:
+                self._write_event(connection, guild_id, record)
+            if records:
+                self._reserve_ids(connection, guild_id, max(int(record["id"]) for record in records) + 1)
+        return len(records)
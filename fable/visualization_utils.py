@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from typing import Callable
 
 import discord
+import graphviz
+
+GRAPH_CACHE_SIZE = 32
+GRAPH_RENDER_WORKERS = 2
 
 
 def create_timeline_embed(
@@ -164,3 +173,90 @@ def create_location_map(locations: dict) -> str:
 
     dot.append("}")
     return "\n".join(dot)
+
+
+def focused_relationships(relationships: dict, focus: str, depth: int = 1) -> dict:
+    """
+    Limit a relationship map to characters within ``depth`` links of ``focus``.
+    Links are followed in both directions, so the focus also shows who points at it.
+    """
+    neighbours: dict[str, set[str]] = {}
+    for char, rels in relationships.items():
+        for targets in rels.values():
+            for target in targets:
+                neighbours.setdefault(char, set()).add(target)
+                neighbours.setdefault(target, set()).add(char)
+
+    included = {focus}
+    frontier = {focus}
+    for _ in range(depth):
+        frontier = {name for current in frontier for name in neighbours.get(current, ())} - included
+        included |= frontier
+
+    subgraph = {focus: {}}
+    for char, rels in relationships.items():
+        if char not in included:
+            continue
+        kept = {rel_type: [target for target in targets if target in included] for rel_type, targets in rels.items()}
+        subgraph[char] = {rel_type: targets for rel_type, targets in kept.items() if targets}
+    return subgraph
+
+
+def render_graph_png(dot_source: str) -> bytes:
+    """Render DOT source to PNG bytes through graphviz's stdout pipe."""
+    return graphviz.Source(dot_source).pipe(format="png")
+
+
+class GraphRenderCache:
+    """
+    Render DOT graphs in a small worker pool and keep recent PNGs keyed by a hash of the source.
+    Concurrent requests for the same source share one render.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = GRAPH_CACHE_SIZE,
+        workers: int = GRAPH_RENDER_WORKERS,
+        renderer: Callable[[str], bytes] = render_graph_png,
+    ):
+        self.max_entries = max_entries
+        self.renders = 0
+        self._renderer = renderer
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fable-graphviz")
+        self._images: OrderedDict[str, bytes] = OrderedDict()
+        self._pending: dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def key(dot_source: str) -> str:
+        return hashlib.sha256(dot_source.encode("utf-8")).hexdigest()
+
+    async def render(self, dot_source: str) -> bytes:
+        """Return the PNG for ``dot_source``, rendering it only when it is not cached."""
+        key = self.key(dot_source)
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+            return image
+
+        task = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = asyncio.create_task(self._render(key, dot_source))
+        # One caller giving up must not cancel the render the others are waiting on.
+        return await asyncio.shield(task)
+
+    async def _render(self, key: str, dot_source: str) -> bytes:
+        try:
+            image = await asyncio.get_running_loop().run_in_executor(self._executor, self._renderer, dot_source)
+        finally:
+            self._pending.pop(key, None)
+        self.renders += 1
+        self._images[key] = image
+        while len(self._images) > self.max_entries:
+            self._images.popitem(last=False)
+        return image
+
+    def close(self) -> None:
+        for task in self._pending.values():
+            task.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
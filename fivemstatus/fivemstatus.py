@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
 import re
 from datetime import datetime, time, timedelta, timezone
@@ -45,6 +47,10 @@ class FiveMStatus(DashboardIntegration, commands.Cog):
     DEFAULT_COLOR = 0x3B315F
     OFFLINE_COLOR = 0xD84E4E
     CFX_JOIN_CODE_RE = re.compile(r"[a-z0-9]{3,24}", re.IGNORECASE)
+    FETCH_CONCURRENCY = 8
+    EDIT_CONCURRENCY = 4
+    # Unchanged panels are still rewritten this often, so a deleted panel is noticed and reposted.
+    UNCHANGED_EDIT_INTERVAL = 900
 
     def __init__(self, bot: Red) -> None:
         self.bot = bot
@@ -72,6 +78,10 @@ class FiveMStatus(DashboardIntegration, commands.Cog):
             last_seen_online=False,
         )
         self._session: aiohttp.ClientSession | None = None
+        self._fetch_budget = asyncio.Semaphore(self.FETCH_CONCURRENCY)
+        self._edit_budget = asyncio.Semaphore(self.EDIT_CONCURRENCY)
+        # Guild ID -> (status message ID, digest of the embed and view last sent to it, write timestamp).
+        self._rendered: dict[int, tuple[int, str, float]] = {}
         self._task = self.status_loop.start()
 
     async def cog_unload(self) -> None:
@@ -87,18 +97,29 @@ class FiveMStatus(DashboardIntegration, commands.Cog):
 
     @tasks.loop(minutes=1)
     async def status_loop(self) -> None:
-        """Refresh every configured status message."""
+        """Refresh every configured status message, polling each distinct server once."""
         all_guilds = await self.config.all_guilds()
+        targets = []
         for guild_id, settings in all_guilds.items():
-            if not settings.get("enabled"):
+            if not settings.get("enabled") or not settings.get("server_address"):
                 continue
             guild = self.bot.get_guild(guild_id)
             if guild is None:
                 continue
-            try:
-                await self._update_status_message(guild, settings)
-            except RECOVERABLE_EXCEPTIONS:
-                log.exception("Failed to update FiveM status for guild %s", guild_id)
+            targets.append((guild, settings))
+
+        addresses = list(dict.fromkeys(settings["server_address"] for _guild, settings in targets))
+        results = await asyncio.gather(*(self._fetch_server_data_limited(address) for address in addresses))
+        fetched = dict(zip(addresses, results))
+        await asyncio.gather(
+            *(self._refresh_guild(guild, settings, fetched[settings["server_address"]]) for guild, settings in targets),
+        )
+
+    async def _refresh_guild(self, guild: discord.Guild, settings: GuildSettings, data: ServerData) -> None:
+        try:
+            await self._update_status_message(guild, settings, data=data, skip_unchanged=True)
+        except RECOVERABLE_EXCEPTIONS:
+            log.exception("Failed to update FiveM status for guild %s", guild.id)
 
     @status_loop.before_loop
     async def before_status_loop(self) -> None:
@@ -567,6 +588,10 @@ class FiveMStatus(DashboardIntegration, commands.Cog):
             self._session = aiohttp.ClientSession()
         return self._session
 
+    async def _fetch_server_data_limited(self, server_address: str) -> ServerData:
+        async with self._fetch_budget:
+            return await self._fetch_server_data(server_address)
+
     async def _fetch_server_data(self, server_address: str) -> ServerData:
         if server_address.startswith("cfx:"):
             return await self._fetch_cfx_data(server_address[4:])
@@ -691,27 +716,10 @@ class FiveMStatus(DashboardIntegration, commands.Cog):
             return text
         return text[: max(0, limit - 3)].rstrip() + "..."
 
-    @staticmethod
-    def _format_duration(seconds: float | None) -> str:
-        if seconds is None:
-            return "Not tracked"
-        seconds = max(0, int(seconds))
-        days, seconds = divmod(seconds, 86400)
-        hours, seconds = divmod(seconds, 3600)
-        minutes, _seconds = divmod(seconds, 60)
-        parts = []
-        if days:
-            parts.append(f"{days} day{'s' if days != 1 else ''}")
-        if hours:
-            parts.append(f"{hours} hr{'s' if hours != 1 else ''}")
-        if minutes or not parts:
-            parts.append(f"{minutes} min{'s' if minutes != 1 else ''}")
-        return ", ".join(parts[:2])
-
-    def _format_next_restart(self, settings: GuildSettings) -> str:
+    def _next_restart_timestamp(self, settings: GuildSettings) -> int | None:
         restart_times = settings.get("restart_times") or []
         if not restart_times:
-            return "Not set"
+            return None
 
         timezone_name = settings.get("timezone") or "UTC"
         try:
@@ -732,10 +740,8 @@ class FiveMStatus(DashboardIntegration, commands.Cog):
             candidates.append(restart_at)
 
         if not candidates:
-            return "Not set"
-
-        next_restart = min(candidates)
-        return f"in {self._format_duration((next_restart - now).total_seconds())}"
+            return None
+        return int(min(candidates).timestamp())
 
     async def _update_status_message(
         self,
@@ -743,7 +749,9 @@ class FiveMStatus(DashboardIntegration, commands.Cog):
         settings: GuildSettings | None = None,
         *,
         force_post: bool = False,
-    ) -> discord.Message:
+        data: ServerData | None = None,
+        skip_unchanged: bool = False,
+    ) -> discord.Message | discord.PartialMessage:
         settings = settings or await self.config.guild(guild).all()
         server_address = settings.get("server_address")
         channel_id = settings.get("status_channel_id")
@@ -765,51 +773,65 @@ class FiveMStatus(DashboardIntegration, commands.Cog):
                 "The configured FiveM status channel was not found.",
             )
 
-        data = await self._fetch_server_data(server_address)
+        if data is None:
+            data = await self._fetch_server_data(server_address)
         settings = await self._sync_uptime_state(guild, settings, data["online"])
         embed = self._build_status_embed(settings, data)
         view = self._build_status_view(settings, data)
+        digest = self._render_digest(embed, view)
 
-        message = None
-        message_id = settings.get("status_message_id")
+        message_id = self._to_int(settings.get("status_message_id"), None)
         if message_id and not force_post:
-            try:
-                message = await channel.fetch_message(int(message_id))
-            except (
-                discord.NotFound,
-                discord.Forbidden,
-                discord.HTTPException,
-                ValueError,
-                TypeError,
+            # Edit by ID so a refresh costs one API call instead of a fetch plus an edit.
+            message = channel.get_partial_message(message_id)
+            rendered = self._rendered.get(guild.id)
+            if (
+                skip_unchanged
+                and rendered is not None
+                and rendered[:2] == (message_id, digest)
+                and datetime.now(timezone.utc).timestamp() - rendered[2] < self.UNCHANGED_EDIT_INTERVAL
             ):
-                message = None
-
-        if message is None:
+                return message
             try:
-                message = await channel.send(embed=embed, view=view)
+                async with self._edit_budget:
+                    edited = await message.edit(embed=embed, view=view)
+            except discord.NotFound:
+                pass
             except discord.Forbidden as error:
                 raise commands.UserFeedbackCheckFailure(
-                    "I cannot send the FiveM status panel in the configured channel.",
+                    "I cannot edit the configured FiveM status panel.",
                 ) from error
             except discord.HTTPException as error:
                 raise commands.UserFeedbackCheckFailure(
-                    f"Discord rejected the FiveM status panel: {error}",
+                    f"Discord rejected the FiveM status update: {error}",
                 ) from error
-            await self.config.guild(guild).status_message_id.set(message.id)
-            return message
+            else:
+                self._rendered[guild.id] = (message_id, digest, datetime.now(timezone.utc).timestamp())
+                return edited
 
         try:
-            await message.edit(embed=embed, view=view)
+            async with self._edit_budget:
+                message = await channel.send(embed=embed, view=view)
         except discord.Forbidden as error:
             raise commands.UserFeedbackCheckFailure(
-                "I cannot edit the configured FiveM status panel.",
+                "I cannot send the FiveM status panel in the configured channel.",
             ) from error
         except discord.HTTPException as error:
             raise commands.UserFeedbackCheckFailure(
-                f"Discord rejected the FiveM status update: {error}",
+                f"Discord rejected the FiveM status panel: {error}",
             ) from error
+        await self.config.guild(guild).status_message_id.set(message.id)
+        self._rendered[guild.id] = (message.id, digest, datetime.now(timezone.utc).timestamp())
         return message
 
+    @staticmethod
+    def _render_digest(embed: discord.Embed, view: discord.ui.View | None) -> str:
+        """Hash what a panel shows, ignoring the embed timestamp that changes on every render."""
+        payload = embed.to_dict()
+        payload.pop("timestamp", None)
+        components = view.to_components() if view else []
+        return hashlib.sha256(json.dumps([payload, components], sort_keys=True, default=str).encode()).hexdigest()
+
     async def _sync_uptime_state(
         self,
         guild: discord.Guild,
@@ -875,10 +897,10 @@ class FiveMStatus(DashboardIntegration, commands.Cog):
         )
         connect_command = f"connect {connect_endpoint}"
 
+        # Relative timestamps are kept current by Discord clients, so the panel text, and with it the
+        # render digest, stays the same from one minute to the next.
         online_since = self._to_int(settings.get("online_since"), None)
-        uptime_seconds = None
-        if online and online_since:
-            uptime_seconds = datetime.now(timezone.utc).timestamp() - online_since
+        next_restart = self._next_restart_timestamp(settings)
 
         embed.add_field(name="STATUS", value=f"`{status_text}`", inline=True)
         embed.add_field(name="PLAYERS", value=f"`{players_text}`", inline=True)
@@ -890,12 +912,12 @@ class FiveMStatus(DashboardIntegration, commands.Cog):
         )
         embed.add_field(
             name="NEXT RESTART",
-            value=f"`{self._format_next_restart(settings)}`",
+            value=f"<t:{next_restart}:R>" if next_restart else "`Not set`",
             inline=True,
         )
         embed.add_field(
             name="UPTIME",
-            value=f"`{self._format_duration(uptime_seconds)}`",
+            value=f"<t:{online_since}:R>" if online and online_since else "`Not tracked`",
             inline=True,
         )
         embed.add_field(name="\u200b", value="\u200b", inline=True)
@@ -2,7 +2,8 @@ from .giveaway import Giveaway
 
 __red_end_user_data_statement__ = (
     "This cog stores per-guild giveaway records, including giveaway message IDs, channel IDs, "
-    "host IDs, winner IDs, prize text, and timestamps needed to end giveaways automatically."
+    "host IDs, winner IDs, prize text, and timestamps needed to end giveaways automatically. "
+    "Giveaways started with high-volume tracking also store the user IDs of their entrants."
 )
 
 
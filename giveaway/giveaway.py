@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import heapq
 import logging
 import random
 import re
@@ -367,6 +368,11 @@ class Giveaway(DashboardIntegration, commands.Cog):
     MIN_DURATION_SECONDS = 30
     MAX_DURATION_SECONDS = 60 * 60 * 24 * 365
     MAX_WINNERS = 25
+    END_CONCURRENCY = 4
+    END_RETRY_SECONDS = 60
+    # Upper bound on one scheduler sleep, so wall-clock adjustments are noticed.
+    MAX_SCHEDULER_SLEEP = 60 * 60
+    ENTRANT_FLUSH_SECONDS = 15
     DURATION_RE = re.compile(r"(\d+)([smhdw])", re.IGNORECASE)
     MESSAGE_LINK_RE = re.compile(
         r"https?://(?:ptb\.|canary\.)?discord(?:app)?\.com/channels/"
@@ -380,16 +386,31 @@ class Giveaway(DashboardIntegration, commands.Cog):
             identifier=2026041101,
             force_registration=True,
         )
-        self.config.register_guild(giveaways={})
+        self.config.register_guild(giveaways={}, entrants={}, high_volume=False)
         self._giveaway_locks: dict[tuple[int, int], asyncio.Lock] = {}
+        # Min-heap of (ends_at, guild_id, message_id); entries not matching _deadlines are stale.
+        self._deadline_heap: list[tuple[float, int, int]] = []
+        self._deadlines: dict[tuple[int, int], float] = {}
+        self._deadlines_loaded = False
+        self._deadline_changed = asyncio.Event()
+        self._end_budget = asyncio.Semaphore(self.END_CONCURRENCY)
+        # Entrant ids of tracked giveaways, kept current from raw reaction events.
+        self._entrants: dict[tuple[int, int], set[int]] = {}
+        self._dirty_entrants: set[tuple[int, int]] = set()
+        # Tracked giveaways whose reactions may have changed while the cog was not listening.
+        self._unreconciled: set[tuple[int, int]] = set()
         self.giveaway_group = GiveawaySlashGroup(self)
         self._task = self.giveaway_loop.start()
+        self._flush_task = self.entrant_flush_loop.start()
 
     async def cog_unload(self) -> None:
         """Cancel the giveaway watcher when the cog unloads."""
         if self._task:
             self._task.cancel()
+        if self._flush_task:
+            self._flush_task.cancel()
         self.bot.tree.remove_command(self.giveaway_group.name)
+        await self._flush_entrants()
 
     async def red_delete_data_for_user(self, *, requester: str, user_id: int) -> None:
         """Remove stored host and winner references for a deleted user."""
@@ -402,41 +423,170 @@ class Giveaway(DashboardIntegration, commands.Cog):
                     winner_ids = [winner_id for winner_id in record.get("winner_ids", []) if winner_id != user_id]
                     if winner_ids != record.get("winner_ids", []):
                         record["winner_ids"] = winner_ids
-
-    @tasks.loop(seconds=30)
+            async with self.config.guild_from_id(guild_id).entrants() as entrants:
+                for message_id, entrant_ids in entrants.items():
+                    if user_id in entrant_ids:
+                        entrants[message_id] = [entrant_id for entrant_id in entrant_ids if entrant_id != user_id]
+        for entrant_ids in self._entrants.values():
+            entrant_ids.discard(user_id)
+
+    @tasks.loop(seconds=0)
     async def giveaway_loop(self) -> None:
-        """End active giveaways whose timers have elapsed."""
-        now = self._now_ts()
-        all_guilds = await self.config.all_guilds()
-        for guild_id, guild_data in all_guilds.items():
-            guild = self.bot.get_guild(guild_id)
-            if guild is None:
-                continue
-
-            for message_id, record in guild_data.get("giveaways", {}).items():
-                if record.get("status") != "active":
-                    continue
-                if float(record.get("ends_at", 0)) > now:
-                    continue
+        """Sleep until the next giveaway deadline, then end everything that is due."""
+        if not self._deadlines_loaded:
+            await self._load_deadlines()
+
+        self._deadline_changed.clear()
+        delay = self._next_deadline_delay()
+        if delay > 0:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._deadline_changed.wait(), timeout=delay)
+            return
 
-                try:
-                    await self._end_giveaway(guild, int(message_id))
-                except Exception:
-                    log.exception(
-                        "Failed to auto-end giveaway %s in guild %s",
-                        message_id,
-                        guild_id,
-                    )
+        due = self._pop_due_deadlines()
+        await asyncio.gather(*(self._end_due_giveaway(guild_id, message_id) for guild_id, message_id in due))
 
     @giveaway_loop.before_loop
     async def before_giveaway_loop(self) -> None:
         """Wait until the bot is ready before checking giveaways."""
         await self.bot.wait_until_ready()
 
+    @tasks.loop(seconds=ENTRANT_FLUSH_SECONDS)
+    async def entrant_flush_loop(self) -> None:
+        """Persist tracked entrant changes in batches."""
+        await self._flush_entrants()
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent) -> None:
+        """Record a tracked giveaway entry."""
+        entrant_ids = self._entrants.get((payload.guild_id, payload.message_id))
+        if entrant_ids is None or str(payload.emoji) != self.REACTION_EMOJI:
+            return
+        if payload.member is not None and payload.member.bot:
+            return
+        if payload.user_id not in entrant_ids:
+            entrant_ids.add(payload.user_id)
+            self._dirty_entrants.add((payload.guild_id, payload.message_id))
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent) -> None:
+        """Withdraw a tracked giveaway entry."""
+        entrant_ids = self._entrants.get((payload.guild_id, payload.message_id))
+        if entrant_ids is None or str(payload.emoji) != self.REACTION_EMOJI:
+            return
+        if payload.user_id in entrant_ids:
+            entrant_ids.discard(payload.user_id)
+            self._dirty_entrants.add((payload.guild_id, payload.message_id))
+
     @staticmethod
     def _now_ts() -> float:
         return datetime.now(timezone.utc).timestamp()
 
+    async def _load_deadlines(self) -> None:
+        all_guilds = await self.config.all_guilds()
+        for guild_id, guild_data in all_guilds.items():
+            for message_id, record in guild_data.get("giveaways", {}).items():
+                if record.get("status") != "active":
+                    continue
+                self._schedule_deadline(guild_id, int(message_id), float(record.get("ends_at", 0)))
+                if record.get("entry_mode") == "tracked" and (guild_id, int(message_id)) not in self._entrants:
+                    self._unreconciled.add((guild_id, int(message_id)))
+        self._deadlines_loaded = True
+
+    def _schedule_deadline(self, guild_id: int, message_id: int, ends_at: float) -> None:
+        self._deadlines[(guild_id, message_id)] = ends_at
+        heapq.heappush(self._deadline_heap, (ends_at, guild_id, message_id))
+        if self._deadline_heap[0][0] == ends_at:
+            self._deadline_changed.set()
+
+    def _unschedule_deadline(self, guild_id: int, message_id: int) -> None:
+        # The heap entry is left behind and discarded once it reaches the top.
+        self._deadlines.pop((guild_id, message_id), None)
+
+    def _discard_stale_deadlines(self) -> None:
+        heap = self._deadline_heap
+        while heap and self._deadlines.get((heap[0][1], heap[0][2])) != heap[0][0]:
+            heapq.heappop(heap)
+
+    def _next_deadline_delay(self) -> float:
+        self._discard_stale_deadlines()
+        if not self._deadline_heap:
+            return self.MAX_SCHEDULER_SLEEP
+        return min(self._deadline_heap[0][0] - self._now_ts(), self.MAX_SCHEDULER_SLEEP)
+
+    def _pop_due_deadlines(self) -> list[tuple[int, int]]:
+        now = self._now_ts()
+        due = []
+        self._discard_stale_deadlines()
+        while self._deadline_heap and self._deadline_heap[0][0] <= now:
+            _ends_at, guild_id, message_id = heapq.heappop(self._deadline_heap)
+            del self._deadlines[(guild_id, message_id)]
+            due.append((guild_id, message_id))
+            self._discard_stale_deadlines()
+        return due
+
+    async def _end_due_giveaway(self, guild_id: int, message_id: int) -> None:
+        async with self._end_budget:
+            guild = self.bot.get_guild(guild_id)
+            if guild is None:
+                self._schedule_deadline(guild_id, message_id, self._now_ts() + self.END_RETRY_SECONDS)
+                return
+
+            try:
+                await self._end_giveaway(guild, message_id)
+            except commands.CommandError:
+                # Already ended, cancelled, or removed by someone else.
+                return
+            except Exception:
+                log.exception(
+                    "Failed to auto-end giveaway %s in guild %s",
+                    message_id,
+                    guild_id,
+                )
+                self._schedule_deadline(guild_id, message_id, self._now_ts() + self.END_RETRY_SECONDS)
+
+    async def _flush_entrants(self, *keys: tuple[int, int]) -> None:
+        """Write dirty entrant sets, or only the given ones, to Config."""
+        for key in keys or tuple(self._dirty_entrants):
+            if key not in self._dirty_entrants:
+                continue
+            self._dirty_entrants.discard(key)
+            guild_id, message_id = key
+            entrant_ids = self._entrants.get(key, set())
+            await self.config.guild_from_id(guild_id).entrants.set_raw(str(message_id), value=sorted(entrant_ids))
+
+    async def _tracked_entrant_ids(
+        self,
+        guild_id: int,
+        message_id: int,
+        message: discord.Message | None,
+        *,
+        reconcile: bool = True,
+    ) -> set[int]:
+        key = (guild_id, message_id)
+        entrant_ids = self._entrants.get(key)
+        if entrant_ids is None:
+            stored = await self.config.guild_from_id(guild_id).entrants.get_raw(str(message_id), default=[])
+            entrant_ids = set(stored)
+        if reconcile and key in self._unreconciled and message is not None:
+            # Events were missed while the cog was not loaded, so fall back to one reaction walk.
+            entrant_ids = await self._collect_entrant_ids(message)
+            self._unreconciled.discard(key)
+            self._dirty_entrants.add(key)
+        self._entrants[key] = entrant_ids
+        return entrant_ids
+
+    async def _release_entrants(self, guild_id: int, message_id: int, *, keep: bool) -> None:
+        """Stop tracking a closed giveaway, keeping its entrant ids for rerolls when asked."""
+        key = (guild_id, message_id)
+        if keep:
+            await self._flush_entrants(key)
+        else:
+            self._dirty_entrants.discard(key)
+            await self.config.guild_from_id(guild_id).entrants.clear_raw(str(message_id))
+        self._entrants.pop(key, None)
+        self._unreconciled.discard(key)
+
     @staticmethod
     def _shorten(text: str, limit: int) -> str:
         if len(text) <= limit:
@@ -608,6 +758,7 @@ class Giveaway(DashboardIntegration, commands.Cog):
         winner_count: int,
         ends_at: float,
         source: str,
+        entry_mode: str = "reactions",
     ) -> dict[str, Any]:
         return {
             "guild_id": guild_id,
@@ -623,8 +774,12 @@ class Giveaway(DashboardIntegration, commands.Cog):
             "ended_at": None,
             "entry_count": 0,
             "source": source,
+            "entry_mode": entry_mode,
         }
 
+    async def _entry_mode(self, guild: discord.Guild) -> str:
+        return "tracked" if await self.config.guild(guild).high_volume() else "reactions"
+
     def _infer_prize_from_message(self, message: discord.Message) -> str:
         if message.embeds:
             first_embed = message.embeds[0]
@@ -665,15 +820,19 @@ class Giveaway(DashboardIntegration, commands.Cog):
             winner_count,
             ends_at,
             "created",
+            await self._entry_mode(guild),
         )
 
         giveaway_message = await channel.send(
             embed=self._build_giveaway_embed(record),
             allowed_mentions=discord.AllowedMentions.none(),
         )
+        if record["entry_mode"] == "tracked":
+            self._entrants[(guild.id, giveaway_message.id)] = set()
         try:
             await giveaway_message.add_reaction(self.REACTION_EMOJI)
         except discord.HTTPException as exc:
+            self._entrants.pop((guild.id, giveaway_message.id), None)
             with contextlib.suppress(discord.HTTPException):
                 await giveaway_message.delete()
             raise commands.CommandError(
@@ -684,6 +843,7 @@ class Giveaway(DashboardIntegration, commands.Cog):
         record["status_message_id"] = giveaway_message.id
         async with self.config.guild(guild).giveaways() as giveaways:
             giveaways[str(giveaway_message.id)] = record
+        self._schedule_deadline(guild.id, giveaway_message.id, ends_at)
 
         duration_text = humanize_timedelta(seconds=duration_seconds) or f"{duration_seconds} seconds"
         return record, giveaway_message, duration_text
@@ -739,6 +899,7 @@ class Giveaway(DashboardIntegration, commands.Cog):
             winner_count,
             ends_at,
             "attached",
+            await self._entry_mode(guild),
         )
         record["message_id"] = entry_message.id
 
@@ -757,9 +918,16 @@ class Giveaway(DashboardIntegration, commands.Cog):
                 "Check my `Add Reactions` permission and make sure the message still exists.",
             ) from exc
 
+        if record["entry_mode"] == "tracked":
+            # The message may already carry reactions, so seed the set once and follow events from then on.
+            entrant_ids = self._entrants[(guild.id, entry_message.id)] = set()
+            entrant_ids |= await self._collect_entrant_ids(entry_message)
+            self._dirty_entrants.add((guild.id, entry_message.id))
+
         record["status_message_id"] = status_message.id
         async with self.config.guild(guild).giveaways() as stored_giveaways:
             stored_giveaways[str(entry_message.id)] = record
+        self._schedule_deadline(guild.id, entry_message.id, ends_at)
 
         try:
             await status_message.edit(embed=self._build_giveaway_embed(record))
@@ -864,6 +1032,44 @@ class Giveaway(DashboardIntegration, commands.Cog):
 
         return entrants
 
+    async def _collect_entrant_ids(self, message: discord.Message) -> set[int]:
+        reaction = discord.utils.get(message.reactions, emoji=self.REACTION_EMOJI)
+        if reaction is None:
+            return set()
+        return {user.id async for user in reaction.users() if not user.bot}
+
+    async def _resolve_entrant(self, guild: discord.Guild, user_id: int) -> discord.Member | None:
+        member = guild.get_member(user_id)
+        if member is None:
+            try:
+                member = await guild.fetch_member(user_id)
+            except (discord.NotFound, discord.Forbidden, discord.HTTPException):
+                return None
+        return None if member.bot else member
+
+    async def _pick_tracked_winners(
+        self,
+        guild: discord.Guild,
+        entrant_ids: set[int],
+        winner_count: int,
+        excluded_ids: set[int] | None = None,
+    ) -> list[discord.Member]:
+        """Sample winners from tracked ids, resolving only the sampled members and redrawing invalid ones."""
+        excluded_ids = excluded_ids or set()
+        pool = [entrant_id for entrant_id in entrant_ids if entrant_id not in excluded_ids]
+        winners: list[discord.Member] = []
+        while pool and len(winners) < winner_count:
+            index = random.randrange(len(pool))
+            pool[index], pool[-1] = pool[-1], pool[index]
+            user_id = pool.pop()
+            member = await self._resolve_entrant(guild, user_id)
+            if member is None:
+                # Left the server or is a bot; they no longer count as an entry.
+                entrant_ids.discard(user_id)
+                continue
+            winners.append(member)
+        return winners
+
     @staticmethod
     def _pick_winners(
         entrants: list[discord.Member],
@@ -963,16 +1169,26 @@ class Giveaway(DashboardIntegration, commands.Cog):
                 raise commands.CommandError("That giveaway is not active.")
 
             message = await self._fetch_giveaway_message(guild, record)
-            entrants = await self._get_entrants(message) if message is not None else []
-            winners = self._pick_winners(entrants, int(record.get("winner_count", 1)))
+            winner_count = int(record.get("winner_count", 1))
+            if record.get("entry_mode") == "tracked":
+                entrant_ids = await self._tracked_entrant_ids(guild.id, message_id, message)
+                winners = await self._pick_tracked_winners(guild, entrant_ids, winner_count)
+                entry_count = len(entrant_ids)
+                self._dirty_entrants.add((guild.id, message_id))
+                await self._release_entrants(guild.id, message_id, keep=True)
+            else:
+                entrants = await self._get_entrants(message) if message is not None else []
+                winners = self._pick_winners(entrants, winner_count)
+                entry_count = len(entrants)
 
             record["status"] = "ended"
             record["ended_at"] = self._now_ts()
-            record["entry_count"] = len(entrants)
+            record["entry_count"] = entry_count
             record["winner_ids"] = [winner.id for winner in winners]
 
             async with self.config.guild(guild).giveaways() as stored_giveaways:
                 stored_giveaways[key] = record
+            self._unschedule_deadline(guild.id, message_id)
 
             await self._edit_giveaway_message(guild, record)
 
@@ -1014,15 +1230,20 @@ class Giveaway(DashboardIntegration, commands.Cog):
                 raise commands.CommandError("Only active giveaways can be cancelled.")
 
             message = await self._fetch_giveaway_message(guild, record)
-            entrants = await self._get_entrants(message) if message is not None else []
+            if record.get("entry_mode") == "tracked":
+                entry_count = len(await self._tracked_entrant_ids(guild.id, message_id, message))
+                await self._release_entrants(guild.id, message_id, keep=False)
+            else:
+                entry_count = len(await self._get_entrants(message)) if message is not None else 0
 
             record["status"] = "cancelled"
             record["ended_at"] = self._now_ts()
-            record["entry_count"] = len(entrants)
+            record["entry_count"] = entry_count
             record["winner_ids"] = []
 
             async with self.config.guild(guild).giveaways() as stored_giveaways:
                 stored_giveaways[key] = record
+            self._unschedule_deadline(guild.id, message_id)
 
             await self._edit_giveaway_message(guild, record)
             return record
@@ -1045,18 +1266,31 @@ class Giveaway(DashboardIntegration, commands.Cog):
             if record.get("status") != "ended":
                 raise commands.CommandError("Only ended giveaways can be rerolled.")
 
-            message = await self._fetch_giveaway_message(guild, record)
-            if message is None:
-                raise commands.CommandError(
-                    "I couldn't fetch the giveaway message, so I can't reroll the entrants.",
+            if record.get("entry_mode") == "tracked":
+                entrant_ids = await self._tracked_entrant_ids(guild.id, message_id, None, reconcile=False)
+                winners = await self._pick_tracked_winners(
+                    guild,
+                    entrant_ids,
+                    winner_count,
+                    excluded_ids=set(record.get("winner_ids", [])),
                 )
+                entry_count = len(entrant_ids)
+                self._dirty_entrants.add((guild.id, message_id))
+                await self._release_entrants(guild.id, message_id, keep=True)
+            else:
+                message = await self._fetch_giveaway_message(guild, record)
+                if message is None:
+                    raise commands.CommandError(
+                        "I couldn't fetch the giveaway message, so I can't reroll the entrants.",
+                    )
 
-            entrants = await self._get_entrants(message)
-            winners = self._pick_winners(
-                entrants,
-                winner_count,
-                excluded_ids=set(record.get("winner_ids", [])),
-            )
+                entrants = await self._get_entrants(message)
+                winners = self._pick_winners(
+                    entrants,
+                    winner_count,
+                    excluded_ids=set(record.get("winner_ids", [])),
+                )
+                entry_count = len(entrants)
             if not winners:
                 raise commands.CommandError(
                     "No new eligible entrants are available for a reroll.",
@@ -1064,7 +1298,7 @@ class Giveaway(DashboardIntegration, commands.Cog):
 
             record["winner_count"] = winner_count
             record["winner_ids"] = [winner.id for winner in winners]
-            record["entry_count"] = len(entrants)
+            record["entry_count"] = entry_count
             record["ended_at"] = self._now_ts()
 
             async with self.config.guild(guild).giveaways() as stored_giveaways:
@@ -1289,6 +1523,14 @@ class Giveaway(DashboardIntegration, commands.Cog):
         await self._announce_reroll(ctx.guild, updated_record, winners)
         await ctx.send(f"Rerolled winner(s): {winner_text}")
 
+    @giveaway.command(name="highvolume")
+    @commands.guild_only()
+    @commands.admin_or_permissions(manage_guild=True)
+    async def giveaway_high_volume(self, ctx: commands.Context, enabled: bool) -> None:
+        """Track entries from reaction events for giveaways started from now on."""
+        await self.config.guild(ctx.guild).high_volume.set(enabled)
+        await ctx.send(f"High-volume entry tracking is now {'enabled' if enabled else 'disabled'} for new giveaways.")
+
     @giveaway.command(name="list")
     @commands.guild_only()
     async def giveaway_list(self, ctx: commands.Context) -> None:
@@ -330,7 +330,7 @@ class DashboardIntegration:
             )
 
         await self.config.guild(guild).inviters.set({})
-        await self.config.guild(guild).members.set({})
+        await self._history.clear_guild(guild.id)
         await self.config.guild(guild).unknown_joins.set(0)
         try:
             invite_cache = await self._refresh_invite_cache(guild)
@@ -356,15 +356,15 @@ class DashboardIntegration:
         settings = await self.config.guild(guild).all()
         invite_cache = settings.get("invite_cache") or {}
         inviters = settings.get("inviters") or {}
-        members = settings.get("members") or {}
         csrf = self._dash_csrf(kwargs)
 
         total_joins = sum(int(stats.get("joins", 0)) for stats in inviters.values())
         total_leaves = sum(int(stats.get("leaves", 0)) for stats in inviters.values())
         total_fake = sum(int(stats.get("fake", 0)) for stats in inviters.values())
-        active_members = sum(1 for record in members.values() if not record.get("left_at"))
+        active_members = await self._history.active_count(guild.id)
+        recent, _total = await self._history.joins_page(guild.id, limit=10)
         leaderboard = self._leaderboard_rows(guild, inviters)
-        recent_members = self._recent_member_rows(guild, members)
+        recent_members = self._recent_member_rows(guild, recent)
         active_tab = self._dashboard_active_tab(
             kwargs,
             {
@@ -521,17 +521,12 @@ color: #07111f; }}
     def _recent_member_rows(
         self,
         guild: discord.Guild,
-        members: dict[str, typing.Any],
+        records: list[dict[str, typing.Any]],
     ) -> str:
-        if not members:
+        if not records:
             return '<p class="it-muted">No member join sources have been tracked yet.</p>'
-        records = sorted(
-            members.values(),
-            key=lambda record: float(record.get("joined_at") or 0),
-            reverse=True,
-        )
         rows = []
-        for record in records[:10]:
+        for record in records:
             member_id = record.get("member_id")
             inviter_id = record.get("inviter_id")
             left = "Yes" if record.get("left_at") else "No"
@@ -3,17 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-import csv
-import io
+import heapq
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 import discord
 from redbot.core import Config, commands
+from redbot.core.data_manager import cog_data_path
 from redbot.core.utils.chat_formatting import box, pagify
 
 from .dashboard_integration import DashboardIntegration
+from .storage import MemberHistoryStore
 
 if TYPE_CHECKING:
     from redbot.core.bot import Red
@@ -26,6 +28,16 @@ MemberRecord = dict[str, Any]
 StatsRecord = dict[str, int]
 
 
+@dataclass
+class PendingJoin:
+    """A member join waiting for its guild's next attribution batch."""
+
+    member: discord.Member
+    joined_at: float
+    queued_at: float
+    done: asyncio.Future[None] = field(repr=False)
+
+
 class InviteTracker(DashboardIntegration, commands.Cog):
     """Track Discord invite usage, joins, leaves, fake joins, and leaderboards."""
 
@@ -33,6 +45,8 @@ class InviteTracker(DashboardIntegration, commands.Cog):
     JOIN_COLOR = 0x3BA55D
     LEAVE_COLOR = 0xED4245
     FAKE_COLOR = 0xFEE75C
+    JOIN_BATCH_SECONDS = 1.0
+    JOINED_BY_PAGE_SIZE = 20
 
     def __init__(self, bot: Red) -> None:
         self.bot = bot
@@ -52,28 +66,49 @@ class InviteTracker(DashboardIntegration, commands.Cog):
             unknown_joins=0,
         )
         self._locks: dict[int, asyncio.Lock] = {}
+        self._pending_joins: dict[int, list[PendingJoin]] = {}
+        # (guild_id, member_id) -> completion of a join that has not been written yet.
+        self._unrecorded_joins: dict[tuple[int, int], asyncio.Future[None]] = {}
+        self._join_batchers: dict[int, asyncio.Task[None]] = {}
+        self._join_metrics: dict[int, dict[str, float]] = {}
+        self._history = MemberHistoryStore(cog_data_path(self) / "history.sqlite3")
         self._startup_task = asyncio.create_task(self._refresh_enabled_guilds())
 
+    async def cog_load(self) -> None:
+        """Open the join history and move legacy Config member records into it."""
+        await self._history.initialize()
+        all_guilds = await self.config.all_guilds()
+        for guild_id, settings in all_guilds.items():
+            members = settings.get("members") or {}
+            if not members:
+                continue
+            imported = await self._history.import_guild(guild_id, members)
+            await self.config.guild_from_id(guild_id).members.clear()
+            log.info("Moved %s InviteTracker member record(s) for guild %s into SQLite", imported, guild_id)
+
     async def cog_unload(self) -> None:
-        """Cancel startup work when the cog unloads."""
+        """Cancel startup and pending join work when the cog unloads."""
         if self._startup_task and not self._startup_task.done():
             self._startup_task.cancel()
+        for task in self._join_batchers.values():
+            task.cancel()
+        for pending_joins in self._pending_joins.values():
+            for pending in pending_joins:
+                pending.done.cancel()
+        self._join_batchers.clear()
+        self._pending_joins.clear()
+        self._unrecorded_joins.clear()
 
     async def red_delete_data_for_user(self, *, requester: str, user_id: int) -> None:
         """Delete stored invite records and stats for a Discord user ID."""
         user_key = str(user_id)
+        await self._history.delete_user(user_id)
         all_guilds = await self.config.all_guilds()
         for guild_id in all_guilds:
             guild_conf = self.config.guild_from_id(guild_id)
             async with guild_conf.inviters() as inviters:
                 inviters.pop(user_key, None)
 
-            async with guild_conf.members() as members:
-                members.pop(user_key, None)
-                for record in members.values():
-                    if str(record.get("inviter_id")) == user_key:
-                        record["inviter_id"] = None
-
             async with guild_conf.invite_cache() as invite_cache:
                 for record in invite_cache.values():
                     if str(record.get("inviter_id")) == user_key:
@@ -170,32 +205,42 @@ class InviteTracker(DashboardIntegration, commands.Cog):
         }
 
     @staticmethod
-    def _find_used_invite(
+    def _attribute_joins(
         before_cache: InviteCache,
         after_cache: InviteCache,
-    ) -> tuple[str | None, dict[str, Any] | None]:
-        candidates: list[tuple[int, int, str, dict[str, Any]]] = []
-
+        join_count: int,
+    ) -> list[tuple[str | None, dict[str, Any] | None]]:
+        """Attribute a batch of joins to invite use increases in one pass.
+
+        Each join consumes one observed use from the invite with the largest
+        remaining increase, exactly as if the joins had been diffed one at a
+        time. Consumed uses are written back into ``after_cache`` so increases
+        left over for filtered or late joins carry into the next batch.
+        """
+        candidates: list[tuple[int, int, str]] = []
+        consumed: dict[str, int] = {}
         for code, after_record in after_cache.items():
-            before_record = before_cache.get(code, {})
-            before_uses = int(before_record.get("uses") or 0)
+            before_uses = int(before_cache.get(code, {}).get("uses") or 0)
             after_uses = int(after_record.get("uses") or 0)
             if after_uses > before_uses:
-                candidates.append(
-                    (after_uses - before_uses, before_uses, code, after_record),
-                )
-
-        if not candidates:
-            return None, None
+                candidates.append((before_uses - after_uses, -after_uses, code))
+                consumed[code] = before_uses
+        heapq.heapify(candidates)
+
+        attributions: list[tuple[str | None, dict[str, Any] | None]] = []
+        for _index in range(join_count):
+            if not candidates:
+                attributions.append((None, None))
+                continue
+            remaining, after_uses, code = heapq.heappop(candidates)
+            consumed[code] += 1
+            attributions.append((code, {**after_cache[code], "uses": consumed[code]}))
+            if remaining + 1 < 0:
+                heapq.heappush(candidates, (remaining + 1, after_uses, code))
 
-        candidates.sort(
-            key=lambda item: (item[0], int(item[3].get("uses") or 0)),
-            reverse=True,
-        )
-        _delta, before_uses, code, record = candidates[0]
-        # Consume one observed use so burst joins can be attributed across member join events.
-        record["uses"] = before_uses + 1
-        return code, record
+        for code, uses in consumed.items():
+            after_cache[code]["uses"] = uses
+        return attributions
 
     async def _fetch_invite_cache(self, guild: discord.Guild) -> InviteCache:
         try:
@@ -241,10 +286,6 @@ class InviteTracker(DashboardIntegration, commands.Cog):
         stats.setdefault("fake", 0)
         return stats
 
-    async def _increment_unknown_joins(self, guild: discord.Guild) -> None:
-        current = await self.config.guild(guild).unknown_joins()
-        await self.config.guild(guild).unknown_joins.set(int(current or 0) + 1)
-
     async def _send_log(self, guild: discord.Guild, embed: discord.Embed) -> None:
         channel_id = await self.config.guild(guild).log_channel_id()
         if not channel_id:
@@ -345,62 +386,111 @@ class InviteTracker(DashboardIntegration, commands.Cog):
         return embed
 
     async def _record_join(self, member: discord.Member) -> None:
+        """Queue a join for attribution and wait until its batch is recorded."""
         guild = member.guild
-        settings = await self.config.guild(guild).all()
-        if not settings.get("enabled"):
+        guild_conf = self.config.guild(guild)
+        if not await guild_conf.enabled():
             return
-        if member.bot and not settings.get("include_bots"):
+        if member.bot and not await guild_conf.include_bots():
             return
 
-        invite_code: str | None = None
-        invite_record: dict[str, Any] | None = None
+        loop = asyncio.get_running_loop()
+        pending = PendingJoin(member, self._now_ts(), loop.time(), loop.create_future())
+        self._pending_joins.setdefault(guild.id, []).append(pending)
+        self._unrecorded_joins[(guild.id, member.id)] = pending.done
+        if guild.id not in self._join_batchers:
+            self._join_batchers[guild.id] = asyncio.create_task(self._run_join_batches(guild))
+        await asyncio.shield(pending.done)
+
+    async def _run_join_batches(self, guild: discord.Guild) -> None:
+        """Drain a guild's join queue, one coalesced batch per window."""
+        try:
+            while self._pending_joins.get(guild.id):
+                await asyncio.sleep(self.JOIN_BATCH_SECONDS)
+                batch = self._pending_joins.pop(guild.id, [])
+                try:
+                    await self._record_join_batch(guild, batch)
+                except Exception:
+                    log.exception("Failed to record a batch of %s invite joins for guild %s", len(batch), guild.id)
+                finally:
+                    for pending in batch:
+                        if not pending.done.done():
+                            pending.done.set_result(None)
+                        key = (guild.id, pending.member.id)
+                        if self._unrecorded_joins.get(key) is pending.done:
+                            del self._unrecorded_joins[key]
+        finally:
+            self._join_batchers.pop(guild.id, None)
+
+    async def _record_join_batch(self, guild: discord.Guild, batch: list[PendingJoin]) -> None:
+        """Attribute every queued join with one invite fetch and one Config write."""
+        if not batch:
+            return
+        guild_conf = self.config.guild(guild)
+        fake_age_hours = int(await guild_conf.fake_age_hours() or 0)
 
         async with self._guild_lock(guild.id):
-            before_cache = await self.config.guild(guild).invite_cache()
+            before_cache = await guild_conf.invite_cache()
+            after_cache: InviteCache | None
             try:
                 after_cache = await self._fetch_invite_cache(guild)
             except commands.CommandError:
-                await self._increment_unknown_joins(guild)
+                after_cache = None
+                attributions = [(None, None)] * len(batch)
                 log.warning(
-                    "Invite lookup failed for member join in guild %s",
+                    "Invite lookup failed for %s member join(s) in guild %s",
+                    len(batch),
                     guild.id,
                 )
             else:
-                invite_code, invite_record = self._find_used_invite(
-                    before_cache,
-                    after_cache,
-                )
-                await self.config.guild(guild).invite_cache.set(after_cache)
-                if invite_record is None:
-                    await self._increment_unknown_joins(guild)
-
-        fake_age_hours = int(settings.get("fake_age_hours") or 0)
-        is_fake = self._is_fake_join(member, fake_age_hours)
-        inviter_id = invite_record.get("inviter_id") if invite_record else None
-
-        member_record: MemberRecord = {
-            "member_id": member.id,
-            "inviter_id": inviter_id,
-            "invite_code": invite_code,
-            "joined_at": self._now_ts(),
-            "left_at": None,
-            "fake": is_fake,
-        }
-
-        async with self.config.guild(guild).members() as members:
-            members[str(member.id)] = member_record
-
-        if inviter_id:
-            async with self.config.guild(guild).inviters() as inviters:
-                stats = self._ensure_stats(inviters, inviter_id)
-                stats["joins"] += 1
-                if is_fake:
-                    stats["fake"] += 1
-
-        await self._send_log(
-            guild,
-            self._join_embed(member, invite_code, invite_record, is_fake),
+                attributions = self._attribute_joins(before_cache, after_cache, len(batch))
+
+            logs: list[discord.Embed] = []
+            records: list[MemberRecord] = []
+            async with guild_conf.all() as data:
+                if after_cache is not None:
+                    data["invite_cache"] = after_cache
+                inviters = data.setdefault("inviters", {})
+                for pending, (invite_code, invite_record) in zip(batch, attributions):
+                    member = pending.member
+                    is_fake = self._is_fake_join(member, fake_age_hours)
+                    inviter_id = invite_record.get("inviter_id") if invite_record else None
+                    records.append(
+                        {
+                            "member_id": member.id,
+                            "inviter_id": inviter_id,
+                            "invite_code": invite_code,
+                            "joined_at": pending.joined_at,
+                            "left_at": None,
+                            "fake": is_fake,
+                        },
+                    )
+                    if invite_record is None:
+                        data["unknown_joins"] = int(data.get("unknown_joins") or 0) + 1
+                    if inviter_id:
+                        stats = self._ensure_stats(inviters, inviter_id)
+                        stats["joins"] += 1
+                        if is_fake:
+                            stats["fake"] += 1
+                    logs.append(self._join_embed(member, invite_code, invite_record, is_fake))
+            await self._history.record_joins(guild.id, records)
+
+        self._record_attribution_metrics(guild.id, batch)
+        for embed in logs:
+            await self._send_log(guild, embed)
+
+    def _record_attribution_metrics(self, guild_id: int, batch: list[PendingJoin]) -> None:
+        now = asyncio.get_running_loop().time()
+        latencies = [now - pending.queued_at for pending in batch]
+        metrics = self._join_metrics.setdefault(
+            guild_id,
+            {"batches": 0, "joins": 0, "largest_batch": 0, "latency_total": 0.0, "latency_max": 0.0},
         )
+        metrics["batches"] += 1
+        metrics["joins"] += len(batch)
+        metrics["largest_batch"] = max(metrics["largest_batch"], len(batch))
+        metrics["latency_total"] += sum(latencies)
+        metrics["latency_max"] = max(metrics["latency_max"], *latencies)
 
     async def _record_leave(self, member: discord.Member) -> None:
         guild = member.guild
@@ -410,14 +500,12 @@ class InviteTracker(DashboardIntegration, commands.Cog):
         if member.bot and not settings.get("include_bots"):
             return
 
-        member_key = str(member.id)
-        record: MemberRecord | None = None
-        async with self.config.guild(guild).members() as members:
-            raw_record = members.get(member_key)
-            if raw_record:
-                raw_record["left_at"] = self._now_ts()
-                record = dict(raw_record)
+        joining = self._unrecorded_joins.get((guild.id, member.id))
+        if joining is not None:
+            # A member who leaves inside the batch window must close the join, not miss it.
+            await asyncio.wait([joining])
 
+        record = await self._history.record_leave(guild.id, member.id, self._now_ts())
         if not record:
             return
 
@@ -476,12 +564,11 @@ class InviteTracker(DashboardIntegration, commands.Cog):
         channel_text = f"<#{channel_id}>" if channel_id else "Not set"
         invite_cache = settings.get("invite_cache") or {}
         inviters = settings.get("inviters") or {}
-        members = settings.get("members") or {}
 
         total_joins = sum(int(stats.get("joins", 0)) for stats in inviters.values())
         total_leaves = sum(int(stats.get("leaves", 0)) for stats in inviters.values())
         total_fake = sum(int(stats.get("fake", 0)) for stats in inviters.values())
-        active_tracked = sum(1 for record in members.values() if not record.get("left_at"))
+        active_tracked = await self._history.active_count(ctx.guild.id)
 
         embed = discord.Embed(
             title="InviteTracker Settings",
@@ -541,11 +628,24 @@ class InviteTracker(DashboardIntegration, commands.Cog):
             ),
             inline=True,
         )
+        metrics = self._join_metrics.get(ctx.guild.id)
+        if metrics:
+            embed.add_field(
+                name="Join Attribution",
+                value=(
+                    f"Batches: **{self._count(int(metrics['batches']))}** "
+                    f"(largest {self._count(int(metrics['largest_batch']))} joins)\n"
+                    f"Average latency: **{metrics['latency_total'] / metrics['joins']:.2f}s**\n"
+                    f"Slowest join: **{metrics['latency_max']:.2f}s**"
+                ),
+                inline=False,
+            )
         embed.add_field(
             name="How It Works",
             value=(
                 "Discord does not tell bots the exact invite used on join. "
-                "InviteTracker compares invite use counts before and after a member joins."
+                "InviteTracker compares invite use counts before and after a member joins, "
+                "checking once for every burst of joins that arrive together."
             ),
             inline=False,
         )
@@ -692,7 +792,7 @@ class InviteTracker(DashboardIntegration, commands.Cog):
             return
 
         await self.config.guild(ctx.guild).inviters.set({})
-        await self.config.guild(ctx.guild).members.set({})
+        await self._history.clear_guild(ctx.guild.id)
         await self.config.guild(ctx.guild).unknown_joins.set(0)
         try:
             await self._refresh_invite_cache(ctx.guild)
@@ -732,10 +832,7 @@ class InviteTracker(DashboardIntegration, commands.Cog):
         embed.set_thumbnail(url=member.display_avatar.url)
         embed.add_field(name="Stats", value=self._stats_line(stats), inline=False)
 
-        members = await self.config.guild(ctx.guild).members()
-        active = sum(
-            1 for record in members.values() if str(record.get("inviter_id")) == str(member.id) and not record.get("left_at")
-        )
+        active = await self._history.active_count(ctx.guild.id, inviter_id=member.id)
         embed.add_field(
             name="Currently Tracked Members",
             value=self._count(active),
@@ -793,8 +890,7 @@ class InviteTracker(DashboardIntegration, commands.Cog):
     ) -> None:
         """Show which invite a member joined with."""
         assert ctx.guild is not None
-        members = await self.config.guild(ctx.guild).members()
-        record = members.get(str(member.id))
+        record = await self._history.latest_join(ctx.guild.id, member.id)
         if not record:
             await ctx.send("I do not have a tracked invite source for that member.")
             return
@@ -841,40 +937,80 @@ class InviteTracker(DashboardIntegration, commands.Cog):
         self,
         ctx: commands.Context,
         inviter: discord.Member,
-        limit: int = 20,
+        limit: int = JOINED_BY_PAGE_SIZE,
+        page: int = 1,
     ) -> None:
-        """List tracked current members invited by a member."""
+        """List tracked current members invited by a member, newest first, `limit` per page."""
         assert ctx.guild is not None
         limit = max(1, min(limit, 50))
-        members = await self.config.guild(ctx.guild).members()
-        records = [
-            record
-            for record in members.values()
-            if str(record.get("inviter_id")) == str(inviter.id) and not record.get("left_at")
-        ]
-        records.sort(
-            key=lambda record: float(record.get("joined_at") or 0),
-            reverse=True,
+        page = max(1, page)
+        records, total = await self._history.joins_page(
+            ctx.guild.id,
+            inviter_id=inviter.id,
+            active_only=True,
+            offset=(page - 1) * limit,
+            limit=limit,
         )
-        if not records:
+        if not total:
             await ctx.send(
                 f"No currently tracked members were invited by {inviter.mention}.",
             )
             return
+        pages = max(1, -(-total // limit))
+        if not records:
+            await ctx.send(f"There are only **{pages}** page(s) of members invited by {inviter.mention}.")
+            return
 
-        lines = []
-        for record in records[:limit]:
-            member_id = record.get("member_id")
-            invite_code = record.get("invite_code") or "unknown"
-            fake_text = " fake" if record.get("fake") else ""
-            lines.append(
-                f"{self._user_ref(member_id)} - `{invite_code}` - {self._format_ts(record.get('joined_at'), 'R')}{fake_text}",
-            )
+        lines = [self._join_line(record, show_inviter=False) for record in records]
+        header = f"Current tracked members invited by {inviter} ({total} total, page {page}/{pages}):"
+        for chunk in pagify("\n".join(lines), page_length=1800):
+            await ctx.send(box(f"{header}\n\n{chunk}"))
 
-        header = f"Current tracked members invited by {inviter} ({len(records)} total):"
-        pages = list(pagify("\n".join(lines), page_length=1800))
-        for page in pages:
-            await ctx.send(box(f"{header}\n\n{page}"))
+    @invites.command(name="code")
+    @commands.guild_only()
+    @commands.admin_or_permissions(manage_guild=True)
+    async def invites_code(
+        self,
+        ctx: commands.Context,
+        invite_code: str,
+        page: int = 1,
+    ) -> None:
+        """List every tracked join through one invite code, newest first."""
+        assert ctx.guild is not None
+        invite_code = invite_code.rsplit("/", 1)[-1]
+        page = max(1, page)
+        records, total = await self._history.joins_page(
+            ctx.guild.id,
+            invite_code=invite_code,
+            offset=(page - 1) * self.JOINED_BY_PAGE_SIZE,
+            limit=self.JOINED_BY_PAGE_SIZE,
+        )
+        if not total:
+            await ctx.send(f"No tracked joins used invite `{invite_code}`.")
+            return
+        pages = max(1, -(-total // self.JOINED_BY_PAGE_SIZE))
+        if not records:
+            await ctx.send(f"There are only **{pages}** page(s) of joins for `{invite_code}`.")
+            return
+
+        lines = [self._join_line(record, show_inviter=True) for record in records]
+        header = f"Tracked joins through {invite_code} ({total} total, page {page}/{pages}):"
+        for chunk in pagify("\n".join(lines), page_length=1800):
+            await ctx.send(box(f"{header}\n\n{chunk}"))
+
+    def _join_line(self, record: MemberRecord, *, show_inviter: bool) -> str:
+        parts = [self._user_ref(record.get("member_id"))]
+        if show_inviter:
+            parts.append(f"by {self._user_ref(record.get('inviter_id'))}")
+        else:
+            parts.append(f"`{record.get('invite_code') or 'unknown'}`")
+        parts.append(self._format_ts(record.get("joined_at"), "R"))
+        line = " - ".join(parts)
+        if record.get("left_at"):
+            line += " left"
+        if record.get("fake"):
+            line += " fake"
+        return line
 
     @invites.command(name="export")
     @commands.guild_only()
@@ -883,37 +1019,11 @@ class InviteTracker(DashboardIntegration, commands.Cog):
     async def invites_export(self, ctx: commands.Context) -> None:
         """Export tracked invite member records as CSV."""
         assert ctx.guild is not None
-        members = await self.config.guild(ctx.guild).members()
-        if not members:
+        export = await self._history.export_csv(ctx.guild.id)
+        if export is None:
             await ctx.send("No invite member records have been tracked yet.")
             return
 
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(
-            ["member_id", "inviter_id", "invite_code", "joined_at", "left_at", "fake"],
-        )
-        for record in members.values():
-            writer.writerow(
-                [
-                    record.get("member_id"),
-                    record.get("inviter_id"),
-                    record.get("invite_code"),
-                    self._format_export_time(record.get("joined_at")),
-                    self._format_export_time(record.get("left_at")),
-                    "yes" if record.get("fake") else "no",
-                ],
-            )
-
-        data = output.getvalue().encode("utf-8")
-        file = discord.File(io.BytesIO(data), filename=f"invites-{ctx.guild.id}.csv")
-        await ctx.send("Invite member records export:", file=file)
-
-    @staticmethod
-    def _format_export_time(value: Any) -> str:
-        if value in (None, ""):
-            return ""
-        try:
-            return datetime.fromtimestamp(float(value), tz=timezone.utc).isoformat()
-        except (TypeError, ValueError, OSError):
-            return ""
+        with export:
+            file = discord.File(export, filename=f"invites-{ctx.guild.id}.csv")
+            await ctx.send("Invite member records export:", file=file)
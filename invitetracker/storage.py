@@ -0,0 +1,322 @@
+"""Indexed SQLite storage for InviteTracker member join history."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import sqlite3
+import tempfile
+from datetime import datetime, timezone
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+EXPORT_COLUMNS = ("member_id", "inviter_id", "invite_code", "joined_at", "left_at", "fake")
+EXPORT_CHUNK_ROWS = 1000
+EXPORT_MEMORY_BYTES = 1024 * 1024
+
+
+def _export_time(value: Any) -> str:
+    if value is None:
+        return ""
+    try:
+        return datetime.fromtimestamp(float(value), tz=timezone.utc).isoformat()
+    except (TypeError, ValueError, OSError):
+        return ""
+
+
+class MemberHistoryStore:
+    """Append-only join history with inviter, invite-code, and time indexes.
+
+    Every tracked join adds a row, so rejoins keep their earlier history; a
+    leave only stamps ``left_at`` on the member's newest open row. Inviter
+    totals stay in Config as a materialised summary, while listings, counts,
+    and exports page straight out of this table.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = asyncio.Lock()
+
+    async def initialize(self) -> None:
+        await asyncio.to_thread(self._initialize_sync)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=5)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA busy_timeout = 5000")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    def _initialize_sync(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                CREATE TABLE IF NOT EXISTS member_joins (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    guild_id INTEGER NOT NULL,
+                    member_id INTEGER NOT NULL,
+                    inviter_id INTEGER,
+                    invite_code TEXT,
+                    joined_at REAL NOT NULL,
+                    left_at REAL,
+                    fake INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_member_joins_member
+                    ON member_joins(guild_id, member_id, id);
+                CREATE INDEX IF NOT EXISTS idx_member_joins_inviter
+                    ON member_joins(guild_id, inviter_id, joined_at);
+                CREATE INDEX IF NOT EXISTS idx_member_joins_code
+                    ON member_joins(guild_id, invite_code, joined_at);
+                CREATE INDEX IF NOT EXISTS idx_member_joins_time
+                    ON member_joins(guild_id, joined_at);
+                CREATE INDEX IF NOT EXISTS idx_member_joins_inviter_user
+                    ON member_joins(inviter_id);
+                CREATE TABLE IF NOT EXISTS legacy_imports (
+                    guild_id INTEGER PRIMARY KEY
+                );
+                """,
+            )
+
+    @staticmethod
+    def _row(row: sqlite3.Row) -> dict[str, Any]:
+        return {
+            "member_id": row["member_id"],
+            "inviter_id": row["inviter_id"],
+            "invite_code": row["invite_code"],
+            "joined_at": row["joined_at"],
+            "left_at": row["left_at"],
+            "fake": bool(row["fake"]),
+        }
+
+    @staticmethod
+    def _insert_joins(
+        connection: sqlite3.Connection,
+        guild_id: int,
+        records: Iterable[dict[str, Any]],
+    ) -> int:
+        cursor = connection.executemany(
+            """
+            INSERT INTO member_joins (guild_id, member_id, inviter_id, invite_code, joined_at, left_at, fake)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    guild_id,
+                    int(record["member_id"]),
+                    int(record["inviter_id"]) if record.get("inviter_id") else None,
+                    record.get("invite_code") or None,
+                    float(record.get("joined_at") or 0),
+                    float(record["left_at"]) if record.get("left_at") else None,
+                    int(bool(record.get("fake"))),
+                )
+                for record in records
+            ],
+        )
+        return max(cursor.rowcount, 0)
+
+    async def import_guild(self, guild_id: int, members: dict[str, Any]) -> int:
+        """Copy legacy Config member records into the history table, once per guild.
+
+        The guild is marked as imported in the same transaction as its rows, so
+        an interrupted migration that runs again does not import duplicates.
+        """
+        records = [
+            {**record, "member_id": record.get("member_id") or member_id}
+            for member_id, record in members.items()
+            if isinstance(record, dict)
+        ]
+        records.sort(key=lambda record: float(record.get("joined_at") or 0))
+        async with self._lock:
+            return await asyncio.to_thread(self._import_guild_sync, guild_id, records)
+
+    def _import_guild_sync(self, guild_id: int, records: list[dict[str, Any]]) -> int:
+        with self._connect() as connection:
+            cursor = connection.execute("INSERT OR IGNORE INTO legacy_imports (guild_id) VALUES (?)", (guild_id,))
+            if cursor.rowcount != 1:
+                return 0
+            return self._insert_joins(connection, guild_id, records)
+
+    async def record_joins(self, guild_id: int, records: list[dict[str, Any]]) -> int:
+        """Append a batch of join records in one transaction."""
+        async with self._lock:
+            return await asyncio.to_thread(self._record_joins_sync, guild_id, records)
+
+    def _record_joins_sync(self, guild_id: int, records: list[dict[str, Any]]) -> int:
+        with self._connect() as connection:
+            # A rejoin without an observed leave closes the member's previous open row.
+            connection.executemany(
+                "UPDATE member_joins SET left_at = ? WHERE guild_id = ? AND member_id = ? AND left_at IS NULL",
+                [(float(record.get("joined_at") or 0), guild_id, int(record["member_id"])) for record in records],
+            )
+            return self._insert_joins(connection, guild_id, records)
+
+    async def record_leave(self, guild_id: int, member_id: int, left_at: float) -> dict[str, Any] | None:
+        """Stamp a member's newest open join and return it, or ``None`` if untracked."""
+        async with self._lock:
+            return await asyncio.to_thread(self._record_leave_sync, guild_id, member_id, left_at)
+
+    def _record_leave_sync(self, guild_id: int, member_id: int, left_at: float) -> dict[str, Any] | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                """
+                SELECT * FROM member_joins
+                WHERE guild_id = ? AND member_id = ? AND left_at IS NULL
+                ORDER BY id DESC LIMIT 1
+                """,
+                (guild_id, member_id),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE member_joins SET left_at = ? WHERE id = ?", (left_at, row["id"]))
+        return {**self._row(row), "left_at": left_at}
+
+    async def latest_join(self, guild_id: int, member_id: int) -> dict[str, Any] | None:
+        return await asyncio.to_thread(self._latest_join_sync, guild_id, member_id)
+
+    def _latest_join_sync(self, guild_id: int, member_id: int) -> dict[str, Any] | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT * FROM member_joins WHERE guild_id = ? AND member_id = ? ORDER BY id DESC LIMIT 1",
+                (guild_id, member_id),
+            ).fetchone()
+        return self._row(row) if row is not None else None
+
+    async def active_count(self, guild_id: int, *, inviter_id: int | None = None) -> int:
+        """Count tracked members who have not left, optionally for one inviter."""
+        return await asyncio.to_thread(self._active_count_sync, guild_id, inviter_id)
+
+    def _active_count_sync(self, guild_id: int, inviter_id: int | None) -> int:
+        sql = "SELECT COUNT(*) FROM member_joins WHERE guild_id = ? AND left_at IS NULL"
+        values: list[Any] = [guild_id]
+        if inviter_id is not None:
+            sql += " AND inviter_id = ?"
+            values.append(inviter_id)
+        with self._connect() as connection:
+            return int(connection.execute(sql, values).fetchone()[0])
+
+    async def joins_page(
+        self,
+        guild_id: int,
+        *,
+        inviter_id: int | None = None,
+        invite_code: str | None = None,
+        active_only: bool = False,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Return one newest-first page of joins and the filtered total."""
+        return await asyncio.to_thread(
+            self._joins_page_sync,
+            guild_id,
+            inviter_id,
+            invite_code,
+            active_only,
+            max(0, offset),
+            max(1, min(limit, 100)),
+        )
+
+    def _joins_page_sync(
+        self,
+        guild_id: int,
+        inviter_id: int | None,
+        invite_code: str | None,
+        active_only: bool,
+        offset: int,
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], int]:
+        clauses = ["guild_id = ?"]
+        values: list[Any] = [guild_id]
+        if inviter_id is not None:
+            clauses.append("inviter_id = ?")
+            values.append(inviter_id)
+        if invite_code is not None:
+            clauses.append("invite_code = ?")
+            values.append(invite_code)
+        if active_only:
+            clauses.append("left_at IS NULL")
+        where = " AND ".join(clauses)
+        with self._connect() as connection:
+            total = int(connection.execute(f"SELECT COUNT(*) FROM member_joins WHERE {where}", values).fetchone()[0])
+            rows = connection.execute(
+                f"SELECT * FROM member_joins WHERE {where} ORDER BY joined_at DESC, id DESC LIMIT ? OFFSET ?",
+                [*values, limit, offset],
+            ).fetchall()
+        return [self._row(row) for row in rows], total
+
+    async def export_csv(self, guild_id: int) -> IO[bytes] | None:
+        """Stream a guild's join history into a rewound CSV file, or ``None`` if empty.
+
+        Rows are read in chunks and written straight to a spooled temporary
+        file, so large histories never sit in memory as one string.
+        """
+        return await asyncio.to_thread(self._export_csv_sync, guild_id)
+
+    def _export_csv_sync(self, guild_id: int) -> IO[bytes] | None:
+        output = tempfile.SpooledTemporaryFile(max_size=EXPORT_MEMORY_BYTES)  # noqa: SIM115
+        writer = _CSVByteWriter(output)
+        writer.writerows([EXPORT_COLUMNS])
+        exported = 0
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "SELECT * FROM member_joins WHERE guild_id = ? ORDER BY joined_at, id",
+                (guild_id,),
+            )
+            while rows := cursor.fetchmany(EXPORT_CHUNK_ROWS):
+                exported += len(rows)
+                writer.writerows(
+                    (
+                        row["member_id"],
+                        row["inviter_id"] or "",
+                        row["invite_code"] or "",
+                        _export_time(row["joined_at"]),
+                        _export_time(row["left_at"]),
+                        "yes" if row["fake"] else "no",
+                    )
+                    for row in rows
+                )
+        if not exported:
+            output.close()
+            return None
+        output.seek(0)
+        return output
+
+    async def delete_user(self, user_id: int) -> int:
+        """Remove a user's own joins and detach them from joins they referred."""
+        async with self._lock:
+            return await asyncio.to_thread(self._delete_user_sync, user_id)
+
+    def _delete_user_sync(self, user_id: int) -> int:
+        with self._connect() as connection:
+            cursor = connection.execute("DELETE FROM member_joins WHERE member_id = ?", (user_id,))
+            connection.execute("UPDATE member_joins SET inviter_id = NULL WHERE inviter_id = ?", (user_id,))
+            return max(cursor.rowcount, 0)
+
+    async def clear_guild(self, guild_id: int) -> int:
+        async with self._lock:
+            return await asyncio.to_thread(self._clear_guild_sync, guild_id)
+
+    def _clear_guild_sync(self, guild_id: int) -> int:
+        with self._connect() as connection:
+            cursor = connection.execute("DELETE FROM member_joins WHERE guild_id = ?", (guild_id,))
+            return max(cursor.rowcount, 0)
+
+
+class _CSVByteWriter:
+    """Encode CSV rows chunk by chunk into a binary file object."""
+
+    def __init__(self, output: IO[bytes]) -> None:
+        self._output = output
+        self._chunk = io.StringIO()
+        self._writer = csv.writer(self._chunk)
+
+    def writerows(self, rows: Iterable[Iterable[Any]]) -> None:
+        self._writer.writerows(rows)
+        self._output.write(self._chunk.getvalue().encode("utf-8"))
+        self._chunk.seek(0)
+        self._chunk.truncate()
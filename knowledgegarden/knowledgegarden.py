@@ -14,7 +14,7 @@ from discord.ext import tasks
 from redbot.core import Config, commands
 
 from .dashboard_integration import DashboardIntegration
-from .search import rank_entries
+from .search import SearchIndex
 
 if TYPE_CHECKING:
     from redbot.core.bot import Red
@@ -41,6 +41,8 @@ class KnowledgeGarden(DashboardIntegration, commands.Cog):
             entries={},
         )
         self._locks: dict[int, asyncio.Lock] = {}
+        self._indexes: dict[int, SearchIndex] = {}
+        self._index_versions: dict[int, int] = {}
 
     def _lock(self, guild_id: int) -> asyncio.Lock:
         if not hasattr(self, "_locks"):
@@ -77,6 +79,24 @@ class KnowledgeGarden(DashboardIntegration, commands.Cog):
     def _now() -> int:
         return int(time.time())
 
+    async def _search_index(self, guild: discord.Guild) -> SearchIndex:
+        """Return the guild's search index, building it from Config on first use."""
+        index = self._indexes.get(guild.id)
+        if index is None:
+            version = self._index_versions.get(guild.id, 0)
+            entries = await self.config.guild(guild).entries()
+            index = await asyncio.to_thread(SearchIndex, entries.values())
+            # An entry saved during the read or build may be missing; rebuild on the next search instead.
+            if self._index_versions.get(guild.id, 0) == version:
+                self._indexes[guild.id] = index
+        return index
+
+    def _index_entry(self, guild_id: int, entry: dict[str, Any]) -> None:
+        self._index_versions[guild_id] = self._index_versions.get(guild_id, 0) + 1
+        index = self._indexes.get(guild_id)
+        if index is not None:
+            index.update(entry)
+
     async def _entry(self, guild: discord.Guild, entry_id: int) -> tuple[dict[str, Any], dict[str, Any]]:
         entries = await self.config.guild(guild).entries()
         entry = entries.get(str(entry_id))
@@ -88,6 +108,7 @@ class KnowledgeGarden(DashboardIntegration, commands.Cog):
         entry["updated_at"] = self._now()
         entries[str(entry["entry_id"])] = entry
         await self.config.guild(guild).entries.set(entries)
+        self._index_entry(guild.id, entry)
 
     async def _audit(self, guild: discord.Guild, action: str, status: str, detail: str = "") -> None:
         operations = self.bot.get_cog("OperationsCenter")
@@ -167,6 +188,7 @@ class KnowledgeGarden(DashboardIntegration, commands.Cog):
             existing[str(entry_id)] = entry
             await conf.entries.set(existing)
             await conf.next_id.set(entry_id + 1)
+            self._index_entry(getattr(guild, "id", 0), entry)
         return entry
 
     @tasks.loop(hours=6)
@@ -320,8 +342,8 @@ class KnowledgeGarden(DashboardIntegration, commands.Cog):
     @commands.mod_or_permissions(manage_messages=True)
     async def draft(self, ctx: commands.Context, title: str, *, answer: str) -> None:
         """Create a draft knowledge entry."""
-        existing = await self.config.guild(ctx.guild).entries()
-        similar = rank_entries(existing.values(), title, published_only=False)[:3]
+        index = await self._search_index(ctx.guild)
+        similar = index.search(title, published_only=False)[:3]
         entry = await self._create(ctx.guild, ctx.author.id, title, answer)
         suffix = ""
         if similar:
@@ -446,7 +468,7 @@ class KnowledgeGarden(DashboardIntegration, commands.Cog):
     @knowledge_garden.command(name="search")
     async def search(self, ctx: commands.Context, *, query: str) -> None:
         """Search published answers locally."""
-        ranked = rank_entries((await self.config.guild(ctx.guild).entries()).values(), query)[:10]
+        ranked = (await self._search_index(ctx.guild)).search(query)[:10]
         if not ranked:
             normalized = " ".join(query.casefold().split())[:100]
             if normalized:
@@ -457,7 +479,7 @@ class KnowledgeGarden(DashboardIntegration, commands.Cog):
                             misses.pop(key, None)
             await ctx.send("No published answer matched that search.")
             return
-        lines = [f"`#{entry['entry_id']}` **{entry['title']}** · score {score}" for score, entry in ranked]
+        lines = [f"`#{entry['entry_id']}` **{entry['title']}** · score {score:.1f}" for score, entry in ranked]
         await ctx.send(
             embed=discord.Embed(title=f"Knowledge results for {query[:100]}", description="\n".join(lines), color=0x57F287)
         )
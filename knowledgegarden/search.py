@@ -2,37 +2,158 @@
 
 from __future__ import annotations
 
+import bisect
+import math
 import re
+from collections import Counter
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
 WORD_RE = re.compile(r"[a-z\d]{2,}")
+FIELDS = ("title", "aliases", "tags", "body")
+FIELD_WEIGHTS = (6.0, 5.0, 4.0, 1.0)
+BM25_K1 = 1.2
+BM25_B = 0.75
+TITLE_PHRASE_BONUS = 2.0
+# Partial words shorter than this would expand to most of the vocabulary.
+MIN_PREFIX = 3
+PREFIX_WEIGHT = 0.5
+PREFIX_EXPANSIONS = 20
 
 
 def tokens(value: str) -> set[str]:
     return set(WORD_RE.findall(value.casefold()))
 
 
+def _field_text(entry: dict[str, Any], field: str) -> str:
+    value = entry.get(field, "")
+    return " ".join(value) if isinstance(value, list) else str(value or "")
+
+
+class SearchIndex:
+    """
+    Inverted index of knowledge entries with BM25F-style scoring.
+    Entries of every status are indexed so staff lookups can include drafts; members only see published results.
+    """
+
+    def __init__(self, entries: Iterable[dict[str, Any]] = ()) -> None:
+        self._postings: dict[str, dict[int, list[int]]] = {}
+        self._lengths: dict[int, tuple[int, ...]] = {}
+        self._terms: dict[int, tuple[str, ...]] = {}
+        self._totals = [0] * len(FIELDS)
+        self._docs: dict[int, dict[str, Any]] = {}
+        self._vocabulary: list[str] | None = None
+        for entry in entries:
+            self.update(entry)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def update(self, entry: dict[str, Any]) -> None:
+        """Index an entry, replacing any earlier version of it."""
+        entry_id = int(entry["entry_id"])
+        self.remove(entry_id)
+        frequencies: dict[str, list[int]] = {}
+        lengths = []
+        for position, field in enumerate(FIELDS):
+            words = WORD_RE.findall(_field_text(entry, field).casefold())
+            lengths.append(len(words))
+            for term, count in Counter(words).items():
+                frequencies.setdefault(term, [0] * len(FIELDS))[position] = count
+        terms = tuple(frequencies)
+        for term, counts in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._vocabulary = None
+            postings[entry_id] = counts
+        self._lengths[entry_id] = tuple(lengths)
+        self._terms[entry_id] = terms
+        self._totals = [total + length for total, length in zip(self._totals, lengths)]
+        self._docs[entry_id] = {
+            "entry_id": entry_id,
+            "title": str(entry.get("title", "")),
+            "status": entry.get("status"),
+            "updated_at": int(entry.get("updated_at", 0)),
+        }
+
+    def remove(self, entry_id: int) -> None:
+        lengths = self._lengths.pop(entry_id, None)
+        if lengths is None:
+            return
+        self._docs.pop(entry_id, None)
+        self._totals = [total - length for total, length in zip(self._totals, lengths)]
+        for term in self._terms.pop(entry_id):
+            postings = self._postings[term]
+            del postings[entry_id]
+            if not postings:
+                del self._postings[term]
+                self._vocabulary = None
+
+    def _expand(self, word: str) -> list[tuple[str, float]]:
+        terms = [(word, 1.0)] if word in self._postings else []
+        if len(word) < MIN_PREFIX:
+            return terms
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        start = bisect.bisect_right(self._vocabulary, word)
+        for term in self._vocabulary[start : start + PREFIX_EXPANSIONS]:
+            if not term.startswith(word):
+                break
+            terms.append((term, PREFIX_WEIGHT))
+        return terms
+
+    def search(self, query: str, *, published_only: bool = True) -> list[tuple[float, dict[str, Any]]]:
+        """Return ``(score, entry)`` pairs, best first; query words of three or more letters also match as prefixes."""
+        words = list(dict.fromkeys(WORD_RE.findall(query.casefold())))
+        if not words or not self._docs:
+            return []
+        count = len(self._docs)
+        slopes = [BM25_B / (total / count or 1.0) for total in self._totals]
+        norms: dict[int, tuple[float, ...]] = {}
+        scores: dict[int, float] = {}
+        for word in words:
+            best: dict[int, float] = {}
+            for term, weight in self._expand(word):
+                postings = self._postings[term]
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for entry_id, frequencies in postings.items():
+                    if published_only and self._docs[entry_id]["status"] != "published":
+                        continue
+                    # Field weight over BM25 length normalisation, computed once per entry per query.
+                    factors = norms.get(entry_id)
+                    if factors is None:
+                        factors = norms[entry_id] = tuple(
+                            field_weight / (1 - BM25_B + slope * length)
+                            for field_weight, slope, length in zip(FIELD_WEIGHTS, slopes, self._lengths[entry_id])
+                        )
+                    weighted = (
+                        frequencies[0] * factors[0]
+                        + frequencies[1] * factors[1]
+                        + frequencies[2] * factors[2]
+                        + frequencies[3] * factors[3]
+                    )
+                    score = weight * idf * weighted * (BM25_K1 + 1) / (weighted + BM25_K1)
+                    if score > best.get(entry_id, 0.0):
+                        best[entry_id] = score
+            for entry_id, score in best.items():
+                scores[entry_id] = scores.get(entry_id, 0.0) + score
+        phrase = query.casefold().strip()
+        ranked = []
+        for entry_id, score in scores.items():
+            doc = self._docs[entry_id]
+            if phrase and phrase in doc["title"].casefold():
+                score += TITLE_PHRASE_BONUS
+            ranked.append((score, doc))
+        return sorted(ranked, key=lambda item: (-item[0], -item[1]["updated_at"], item[1]["entry_id"]))
+
+
 def rank_entries(
     entries: Iterable[dict[str, Any]], query: str, *, published_only: bool = True
-) -> list[tuple[int, dict[str, Any]]]:
-    query_words = tokens(query)
-    if not query_words:
-        return []
-    ranked = []
-    for entry in entries:
-        if published_only and entry.get("status") != "published":
-            continue
-        title = tokens(str(entry.get("title", "")))
-        tags = tokens(" ".join(entry.get("tags", [])))
-        aliases = tokens(" ".join(entry.get("aliases", [])))
-        body = tokens(str(entry.get("body", "")))
-        score = 6 * len(query_words & title) + 5 * len(query_words & aliases) + 4 * len(query_words & tags)
-        score += len(query_words & body)
-        if query.casefold() in str(entry.get("title", "")).casefold():
-            score += 8
-        if score:
-            ranked.append((score, entry))
-    return sorted(ranked, key=lambda item: (-item[0], -int(item[1].get("updated_at", 0)), int(item[1].get("entry_id", 0))))
+) -> list[tuple[float, dict[str, Any]]]:
+    """Rank entries once without keeping an index; long-lived callers should hold a :class:`SearchIndex`."""
+    entries = {int(entry["entry_id"]): entry for entry in entries}
+    index = SearchIndex(entries.values())
+    return [(score, entries[doc["entry_id"]]) for score, doc in index.search(query, published_only=published_only)]
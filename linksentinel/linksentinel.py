@@ -6,9 +6,8 @@ import asyncio
 import csv
 import io
 import ipaddress
+import logging
 import re
-import socket
-import ssl
 import time
 from contextlib import suppress
 from typing import TYPE_CHECKING, Any
@@ -20,12 +19,17 @@ from discord.ext import tasks
 from redbot.core import Config, commands
 
 from .dashboard_integration import DashboardIntegration
+from .probes import CertificateRecorder, DNSCache, ProbeCache, ProbeResult, PublicResolver
 
 if TYPE_CHECKING:
     from redbot.core.bot import Red
 
 
 URL_RE = re.compile(r"https?://[^\s<>\])}\"']+", re.IGNORECASE)
+PROBE_CONCURRENCY = 16
+HEAD_FALLBACK_STATUSES = {403, 405, 501}
+
+log = logging.getLogger("red.taakoscogs.linksentinel")
 
 
 class LinkSentinel(DashboardIntegration, commands.Cog):
@@ -38,6 +42,10 @@ class LinkSentinel(DashboardIntegration, commands.Cog):
         self.bot = bot
         self.session: aiohttp.ClientSession | None = None
         self._scan_lock = asyncio.Lock()
+        self._probe_budget = asyncio.Semaphore(PROBE_CONCURRENCY)
+        self._probes = ProbeCache()
+        self._dns = DNSCache()
+        self._tls = CertificateRecorder()
         self.config = Config.get_conf(self, identifier=self.CONFIG_IDENTIFIER, force_registration=True)
         self.config.register_guild(
             alert_channel_id=None,
@@ -50,11 +58,18 @@ class LinkSentinel(DashboardIntegration, commands.Cog):
         )
 
     async def cog_load(self) -> None:
-        self.session = aiohttp.ClientSession(headers={"User-Agent": "TaakosCogs-LinkSentinel/1.0"})
+        self.session = aiohttp.ClientSession(
+            headers={"User-Agent": "TaakosCogs-LinkSentinel/1.0"},
+            # Connect through the same cached, public-only lookup the SSRF check used so a
+            # hostname cannot rebind to a private address between the check and the request.
+            connector=aiohttp.TCPConnector(ssl=self._tls, resolver=PublicResolver(self._dns), use_dns_cache=False),
+        )
         self.scheduled_scan.start()
 
     def cog_unload(self) -> None:
         self.scheduled_scan.cancel()
+        self._probes.close()
+        self._dns.close()
         if self.session and not self.session.closed:
             asyncio.create_task(self.session.close())
 
@@ -111,30 +126,6 @@ class LinkSentinel(DashboardIntegration, commands.Cog):
         await conf.next_link_id.set(link_id + 1)
         return link_id, True
 
-    async def _check_tls(self, url: str, timeout: int) -> int | None:
-        parsed = urlparse(url)
-        if parsed.scheme != "https" or not parsed.hostname:
-            return None
-        port = parsed.port or 443
-        context = ssl.create_default_context()
-        writer = None
-        try:
-            _reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(parsed.hostname, port, ssl=context, server_hostname=parsed.hostname),
-                timeout=timeout,
-            )
-            ssl_object = writer.get_extra_info("ssl_object")
-            certificate = ssl_object.getpeercert() if ssl_object else None
-            not_after = certificate.get("notAfter") if certificate else None
-            return int(ssl.cert_time_to_seconds(not_after)) if not_after else None
-        except (OSError, asyncio.TimeoutError, ssl.SSLError, ValueError):
-            return None
-        finally:
-            if writer:
-                writer.close()
-                with suppress(OSError, ssl.SSLError):
-                    await writer.wait_closed()
-
     async def _validate_public_target(self, url: str) -> None:
         """Reject local and special-use targets before each request or redirect."""
         parsed = urlparse(url)
@@ -143,61 +134,106 @@ class LinkSentinel(DashboardIntegration, commands.Cog):
             raise ValueError("Local network targets are not allowed")
         port = parsed.port or (443 if parsed.scheme == "https" else 80)
         try:
-            addresses = await asyncio.get_running_loop().getaddrinfo(
-                hostname,
-                port,
-                type=socket.SOCK_STREAM,
-            )
+            addresses = await self._dns.resolve(hostname, port)
         except OSError as exc:
             raise ValueError(f"DNS resolution failed: {exc}") from exc
         for address in addresses:
-            ip = ipaddress.ip_address(address[4][0])
+            ip = ipaddress.ip_address(address)
             if not ip.is_global:
                 raise ValueError(f"Non-public target {ip} is not allowed")
 
-    async def _fetch(self, url: str, timeout: int) -> tuple[int, str]:
-        """Fetch with manually validated redirects to prevent redirect-based SSRF."""
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        timeout: aiohttp.ClientTimeout,
+    ) -> tuple[ProbeResult, str | None]:
+        async with self.session.request(
+            method,
+            url,
+            headers=headers,
+            allow_redirects=False,
+            timeout=timeout,
+            read_until_eof=False,
+        ) as response:
+            location = response.headers.get("Location") if 300 <= response.status < 400 else None
+            result = ProbeResult(
+                status_code=response.status,
+                final_url=str(response.url),
+                tls_expires_at=self._tls.expiry(response.url.host) if response.url.scheme == "https" else None,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return result, location
+
+    async def _fetch(self, url: str, timeout: int, previous: ProbeResult | None = None) -> ProbeResult:
+        """
+        Fetch with manually validated redirects to prevent redirect-based SSRF.
+        Each hop tries HEAD before GET and revalidates with the previous probe's validators.
+        """
         if not self.session:
             raise RuntimeError("HTTP session is not ready")
+        headers = {}
+        if previous and previous.status_code is not None and previous.status_code < 400:
+            if previous.etag:
+                headers["If-None-Match"] = previous.etag
+            if previous.last_modified:
+                headers["If-Modified-Since"] = previous.last_modified
         current = url
         client_timeout = aiohttp.ClientTimeout(total=timeout)
-        for _redirect in range(9):
+        tls_expires_at = None
+        for hop in range(9):
             await self._validate_public_target(current)
-            async with self.session.get(
-                current,
-                allow_redirects=False,
-                timeout=client_timeout,
-                read_until_eof=False,
-            ) as response:
-                if 300 <= response.status < 400 and response.headers.get("Location"):
-                    current = urljoin(current, response.headers["Location"])
-                    continue
-                return response.status, str(response.url)
+            result, location = await self._request("HEAD", current, headers, client_timeout)
+            if result.status_code in HEAD_FALLBACK_STATUSES:
+                result, location = await self._request("GET", current, headers, client_timeout)
+            if hop == 0:
+                tls_expires_at = result.tls_expires_at
+            if location:
+                current = urljoin(current, location)
+                continue
+            result.tls_expires_at = tls_expires_at
+            if result.status_code == 304 and previous:
+                return ProbeResult(
+                    status_code=previous.status_code,
+                    final_url=previous.final_url,
+                    tls_expires_at=tls_expires_at or previous.tls_expires_at,
+                    etag=result.etag or previous.etag,
+                    last_modified=result.last_modified or previous.last_modified,
+                    not_modified=True,
+                )
+            return result
         raise ValueError("Too many redirects")
 
-    async def _check_link(self, item: dict[str, Any], timeout: int) -> dict[str, Any]:
+    async def _probe(self, url: str, timeout: int, previous: ProbeResult | None) -> ProbeResult:
+        async with self._probe_budget:
+            started = time.monotonic()
+            try:
+                result = await self._fetch(url, timeout, previous)
+            except (aiohttp.ClientError, asyncio.TimeoutError, RuntimeError, ValueError) as exc:
+                result = ProbeResult(error=f"{type(exc).__name__}: {exc}"[:300])
+            result.response_ms = int((time.monotonic() - started) * 1000)
+        return result
+
+    async def _check_link(self, item: dict[str, Any], timeout: int, *, refresh: bool = False) -> dict[str, Any]:
         if not self.session:
             raise RuntimeError("HTTP session is not ready")
-        started = time.monotonic()
-        status_code = None
-        final_url = None
-        error = None
-        try:
-            status_code, final_url = await self._fetch(item["url"], timeout)
-        except (aiohttp.ClientError, asyncio.TimeoutError, RuntimeError, ValueError) as exc:
-            error = f"{type(exc).__name__}: {exc}"[:300]
-        elapsed = int((time.monotonic() - started) * 1000)
-        tls_expires_at = await self._check_tls(item["url"], timeout) if status_code is not None else None
-        healthy = status_code is not None and status_code < 400
+        probe = await self._probes.get(
+            item["url"],
+            lambda previous: self._probe(item["url"], timeout, previous),
+            refresh=refresh,
+        )
+        healthy = probe.status_code is not None and probe.status_code < 400
         result = dict(item)
         result.update(
             last_checked_at=self._now(),
             status="healthy" if healthy else "failed",
-            status_code=status_code,
-            final_url=final_url,
-            response_ms=elapsed,
-            tls_expires_at=tls_expires_at,
-            error=error,
+            status_code=probe.status_code,
+            final_url=probe.final_url,
+            response_ms=probe.response_ms,
+            tls_expires_at=probe.tls_expires_at,
+            error=probe.error,
             failures=0 if healthy else int(item.get("failures", 0)) + 1,
         )
         return result
@@ -236,16 +272,14 @@ class LinkSentinel(DashboardIntegration, commands.Cog):
         with suppress(discord.HTTPException):
             await channel.send(embed=embed)
 
-    async def _scan_guild(self, guild: discord.Guild) -> tuple[int, int]:
+    async def _scan_guild(self, guild: discord.Guild, *, refresh: bool = False) -> tuple[int, int]:
         conf = self.config.guild(guild)
         settings = await conf.all()
         links = settings["links"]
         checked = failed = 0
-        semaphore = asyncio.Semaphore(4)
 
         async def check(key: str, item: dict[str, Any]) -> tuple[str, dict[str, Any]]:
-            async with semaphore:
-                return key, await self._check_link(item, int(settings["timeout_seconds"]))
+            return key, await self._check_link(item, int(settings["timeout_seconds"]), refresh=refresh)
 
         jobs = [check(key, item) for key, item in links.items() if item.get("enabled", True)]
         for key, result in await asyncio.gather(*jobs):
@@ -263,10 +297,16 @@ class LinkSentinel(DashboardIntegration, commands.Cog):
             return
         async with self._scan_lock:
             now = self._now()
+            due = []
             for guild in self.bot.guilds:
                 settings = await self.config.guild(guild).all()
                 if settings["links"] and now - settings["last_scan_at"] >= int(settings["interval_hours"]) * 3600:
-                    await self._scan_guild(guild)
+                    due.append(guild)
+            # Guilds scan together; the shared probe budget, not the guild count, bounds outgoing requests.
+            results = await asyncio.gather(*(self._scan_guild(guild) for guild in due), return_exceptions=True)
+            for guild, result in zip(due, results):
+                if isinstance(result, Exception):
+                    log.error("Scheduled link scan failed in guild %s", guild.id, exc_info=result)
 
     @scheduled_scan.before_loop
     async def before_scheduled_scan(self) -> None:
@@ -351,7 +391,7 @@ class LinkSentinel(DashboardIntegration, commands.Cog):
     async def scan(self, ctx: commands.Context) -> None:
         """Run a check immediately."""
         async with ctx.typing():
-            checked, failed = await self._scan_guild(ctx.guild)
+            checked, failed = await self._scan_guild(ctx.guild, refresh=True)
         await ctx.send(f"Checked **{checked}** link(s); **{failed}** currently failing.")
 
     @linksentinel.command(name="list")
@@ -0,0 +1,225 @@
+"""Cross-guild caches for LinkSentinel's HTTP probes and DNS lookups."""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import socket
+import ssl
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit, urlunsplit
+
+from aiohttp.abc import AbstractResolver
+
+PROBE_TTL = 600
+PROBE_CACHE_SIZE = 4096
+DNS_TTL = 300
+DNS_CACHE_SIZE = 1024
+CERTIFICATE_CACHE_SIZE = 1024
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def probe_key(url: str) -> str:
+    """Normalise ``url`` so equivalent spellings share one cache entry."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower().rstrip(".")
+    netloc = f"[{host}]" if ":" in host else host
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        netloc += f":{parts.port}"
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+@dataclass(slots=True)
+class ProbeResult:
+    """Outcome of one HTTP probe, plus the validators used to revalidate it."""
+
+    status_code: int | None = None
+    final_url: str | None = None
+    response_ms: int = 0
+    tls_expires_at: int | None = None
+    error: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    not_modified: bool = False
+
+
+ProbeCallback = Callable[["ProbeResult | None"], Awaitable[ProbeResult]]
+
+
+class ProbeCache:
+    """
+    Share probe results for the same URL across guilds for ``ttl`` seconds.
+    Concurrent callers share one in-flight probe, and expired entries are kept
+    so the next probe can send their ``ETag``/``Last-Modified`` validators.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = PROBE_TTL,
+        max_entries: int = PROBE_CACHE_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.probes = 0
+        self._clock = clock
+        self._results: OrderedDict[str, tuple[float, ProbeResult]] = OrderedDict()
+        self._pending: dict[str, asyncio.Task] = {}
+
+    async def get(self, url: str, probe: ProbeCallback, *, refresh: bool = False) -> ProbeResult:
+        """
+        Return a fresh cached result for ``url`` or run ``probe`` with the previous one.
+        ``refresh`` skips the fresh entry but still joins a probe that is already running.
+        """
+        key = probe_key(url)
+        cached = self._results.get(key)
+        if cached is not None:
+            self._results.move_to_end(key)
+            if not refresh and self._clock() - cached[0] < self.ttl:
+                return cached[1]
+
+        task = self._pending.get(key)
+        if task is None:
+            previous = cached[1] if cached else None
+            task = self._pending[key] = asyncio.create_task(self._probe(key, probe, previous))
+        # One guild's scan being cancelled must not cancel the probe other guilds are waiting on.
+        return await asyncio.shield(task)
+
+    async def _probe(self, key: str, probe: ProbeCallback, previous: ProbeResult | None) -> ProbeResult:
+        try:
+            result = await probe(previous)
+        finally:
+            self._pending.pop(key, None)
+        self.probes += 1
+        self._results[key] = (self._clock(), result)
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+        return result
+
+    def close(self) -> None:
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
+
+
+class _RecordingSSLObject(ssl.SSLObject):
+    def do_handshake(self) -> None:
+        super().do_handshake()
+        certificate = self.getpeercert()
+        not_after = certificate.get("notAfter") if certificate else None
+        if not_after and self.server_hostname:
+            self.context.record(self.server_hostname, int(ssl.cert_time_to_seconds(not_after)))
+
+
+class CertificateRecorder(ssl.SSLContext):
+    """
+    Verifying TLS client context that remembers each host's certificate expiry from the handshake,
+    so a probe reads it from the connection that carried its request instead of dialling again.
+    """
+
+    sslobject_class = _RecordingSSLObject
+
+    def __new__(cls, max_entries: int = CERTIFICATE_CACHE_SIZE):
+        return super().__new__(cls, ssl.PROTOCOL_TLS_CLIENT)
+
+    def __init__(self, max_entries: int = CERTIFICATE_CACHE_SIZE):
+        super().__init__()
+        self.load_default_certs(ssl.Purpose.SERVER_AUTH)
+        self.max_entries = max_entries
+        self._expiries: OrderedDict[str, int] = OrderedDict()
+
+    def record(self, hostname: str, expires_at: int) -> None:
+        self._expiries[hostname.lower()] = expires_at
+        self._expiries.move_to_end(hostname.lower())
+        while len(self._expiries) > self.max_entries:
+            self._expiries.popitem(last=False)
+
+    def expiry(self, hostname: str | None) -> int | None:
+        return self._expiries.get(hostname.lower()) if hostname else None
+
+
+class DNSCache:
+    """Cache successful ``getaddrinfo`` lookups for the SSRF check; failures are retried."""
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DNS_TTL,
+        max_entries: int = DNS_CACHE_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.lookups = 0
+        self._clock = clock
+        self._addresses: OrderedDict[tuple[str, int], tuple[float, tuple[str, ...]]] = OrderedDict()
+        self._pending: dict[tuple[str, int], asyncio.Task] = {}
+
+    async def resolve(self, hostname: str, port: int) -> tuple[str, ...]:
+        key = (hostname.lower(), port)
+        cached = self._addresses.get(key)
+        if cached is not None and self._clock() - cached[0] < self.ttl:
+            self._addresses.move_to_end(key)
+            return cached[1]
+        task = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = asyncio.create_task(self._lookup(key))
+        return await asyncio.shield(task)
+
+    async def _lookup(self, key: tuple[str, int]) -> tuple[str, ...]:
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(key[0], key[1], type=socket.SOCK_STREAM)
+        finally:
+            self._pending.pop(key, None)
+        self.lookups += 1
+        addresses = tuple(dict.fromkeys(info[4][0] for info in infos))
+        self._addresses[key] = (self._clock(), addresses)
+        while len(self._addresses) > self.max_entries:
+            self._addresses.popitem(last=False)
+        return addresses
+
+    def close(self) -> None:
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
+
+
+class PublicResolver(AbstractResolver):
+    """
+    aiohttp resolver that connects only to the global addresses ``DNSCache`` holds,
+    so the SSRF check and the connection it guards share one resolution.
+    """
+
+    def __init__(self, dns: DNSCache):
+        self._dns = dns
+
+    async def resolve(self, host: str, port: int = 0, family: int = socket.AF_UNSPEC) -> list[dict[str, Any]]:
+        hosts = []
+        for address in await self._dns.resolve(host, port):
+            ip = ipaddress.ip_address(address)
+            address_family = socket.AF_INET6 if ip.version == 6 else socket.AF_INET
+            if not ip.is_global or family not in (socket.AF_UNSPEC, address_family):
+                continue
+            hosts.append(
+                {
+                    "hostname": host,
+                    "host": address,
+                    "port": port,
+                    "family": address_family,
+                    "proto": 0,
+                    "flags": socket.AI_NUMERICHOST,
+                },
+            )
+        if not hosts:
+            raise OSError(f"No public address for {host}")
+        return hosts
+
+    async def close(self) -> None:
+        return None
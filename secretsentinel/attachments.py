@@ -0,0 +1,194 @@
+"""Bounded, streamed secret scanning for text, gzip, and zip attachments."""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import hashlib
+import io
+import zipfile
+import zlib
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterable
+
+from .detection import find_secrets
+
+TEXT_EXTENSIONS = frozenset(
+    {".txt", ".log", ".env", ".json", ".yaml", ".yml", ".ini", ".cfg", ".py", ".js", ".ts", ".md"},
+)
+ATTACHMENT_CHUNK = 16384
+MAX_TEXT_BYTES = 65536
+MAX_ARCHIVE_BYTES = 262144
+MAX_EXPANDED_BYTES = 1048576
+MAX_COMPRESSION_RATIO = 100
+MAX_ARCHIVE_MEMBERS = 50
+ATTACHMENT_CONCURRENCY = 4
+ATTACHMENT_CACHE_SIZE = 256
+# Longer than the shortest text any detector needs, so a value cut by a chunk boundary is still seen whole.
+STREAM_OVERLAP = 512
+
+ChunkFetcher = Callable[[str, int], AsyncIterator[bytes]]
+
+
+def _suffix(filename: str) -> str:
+    return "." + filename.rsplit(".", 1)[-1].casefold() if "." in filename else ""
+
+
+def attachment_format(filename: str) -> str | None:
+    """Return ``text``, ``gzip``, or ``zip`` for scannable attachments, otherwise ``None``."""
+    suffix = _suffix(filename)
+    if suffix in TEXT_EXTENSIONS:
+        return "text"
+    if suffix == ".gz" and _suffix(filename[:-3]) in TEXT_EXTENSIONS:
+        return "gzip"
+    if suffix == ".zip":
+        return "zip"
+    return None
+
+
+class StreamScanner:
+    """Collect secret kinds from UTF-8 bytes fed in chunks, carrying an overlap across chunk boundaries."""
+
+    def __init__(self, overlap: int = STREAM_OVERLAP):
+        self.kinds: set[str] = set()
+        self.overlap = overlap
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        self._tail = ""
+
+    def feed(self, chunk: bytes, *, final: bool = False) -> None:
+        text = self._tail + self._decoder.decode(chunk, final)
+        self.kinds.update(match.kind for match in find_secrets(text))
+        self._tail = text[-self.overlap :]
+
+
+def scan_text_chunks(chunks: Iterable[bytes]) -> frozenset[str]:
+    scanner = StreamScanner()
+    for chunk in chunks:
+        scanner.feed(chunk)
+    scanner.feed(b"", final=True)
+    return frozenset(scanner.kinds)
+
+
+def _expansion_budget(compressed_size: int) -> int:
+    return min(MAX_EXPANDED_BYTES, max(compressed_size, 1) * MAX_COMPRESSION_RATIO)
+
+
+def scan_gzip_chunks(chunks: Iterable[bytes]) -> frozenset[str]:
+    """Scan every member of a gzip stream chunk by chunk, stopping once the size or ratio cap is reached."""
+    chunks = list(chunks)
+    budget = _expansion_budget(sum(len(chunk) for chunk in chunks))
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    scanner = StreamScanner()
+    try:
+        for chunk in chunks:
+            pending = chunk
+            while pending and budget > 0:
+                output = decompressor.decompress(pending, min(budget, ATTACHMENT_CHUNK))
+                budget -= len(output)
+                scanner.feed(output)
+                if decompressor.eof:
+                    # Concatenated members (``cat a.gz b.gz``) each need a fresh decompressor.
+                    pending = decompressor.unused_data
+                    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                else:
+                    pending = decompressor.unconsumed_tail
+            if budget <= 0:
+                break
+    except zlib.error:
+        pass
+    scanner.feed(b"", final=True)
+    return frozenset(scanner.kinds)
+
+
+def scan_zip(chunks: Iterable[bytes]) -> frozenset[str]:
+    """Scan the text members of a zip archive under a shared size and per-member ratio cap."""
+    payload = b"".join(chunks)
+    budget = _expansion_budget(len(payload))
+    kinds: set[str] = set()
+    try:
+        with zipfile.ZipFile(io.BytesIO(payload)) as archive:
+            for info in archive.infolist()[:MAX_ARCHIVE_MEMBERS]:
+                if budget <= 0:
+                    break
+                if info.is_dir() or info.flag_bits & 0x1 or _suffix(info.filename) not in TEXT_EXTENSIONS:
+                    continue
+                if info.file_size > max(info.compress_size, 1) * MAX_COMPRESSION_RATIO:
+                    continue
+                scanner = StreamScanner()
+                with archive.open(info) as member:
+                    # Read against the remaining budget rather than trusting the declared size.
+                    while budget > 0 and (chunk := member.read(min(budget, ATTACHMENT_CHUNK))):
+                        budget -= len(chunk)
+                        scanner.feed(chunk)
+                scanner.feed(b"", final=True)
+                kinds.update(scanner.kinds)
+    except (zipfile.BadZipFile, zipfile.LargeZipFile, NotImplementedError, EOFError, zlib.error, ValueError):
+        pass
+    return frozenset(kinds)
+
+
+SCANNERS: dict[str, Callable[[Iterable[bytes]], frozenset[str]]] = {
+    "text": scan_text_chunks,
+    "gzip": scan_gzip_chunks,
+    "zip": scan_zip,
+}
+DOWNLOAD_LIMITS = {"text": MAX_TEXT_BYTES, "gzip": MAX_ARCHIVE_BYTES, "zip": MAX_ARCHIVE_BYTES}
+
+
+class AttachmentScanner:
+    """
+    Stream attachments under a shared concurrency limit and scan them off the event loop.
+    Results are cached by content hash, so a reposted file is downloaded but not scanned again.
+    """
+
+    def __init__(
+        self,
+        fetch: ChunkFetcher,
+        *,
+        concurrency: int = ATTACHMENT_CONCURRENCY,
+        cache_size: int = ATTACHMENT_CACHE_SIZE,
+    ):
+        self.cache_size = cache_size
+        self.scans = 0
+        self._fetch = fetch
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._results: OrderedDict[str, frozenset[str]] = OrderedDict()
+
+    async def scan(self, filename: str, size: int, url: str) -> frozenset[str]:
+        """Return the secret kinds in one attachment, or nothing when it is unsupported or over its cap."""
+        fmt = attachment_format(filename)
+        if fmt is None or size > DOWNLOAD_LIMITS[fmt]:
+            return frozenset()
+        async with self._semaphore:
+            chunks = await self._download(url, DOWNLOAD_LIMITS[fmt])
+            if chunks is None:
+                return frozenset()
+            digest = hashlib.sha256(fmt.encode())
+            for chunk in chunks:
+                digest.update(chunk)
+            key = digest.hexdigest()
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                return cached
+            kinds = await asyncio.to_thread(SCANNERS[fmt], chunks)
+        self.scans += 1
+        self._results[key] = kinds
+        while len(self._results) > self.cache_size:
+            self._results.popitem(last=False)
+        return kinds
+
+    async def _download(self, url: str, limit: int) -> list[bytes] | None:
+        chunks: list[bytes] = []
+        received = 0
+        stream = self._fetch(url, ATTACHMENT_CHUNK)
+        try:
+            async for chunk in stream:
+                received += len(chunk)
+                # The declared size is only a hint; stop as soon as the real body passes the cap.
+                if received > limit:
+                    return None
+                chunks.append(chunk)
+        finally:
+            await stream.aclose()
+        return chunks
@@ -67,6 +67,7 @@ class DashboardIntegration:
             else:
                 await conf.log_channel_id.set(channel_id)
                 notices.append({"message": "SecretSentinel settings saved.", "category": "success"})
+            self._invalidate_settings_cache(guild.id)
         settings = await conf.all()
         options = '<option value="">Disabled</option>' + "".join(
             f'<option value="{c.id}"{" selected" if c.id == settings["log_channel_id"] else ""}>#{html.escape(c.name)}</option>'
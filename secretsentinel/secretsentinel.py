@@ -2,39 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from contextlib import suppress
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any
 
+import aiohttp
 import discord
 from redbot.core import Config, commands
 
+from .attachments import AttachmentScanner
 from .dashboard_integration import DashboardIntegration
 from .detection import PATTERNS, find_secrets
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from redbot.core.bot import Red
 
+ATTACHMENT_TIMEOUT = 15
+
 
 class SecretSentinel(DashboardIntegration, commands.Cog):
     """Find exposed credentials without retaining the credential value."""
 
     CONFIG_IDENTIFIER = 2026081801
     SCHEMA_VERSION = 2
-    TEXT_EXTENSIONS: ClassVar[set[str]] = {
-        ".txt",
-        ".log",
-        ".env",
-        ".json",
-        ".yaml",
-        ".yml",
-        ".ini",
-        ".cfg",
-        ".py",
-        ".js",
-        ".ts",
-        ".md",
-    }
 
     def __init__(self, bot: Red) -> None:
         self.bot = bot
@@ -55,11 +48,20 @@ class SecretSentinel(DashboardIntegration, commands.Cog):
         self._handled: set[int] = set()
         self._last_alert: dict[tuple[int, int, str], int] = {}
         self._last_incident: dict[int, int] = {}
+        self._settings_cache: dict[int, dict[str, Any]] = {}
+        self._settings_versions: dict[int, int] = {}
+        self.session: aiohttp.ClientSession | None = None
+        self._attachments = AttachmentScanner(self._attachment_chunks)
 
     async def cog_load(self) -> None:
+        self.session = aiohttp.ClientSession()
         for guild_id in await self.config.all_guilds():
             await self.config.guild_from_id(guild_id).schema_version.set(self.SCHEMA_VERSION)
 
+    async def cog_unload(self) -> None:
+        if self.session and not self.session.closed:
+            await self.session.close()
+
     @staticmethod
     def _now() -> int:
         return int(time.time())
@@ -94,32 +96,53 @@ class SecretSentinel(DashboardIntegration, commands.Cog):
     async def red_delete_data_for_user(self, *, requester: str, user_id: int) -> None:
         return
 
-    async def _attachment_text(self, attachment: discord.Attachment) -> str:
-        suffix = "." + attachment.filename.rsplit(".", 1)[-1].casefold() if "." in attachment.filename else ""
-        if attachment.size > 65536 or suffix not in self.TEXT_EXTENSIONS:
-            return ""
+    def _invalidate_settings_cache(self, guild_id: int) -> None:
+        self._settings_cache.pop(guild_id, None)
+        self._settings_versions[guild_id] = self._settings_versions.get(guild_id, 0) + 1
+
+    async def _get_guild_settings(self, guild: discord.Guild) -> dict[str, Any]:
+        """Return the listener's view of guild settings, cached until a setter invalidates them."""
+        cached = self._settings_cache.get(guild.id)
+        if cached is not None:
+            return cached
+        version = self._settings_versions.get(guild.id, 0)
+        settings = await self.config.guild(guild).all()
+        for key in ("monitored_bot_ids", "ignored_channel_ids", "ignored_role_ids", "disabled_kinds"):
+            settings[key] = frozenset(settings[key])
+        # A setter that ran during the read leaves the cache empty so the next message reloads.
+        if self._settings_versions.get(guild.id, 0) == version:
+            self._settings_cache[guild.id] = settings
+        return settings
+
+    async def _attachment_chunks(self, url: str, chunk_size: int) -> AsyncIterator[bytes]:
+        if not self.session:
+            return
         try:
-            payload = await attachment.read()
-        except (discord.HTTPException, discord.NotFound, discord.Forbidden):
-            return ""
-        return payload.decode("utf-8", errors="ignore")
+            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=ATTACHMENT_TIMEOUT)) as response:
+                if response.status != 200:
+                    return
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    yield chunk
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
         if not message.guild or message.id in self._handled:
             return
-        settings = await self.config.guild(message.guild).all()
+        settings = await self._get_guild_settings(message.guild)
         if message.author.bot and message.author.id not in settings["monitored_bot_ids"]:
             return
         if not settings["enabled"] or message.channel.id in settings["ignored_channel_ids"]:
             return
-        author_roles = {role.id for role in getattr(message.author, "roles", [])}
-        if author_roles.intersection(settings["ignored_role_ids"]):
+        if not settings["ignored_role_ids"].isdisjoint(role.id for role in getattr(message.author, "roles", [])):
             return
         kinds = {match.kind for match in find_secrets(message.content)}
-        if settings["scan_attachments"]:
-            for attachment in message.attachments:
-                kinds.update(match.kind for match in find_secrets(await self._attachment_text(attachment)))
+        if settings["scan_attachments"] and message.attachments:
+            found = await asyncio.gather(
+                *(self._attachments.scan(item.filename, item.size, item.url) for item in message.attachments),
+            )
+            kinds.update(*found)
         kinds.difference_update(settings["disabled_kinds"])
         if not kinds:
             return
@@ -208,6 +231,7 @@ class SecretSentinel(DashboardIntegration, commands.Cog):
     async def enable(self, ctx: commands.Context, enabled: bool) -> None:
         """Enable or disable message scanning."""
         await self.config.guild(ctx.guild).enabled.set(enabled)
+        self._invalidate_settings_cache(ctx.guild.id)
         await ctx.send(f"SecretSentinel is now {'enabled' if enabled else 'disabled'}.")
 
     @secret_sentinel.command(name="setup")
@@ -225,6 +249,7 @@ class SecretSentinel(DashboardIntegration, commands.Cog):
         await conf.log_channel_id.set(destination.id)
         await conf.action.set("delete" if can_delete else "report")
         await conf.enabled.set(True)
+        self._invalidate_settings_cache(ctx.guild.id)
         await ctx.send(
             f"SecretSentinel enabled with alerts in {destination.mention}. "
             f"Action: **{'delete and report' if can_delete else 'report only'}**."
@@ -265,18 +290,21 @@ class SecretSentinel(DashboardIntegration, commands.Cog):
             raise commands.BadArgument("Action must be `delete` or `report`.")
         stored = "report" if action.startswith("report") else "delete"
         await self.config.guild(ctx.guild).action.set(stored)
+        self._invalidate_settings_cache(ctx.guild.id)
         await ctx.send(f"SecretSentinel action set to `{stored}`.")
 
     @secret_sentinel.command(name="attachments")
     async def attachments(self, ctx: commands.Context, enabled: bool) -> None:
         """Enable or disable scanning of small text attachments."""
         await self.config.guild(ctx.guild).scan_attachments.set(enabled)
+        self._invalidate_settings_cache(ctx.guild.id)
         await ctx.send(f"Text attachment scanning is now {'enabled' if enabled else 'disabled'}.")
 
     @secret_sentinel.command(name="cooldown")
     async def cooldown(self, ctx: commands.Context, seconds: commands.Range[int, 0, 3600]) -> None:
         """Set duplicate alert suppression for the same author and detector types."""
         await self.config.guild(ctx.guild).alert_cooldown_seconds.set(int(seconds))
+        self._invalidate_settings_cache(ctx.guild.id)
         await ctx.send(f"Duplicate alert cooldown set to {int(seconds)} second(s). Message actions still run every time.")
 
     @secret_sentinel.command(name="detector")
@@ -293,6 +321,7 @@ class SecretSentinel(DashboardIntegration, commands.Cog):
             else:
                 disabled.append(selected)
                 state = "disabled"
+        self._invalidate_settings_cache(ctx.guild.id)
         await ctx.send(f"Detector **{selected}** is now {state}.")
 
     @secret_sentinel.command(name="scanbot")
@@ -307,6 +336,7 @@ class SecretSentinel(DashboardIntegration, commands.Cog):
             else:
                 bot_ids.append(bot_user.id)
                 state = "monitored"
+        self._invalidate_settings_cache(ctx.guild.id)
         await ctx.send(f"{bot_user.mention} is now {state} by SecretSentinel.")
 
     @secret_sentinel.command(name="opsroom")
@@ -320,12 +350,14 @@ class SecretSentinel(DashboardIntegration, commands.Cog):
             if not role_id or not ctx.guild.get_role(role_id):
                 raise commands.BadArgument("Configure an OpsRoom response role before enabling credential incidents.")
         await self.config.guild(ctx.guild).create_opsroom_incidents.set(enabled)
+        self._invalidate_settings_cache(ctx.guild.id)
         await ctx.send(f"OpsRoom credential incidents are now {'enabled' if enabled else 'disabled'}.")
 
     @secret_sentinel.command(name="logchannel")
     async def log_channel(self, ctx: commands.Context, channel: discord.TextChannel | None = None) -> None:
         """Set the staff alert channel, or omit it to disable alerts."""
         await self.config.guild(ctx.guild).log_channel_id.set(channel.id if channel else None)
+        self._invalidate_settings_cache(ctx.guild.id)
         await ctx.send(f"Alert channel set to {channel.mention}." if channel else "Alert channel disabled.")
 
     @secret_sentinel.command(name="ignorechannel")
@@ -338,6 +370,7 @@ class SecretSentinel(DashboardIntegration, commands.Cog):
             else:
                 ids.append(channel.id)
                 result = "added to"
+        self._invalidate_settings_cache(ctx.guild.id)
         await ctx.send(f"{channel.mention} {result} the exclusion list.")
 
     @secret_sentinel.command(name="ignorerole")
@@ -352,6 +385,7 @@ class SecretSentinel(DashboardIntegration, commands.Cog):
             else:
                 ids.append(role.id)
                 result = "added to"
+        self._invalidate_settings_cache(ctx.guild.id)
         await ctx.send(f"{role.mention} {result} the exclusion list.")
 
     @secret_sentinel.command(name="selftest", aliases=["scan"])
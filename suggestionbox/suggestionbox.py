@@ -8,6 +8,8 @@ import copy
 import csv
 import io
 import logging
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -26,6 +28,20 @@ log = logging.getLogger("red.taakoscogs.suggestionbox")
 SuggestionRecord = dict[str, Any]
 
 
+@dataclass
+class VoteState:
+    """Live vote sets for one suggestion message, written back and re-rendered in batches."""
+
+    guild_id: int
+    key: str
+    upvotes: set[str]
+    downvotes: set[str]
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    dirty: bool = False
+    last_sync: float = 0.0
+    sync_task: asyncio.Task | None = None
+
+
 class SuggestionVoteView(discord.ui.View):
     """Persistent voting buttons for suggestion messages."""
 
@@ -85,6 +101,8 @@ class SuggestionBox(DashboardIntegration, commands.Cog):
     MAX_SUGGESTION_LENGTH = 1800
     MAX_REASON_LENGTH = 700
     MAX_COMMENT_LENGTH = 700
+    # Votes are written and the suggestion message edited at most once per interval, with the latest counts.
+    VOTE_SYNC_INTERVAL = 5.0
 
     def __init__(self, bot: Red) -> None:
         self.bot = bot
@@ -107,12 +125,23 @@ class SuggestionBox(DashboardIntegration, commands.Cog):
             suggestions={},
         )
         self._locks: dict[int, asyncio.Lock] = {}
+        self._message_keys: dict[int, dict[int, str]] = {}
+        self._votes: dict[int, VoteState] = {}
         self._vote_view = SuggestionVoteView(self)
 
     async def cog_load(self) -> None:
         """Register persistent button callbacks."""
         self.bot.add_view(self._vote_view)
 
+    async def cog_unload(self) -> None:
+        """Write votes that are still waiting for their batched sync."""
+        for message_id, state in list(self._votes.items()):
+            if state.sync_task is not None:
+                state.sync_task.cancel()
+            if state.dirty:
+                async with state.lock:
+                    await self._persist_votes(message_id, state)
+
     async def red_delete_data_for_user(self, *, requester: str, user_id: int) -> None:
         """Delete stored suggestion data associated with a Discord user ID."""
         user_key = str(user_id)
@@ -128,6 +157,10 @@ class SuggestionBox(DashboardIntegration, commands.Cog):
                         record["updated_at"] = self._now_ts()
                     record["upvotes"] = [voter for voter in record.get("upvotes", []) if str(voter) != user_key]
                     record["downvotes"] = [voter for voter in record.get("downvotes", []) if str(voter) != user_key]
+                    state = self._votes.get(int(record.get("message_id") or 0))
+                    if state is not None:
+                        state.upvotes.discard(user_key)
+                        state.downvotes.discard(user_key)
                     if str(record.get("decision_by")) == user_key:
                         record["decision_by"] = None
                     record["staff_notes"] = [
@@ -677,12 +710,103 @@ class SuggestionBox(DashboardIntegration, commands.Cog):
         guild: discord.Guild,
         message_id: int,
     ) -> tuple[str, SuggestionRecord]:
-        suggestions = await self.config.guild(guild).suggestions()
-        for key, record in suggestions.items():
-            if int(record.get("message_id") or 0) == int(message_id):
-                return key, record
+        message_id = int(message_id)
+        keys = self._message_keys.get(guild.id)
+        if keys is None or message_id not in keys:
+            keys = await self._index_suggestion_messages(guild, keys)
+        key = keys.get(message_id)
+        record = await self.config.guild(guild).suggestions.get_raw(key, default=None) if key else None
+        if record and int(record.get("message_id") or 0) == message_id:
+            return key, record
+        keys.pop(message_id, None)
         raise commands.BadArgument("That message is not a tracked suggestion.")
 
+    async def _index_suggestion_messages(self, guild: discord.Guild, seen: dict[int, str] | None) -> dict[int, str]:
+        """Map suggestion message IDs to record keys, rebuilding at most once for concurrent misses."""
+        async with self._guild_lock(guild.id):
+            keys = self._message_keys.get(guild.id)
+            if keys is None or keys is seen:
+                suggestions = await self.config.guild(guild).suggestions()
+                keys = self._message_keys[guild.id] = {
+                    int(record["message_id"]): key for key, record in suggestions.items() if record.get("message_id")
+                }
+            return keys
+
+    def _vote_state(self, guild_id: int, message_id: int, key: str, record: SuggestionRecord) -> VoteState:
+        state = self._votes.get(message_id)
+        if state is None or state.key != key:
+            state = self._votes[message_id] = VoteState(
+                guild_id=guild_id,
+                key=key,
+                upvotes={str(voter) for voter in record.get("upvotes", [])},
+                downvotes={str(voter) for voter in record.get("downvotes", [])},
+            )
+        return state
+
+    def _schedule_vote_sync(self, guild: discord.Guild, message_id: int, state: VoteState) -> None:
+        state.dirty = True
+        if state.sync_task is None or state.sync_task.done():
+            state.sync_task = asyncio.create_task(self._sync_votes_later(guild, message_id, state))
+
+    async def _sync_votes_later(self, guild: discord.Guild, message_id: int, state: VoteState) -> None:
+        delay = state.last_sync + self.VOTE_SYNC_INTERVAL - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        state.last_sync = time.monotonic()
+        state.sync_task = None
+        try:
+            async with state.lock:
+                record = await self._persist_votes(message_id, state)
+                if record is not None:
+                    await self._edit_vote_message(guild, record)
+        except Exception:
+            log.exception("Failed to sync votes for suggestion message %s in guild %s", message_id, guild.id)
+
+    async def _persist_votes(self, message_id: int, state: VoteState) -> SuggestionRecord | None:
+        """Write the current vote sets into the stored record and return it, or ``None`` if it is gone."""
+        state.dirty = False
+        upvotes, downvotes = sorted(state.upvotes), sorted(state.downvotes)
+        suggestions = self.config.guild_from_id(state.guild_id).suggestions
+        async with self._guild_lock(state.guild_id):
+            record = await suggestions.get_raw(state.key, default=None)
+            if not record or int(record.get("message_id") or 0) != message_id:
+                self._votes.pop(message_id, None)
+                return None
+            record["upvotes"] = upvotes
+            record["downvotes"] = downvotes
+            record["updated_at"] = self._now_ts()
+            await suggestions.set_raw(state.key, value=record)
+        if str(record.get("status") or "open") != "open":
+            # Voting is over, so this was the final write for the suggestion.
+            self._votes.pop(message_id, None)
+        return record
+
+    async def _close_vote_state(self, message_id: int) -> SuggestionRecord | None:
+        """Write a closed or deleted suggestion's pending votes and stop tracking it in memory."""
+        state = self._votes.pop(message_id, None)
+        if state is None:
+            return None
+        if state.sync_task is not None:
+            state.sync_task.cancel()
+        async with state.lock:
+            return await self._persist_votes(message_id, state) if state.dirty else None
+
+    async def _edit_vote_message(self, guild: discord.Guild, record: SuggestionRecord) -> None:
+        channel = guild.get_channel(int(record.get("channel_id") or 0))
+        if not isinstance(channel, discord.TextChannel):
+            return
+        guild_conf = self.config.guild(guild)
+        settings = {
+            "embed_color": await guild_conf.embed_color(),
+            "allow_downvotes": await guild_conf.allow_downvotes(),
+            "anonymous": await guild_conf.anonymous(),
+        }
+        message = channel.get_partial_message(int(record["message_id"]))
+        try:
+            await message.edit(embed=self._record_embed(guild, record, settings), view=self._view_for_record(record))
+        except discord.HTTPException:
+            log.warning("Failed to update votes on suggestion %s in guild %s", record.get("id"), guild.id)
+
     async def handle_vote(
         self,
         interaction: discord.Interaction,
@@ -705,80 +829,70 @@ class SuggestionBox(DashboardIntegration, commands.Cog):
             return
 
         guild = interaction.guild
-        async with self._guild_lock(guild.id):
-            settings = await self.config.guild(guild).all()
-            if not settings.get("enabled"):
-                await interaction.response.send_message(
-                    "Suggestion voting is disabled.",
-                    ephemeral=True,
-                )
-                return
-            if vote_type == "down" and not settings.get("allow_downvotes"):
-                await interaction.response.send_message(
-                    "Downvotes are disabled here.",
-                    ephemeral=True,
-                )
-                return
+        guild_conf = self.config.guild(guild)
+        if not await guild_conf.enabled():
+            await interaction.response.send_message(
+                "Suggestion voting is disabled.",
+                ephemeral=True,
+            )
+            return
+        if vote_type == "down" and not await guild_conf.allow_downvotes():
+            await interaction.response.send_message(
+                "Downvotes are disabled here.",
+                ephemeral=True,
+            )
+            return
 
-            try:
-                suggestion_key, record = await self._find_record_by_message(
-                    guild,
-                    interaction.message.id,
-                )
-            except commands.BadArgument:
-                await interaction.response.send_message(
-                    "This suggestion is no longer tracked.",
-                    ephemeral=True,
-                )
-                return
+        try:
+            suggestion_key, record = await self._find_record_by_message(
+                guild,
+                interaction.message.id,
+            )
+        except commands.BadArgument:
+            await interaction.response.send_message(
+                "This suggestion is no longer tracked.",
+                ephemeral=True,
+            )
+            return
 
-            if str(record.get("status") or "open") != "open":
-                await interaction.response.send_message(
-                    "Voting is closed for this suggestion.",
-                    ephemeral=True,
-                )
-                return
-            if not settings.get("allow_self_vote") and str(
-                record.get("author_id"),
-            ) == str(user.id):
-                await interaction.response.send_message(
-                    "You cannot vote on your own suggestion.",
-                    ephemeral=True,
-                )
-                return
+        if str(record.get("status") or "open") != "open":
+            await interaction.response.send_message(
+                "Voting is closed for this suggestion.",
+                ephemeral=True,
+            )
+            return
+        if str(record.get("author_id")) == str(user.id) and not await guild_conf.allow_self_vote():
+            await interaction.response.send_message(
+                "You cannot vote on your own suggestion.",
+                ephemeral=True,
+            )
+            return
 
-            upvotes = {str(voter) for voter in record.get("upvotes", [])}
-            downvotes = {str(voter) for voter in record.get("downvotes", [])}
-            voter_key = str(user.id)
-
-            if vote_type == "up":
-                if voter_key in upvotes:
-                    upvotes.remove(voter_key)
-                    message = "Your upvote was removed."
-                else:
-                    upvotes.add(voter_key)
-                    downvotes.discard(voter_key)
-                    message = "Your upvote was counted."
-            else:
-                if voter_key in downvotes:
-                    downvotes.remove(voter_key)
-                    message = "Your downvote was removed."
-                else:
-                    downvotes.add(voter_key)
-                    upvotes.discard(voter_key)
-                    message = "Your downvote was counted."
-
-            record["upvotes"] = sorted(upvotes)
-            record["downvotes"] = sorted(downvotes)
-            record["updated_at"] = self._now_ts()
+        # Only this suggestion's in-memory sets change here; the record and message follow in one batched sync.
+        state = self._vote_state(guild.id, interaction.message.id, suggestion_key, record)
+        upvotes, downvotes = state.upvotes, state.downvotes
+        voter_key = str(user.id)
 
-            async with self.config.guild(guild).suggestions() as suggestions:
-                suggestions[suggestion_key] = record
+        if vote_type == "up":
+            if voter_key in upvotes:
+                upvotes.remove(voter_key)
+                message = "Your upvote was removed."
+            else:
+                upvotes.add(voter_key)
+                downvotes.discard(voter_key)
+                message = "Your upvote was counted."
+        else:
+            if voter_key in downvotes:
+                downvotes.remove(voter_key)
+                message = "Your downvote was removed."
+            else:
+                downvotes.add(voter_key)
+                upvotes.discard(voter_key)
+                message = "Your downvote was counted."
 
-            embed = self._record_embed(guild, record, settings)
-            await interaction.response.edit_message(embed=embed, view=self._vote_view)
-            with contextlib.suppress(discord.HTTPException):
-                await interaction.followup.send(message, ephemeral=True)
+        self._schedule_vote_sync(guild, interaction.message.id, state)
+        with contextlib.suppress(discord.HTTPException):
+            await interaction.response.send_message(message, ephemeral=True)
 
     async def _submit_suggestion(
         self,
@@ -848,6 +962,8 @@ class SuggestionBox(DashboardIntegration, commands.Cog):
             async with self.config.guild(guild).suggestions() as suggestions:
                 suggestions[self._suggestion_key(next_id)] = record
             await self.config.guild(guild).next_id.set(next_id + 1)
+            if guild.id in self._message_keys:
+                self._message_keys[guild.id][message.id] = self._suggestion_key(next_id)
 
         await self._sync_suggestion_message(guild, record, settings)
         await self._send_review_log(guild, record, "Submitted", author)
@@ -1394,6 +1510,8 @@ class SuggestionBox(DashboardIntegration, commands.Cog):
             record["decision_reason"] = reason
             record["decision_at"] = self._now_ts()
             suggestions[key] = record
+        if status != "open":
+            record = await self._close_vote_state(int(record.get("message_id") or 0)) or record
 
         settings = await self.config.guild(ctx.guild).all()
         await self._sync_suggestion_message(ctx.guild, record, settings)
@@ -1551,6 +1669,7 @@ class SuggestionBox(DashboardIntegration, commands.Cog):
                     f"No suggestion with ID `{suggestion_id}` was found.",
                 )
                 return
+        await self._close_vote_state(int(record.get("message_id") or 0))
 
         message = await self._fetch_suggestion_message(ctx.guild, record)
         if message is not None:
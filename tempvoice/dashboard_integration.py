@@ -372,6 +372,8 @@ class DashboardIntegration:
         await guild_conf.auto_delete_delay.set(auto_delete_delay)
         await guild_conf.channel_name_template.set(template)
         await guild_conf.clone_trigger_permissions.set(clone_permissions)
+        if enabled:
+            await self._resume_warm_pool(guild)
 
     async def _dashboard_cleanup(
         self,
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import heapq
 import logging
 import re
+import time
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
@@ -254,6 +256,10 @@ class TempVoice(DashboardIntegration, commands.Cog):
     ERROR_COLOR = 0xED4245
     DEFAULT_TEMPLATE = "{owner}'s channel"
     MAX_DELETE_DELAY = 300
+    DELETE_CONCURRENCY = 4
+    MAX_WARM_POOL = 10
+    WARM_POOL_REFILL_INTERVAL = 5.0
+    WARM_CHANNEL_NAME = "TempVoice standby"
     USER_ID_RE = re.compile(r"(\d{15,22})")
 
     def __init__(self, bot: Red) -> None:
@@ -273,29 +279,38 @@ class TempVoice(DashboardIntegration, commands.Cog):
             auto_delete_delay=3,
             clone_trigger_permissions=True,
             temp_channels={},
+            warm_pool_size=0,
+            warm_channels=[],
         )
         self._locks: dict[int, asyncio.Lock] = {}
-        self._delete_tasks: dict[int, asyncio.Task] = {}
+        # Min-heap of (due, guild_id, channel_id); entries not matching _cleanup_due are stale.
+        self._cleanup_heap: list[tuple[float, int, int]] = []
+        self._cleanup_due: dict[int, tuple[int, float]] = {}
+        self._cleanup_changed = asyncio.Event()
+        self._delete_budget = asyncio.Semaphore(self.DELETE_CONCURRENCY)
+        self._reaper_task: asyncio.Task | None = None
         self._startup_task: asyncio.Task | None = None
+        self._refill_tasks: dict[int, asyncio.Task] = {}
+        # Per-guild [hits, misses] for warm pool hand-outs since the cog loaded.
+        self._warm_stats: dict[int, list[int]] = {}
         self._control_view = TempVoiceControlView(self)
 
     async def cog_load(self) -> None:
         """Register persistent component callbacks."""
         self.bot.add_view(self._control_view)
+        self._reaper_task = asyncio.create_task(self._run_reaper())
         self._startup_task = asyncio.create_task(self._startup_cleanup())
 
     async def cog_unload(self) -> None:
         """Cancel pending cleanup tasks when the cog unloads."""
-        if self._startup_task and not self._startup_task.done():
-            self._startup_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._startup_task
-        for task in self._delete_tasks.values():
-            task.cancel()
-        for task in self._delete_tasks.values():
-            with contextlib.suppress(asyncio.CancelledError):
-                await task
-        self._delete_tasks.clear()
+        for task in (self._startup_task, self._reaper_task, *self._refill_tasks.values()):
+            if task and not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._cleanup_heap.clear()
+        self._cleanup_due.clear()
+        self._refill_tasks.clear()
 
     async def red_delete_data_for_user(self, *, requester: str, user_id: int) -> None:
         """Remove stored references to a Discord user ID."""
@@ -465,8 +480,7 @@ class TempVoice(DashboardIntegration, commands.Cog):
         guild: discord.Guild,
         channel_id: int,
     ) -> TempVoiceRecord | None:
-        records = await self.config.guild(guild).temp_channels()
-        return records.get(str(channel_id))
+        return await self.config.guild(guild).temp_channels.get_raw(str(channel_id), default=None)
 
     async def _record_from_interaction(
         self,
@@ -528,6 +542,7 @@ class TempVoice(DashboardIntegration, commands.Cog):
         self,
         guild: discord.Guild,
         channel_id: int,
+        /,
         **updates: Any,
     ) -> TempVoiceRecord:
         async with self.config.guild(guild).temp_channels() as records:
@@ -667,40 +682,82 @@ class TempVoice(DashboardIntegration, commands.Cog):
                 )
 
     def _cancel_cleanup(self, channel_id: int) -> None:
-        task = self._delete_tasks.pop(channel_id, None)
-        if task and not task.done():
-            task.cancel()
+        # The heap entry is left behind and discarded once it reaches the top.
+        self._cleanup_due.pop(channel_id, None)
 
     def _schedule_cleanup(self, guild_id: int, channel_id: int, delay: int) -> None:
-        self._cancel_cleanup(channel_id)
-        self._delete_tasks[channel_id] = asyncio.create_task(
-            self._cleanup_after_delay(guild_id, channel_id, delay),
-        )
+        due = time.monotonic() + max(0, min(delay, self.MAX_DELETE_DELAY))
+        self._cleanup_due[channel_id] = (guild_id, due)
+        heapq.heappush(self._cleanup_heap, (due, guild_id, channel_id))
+        if self._cleanup_heap[0][2] == channel_id:
+            self._cleanup_changed.set()
+
+    def _pending_cleanups(self, guild_id: int) -> int:
+        return sum(1 for pending_guild_id, _due in self._cleanup_due.values() if pending_guild_id == guild_id)
+
+    def _discard_stale_cleanups(self) -> None:
+        heap = self._cleanup_heap
+        while heap and self._cleanup_due.get(heap[0][2]) != (heap[0][1], heap[0][0]):
+            heapq.heappop(heap)
+
+    def _pop_due_cleanups(self) -> dict[int, list[int]]:
+        now = time.monotonic()
+        due: dict[int, list[int]] = {}
+        self._discard_stale_cleanups()
+        while self._cleanup_heap and self._cleanup_heap[0][0] <= now:
+            _due, guild_id, channel_id = heapq.heappop(self._cleanup_heap)
+            del self._cleanup_due[channel_id]
+            due.setdefault(guild_id, []).append(channel_id)
+            self._discard_stale_cleanups()
+        return due
+
+    async def _run_reaper(self) -> None:
+        """Delete empty temporary channels as their cleanup deadlines pass."""
+        while True:
+            self._cleanup_changed.clear()
+            due = self._pop_due_cleanups()
+            if due:
+                try:
+                    await asyncio.gather(*(self._reap_guild(guild_id, channel_ids) for guild_id, channel_ids in due.items()))
+                except Exception:
+                    log.exception("TempVoice cleanup failed.")
+                continue
 
-    async def _cleanup_after_delay(
-        self,
-        guild_id: int,
-        channel_id: int,
-        delay: int,
-    ) -> None:
-        try:
-            await asyncio.sleep(max(0, min(delay, self.MAX_DELETE_DELAY)))
-            guild = self.bot.get_guild(guild_id)
-            if guild is None:
-                return
+            timeout = self._cleanup_heap[0][0] - time.monotonic() if self._cleanup_heap else None
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._cleanup_changed.wait(), timeout=timeout)
+
+    async def _reap_guild(self, guild_id: int, channel_ids: list[int]) -> None:
+        """Delete a guild's due channels in parallel and drop their records in one write."""
+        guild = self.bot.get_guild(guild_id)
+        if guild is None:
+            return
+
+        async def reap(channel_id: int) -> bool:
             channel = guild.get_channel(channel_id)
             if not isinstance(channel, discord.VoiceChannel):
-                await self._remove_temp_record(guild, channel_id)
-                return
+                return True
             if self._human_members(channel):
-                return
-            await self._delete_temp_channel(
-                guild,
-                channel_id,
-                reason="TempVoice channel was empty.",
-            )
-        finally:
-            self._delete_tasks.pop(channel_id, None)
+                return False
+            async with self._delete_budget:
+                try:
+                    await channel.delete(reason="TempVoice channel was empty.")
+                except discord.NotFound:
+                    pass
+                except (discord.Forbidden, discord.HTTPException):
+                    log.exception(
+                        "Could not delete TempVoice channel %s in guild %s.",
+                        channel_id,
+                        guild.id,
+                    )
+            return True
+
+        results = await asyncio.gather(*(reap(channel_id) for channel_id in channel_ids))
+        removed = [channel_id for channel_id, drop in zip(channel_ids, results) if drop]
+        if removed:
+            async with self.config.guild(guild).temp_channels() as records:
+                for channel_id in removed:
+                    records.pop(str(channel_id), None)
 
     async def _startup_cleanup(self) -> None:
         """Schedule cleanup for empty persisted temporary channels after a restart."""
@@ -732,11 +789,132 @@ class TempVoice(DashboardIntegration, commands.Cog):
                     async with self.config.guild(guild).temp_channels() as stored:
                         for channel_id in stale_ids:
                             stored.pop(channel_id, None)
+
+                warm_ids = settings.get("warm_channels", [])
+                live_ids = [
+                    channel_id for channel_id in warm_ids if isinstance(guild.get_channel(int(channel_id)), discord.VoiceChannel)
+                ]
+                if live_ids != warm_ids:
+                    await self.config.guild(guild).warm_channels.set(live_ids)
+                if settings.get("enabled") and settings.get("warm_pool_size"):
+                    self._schedule_warm_refill(guild)
         except asyncio.CancelledError:
             raise
         except Exception:
             log.exception("TempVoice startup cleanup failed.")
 
+    @staticmethod
+    def _temp_category(
+        guild: discord.Guild,
+        category_id: Any,
+        trigger: discord.VoiceChannel | None,
+    ) -> discord.CategoryChannel | None:
+        if category_id:
+            maybe_category = guild.get_channel(int(category_id))
+            if isinstance(maybe_category, discord.CategoryChannel):
+                return maybe_category
+        return trigger.category if trigger is not None else None
+
+    def _warm_pool_text(self, guild_id: int, settings: GuildSettings) -> str:
+        size = int(settings.get("warm_pool_size") or 0)
+        if size <= 0:
+            return "Off"
+        ready = len(settings.get("warm_channels", []))
+        hits, misses = self._warm_stats.get(guild_id, (0, 0))
+        if not hits + misses:
+            return f"{ready}/{size} ready, no joins yet"
+        return f"{ready}/{size} ready, {hits / (hits + misses):.0%} hit rate ({hits} of {hits + misses} joins)"
+
+    async def _take_warm_channel(
+        self,
+        guild: discord.Guild,
+        category: discord.CategoryChannel | None,
+        **options: Any,
+    ) -> discord.VoiceChannel | None:
+        """Hand out a standby channel with one edit, or return None when the pool is empty."""
+        channel = None
+        async with self.config.guild(guild).warm_channels() as warm_ids:
+            while warm_ids and channel is None:
+                candidate = guild.get_channel(int(warm_ids.pop(0)))
+                if isinstance(candidate, discord.VoiceChannel):
+                    channel = candidate
+
+        stats = self._warm_stats.setdefault(guild.id, [0, 0])
+        if channel is None:
+            stats[1] += 1
+            return None
+        if category is not None and channel.category_id != category.id:
+            options["category"] = category
+        try:
+            edited = await channel.edit(**options)
+        except (discord.Forbidden, discord.HTTPException):
+            log.exception(
+                "Could not hand out TempVoice standby channel %s in guild %s.",
+                channel.id,
+                guild.id,
+            )
+            with contextlib.suppress(discord.HTTPException):
+                await channel.delete(reason="TempVoice standby channel could not be prepared.")
+            stats[1] += 1
+            return None
+        stats[0] += 1
+        return edited or channel
+
+    def _schedule_warm_refill(self, guild: discord.Guild) -> None:
+        task = self._refill_tasks.get(guild.id)
+        if task is None or task.done():
+            self._refill_tasks[guild.id] = asyncio.create_task(self._refill_warm_pool(guild))
+
+    async def _resume_warm_pool(self, guild: discord.Guild) -> None:
+        """Start refilling the standby pool after TempVoice is (re)enabled, if one is configured."""
+        if await self.config.guild(guild).warm_pool_size():
+            self._schedule_warm_refill(guild)
+
+    async def _refill_warm_pool(self, guild: discord.Guild) -> None:
+        """Top the standby pool up to its configured size, one channel per refill interval."""
+        guild_conf = self.config.guild(guild)
+        while await guild_conf.enabled():
+            try:
+                size = int(await guild_conf.warm_pool_size() or 0)
+                if len(await guild_conf.warm_channels()) >= size:
+                    return
+
+                trigger = guild.get_channel(int(await guild_conf.join_channel_id() or 0))
+                category = self._temp_category(
+                    guild,
+                    await guild_conf.category_id(),
+                    trigger if isinstance(trigger, discord.VoiceChannel) else None,
+                )
+                overwrites: dict[Any, discord.PermissionOverwrite] = {
+                    guild.default_role: discord.PermissionOverwrite(view_channel=False, connect=False),
+                    guild.me: discord.PermissionOverwrite(
+                        view_channel=True,
+                        connect=True,
+                        manage_channels=True,
+                        move_members=True,
+                    ),
+                }
+                channel = await (category or guild).create_voice_channel(
+                    name=self.WARM_CHANNEL_NAME,
+                    overwrites=overwrites,
+                    reason="TempVoice standby channel for the warm pool.",
+                )
+
+                # The pool may have been shrunk while the channel was being created.
+                async with guild_conf.warm_channels() as warm_ids:
+                    keep = len(warm_ids) < int(await guild_conf.warm_pool_size() or 0)
+                    if keep:
+                        warm_ids.append(channel.id)
+                if not keep:
+                    await channel.delete(reason="TempVoice warm pool is already full.")
+                    return
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Keep the refill alive; the next interval retries instead of leaving the pool empty.
+                log.exception("Could not refill the TempVoice warm pool in guild %s.", guild.id)
+            await asyncio.sleep(self.WARM_POOL_REFILL_INTERVAL)
+
     async def _active_owner_channel(
         self,
         guild: discord.Guild,
@@ -782,14 +960,7 @@ class TempVoice(DashboardIntegration, commands.Cog):
                     )
                 return
 
-            category = None
-            category_id = settings.get("category_id")
-            if category_id:
-                maybe_category = guild.get_channel(int(category_id))
-                if isinstance(maybe_category, discord.CategoryChannel):
-                    category = maybe_category
-            if category is None:
-                category = trigger.category
+            category = self._temp_category(guild, settings.get("category_id"), trigger)
 
             name = self._render_channel_name(
                 str(settings.get("channel_name_template") or self.DEFAULT_TEMPLATE),
@@ -809,27 +980,31 @@ class TempVoice(DashboardIntegration, commands.Cog):
             overwrites[member] = owner_overwrite
 
             reason = f"TempVoice channel created for {member} ({member.id})."
-            try:
-                if category is not None:
-                    channel = await category.create_voice_channel(
+            channel = None
+            if settings.get("warm_pool_size"):
+                channel = await self._take_warm_channel(
+                    guild,
+                    category,
+                    name=name,
+                    overwrites=overwrites,
+                    user_limit=user_limit,
+                    reason=reason,
+                )
+                self._schedule_warm_refill(guild)
+            if channel is None:
+                try:
+                    channel = await (category or guild).create_voice_channel(
                         name=name,
                         overwrites=overwrites,
                         user_limit=user_limit,
                         reason=reason,
                     )
-                else:
-                    channel = await guild.create_voice_channel(
-                        name=name,
-                        overwrites=overwrites,
-                        user_limit=user_limit,
-                        reason=reason,
+                except (discord.Forbidden, discord.HTTPException):
+                    log.exception(
+                        "Could not create TempVoice channel in guild %s.",
+                        guild.id,
                     )
-            except (discord.Forbidden, discord.HTTPException):
-                log.exception(
-                    "Could not create TempVoice channel in guild %s.",
-                    guild.id,
-                )
-                return
+                    return
 
             record: TempVoiceRecord = {
                 "channel_id": channel.id,
@@ -899,8 +1074,8 @@ class TempVoice(DashboardIntegration, commands.Cog):
 
         if isinstance(after.channel, discord.VoiceChannel):
             self._cancel_cleanup(after.channel.id)
-            settings = await self.config.guild(member.guild).all()
-            if settings.get("enabled") and int(settings.get("join_channel_id") or 0) == after.channel.id:
+            guild_conf = self.config.guild(member.guild)
+            if int(await guild_conf.join_channel_id() or 0) == after.channel.id and await guild_conf.enabled():
                 await self._create_temp_channel_for(member, after.channel)
 
         if before.channel is not None:
@@ -1409,6 +1584,16 @@ class TempVoice(DashboardIntegration, commands.Cog):
             value=str(len(temp_channels)),
             inline=True,
         )
+        embed.add_field(
+            name="Pending Deletions",
+            value=str(self._pending_cleanups(guild.id)),
+            inline=True,
+        )
+        embed.add_field(
+            name="Warm Pool",
+            value=self._warm_pool_text(guild.id, settings),
+            inline=False,
+        )
         return embed
 
     @commands.hybrid_group(
@@ -1481,6 +1666,7 @@ class TempVoice(DashboardIntegration, commands.Cog):
         await self.config.guild(ctx.guild).category_id.set(
             category.id if category else None,
         )
+        await self._resume_warm_pool(ctx.guild)
 
         await ctx.send(
             f"TempVoice is enabled. Users who join {join_channel.mention} will get a temporary voice channel.",
@@ -1499,6 +1685,7 @@ class TempVoice(DashboardIntegration, commands.Cog):
             )
             return
         await self.config.guild(ctx.guild).enabled.set(True)
+        await self._resume_warm_pool(ctx.guild)
         await ctx.send("TempVoice is enabled.")
 
     @tempvoice.command(name="disable", description="Disable temporary voice creation.")
@@ -1528,6 +1715,7 @@ class TempVoice(DashboardIntegration, commands.Cog):
         assert ctx.guild is not None
         await self.config.guild(ctx.guild).join_channel_id.set(channel.id)
         await self.config.guild(ctx.guild).enabled.set(True)
+        await self._resume_warm_pool(ctx.guild)
         await ctx.send(
             f"Users who join {channel.mention} will get a temporary voice channel.",
         )
@@ -1644,6 +1832,37 @@ class TempVoice(DashboardIntegration, commands.Cog):
             f"Empty temporary channels will be deleted after {seconds} seconds.",
         )
 
+    @tempvoice.command(
+        name="warmpool",
+        description="Keep hidden standby channels ready for instant creation.",
+    )
+    @commands.guild_only()
+    @commands.admin_or_permissions(manage_guild=True)
+    @commands.bot_has_permissions(manage_channels=True)
+    async def tempvoice_warmpool(self, ctx: commands.Context, size: int) -> None:
+        """Keep a number of hidden standby channels ready so join-to-create is instant."""
+        assert ctx.guild is not None
+        if size < 0 or size > self.MAX_WARM_POOL:
+            await ctx.send(
+                f"Warm pool size must be between 0 and {self.MAX_WARM_POOL}. Use 0 to turn it off.",
+            )
+            return
+        guild_conf = self.config.guild(ctx.guild)
+        await guild_conf.warm_pool_size.set(size)
+        async with guild_conf.warm_channels() as warm_ids:
+            surplus = warm_ids[size:]
+            del warm_ids[size:]
+        for channel_id in surplus:
+            channel = ctx.guild.get_channel(int(channel_id))
+            if isinstance(channel, discord.VoiceChannel):
+                with contextlib.suppress(discord.HTTPException):
+                    await channel.delete(reason=f"TempVoice warm pool resized by {ctx.author} ({ctx.author.id}).")
+        if not size:
+            await ctx.send("The warm pool is off. New temporary channels will be created on join.")
+            return
+        self._schedule_warm_refill(ctx.guild)
+        await ctx.send(f"TempVoice will keep {size} hidden standby channel(s) ready for instant creation.")
+
     @tempvoice.command(name="list", description="List active temporary voice channels.")
     @commands.guild_only()
     @commands.bot_has_permissions(embed_links=True)
@@ -0,0 +1,51 @@
+"""Time CommandHub's registry startup and indexed search on synthetic commands.
+
+Run directly from the repository root:
+    python tests/simulate_commandhub.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from test_commandhub_registry import COGS, boot_registry
+from test_commandhub_search import QUERIES, _synthetic_commands
+
+from commandhub.utils import CommandSearchIndex, rank_commands
+
+
+def registry_startup() -> None:
+    for incremental in (False, True):
+        started = time.perf_counter()
+        registry = asyncio.run(boot_registry(incremental))
+        label = "incremental" if incremental else "full rebuilds"
+        print(
+            f"registry startup, {COGS} cogs, {label:>13}: {(time.perf_counter() - started) * 1000:7.1f} ms, "
+            f"{registry.normalizations} normalizations",
+        )
+
+
+def search(count: int = 5_000, rounds: int = 20) -> None:
+    commands = _synthetic_commands(count)
+    started = time.perf_counter()
+    index = CommandSearchIndex(commands)
+    print(f"search index over {count} commands built in {(time.perf_counter() - started) * 1000:.1f} ms")
+    for query in QUERIES:
+        started = time.perf_counter()
+        for _ in range(rounds):
+            index.search(query, limit=25)
+        indexed_ms = (time.perf_counter() - started) * 1000 / rounds
+        started = time.perf_counter()
+        rank_commands(commands, query)
+        reference_ms = (time.perf_counter() - started) * 1000
+        print(f"{query!r:>16} | indexed {indexed_ms:7.3f} ms | rank_commands {reference_ms:7.2f} ms")
+
+
+if __name__ == "__main__":
+    registry_startup()
+    search()
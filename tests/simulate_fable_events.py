@@ -0,0 +1,32 @@
+"""Time Fable's indexed character pages on a large synthetic event log.
+
+Run directly from the repository root:
+    python tests/simulate_fable_events.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from test_fable_events import _large_store
+
+
+async def character_pages(count: int = 20_000, rounds: int = 50) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        store = await _large_store(Path(directory) / "events.sqlite3", count)
+        started = time.perf_counter()
+        for _ in range(rounds):
+            _, cursor = await store.character_events(1, "Hero3")
+            await store.character_events(1, "Hero3", before=cursor)
+        elapsed = time.perf_counter() - started
+        print(f"{rounds * 2} indexed character pages over {count:,} events: {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(character_pages())
@@ -0,0 +1,58 @@
+"""Time KnowledgeGarden's BM25 index against a full scan over a synthetic 10k-entry corpus.
+
+Run directly from the repository root:
+    python tests/simulate_knowledgegarden.py
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from test_knowledgegarden_search import QUERIES, _corpus
+
+from knowledgegarden.search import SearchIndex, tokens
+
+
+def _reference_rank(entries: list[dict], query: str) -> list[tuple[int, dict]]:
+    """The previous full-scan ranking, timed against the index."""
+    query_words = tokens(query)
+    ranked = []
+    for entry in entries:
+        if entry.get("status") != "published":
+            continue
+        title = tokens(str(entry.get("title", "")))
+        tags = tokens(" ".join(entry.get("tags", [])))
+        aliases = tokens(" ".join(entry.get("aliases", [])))
+        body = tokens(str(entry.get("body", "")))
+        score = 6 * len(query_words & title) + 5 * len(query_words & aliases) + 4 * len(query_words & tags)
+        score += len(query_words & body)
+        if score:
+            ranked.append((score, entry))
+    return sorted(ranked, key=lambda item: (-item[0], -int(item[1].get("updated_at", 0)), int(item[1].get("entry_id", 0))))
+
+
+def search(size: int = 10_000) -> None:
+    entries = _corpus(size)
+    started = time.perf_counter()
+    index = SearchIndex(entries)
+    build = time.perf_counter() - started
+
+    def per_query_ms(run) -> float:
+        started = time.perf_counter()
+        for query in QUERIES:
+            run(query)
+        return (time.perf_counter() - started) / len(QUERIES) * 1000
+
+    reference = min(per_query_ms(lambda query: _reference_rank(entries, query)) for _ in range(2))
+    indexed = min(per_query_ms(index.search) for _ in range(3))
+    print(
+        f"{size:,} entries: index build {build * 1000:.0f} ms, full scan {reference:.1f} ms/query, index {indexed:.1f} ms/query"
+    )
+
+
+if __name__ == "__main__":
+    search()
@@ -0,0 +1,35 @@
+"""Time SecretSentinel's prefiltered scanner against the per-pattern scan on clean chat.
+
+Run directly from the repository root:
+    python tests/simulate_secretsentinel.py
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from test_secretsentinel_scanner import _corpus, _reference_find_secrets
+
+from secretsentinel.detection import find_secrets
+
+
+def clean_chat(size: int = 5000, rounds: int = 3) -> None:
+    corpus = _corpus(size)
+
+    def per_message_us(scan) -> float:
+        started = time.perf_counter()
+        for text in corpus:
+            scan(text)
+        return (time.perf_counter() - started) / len(corpus) * 1_000_000
+
+    reference = min(per_message_us(_reference_find_secrets) for _ in range(rounds))
+    combined = min(per_message_us(find_secrets) for _ in range(rounds))
+    print(f"clean chat per message: per-pattern {reference:.2f} µs, prefiltered scanner {combined:.2f} µs")
+
+
+if __name__ == "__main__":
+    clean_chat()
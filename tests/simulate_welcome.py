@@ -0,0 +1,71 @@
+"""Time welcome image rendering for a wave of joins against the old per-join path.
+
+Run directly from the repository root:
+    python tests/simulate_welcome.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from PIL import Image
+from test_welcome_imaging import OVERLAY, _cog, _image_bytes, _image_data, _member
+
+from welcome import imaging
+
+
+def _legacy_render(image_data: dict[str, str], avatar: bytes) -> bytes:
+    """The per-join work the cog did before: decode, fit, mask, and optimised PNG, every time."""
+    data = base64.b64decode(image_data["data_base64"])
+    prepared = imaging.prepare_background((), data, image_data["filename"], OVERLAY)
+    avatar_image = imaging.ImageOps.fit(
+        Image.open(io.BytesIO(avatar)).convert("RGBA"),
+        (prepared.box[2],) * 2,
+        method=imaging._resampling_filter(),
+    )
+    prepared.base.paste(avatar_image, prepared.box[:2], prepared.mask)
+    buffer = io.BytesIO()
+    prepared.base.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+async def joins(count: int = 100) -> None:
+    avatar = _image_bytes((512, 512), "PNG", (220, 180, 30))
+    image_data = _image_data(_image_bytes((1280, 720), "PNG"))
+    cog = _cog(avatar)
+    ticks = 0
+    rendering = True
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while rendering:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    started = time.perf_counter()
+    legacy = [_legacy_render(image_data, avatar) for _ in range(10)]
+    legacy_per_join = (time.perf_counter() - started) / len(legacy)
+
+    ticking = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    files = await asyncio.gather(*(cog._build_image_file(image_data, _member(index), OVERLAY) for index in range(count)))
+    cached_per_join = (time.perf_counter() - started) / len(files)
+    rendering = False
+    await ticking
+
+    print(
+        f"welcome images: legacy {legacy_per_join * 1000:.1f} ms/join, "
+        f"cached off-loop {cached_per_join * 1000:.1f} ms/join over {len(files)} joins, "
+        f"{ticks} event-loop ticks while rendering",
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(joins())
@@ -0,0 +1,150 @@
+"""Conditional status polling and change-aware panel edits for CfxStatus."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+from aiohttp import web
+
+from cfxstatus.cfxstatus import CfxStatus
+
+
+def _summary(fivem: str = "operational") -> dict:
+    names = ("CnL", "FiveM", "RedM", "Cfx.re Platform Server (FXServer)", "Portal")
+    components = [{"name": name, "status": fivem if name == "FiveM" else "operational"} for name in names]
+    return {"page": {"updated_at": "2026-10-19T00:00:00Z"}, "components": components}
+
+
+def _cog() -> CfxStatus:
+    cog = object.__new__(CfxStatus)
+    cog._session = None
+    cog._sources = {}
+    cog._status_task = None
+    cog._edit_budget = asyncio.Semaphore(CfxStatus.EDIT_CONCURRENCY)
+    cog._rendered = {}
+    return cog
+
+
+def test_sources_are_revalidated_and_unchanged_bodies_are_not_reparsed() -> None:
+    async def check() -> None:
+        requests: list[tuple[str | None, str | None]] = []
+        state = {"body": json.dumps(_summary()), "etag": '"v1"'}
+
+        async def summary(request: web.Request) -> web.Response:
+            requests.append((request.headers.get("If-None-Match"), request.headers.get("If-Modified-Since")))
+            await asyncio.sleep(0.02)
+            headers = {"Last-Modified": "Mon, 19 Oct 2026 00:00:00 GMT"}
+            if state["etag"]:
+                headers["ETag"] = state["etag"]
+                if request.headers.get("If-None-Match") == state["etag"]:
+                    return web.Response(status=304, headers=headers)
+            return web.Response(text=state["body"], content_type="application/json", headers=headers)
+
+        app = web.Application()
+        app.router.add_get("/summary.json", summary)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+
+        cog = _cog()
+        cog.CFX_SUMMARY_API_URL = f"http://127.0.0.1:{runner.addresses[0][1]}/summary.json"
+        parses = 0
+        parse = cog._parse_statuspage_components
+
+        def counting_parse(data):
+            nonlocal parses
+            parses += 1
+            return parse(data)
+
+        cog._parse_statuspage_components = counting_parse
+        try:
+            first, second, third = await asyncio.gather(*(cog.fetch_status() for _ in range(3)))
+            assert first is second is third
+            assert requests == [(None, None)]
+
+            assert await cog.fetch_status() is first
+            assert requests[-1] == ('"v1"', "Mon, 19 Oct 2026 00:00:00 GMT")
+
+            # A server without ETags that returns the same bytes is fingerprinted instead of parsed.
+            state["etag"] = None
+            assert await cog.fetch_status() is first
+            assert parses == 1
+
+            state["body"] = json.dumps(_summary("major_outage"))
+            changed = await cog.fetch_status()
+            assert changed.components["FiveM"] == "Major Outage"
+            assert parses == 2
+        finally:
+            await cog._session.close()
+            await runner.cleanup()
+
+    asyncio.run(check())
+
+
+def test_due_panels_refresh_concurrently_and_unchanged_status_is_not_edited() -> None:
+    async def check() -> None:
+        edits: list[int] = []
+        active = peak = 0
+
+        def channel_for(guild_id: int) -> MagicMock:
+            channel = MagicMock(spec=discord.TextChannel)
+
+            async def edit(**kwargs):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.05)
+                active -= 1
+                edits.append(guild_id)
+                return SimpleNamespace(id=guild_id)
+
+            channel.get_partial_message.side_effect = lambda message_id: SimpleNamespace(id=message_id, edit=edit)
+            return channel
+
+        guild_ids = range(1, 7)
+        channels = {guild_id: channel_for(guild_id) for guild_id in guild_ids}
+        guilds = {
+            guild_id: SimpleNamespace(id=guild_id, me=object(), get_channel=lambda _id, guild_id=guild_id: channels[guild_id])
+            for guild_id in guild_ids
+        }
+        stored = {
+            guild_id: {"enabled": True, "status_channel_id": 50, "status_message_id": guild_id, "last_poll_at": 0}
+            for guild_id in guild_ids
+        }
+        last_poll = SimpleNamespace(set=AsyncMock())
+        cog = _cog()
+        cog.bot = SimpleNamespace(get_guild=guilds.get)
+        cog.config = SimpleNamespace(
+            all_guilds=AsyncMock(side_effect=lambda: {key: dict(value) for key, value in stored.items()}),
+            guild=lambda guild: SimpleNamespace(last_poll_at=last_poll),
+        )
+        payloads = [cog._parse_statuspage_components(_summary())]
+        fetches = 0
+
+        async def fetch_status():
+            nonlocal fetches
+            fetches += 1
+            components = payloads[-1]
+            return SimpleNamespace(components=components, source_name="Cfx.re Statuspage")
+
+        cog.fetch_status = fetch_status
+
+        await CfxStatus.status_loop.coro(cog)
+        assert sorted(edits) == list(guild_ids)
+        assert peak == CfxStatus.EDIT_CONCURRENCY
+        assert fetches == 1
+
+        edits.clear()
+        await CfxStatus.status_loop.coro(cog)
+        assert edits == []
+        assert last_poll.set.await_count == 12
+
+        payloads.append(cog._parse_statuspage_components(_summary("degraded_performance")))
+        await CfxStatus.status_loop.coro(cog)
+        assert sorted(edits) == list(guild_ids)
+
+    asyncio.run(check())
@@ -0,0 +1,179 @@
+"""Incremental discovery and startup cost of CommandHub's command registry."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import discord
+from redbot.core import app_commands, commands
+
+from commandhub.models import CommandSource
+from commandhub.registry import CommandRegistry
+
+COGS = 80
+COMMANDS_PER_COG = 10
+
+
+def _make_cog(index: int) -> commands.Cog:
+    # discord.py only binds ``self`` for callbacks whose qualified name places them in a class.
+    attrs: dict[str, object] = {}
+    for number in range(COMMANDS_PER_COG):
+
+        async def callback(self, ctx: commands.Context, amount: int, target: discord.Member | None = None) -> None:
+            """Synthetic command."""
+
+        callback.__qualname__ = f"SyntheticCog{index}.command_{number}"
+        attrs[f"command_{number}"] = commands.command(name=f"cog{index}cmd{number}")(callback)
+
+    async def ping(self, interaction: discord.Interaction, loud: bool) -> None:
+        """Synthetic slash command."""
+
+    ping.__qualname__ = f"SyntheticCog{index}.ping"
+    attrs["ping"] = app_commands.command(name=f"ping{index}", description="Ping")(ping)
+    return type(f"SyntheticCog{index}", (commands.Cog,), attrs)()
+
+
+class FakeBot:
+    """Bot whose tree, like Red's, only holds app commands enabled with ``[p]slash enable``."""
+
+    def __init__(self) -> None:
+        self.cogs: dict[str, commands.Cog] = {}
+        self.disabled: set[str] = set()
+        self._tree: dict[str, app_commands.Command] = {}
+        self.tree = SimpleNamespace(get_commands=lambda: list(self._tree.values()), get_command=self._get_command)
+
+    def _get_command(self, name: str, **options: object) -> app_commands.Command | None:
+        kind = options.get("type", discord.AppCommandType.chat_input)
+        return self._tree.get(name) if kind is discord.AppCommandType.chat_input else None
+
+    def walk_commands(self):
+        for cog in self.cogs.values():
+            yield from cog.walk_commands()
+
+    def load(self, cog: commands.Cog) -> None:
+        for command in cog.walk_commands():
+            command.cog = cog
+        self.cogs[cog.qualified_name] = cog
+        for command in cog.get_app_commands():
+            if command.name not in self.disabled:
+                self._tree[command.name] = command
+
+    def unload(self, cog: commands.Cog) -> None:
+        self.cogs.pop(cog.qualified_name)
+        for command in cog.get_app_commands():
+            self._tree.pop(command.name, None)
+
+
+def _registry(bot: FakeBot, debounce: float = 0.01) -> CommandRegistry:
+    return CommandRegistry(bot, SimpleNamespace(check_compatibility=lambda: False), debounce=debounce)
+
+
+def test_cog_events_update_only_that_cogs_commands() -> None:
+    async def check() -> None:
+        bot = FakeBot()
+        first, second = _make_cog(1), _make_cog(2)
+        bot.load(first)
+        registry = _registry(bot)
+        await registry.refresh()
+        assert registry.normalizations == COMMANDS_PER_COG + 1
+
+        bot.load(second)
+        registry.schedule_cog(second)
+        await asyncio.sleep(0.05)
+        assert registry.normalizations == 2 * (COMMANDS_PER_COG + 1)
+        assert registry.get(CommandSource.APPLICATION, "ping2") is not None
+        assert registry.counts[CommandSource.PREFIX] == 2 * COMMANDS_PER_COG
+
+        bot.unload(first)
+        registry.schedule_cog(first, removed=True)
+        await asyncio.sleep(0.05)
+        assert registry.get(CommandSource.PREFIX, "cog1cmd0") is None
+        assert registry.get(CommandSource.APPLICATION, "ping1") is None
+        assert registry.get(CommandSource.PREFIX, "cog2cmd0") is not None
+        assert [item.qualified_name for item in registry.search("cog", limit=3)] == ["cog2cmd0", "cog2cmd1", "cog2cmd2"]
+        assert registry.search("ping1") == []
+
+        await registry.refresh()
+        assert registry.normalizations == 2 * (COMMANDS_PER_COG + 1)
+
+    asyncio.run(check())
+
+
+def test_incremental_loads_keep_slash_disabled_commands_hidden_like_a_refresh() -> None:
+    async def check() -> None:
+        bot = FakeBot()
+        bot.disabled.add("ping2")
+        registry = _registry(bot)
+        cog = _make_cog(2)
+        bot.load(cog)
+        registry.schedule_cog(cog)
+        await asyncio.sleep(0.05)
+
+        assert registry.get(CommandSource.APPLICATION, "ping2") is None
+        assert registry.get(CommandSource.PREFIX, "cog2cmd0") is not None
+        incremental = set(registry.commands)
+        await registry.refresh()
+        assert set(registry.commands) == incremental
+
+    asyncio.run(check())
+
+
+def test_cog_event_bursts_are_debounced_into_one_flush() -> None:
+    async def check() -> None:
+        bot = FakeBot()
+        registry = _registry(bot, debounce=0.02)
+        flushes = 0
+        flush = registry.flush
+
+        async def counting_flush() -> None:
+            nonlocal flushes
+            flushes += 1
+            await flush()
+
+        registry.flush = counting_flush
+        cogs = [_make_cog(index) for index in range(5)]
+        for cog in cogs:
+            bot.load(cog)
+            registry.schedule_cog(cog)
+        bot.unload(cogs[0])
+        registry.schedule_cog(cogs[0], removed=True)
+        await asyncio.sleep(0.08)
+
+        assert flushes == 1
+        assert len(registry.commands) == 4 * (COMMANDS_PER_COG + 1)
+        registry.schedule_cog(cogs[1], removed=True)
+        registry.cancel()
+        await asyncio.sleep(0.04)
+        assert flushes == 1
+
+    asyncio.run(check())
+
+
+async def boot_registry(incremental: bool) -> CommandRegistry:
+    """Load every synthetic cog with one registry event each, as a bot does at startup."""
+    bot = FakeBot()
+    registry = _registry(bot, debounce=0.0)
+    for cog in [_make_cog(index) for index in range(COGS)]:
+        bot.load(cog)
+        if incremental:
+            registry.schedule_cog(cog)
+        else:
+            # The previous behaviour: a full rebuild with no memoisation on every cog event.
+            registry._normalized.clear()
+            await registry.refresh()
+    if incremental:
+        await registry.flush()
+    return registry
+
+
+def test_startup_loads_normalize_each_command_once_and_match_full_rebuilds() -> None:
+    async def check() -> None:
+        full = await boot_registry(incremental=False)
+        incremental = await boot_registry(incremental=True)
+
+        assert set(incremental.commands) == set(full.commands)
+        assert incremental.normalizations == COGS * (COMMANDS_PER_COG + 1)
+        assert full.normalizations == sum(index * (COMMANDS_PER_COG + 1) for index in range(1, COGS + 1))
+
+    asyncio.run(check())
@@ -0,0 +1,80 @@
+"""Indexed CommandHub search: parity with the reference ranking."""
+
+from __future__ import annotations
+
+import random
+
+from commandhub.models import CommandSource, HubCommand
+from commandhub.utils import CommandSearchIndex, rank_commands
+
+SYLLABLES = ("ba", "lan", "ro", "le", "ti", "ck", "gi", "va", "qu", "es", "mu", "si", "xp", "ra", "id", "po")
+# Two-syllable words give a few hundred distinct terms, so most queries match a realistic share of commands.
+WORDS = tuple(
+    sorted({first + second for first in SYLLABLES for second in SYLLABLES} | {"balance", "role", "ticket", "raid"}),
+)
+QUERIES = ("balance", "role", "giv", "ticket close", "qu", "b", "xp", "raid boss", "lanti", "zzz", "Economy", "")
+
+
+def _synthetic_commands(count: int, seed: int = 34) -> list[HubCommand]:
+    rng = random.Random(seed)
+    commands = []
+    for index in range(count):
+        words = rng.sample(WORDS, 2)
+        cog = rng.choice(WORDS).title()
+        commands.append(
+            HubCommand(
+                rng.choice(tuple(CommandSource)),
+                f"{words[0]} {words[1]} {index}",
+                f"{words[0]} {words[1]} {index}",
+                f"{rng.choice(WORDS).title()} {' '.join(rng.sample(WORDS, 6))} for the server.",
+                f"{cog}Cog",
+                rng.choice((cog, "Economy", "Moderation", None)),
+            ),
+        )
+    return commands
+
+
+def test_index_matches_reference_ranking() -> None:
+    commands = _synthetic_commands(600)
+    index = CommandSearchIndex(commands)
+
+    for query in (*QUERIES, "ban 1", "  Level ", "ue"):
+        assert index.search(query) == rank_commands(commands, query), query
+        assert index.search(query, limit=5) == rank_commands(commands, query)[:5], query
+
+
+def test_incremental_updates_match_a_fresh_ranking() -> None:
+    commands = _synthetic_commands(400, seed=7)
+    index = CommandSearchIndex(commands[:300])
+    for command in commands[:100]:
+        index.discard(command.key)
+    for command in commands[300:]:
+        index.add(command)
+    remaining = commands[100:]
+
+    assert len(index) == 300
+    for query in QUERIES:
+        assert index.search(query) == rank_commands(remaining, query), query
+        assert index.search(query, limit=10) == rank_commands(remaining, query)[:10], query
+
+
+def test_index_keeps_exact_then_prefix_then_description_order() -> None:
+    commands = [
+        HubCommand(CommandSource.PREFIX, "show balance", "show balance", "economy balance details", None, None),
+        HubCommand(CommandSource.PREFIX, "balance history", "balance history", "", None, None),
+        HubCommand(CommandSource.PREFIX, "balance", "balance", "", None, None),
+        HubCommand(CommandSource.PREFIX, "payday", "payday", "Adds to your balance", "Economy", None),
+    ]
+
+    ranked = CommandSearchIndex(commands).search("BALANCE")
+
+    assert [item.qualified_name for item in ranked] == ["balance", "balance history", "show balance", "payday"]
+
+
+def test_limited_queries_over_five_thousand_commands_match_the_reference() -> None:
+    commands = _synthetic_commands(5_000)
+    index = CommandSearchIndex(commands)
+
+    assert len(index) == 5_000
+    for query in QUERIES:
+        assert index.search(query, limit=25) == rank_commands(commands, query)[:25], query
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from deepdelve.art import bestiary_slug, combat_art_path
+from deepdelve.art import BestiaryArtRegistry, bestiary_slug, combat_art_path
 from deepdelve.content import BOSSES, ENEMIES
 
 
@@ -27,3 +27,33 @@ def test_modified_encounters_reuse_their_base_portrait() -> None:
 def test_bestiary_slugs_are_stable_for_punctuation() -> None:
     assert bestiary_slug("Yesterday's Corpse") == "yesterday-s-corpse"
     assert bestiary_slug("Saint Caligo, Unremembered") == "saint-caligo-unremembered"
+
+
+def test_art_registry_serves_cached_portraits_within_its_byte_cap(tmp_path) -> None:
+    for name, size in (("cave-rat", 300), ("ash-wraith", 400), ("embermaw", 500)):
+        (tmp_path / f"{name}.webp").write_bytes(bytes([len(name)]) * size)
+    registry = BestiaryArtRegistry(tmp_path, max_bytes=900)
+
+    first = registry.file_for({"name": "Cave Rat"})
+    second = registry.file_for({"name": "Riftbound Cave Rat", "base_name": "Cave Rat"})
+    assert first.filename == second.filename == "cave-rat.webp"
+    assert first.fp.read() == second.fp.read() == bytes([8]) * 300
+    assert (registry.hits, registry.misses) == (1, 1)
+
+    registry.portrait_bytes("ash-wraith")
+    registry.portrait_bytes("embermaw")
+    assert registry.cached_bytes == 900
+    assert registry.portrait_bytes("cave-rat") is not None
+    assert registry.misses == 4
+    assert registry.cached_bytes <= 900
+    assert registry.file_for({"name": "Missing"}) is None
+
+
+def test_art_registry_thumbnails_replace_full_portraits_for_embeds() -> None:
+    registry = BestiaryArtRegistry()
+    assert registry.build_thumbnails(128) == len(registry)
+
+    thumbnail = registry.file_for({"name": "Cave Rat"}, thumbnail=True)
+    full = registry.file_for({"name": "Cave Rat"})
+    assert thumbnail.filename == full.filename
+    assert len(thumbnail.fp.read()) < len(full.fp.read())
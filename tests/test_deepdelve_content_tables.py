@@ -0,0 +1,89 @@
+"""Determinism checks for DeepDelve's precomputed generation tables."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+from deepdelve.advanced_content import ITEM_SETS, LEGENDARIES, SUBCLASSES
+from deepdelve.content import ENEMIES, GAME_CLASSES, enemy_for_floor, generate_item, roll_rarity
+from deepdelve.systems import compile_generation_tables, enchantments_for
+from deepdelve.systems.items import ENCHANTMENTS, apply_advanced_itemization, item_sets_for
+
+
+def _reference_enemy_choice(floor: int, rng: random.Random) -> dict[str, Any]:
+    tier = min(5, max(1, (max(1, floor) - 1) // 5 + 1))
+    return rng.choice([enemy for enemy in ENEMIES if enemy["tier"] in {tier, max(1, tier - 1)}])
+
+
+def _reference_rarity(floor: int, luck: int, rng: random.Random) -> int:
+    legendary = min(5.0, 0.35 + floor * 0.06 + luck * 0.035)
+    epic = min(12.0, 2.0 + floor * 0.12 + luck * 0.07)
+    rare = min(25.0, 8.0 + floor * 0.18 + luck * 0.12)
+    uncommon = min(42.0, 26.0 + floor * 0.2 + luck * 0.15)
+    roll = rng.uniform(0, 100)
+    if roll < legendary:
+        return 4
+    if roll < legendary + epic:
+        return 3
+    if roll < legendary + epic + rare:
+        return 2
+    if roll < legendary + epic + rare + uncommon:
+        return 1
+    return 0
+
+
+def test_enemy_bands_match_per_roll_filtering() -> None:
+    for floor in range(1, 61):
+        for seed in range(25):
+            expected = _reference_enemy_choice(floor, random.Random(seed))
+            actual = enemy_for_floor(floor, random.Random(seed))
+            assert actual["base_name"] == expected["name"], (floor, seed)
+
+
+def test_rarity_thresholds_match_previous_rolls() -> None:
+    for floor in range(1, 121, 7):
+        for luck in (0, 5, 18, 60):
+            expected_rng = random.Random(floor * 1000 + luck)
+            actual_rng = random.Random(floor * 1000 + luck)
+            expected = [_reference_rarity(floor, luck, expected_rng) for _ in range(200)]
+            assert [roll_rarity(floor, luck, actual_rng) for _ in range(200)] == expected
+
+
+def test_itemization_tables_keep_seeded_loot_stable() -> None:
+    names = []
+    for seed in range(300):
+        rng = random.Random(seed)
+        item = generate_item(40, 30, rng, rarity_index=4 if seed % 2 else 3)
+        names.append(apply_advanced_itemization(item, 40, "shadow", "", rng)["name"])
+    assert any(name in {legendary["name"] for legendary in LEGENDARIES} for name in names)
+    assert any(details["name"] in name for name in names for details in ITEM_SETS.values())
+
+    compile_generation_tables()
+    rebuilt = []
+    for seed in range(300):
+        rng = random.Random(seed)
+        item = generate_item(40, 30, rng, rarity_index=4 if seed % 2 else 3)
+        rebuilt.append(apply_advanced_itemization(item, 40, "shadow", "", rng)["name"])
+    assert rebuilt == names
+
+
+def test_set_and_legendary_tables_match_authored_order() -> None:
+    for class_key in GAME_CLASSES:
+        for subclass in ("", *SUBCLASSES.get(class_key, {})):
+            expected = [
+                (key, details)
+                for key, details in ITEM_SETS.items()
+                if class_key in details["classes"] and (not details.get("subclasses") or subclass in details["subclasses"])
+            ]
+            assert list(item_sets_for(class_key, subclass)) == expected
+    tables = compile_generation_tables()
+    for slot in ("weapon", "armor", "charm"):
+        expected = [legendary for legendary in LEGENDARIES if legendary["slot"] == slot]
+        assert list(tables["items"]["legendaries"].get(slot, ())) == expected
+
+
+def test_enchantment_table_filters_by_effect() -> None:
+    assert enchantments_for() == ENCHANTMENTS
+    assert enchantments_for("burn") == (ENCHANTMENTS[0],)
+    assert enchantments_for("unknown") == ()
@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
 
+import discord
 from discord.ui.view import ViewStore
 
 from deepdelve.deepdelve import (
@@ -44,6 +45,7 @@ from deepdelve.persistent_views import (
     DeepDelveDynamicButton,
     DeepDelveDynamicSelect,
 )
+from deepdelve.render_cache import EmbedRenderCache
 
 
 def _component(item):
@@ -404,13 +406,14 @@ def test_every_rendered_persistent_component_has_a_dispatch_route() -> None:
         cog._get_profile = AsyncMock(return_value={"class_key": "vanguard", "inventory": []})
         cog._persistent_error = AsyncMock()
         cog._adventure_embed = lambda _profile: SimpleNamespace()
-        cog._inventory_embed = lambda _profile, _selected=None: SimpleNamespace()
+        cog._inventory_embed = lambda _profile, _selected=None: discord.Embed()
         cog._origin_embed = lambda _profile: SimpleNamespace()
-        cog._profile_embed = lambda _user, _profile: SimpleNamespace()
+        cog._profile_embed = lambda _user, _profile: discord.Embed()
         cog._town_embed = lambda _profile: SimpleNamespace()
         cog.config = SimpleNamespace(
             member_from_ids=lambda _guild_id, _user_id: SimpleNamespace(clear=AsyncMock()),
         )
+        cog._render_cache = EmbedRenderCache()
         interaction = SimpleNamespace(
             guild=SimpleNamespace(id=1),
             user=SimpleNamespace(id=123456789, display_name="Route Tester"),
@@ -651,7 +654,7 @@ def test_cog_unload_stops_the_persistent_world_boss_view() -> None:
     cog._guild_locks = {1: asyncio.Lock()}
     cog._world_boss_view = world_boss_view
 
-    cog.cog_unload()
+    asyncio.run(cog.cog_unload())
 
     world_boss_view.stop.assert_called_once_with()
     assert cog._world_boss_view is None
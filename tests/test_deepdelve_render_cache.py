@@ -0,0 +1,89 @@
+"""Regression coverage for memoised DeepDelve screen embeds."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import discord
+
+from deepdelve.deepdelve import DeepDelve
+from deepdelve.render_cache import EmbedRenderCache
+
+
+def _builder(title: str) -> Mock:
+    def build() -> discord.Embed:
+        embed = discord.Embed(title=title, description="Inventory")
+        embed.add_field(name="Weapon", value="Lantern Blade")
+        return embed
+
+    return Mock(side_effect=build)
+
+
+def test_reopening_an_unchanged_screen_reuses_the_built_payload() -> None:
+    cache = EmbedRenderCache()
+    build = _builder("Pack")
+
+    first = cache.render(1, 2, "inventory", build)
+    first.add_field(name="Decorated", value="by the caller")
+    second = cache.render(1, 2, "inventory", build)
+
+    build.assert_called_once_with()
+    assert [field.name for field in second.fields] == ["Weapon"]
+    assert second.to_dict() != first.to_dict()
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate == 0.5
+
+
+def test_bumping_a_revision_only_invalidates_that_delver() -> None:
+    cache = EmbedRenderCache()
+    mine, theirs = _builder("Mine"), _builder("Theirs")
+    cache.render(1, 2, "profile", mine)
+    cache.render(1, 3, "profile", theirs)
+
+    assert cache.bump(1, 2) == 1
+    cache.render(1, 2, "profile", mine)
+    cache.render(1, 3, "profile", theirs)
+
+    assert mine.call_count == 2
+    assert theirs.call_count == 1
+    assert cache.revision(1, 2) == 1
+    assert cache.revision(1, 3) == 0
+
+
+def test_least_recent_delvers_are_evicted_past_the_owner_cap() -> None:
+    cache = EmbedRenderCache(max_owners=2)
+    for user_id in (1, 2, 3):
+        cache.render(1, user_id, "codex", _builder(str(user_id)))
+
+    assert len(cache) == 2
+    rebuilt = _builder("1")
+    cache.render(1, 1, "codex", rebuilt)
+    rebuilt.assert_called_once_with()
+
+
+def test_saving_a_profile_bumps_its_render_revision() -> None:
+    async def check() -> None:
+        cog = object.__new__(DeepDelve)
+        cog._render_cache = EmbedRenderCache()
+        member = SimpleNamespace(set=AsyncMock())
+        cog.config = SimpleNamespace(
+            guild_from_id=lambda _guild_id: SimpleNamespace(economy_mode=AsyncMock(return_value="internal")),
+            member_from_ids=lambda _guild_id, _user_id: member,
+        )
+        profile = {"gold": 10, "titles": [], "current_title": ""}
+        build = _builder("Character")
+
+        cog._cached_embed(1, 2, profile, "profile", build)
+        cog._cached_embed(1, 2, profile, "profile", build)
+        await cog._save_profile(1, 2, profile, 10)
+        cog._cached_embed(1, 2, profile, "profile", build)
+        profile["gold"] = 25
+        cog._cached_embed(1, 2, profile, "profile", build)
+
+        assert build.call_count == 3
+        assert cog._render_cache.revision(1, 2) == 1
+        member.set.assert_awaited_once_with(profile)
+
+    asyncio.run(check())
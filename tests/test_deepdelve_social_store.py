@@ -0,0 +1,136 @@
+"""Behavioral tests for DeepDelve's indexed auction and social store."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from deepdelve.storage import SocialStore
+from deepdelve.systems.migrations import GUILD_SCHEMA_VERSION, migrate_item
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _item(index: int, rarity: int = 0) -> dict:
+    return {"id": f"{index:08x}", "name": f"Blade {index}", "slot": "weapon", "rarity_index": rarity}
+
+
+def test_legacy_guild_blobs_import_once_with_member_index(tmp_path: Path) -> None:
+    legacy = {
+        "auctions": {"A12345": {"seller": 7, "item": _item(1, 2), "price": 50, "created": "2026-01-01T00:00:00+00:00"}},
+        "parties": {"P12345": {"leader": 7, "members": [7, 8]}},
+        "player_guilds": {"G12345": {"name": "Lanterns", "owner": 8, "members": [8], "level": 2, "renown": 0, "treasury": 0}},
+        "arenas": {"D12345": {"challenger": 9, "opponent": 7, "wager": 10, "status": "pending"}},
+    }
+
+    async def scenario() -> tuple[int, int, dict, dict, bool]:
+        store = SocialStore(tmp_path / "social.sqlite3")
+        await store.initialize()
+        first = await store.import_guild(1, legacy)
+        second = await store.import_guild(1, legacy)
+        return (
+            first,
+            second,
+            await store.user_records(7),
+            await store.user_records(8),
+            await store.name_taken(1, "player_guild", " lanterns "),
+        )
+
+    first, second, seller, guild_owner, taken = asyncio.run(scenario())
+    assert (first, second) == (4, 0)
+    assert set(seller[1]) == {"auctions", "parties", "arenas"}
+    assert seller[1]["auctions"]["A12345"]["item"]["name"] == "Blade 1"
+    assert set(guild_owner[1]) == {"parties", "player_guilds"}
+    assert taken
+
+
+def test_auction_browse_pages_and_filters_by_price_and_rarity(tmp_path: Path) -> None:
+    async def scenario() -> tuple:
+        store = SocialStore(tmp_path / "social.sqlite3")
+        await store.initialize()
+        for index in range(45):
+            await store.add_auction(1, 100 + index % 3, _item(index, index % 5), 1000 - index * 10)
+        await store.add_auction(2, 100, _item(99), 1)
+        first_page, total = await store.browse_auctions(1, limit=20)
+        last_page, _total = await store.browse_auctions(1, offset=40, limit=20)
+        epic, epic_total = await store.browse_auctions(1, rarity_index=3, max_price=700)
+        return first_page, total, last_page, epic, epic_total, await store.auction_count(1, seller_id=101)
+
+    first_page, total, last_page, epic, epic_total, seller_count = asyncio.run(scenario())
+    assert total == 45
+    assert len(first_page) == 20
+    assert len(last_page) == 5
+    prices = [record["price"] for record in first_page]
+    assert prices == sorted(prices)
+    assert prices[0] == 560
+    assert epic_total == len(epic) == 3
+    assert all(record["item"]["rarity_index"] == 3 and record["price"] <= 700 for record in epic)
+    assert seller_count == 15
+
+
+def test_concurrent_auction_purchases_only_transfer_the_listing_once(tmp_path: Path) -> None:
+    async def scenario() -> tuple[list, int]:
+        store = SocialStore(tmp_path / "social.sqlite3")
+        await store.initialize()
+        auction_id = await store.add_auction(1, 7, _item(1), 25)
+        wrong_seller = await store.take_auction(1, auction_id, seller_id=8)
+        results = await asyncio.gather(*(store.take_auction(1, auction_id, seller_id=7) for _ in range(20)))
+        assert wrong_seller is None
+        return results, await store.auction_count(1)
+
+    results, remaining = asyncio.run(scenario())
+    assert sum(result is not None for result in results) == 1
+    assert remaining == 0
+
+
+def test_social_records_rank_and_reindex_members(tmp_path: Path) -> None:
+    async def scenario() -> tuple:
+        store = SocialStore(tmp_path / "social.sqlite3")
+        await store.initialize()
+        codes = []
+        for level, renown in ((1, 900), (3, 10), (3, 400), (2, 0)):
+            record = {
+                "name": f"Guild {level}-{renown}",
+                "owner": 5,
+                "members": [5],
+                "level": level,
+                "renown": renown,
+                "treasury": 0,
+            }
+            codes.append(await store.create_record(1, "player_guild", "G", record))
+        record = await store.get_record(1, "player_guild", codes[0])
+        record["members"] = [6]
+        record["owner"] = 6
+        await store.save_record(1, "player_guild", codes[0], record)
+        ranked = await store.ranked_records(1, "player_guild", ("level", "renown", "treasury"), limit=3)
+        await store.delete_record(1, "player_guild", codes[1])
+        return codes, ranked, await store.user_records(5), await store.user_records(6)
+
+    codes, ranked, original_owner, new_owner = asyncio.run(scenario())
+    assert [code for code, _record in ranked] == [codes[2], codes[1], codes[3]]
+    assert set(original_owner[1]["player_guilds"]) == {codes[2], codes[3]}
+    assert set(new_owner[1]["player_guilds"]) == {codes[0]}
+
+
+def test_stored_auction_and_vault_items_are_migrated_once_per_item_schema(tmp_path: Path) -> None:
+    def legacy_item(index: int) -> dict:
+        return {**_item(index, 2), "enchant": "Ember Sigil", "unique_effect": "burn", "effect_description": "Burns."}
+
+    async def scenario() -> tuple:
+        store = SocialStore(tmp_path / "social.sqlite3")
+        await store.initialize()
+        # Rows written before the item schema changed still hold the old shape.
+        auction_id = await store.add_auction(1, 7, legacy_item(1), 50)
+        guild = {"name": "Lanterns", "owner": 8, "members": [8], "vault": [legacy_item(2), _item(3)]}
+        code = await store.create_record(1, "player_guild", "G", guild)
+        first = await store.migrate_items(GUILD_SCHEMA_VERSION, migrate_item)
+        second = await store.migrate_items(GUILD_SCHEMA_VERSION, migrate_item)
+        return first, second, await store.get_auction(1, auction_id), await store.get_record(1, "player_guild", code)
+
+    first, second, auction, guild = asyncio.run(scenario())
+    assert (first, second) == (2, 0)
+    assert auction["item"]["enchant_effect"] == "burn"
+    assert auction["item"]["rarity_index"] == 2
+    assert guild["vault"][0]["enchant_effect"] == "burn"
+    assert "enchant_effect" not in guild["vault"][1]
@@ -0,0 +1,156 @@
+"""Regression coverage for in-memory DeepDelve world-boss raids."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+from deepdelve.deepdelve import DeepDelve
+from deepdelve.systems import WorldBossLedger, world_boss_rewards
+
+
+def _record(hp: int) -> dict:
+    return {
+        "name": "Nhal, Eater of Seasons",
+        "emoji": "🌌",
+        "description": "A shadow descends.",
+        "hp": hp,
+        "max_hp": hp,
+        "contributions": {},
+        "last_attacks": {},
+        "spawned": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def _interaction(user_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        guild=SimpleNamespace(id=1),
+        user=SimpleNamespace(id=user_id),
+        response=SimpleNamespace(defer=AsyncMock()),
+        followup=SimpleNamespace(send=AsyncMock()),
+        edit_original_response=AsyncMock(),
+    )
+
+
+def _raid_cog(record: dict) -> DeepDelve:
+    guild_value = SimpleNamespace(world_boss=AsyncMock(return_value=record))
+    guild_value.world_boss.set = AsyncMock()
+    cog = object.__new__(DeepDelve)
+    cog._world_bosses = {}
+    cog._guild_locks = {}
+    cog.config = SimpleNamespace(guild_from_id=Mock(return_value=guild_value))
+    cog._get_profile = AsyncMock(return_value={"created": True})
+    cog._stats = lambda _profile: {"attack": 10, "luck": 0}
+    cog._resolve_world_boss = AsyncMock()
+    return cog
+
+
+def test_five_hundred_concurrent_strikes_resolve_the_kill_exactly_once() -> None:
+    async def check() -> None:
+        cog = _raid_cog(_record(5000))
+        interactions = [_interaction(1000 + index) for index in range(500)]
+
+        await asyncio.gather(*(cog._world_boss_strike(interaction) for interaction in interactions))
+
+        ledger = cog._world_bosses[1]
+        cog._resolve_world_boss.assert_awaited_once()
+        resolved_interaction, resolved_ledger, final_damage = cog._resolve_world_boss.await_args.args
+        assert resolved_ledger is ledger
+        assert not ledger.active
+        assert ledger.record["hp"] == 0
+        contributions = ledger.record["contributions"]
+        assert 5000 <= sum(contributions.values()) < 5000 + final_damage
+        assert contributions[str(resolved_interaction.user.id)] == final_damage
+        fallen = [
+            interaction
+            for interaction in interactions
+            if interaction.followup.send.await_count and str(interaction.user.id) not in contributions
+        ]
+        assert len(fallen) + len(contributions) == 500
+        cog.config.guild_from_id(1).world_boss.assert_awaited_once_with()
+        cog.config.guild_from_id(1).world_boss.set.assert_not_awaited()
+
+    asyncio.run(check())
+
+
+def test_concurrent_strikes_from_one_delver_respect_the_cooldown() -> None:
+    async def check() -> None:
+        cog = _raid_cog(_record(10_000))
+        interactions = [_interaction(7) for _ in range(5)]
+
+        await asyncio.gather(*(cog._world_boss_strike(interaction) for interaction in interactions))
+
+        record = cog._world_bosses[1].record
+        assert list(record["contributions"]) == ["7"]
+        assert record["hp"] == 10_000 - record["contributions"]["7"]
+        assert sum(interaction.edit_original_response.await_count for interaction in interactions) == 1
+        assert sum(interaction.followup.send.await_count for interaction in interactions) == 4
+
+    asyncio.run(check())
+
+
+def test_ledger_only_reports_the_kill_to_the_final_strike() -> None:
+    now = datetime.now(timezone.utc)
+    ledger = WorldBossLedger(_record(50))
+
+    assert ledger.strike(1, 30, now) == "hit"
+    assert ledger.strike(1, 30, now + timedelta(seconds=5)) == "cooldown"
+    assert ledger.strike(2, 30, now) == "killed"
+    assert ledger.strike(3, 30, now) == "fallen"
+    assert ledger.defeated_at == now
+    assert ledger.record["contributions"] == {"1": 30, "2": 30}
+
+
+def test_checkpoint_persists_dirty_bosses_once_and_skips_fallen_ones() -> None:
+    async def check() -> None:
+        cog = _raid_cog(_record(500))
+        ledger = await cog._world_boss_ledger(1)
+        ledger.strike(1, 40, datetime.now(timezone.utc))
+
+        await cog._checkpoint_world_bosses()
+        await cog._checkpoint_world_bosses()
+
+        world_boss = cog.config.guild_from_id(1).world_boss
+        world_boss.set.assert_awaited_once()
+        saved = world_boss.set.await_args.args[0]
+        assert saved["hp"] == 460
+        assert saved["contributions"] is not ledger.record["contributions"]
+
+        ledger.strike(2, 460, datetime.now(timezone.utc))
+        await cog._checkpoint_world_bosses()
+        world_boss.set.assert_awaited_once()
+
+    asyncio.run(check())
+
+
+def test_unload_awaits_the_final_checkpoint_after_stopping_the_loop() -> None:
+    async def check() -> None:
+        cog = _raid_cog(_record(500))
+        cog.bot = SimpleNamespace(remove_dynamic_items=Mock())
+        cog._locks = {}
+        cog._world_boss_view = None
+        cog._world_boss_checkpoints = asyncio.create_task(cog._world_boss_checkpoint_loop())
+        ledger = await cog._world_boss_ledger(1)
+        ledger.strike(1, 40, datetime.now(timezone.utc))
+
+        await cog.cog_unload()
+
+        world_boss = cog.config.guild_from_id(1).world_boss
+        world_boss.set.assert_awaited_once()
+        assert world_boss.set.await_args.args[0]["hp"] == 460
+        assert cog._world_boss_checkpoints is None
+        assert not ledger.dirty
+
+    asyncio.run(check())
+
+
+def test_rewards_are_split_from_aggregated_contributions() -> None:
+    record = {"max_hp": 1000, "contributions": {"1": 750, "2": 246, "3": 4}}
+
+    rewards = world_boss_rewards(record)
+
+    assert rewards[1] == {"gold": 290, "xp": 338, "season_points": 75, "renown": 75}
+    assert rewards[2] == {"gold": 230, "xp": 212, "season_points": 75, "renown": 25}
+    assert rewards[3]["renown"] == 1
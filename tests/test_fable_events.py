@@ -0,0 +1,110 @@
+"""Indexed SQLite event log for Fable: stable ids, character index, and cursor paging."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from fable.fable import Fable
+from fable.storage import EventStore
+
+
+def _event(*characters: str, description: str = "Something happened") -> dict:
+    return {
+        "description": description,
+        "ic_date": "3023-12-05",
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "created_by": "10",
+        "characters": list(characters),
+    }
+
+
+def test_ids_are_never_reused_and_edits_reindex_characters(tmp_path) -> None:
+    async def check() -> None:
+        store = EventStore(tmp_path / "events.sqlite3")
+        await store.initialize()
+
+        first = await store.log_event(1, _event("Athena", "Mira"))
+        second = await store.log_event(1, _event("Athena"))
+        assert (first["id"], second["id"]) == (1, 2)
+        assert (await store.log_event(2, _event("Athena")))["id"] == 1
+
+        assert await store.delete_event(1, 2)
+        assert not await store.delete_event(1, 2)
+        assert (await store.log_event(1, _event("Mira")))["id"] == 3
+
+        first["characters"] = ["Mira", "Bram"]
+        first["description"] = "Rewritten"
+        await store.update_event(1, first)
+        assert await store.character_events(1, "Athena") == ([], None)
+        bram, _ = await store.character_events(1, "Bram")
+        assert [(event["id"], event["description"]) for event in bram] == [(1, "Rewritten")]
+        assert await store.get_event(1, 1) == first
+        assert await store.event_count(1) == 2
+
+    asyncio.run(check())
+
+
+def test_character_pages_follow_the_cursor_newest_first(tmp_path) -> None:
+    async def check() -> None:
+        store = EventStore(tmp_path / "events.sqlite3")
+        await store.initialize()
+        for index in range(25):
+            await store.log_event(1, _event("Athena" if index % 2 == 0 else "Mira"))
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = await store.character_events(1, "Athena", before=cursor, limit=5)
+            seen.extend(event["id"] for event in page)
+            if cursor is None:
+                break
+        assert seen == list(range(25, 0, -2))
+        assert await store.character_event_count(1, "Athena") == 13
+
+    asyncio.run(check())
+
+
+def test_legacy_config_events_move_into_the_store(tmp_path) -> None:
+    async def check() -> None:
+        cog = object.__new__(Fable)
+        cog._events = EventStore(tmp_path / "events.sqlite3")
+        await cog._events.initialize()
+        guild_conf = SimpleNamespace(logs=SimpleNamespace(set=AsyncMock()), clear_raw=AsyncMock())
+        cog.config = SimpleNamespace(guild_from_id=lambda guild_id: guild_conf)
+        settings = {
+            "logs": [{**_event("Athena"), "id": 4}, _event("Mira")],
+            "events": {"7": {**_event("Athena"), "id": 7}},
+        }
+
+        assert await cog._migrate_legacy_events(1, settings) == 3
+        assert list(await cog._events.all_events(1)) == ["4", "7", "8"]
+        guild_conf.logs.set.assert_awaited_once_with([])
+        guild_conf.clear_raw.assert_awaited_once_with("events")
+        assert await cog._migrate_legacy_events(1, {"logs": []}) == 0
+
+    asyncio.run(check())
+
+
+async def _large_store(path, count: int = 20_000) -> EventStore:
+    store = EventStore(path)
+    await store.initialize()
+    cast = [f"Hero{index}" for index in range(200)]
+    records = [{**_event(cast[index % 200], cast[(index * 7) % 200]), "id": index + 1} for index in range(count)]
+    await store.import_guild(1, records)
+    return store
+
+
+def test_character_pages_walk_a_large_log(tmp_path) -> None:
+    async def check() -> None:
+        store = await _large_store(tmp_path / "events.sqlite3")
+
+        page, cursor = await store.character_events(1, "Hero3")
+        older, _ = await store.character_events(1, "Hero3", before=cursor)
+
+        assert len(page) == len(older) == 10
+        assert all("Hero3" in event["characters"] for event in [*page, *older])
+        assert max(event["id"] for event in older) < min(event["id"] for event in page)
+        assert (await store.log_event(1, _event("Hero3")))["id"] == 20_001
+
+    asyncio.run(check())
@@ -0,0 +1,112 @@
+"""Off-loop, cached graphviz rendering for Fable's relationship and location maps."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from fable.fable import Fable
+from fable.visualization_utils import GraphRenderCache, create_relationship_graph, focused_relationships
+
+RELATIONSHIPS = {
+    "Aria": {"ally": ["Bram"], "rival": ["Cole"]},
+    "Bram": {"family": ["Dana"]},
+    "Cole": {},
+    "Dana": {"ally": ["Eli"]},
+    "Eli": {},
+    "Finn": {"neutral": ["Aria"]},
+    "Gus": {"ally": ["Hale"]},
+    "Hale": {},
+}
+
+
+class SlowRenderer:
+    def __init__(self, seconds: float = 0.05) -> None:
+        self.seconds = seconds
+        self.calls: list[str] = []
+        self.threads: set[str] = set()
+
+    def __call__(self, dot_source: str) -> bytes:
+        self.calls.append(dot_source)
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.seconds)
+        return f"png:{len(dot_source)}".encode()
+
+
+def test_focused_subgraph_follows_links_both_ways() -> None:
+    first_ring = focused_relationships(RELATIONSHIPS, "Aria")
+    second_ring = focused_relationships(RELATIONSHIPS, "Aria", depth=2)
+
+    assert set(first_ring) == {"Aria", "Bram", "Cole", "Finn"}
+    assert first_ring["Bram"] == {}
+    assert first_ring["Finn"] == {"neutral": ["Aria"]}
+    assert set(second_ring) == {"Aria", "Bram", "Cole", "Finn", "Dana"}
+    assert second_ring["Bram"] == {"family": ["Dana"]}
+    assert focused_relationships({}, "Solo") == {"Solo": {}}
+
+    # Editing a character outside the focus leaves the focused DOT source, and so its cache key, unchanged.
+    edited = {**RELATIONSHIPS, "Gus": {"rival": ["Hale"]}}
+    assert create_relationship_graph(focused_relationships(edited, "Aria")) == create_relationship_graph(first_ring)
+
+
+def test_identical_sources_render_once_in_the_worker_pool() -> None:
+    async def check() -> None:
+        renderer = SlowRenderer()
+        cache = GraphRenderCache(max_entries=2, renderer=renderer)
+        ticks = 0
+        rendering = True
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while rendering:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticking = asyncio.create_task(ticker())
+        images = await asyncio.gather(*(cache.render("graph A {}") for _ in range(5)))
+        rendering = False
+        await ticking
+
+        assert len(set(images)) == 1
+        assert cache.renders == 1
+        assert ticks > 1
+        assert all(name.startswith("fable-graphviz") for name in renderer.threads)
+
+        assert await cache.render("graph A {}") == images[0]
+
+        await cache.render("graph B {}")
+        await cache.render("graph C {}")
+        await cache.render("graph A {}")
+        assert renderer.calls == ["graph A {}", "graph B {}", "graph C {}", "graph A {}"]
+        cache.close()
+
+    asyncio.run(check())
+
+
+def test_visualize_sends_cached_png_without_touching_the_working_directory(tmp_path, monkeypatch) -> None:
+    async def check() -> None:
+        monkeypatch.chdir(tmp_path)
+        cog = object.__new__(Fable)
+        cog._graph_renderer = GraphRenderCache(renderer=SlowRenderer(0.0))
+        ctx = SimpleNamespace(guild=SimpleNamespace(id=7), send=AsyncMock())
+
+        for _ in range(3):
+            await cog._send_graph(ctx, "graph G {}", "locations_7.png", "Map:", "map")
+
+        assert cog._graph_renderer.renders == 1
+        file = ctx.send.await_args.kwargs["file"]
+        assert file.filename == "locations_7.png"
+        assert file.fp.read() == b"png:10"
+        assert list(tmp_path.iterdir()) == []
+
+        def missing_dot(_source: str) -> bytes:
+            raise RuntimeError("no dot")
+
+        cog._graph_renderer = GraphRenderCache(renderer=missing_dot)
+        await cog._send_graph(ctx, "graph G {}", "locations_7.png", "Map:", "map")
+        assert ctx.send.await_args.args == ("❌ Failed to generate map: no dot",)
+
+    asyncio.run(check())
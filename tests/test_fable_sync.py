@@ -0,0 +1,240 @@
+"""Incremental, off-loop Google sync for Fable against local fake Sheets and Docs services."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from fable.fable import Fable
+from fable.google_sync import GoogleSyncManager
+from fable.google_sync_utils import SHEET_HEADER
+from fable.storage import EventStore
+
+
+class _Request:
+    def __init__(self, service, result=None, action=None) -> None:
+        self._service = service
+        self._result = result
+        self._action = action
+
+    def execute(self):
+        self._service.threads.add(threading.current_thread().name)
+        time.sleep(self._service.latency)
+        if self._action:
+            self._action()
+        return self._result
+
+
+class FakeSheetsService:
+    """Keeps a single sheet as ``{row: [collection, key, data]}`` and records every request."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.rows: dict[int, list[str]] = {}
+        self.requests: list[tuple[str, int]] = []
+        self.threads: set[str] = set()
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def batchUpdate(self, *, body: dict, **_request):  # noqa: N802 - mirrors the Google client.
+        def apply() -> None:
+            for update in body["data"]:
+                row = int(re.match(r"A(\d+):C\d+", update["range"]).group(1))
+                self.rows[row] = list(update["values"][0])
+
+        self.requests.append(("batchUpdate", len(body["data"])))
+        return _Request(self, {}, apply)
+
+    def clear(self, **_request):
+        self.requests.append(("clear", 0))
+        return _Request(self, {}, self.rows.clear)
+
+    def get(self, **_request):
+        last = max(self.rows, default=0)
+        values = [self.rows.get(row, []) for row in range(1, last + 1)]
+        return _Request(self, {"values": values})
+
+    def cells(self) -> dict[str, dict]:
+        return {f"{row[0]}/{row[1]}": json.loads(row[2]) for number, row in self.rows.items() if number > 1 and row[0]}
+
+
+class FakeDocsService:
+    def __init__(self) -> None:
+        self.latency = 0.0
+        self.text = "\n"
+        self.writes: list[list[dict]] = []
+        self.threads: set[str] = set()
+
+    def documents(self):
+        return self
+
+    def get(self, **_request):
+        return _Request(self, {"body": {"content": [{"endIndex": 1}, {"endIndex": len(self.text) + 1}]}})
+
+    def batchUpdate(self, *, body: dict, **_request):  # noqa: N802 - mirrors the Google client.
+        def apply() -> None:
+            self.writes.append(body["requests"])
+            self.text = body["requests"][-1]["insertText"]["text"] + "\n"
+
+        return _Request(self, {}, apply)
+
+
+def _world(characters: int = 3) -> dict:
+    return {
+        "characters": {f"Hero{index}": {"name": f"Hero{index}", "traits": ["brave"]} for index in range(characters)},
+        "events": {"1": {"id": 1, "description": "Met at the inn", "characters": ["Hero0"]}},
+        "locations": {},
+        "milestones": {},
+    }
+
+
+def _manager(service, **kwargs) -> GoogleSyncManager:
+    return GoogleSyncManager(service_factory=lambda kind, api_key: service, **kwargs)
+
+
+SHEET = {"type": "sheet", "id": "sheet-id", "api_key": "{}"}
+
+
+def test_exports_send_only_changed_rows_and_import_round_trips() -> None:
+    async def check() -> None:
+        service = FakeSheetsService()
+        manager = _manager(service)
+        data = _world()
+
+        first = await manager.export(SHEET, data)
+        assert service.requests == [("clear", 0), ("batchUpdate", 5)]
+        assert service.rows[1] == SHEET_HEADER
+
+        data["characters"]["Hero1"]["traits"].append("clever")
+        del data["events"]["1"]
+        data["locations"]["Inn"] = {"category": "tavern"}
+        service.requests.clear()
+        second = await manager.export({**SHEET, "journal": first.journal}, data)
+        assert service.requests == [("batchUpdate", 3)]
+        assert second.written == 3
+
+        unchanged = await manager.export({**SHEET, "journal": second.journal}, data)
+        assert unchanged.unchanged
+        assert service.requests == [("batchUpdate", 3)]
+
+        # The blanked event row is reused by the next new object.
+        data["milestones"]["m1"] = {"title": "First quest"}
+        third = await manager.export({**SHEET, "journal": second.journal}, data)
+        assert third.journal["rows"]["milestones/m1"][0] == first.journal["rows"]["events/1"][0]
+
+        expected = {f"{collection}/{key}": value for collection, items in data.items() for key, value in items.items()}
+        assert service.cells() == expected
+        assert await manager.import_data(SHEET) == {key: value for key, value in data.items() if value}
+        manager.close()
+
+    asyncio.run(check())
+
+
+def test_large_exports_are_batched_off_the_event_loop_with_progress() -> None:
+    async def check() -> None:
+        service = FakeSheetsService(latency=0.02)
+        manager = _manager(service, batch_size=100)
+        progress: list[tuple[int, int]] = []
+        ticks = 0
+        exporting = True
+
+        async def report(done: int, total: int) -> None:
+            progress.append((done, total))
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while exporting:
+                ticks += 1
+                await asyncio.sleep(0.002)
+
+        ticking = asyncio.create_task(ticker())
+        result = await manager.export(SHEET, _world(characters=250), progress=report)
+        exporting = False
+        await ticking
+
+        assert result.written == 252
+        assert progress == [(100, 252), (200, 252), (252, 252)]
+        assert ticks > 5
+        assert all(name.startswith("fable-google-sync") for name in service.threads)
+        manager.close()
+
+    asyncio.run(check())
+
+
+def test_slow_google_calls_time_out() -> None:
+    async def check() -> None:
+        manager = _manager(FakeSheetsService(latency=0.3), timeout=0.05)
+        with pytest.raises(asyncio.TimeoutError):
+            await manager.export(SHEET, _world())
+        manager.close()
+
+    asyncio.run(check())
+
+
+def test_doc_exports_skip_unchanged_content_and_import_legacy_sheets() -> None:
+    async def check() -> None:
+        docs = FakeDocsService()
+        manager = _manager(docs)
+        doc_sync = {"type": "doc", "id": "doc-id", "api_key": "{}"}
+
+        first = await manager.export(doc_sync, _world())
+        assert "Hero2" in docs.text
+        assert [request for request in docs.writes[0] if "deleteContentRange" in request] == []
+        second = await manager.export({**doc_sync, "journal": first.journal}, _world())
+        assert second.unchanged
+        assert len(docs.writes) == 1
+
+        await manager.export({**doc_sync, "journal": first.journal}, _world(characters=1))
+        delete = docs.writes[1][0]["deleteContentRange"]["range"]
+        assert delete == {"startIndex": 1, "endIndex": len(docs.writes[0][-1]["insertText"]["text"]) + 1}
+
+        sheets = FakeSheetsService()
+        sheets.rows[1] = [json.dumps({"characters": {"Old": {}}})]
+        assert await _manager(sheets).import_data(SHEET) == {"characters": {"Old": {}}}
+        manager.close()
+
+    asyncio.run(check())
+
+
+def test_importing_a_type_the_sheet_has_no_rows_for_keeps_the_stored_data(tmp_path) -> None:
+    async def check() -> None:
+        service = FakeSheetsService()
+        cog = object.__new__(Fable)
+        cog._google_sync = _manager(service)
+        cog._events = EventStore(tmp_path / "events.sqlite3")
+        await cog._events.initialize()
+        await cog._events.log_event(1, {"description": "Met at the inn", "characters": ["Hero0"]})
+        guild_conf = SimpleNamespace(
+            sync=AsyncMock(return_value=SHEET),
+            set=AsyncMock(),
+            set_raw=AsyncMock(),
+        )
+        guild_conf.sync.clear_raw = AsyncMock()
+        cog.config = SimpleNamespace(guild=lambda guild: guild_conf)
+        ctx = SimpleNamespace(guild=SimpleNamespace(id=1), send=AsyncMock())
+
+        # A characters-only export against a fresh journal clears the sheet and writes only character rows.
+        await cog._google_sync.export(SHEET, {"characters": _world()["characters"]}, ("characters",))
+        await Fable.syimport.callback(cog, ctx, "events")
+
+        assert "That sheet has no events rows." in ctx.send.await_args.kwargs["embed"].description
+        assert list(await cog._events.all_events(1)) == ["1"]
+        guild_conf.set_raw.assert_not_awaited()
+        guild_conf.sync.clear_raw.assert_not_awaited()
+
+        await Fable.syimport.callback(cog, ctx, "characters")
+        guild_conf.set_raw.assert_awaited_once_with("characters", value=_world()["characters"])
+        cog._google_sync.close()
+
+    asyncio.run(check())
@@ -0,0 +1,200 @@
+"""Shared per-server polling and change-aware panel edits for FiveMStatus."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+
+from fivemstatus.fivemstatus import FiveMStatus
+
+
+def _data(address: str, clients: int) -> dict:
+    return {
+        "online": True,
+        "hostname": f"Server {address}",
+        "clients": clients,
+        "max_clients": 64,
+        "players": [],
+        "vars": {},
+        "connect_endpoint": address,
+        "join_code": address[4:] if address.startswith("cfx:") else None,
+        "error": None,
+    }
+
+
+class Panels:
+    """Status channels whose partial messages record edits and concurrency."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.edits: list[int] = []
+        self.active = 0
+        self.peak = 0
+        self.channels: dict[int, MagicMock] = {}
+
+    def channel(self, guild_id: int) -> MagicMock:
+        channel = MagicMock(spec=discord.TextChannel)
+        channel.fetch_message = AsyncMock()
+        channel.send = AsyncMock(return_value=SimpleNamespace(id=9000 + guild_id))
+
+        async def edit(**kwargs):
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                await asyncio.sleep(self.delay)
+            finally:
+                self.active -= 1
+            self.edits.append(guild_id)
+            return SimpleNamespace(id=guild_id)
+
+        channel.get_partial_message.side_effect = lambda message_id: SimpleNamespace(id=message_id, edit=edit)
+        self.channels[guild_id] = channel
+        return channel
+
+
+def _cog(
+    addresses: dict[int, str],
+    panels: Panels,
+    *,
+    uptime: int = 3 * 86400,
+    restart_times: list[str] | None = None,
+) -> tuple[FiveMStatus, Counter, dict]:
+    online_since = int(time.time()) - uptime
+    stored = {
+        guild_id: {
+            "enabled": guild_id != 99,
+            "server_address": address,
+            "status_channel_id": 50,
+            "status_message_id": guild_id,
+            "online_since": online_since,
+            "last_seen_online": True,
+            "restart_times": restart_times or [],
+        }
+        for guild_id, address in addresses.items()
+    }
+    channels = {guild_id: panels.channel(guild_id) for guild_id in addresses}
+    guilds = {
+        guild_id: SimpleNamespace(id=guild_id, get_channel=lambda _channel_id, guild_id=guild_id: channels[guild_id])
+        for guild_id in addresses
+    }
+    guild_conf = SimpleNamespace(
+        online_since=SimpleNamespace(set=AsyncMock()),
+        last_seen_online=SimpleNamespace(set=AsyncMock()),
+        status_message_id=SimpleNamespace(set=AsyncMock()),
+    )
+    cog = object.__new__(FiveMStatus)
+    cog.bot = SimpleNamespace(get_guild=guilds.get)
+    cog.config = SimpleNamespace(
+        all_guilds=AsyncMock(side_effect=lambda: {guild_id: dict(values) for guild_id, values in stored.items()}),
+        guild=lambda guild: guild_conf,
+    )
+    cog._fetch_budget = asyncio.Semaphore(FiveMStatus.FETCH_CONCURRENCY)
+    cog._edit_budget = asyncio.Semaphore(FiveMStatus.EDIT_CONCURRENCY)
+    cog._rendered = {}
+
+    fetches: Counter = Counter()
+    live = {address: _data(address, 10) for address in addresses.values()}
+
+    async def fetch(address: str) -> dict:
+        fetches[address] += 1
+        await asyncio.sleep(0.05)
+        return dict(live[address])
+
+    cog._fetch_server_data = fetch
+    return cog, fetches, live
+
+
+def test_tick_fetches_each_server_once_and_skips_unchanged_panels() -> None:
+    async def check() -> None:
+        panels = Panels()
+        addresses = {1: "cfx:abc123", 2: "cfx:abc123", 3: "cfx:abc123", 4: "cfx:abc123", 5: "1.2.3.4:30120", 6: "1.2.3.4:30120"}
+        addresses[99] = "5.6.7.8:30120"
+        cog, fetches, live = _cog(addresses, panels)
+
+        await FiveMStatus.status_loop.coro(cog)
+
+        # One fetch per server address, and panel edits run in concurrent waves rather than in sequence.
+        assert fetches == Counter({"cfx:abc123": 1, "1.2.3.4:30120": 1})
+        assert sorted(panels.edits) == [1, 2, 3, 4, 5, 6]
+        assert panels.peak == FiveMStatus.EDIT_CONCURRENCY
+        assert not any(channel.fetch_message.await_count for channel in panels.channels.values())
+
+        panels.edits.clear()
+        await FiveMStatus.status_loop.coro(cog)
+        assert panels.edits == []
+        assert fetches == Counter({"cfx:abc123": 2, "1.2.3.4:30120": 2})
+
+        live["1.2.3.4:30120"]["clients"] = 11
+        await FiveMStatus.status_loop.coro(cog)
+        assert sorted(panels.edits) == [5, 6]
+
+    asyncio.run(check())
+
+
+class LaterClock(datetime):
+    """``datetime`` whose ``now`` runs a fixed offset ahead, to stand in for the next loop tick."""
+
+    offset = timedelta()
+
+    @classmethod
+    def now(cls, tz=None):
+        return datetime.now(tz) + cls.offset
+
+
+def test_fresh_panels_with_a_restart_schedule_stay_unedited_between_ticks() -> None:
+    async def check() -> None:
+        LaterClock.offset = timedelta()
+        panels = Panels(delay=0)
+        restart_at = (datetime.now(timezone.utc) + timedelta(hours=6)).strftime("%H:%M")
+        cog, _fetches, _live = _cog({1: "cfx:abc123"}, panels, uptime=20 * 60, restart_times=[restart_at])
+
+        with patch("fivemstatus.fivemstatus.datetime", LaterClock):
+            await FiveMStatus.status_loop.coro(cog)
+            assert panels.edits == [1]
+            fields = {
+                field.name: field.value
+                for field in cog._build_status_embed((await cog.config.all_guilds())[1], _data("cfx:abc123", 10)).fields
+            }
+            assert fields["UPTIME"].startswith("<t:") and fields["NEXT RESTART"].startswith("<t:")
+
+            # A minute later the uptime and the countdown have moved, but the panel text has not.
+            LaterClock.offset = timedelta(minutes=1)
+            await FiveMStatus.status_loop.coro(cog)
+            assert panels.edits == [1]
+
+    asyncio.run(check())
+
+
+def test_manual_refresh_always_edits_and_deleted_panels_are_reposted() -> None:
+    async def check() -> None:
+        panels = Panels(delay=0)
+        cog, _fetches, _live = _cog({1: "cfx:abc123"}, panels)
+        channel = panels.channels[1]
+        guild = cog.bot.get_guild(1)
+        settings = (await cog.config.all_guilds())[1]
+
+        await cog._update_status_message(guild, dict(settings))
+        await cog._update_status_message(guild, dict(settings))
+        assert panels.edits == [1, 1]
+
+        missing = discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Message")
+        channel.get_partial_message.side_effect = lambda message_id: SimpleNamespace(
+            id=message_id,
+            edit=AsyncMock(side_effect=missing),
+        )
+        # The loop skips an unchanged panel for a while, then rewrites it and notices the deletion.
+        assert (await cog._update_status_message(guild, dict(settings), skip_unchanged=True)).id == 1
+        message_id, digest, written_at = cog._rendered[1]
+        cog._rendered[1] = (message_id, digest, written_at - FiveMStatus.UNCHANGED_EDIT_INTERVAL)
+        message = await cog._update_status_message(guild, dict(settings), skip_unchanged=True)
+        assert message.id == 9001
+        cog.config.guild(guild).status_message_id.set.assert_awaited_once_with(9001)
+        assert cog._rendered[1][:2] == (9001, digest)
+
+    asyncio.run(check())
@@ -0,0 +1,156 @@
+"""Event-tracked entrants and lazy winner validation for Giveaway."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+
+from giveaway.giveaway import Giveaway
+
+
+class FakeGroup:
+    """Config group that returns copies on read and counts writes, as Red's Config would."""
+
+    def __init__(self, stored: dict) -> None:
+        self.stored = stored
+        self.writes = 0
+
+    def __call__(self) -> FakeGroup:
+        return self
+
+    def __await__(self):
+        async def read() -> dict:
+            return copy.deepcopy(self.stored)
+
+        return read().__await__()
+
+    async def __aenter__(self) -> dict:
+        return self.stored
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.writes += 1
+
+    async def get_raw(self, key: str, default=None):
+        return copy.deepcopy(self.stored.get(key, default))
+
+    async def set_raw(self, key: str, value) -> None:
+        self.writes += 1
+        self.stored[key] = copy.deepcopy(value)
+
+    async def clear_raw(self, key: str) -> None:
+        self.stored.pop(key, None)
+
+
+def _payload(user_id: int, *, message_id: int = 10, emoji: str = Giveaway.REACTION_EMOJI, bot: bool = False):
+    member = SimpleNamespace(id=user_id, bot=bot)
+    return SimpleNamespace(guild_id=1, message_id=message_id, user_id=user_id, emoji=emoji, member=member)
+
+
+def _cog(record: dict, entrants: dict | None = None) -> tuple[Giveaway, SimpleNamespace, MagicMock]:
+    guild_conf = SimpleNamespace(giveaways=FakeGroup({"10": record}), entrants=FakeGroup(entrants or {}))
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.send = AsyncMock()
+    cog = object.__new__(Giveaway)
+    cog.config = SimpleNamespace(
+        guild=lambda guild: guild_conf,
+        guild_from_id=lambda guild_id: guild_conf,
+        all_guilds=AsyncMock(return_value={1: {"giveaways": {"10": record}}}),
+    )
+    cog._giveaway_locks = {}
+    cog._deadline_heap, cog._deadlines, cog._deadlines_loaded = [], {}, False
+    cog._deadline_changed = asyncio.Event()
+    cog._entrants, cog._dirty_entrants, cog._unreconciled = {}, set(), set()
+    cog._get_text_channel = lambda guild, channel_id: channel
+    cog._edit_giveaway_message = AsyncMock()
+    return cog, guild_conf, channel
+
+
+def _record(**extra) -> dict:
+    return {
+        "guild_id": 1,
+        "message_id": 10,
+        "channel_id": 50,
+        "prize": "Nitro",
+        "winner_count": 3,
+        "ends_at": time.time() - 1,
+        "status": "active",
+        "winner_ids": [],
+        "entry_mode": "tracked",
+        **extra,
+    }
+
+
+def _guild(departed: set[int]) -> SimpleNamespace:
+    async def fetch_member(user_id: int):
+        if user_id in departed:
+            raise discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Member")
+        return SimpleNamespace(id=user_id, bot=False, mention=f"<@{user_id}>")
+
+    return SimpleNamespace(id=1, get_member=lambda user_id: None, fetch_member=AsyncMock(side_effect=fetch_member))
+
+
+def test_fifty_thousand_tracked_entrants_end_without_walking_reactions() -> None:
+    async def check() -> None:
+        cog, guild_conf, channel = _cog(_record())
+        cog._entrants[(1, 10)] = set()
+        # Every other entrant has since left the server.
+        guild = _guild(departed=set(range(0, 50_000, 2)))
+        cog._fetch_giveaway_message = AsyncMock(side_effect=AssertionError("tracked giveaways must not walk reactions"))
+
+        for user_id in range(50_000):
+            await cog.on_raw_reaction_add(_payload(user_id))
+        await cog.on_raw_reaction_add(_payload(99_999, bot=True))
+        await cog.on_raw_reaction_add(_payload(99_998, emoji="\N{THUMBS UP SIGN}"))
+        await cog.on_raw_reaction_add(_payload(99_997, message_id=11))
+        await cog.on_raw_reaction_remove(_payload(49_999))
+        await Giveaway.entrant_flush_loop.coro(cog)
+        await Giveaway.entrant_flush_loop.coro(cog)
+        assert guild_conf.entrants.writes == 1
+        assert len(guild_conf.entrants.stored["10"]) == 49_999
+
+        cog._fetch_giveaway_message = AsyncMock(return_value=None)
+        record, winners = await cog._end_giveaway(guild, 10)
+        assert len(winners) == 3 and all(winner.id % 2 for winner in winners)
+        # Only the drawn entrants were looked up; departed ones were redrawn and dropped.
+        lookups = guild.fetch_member.await_count
+        assert lookups < 40
+        assert record["entry_count"] == 49_999 - (lookups - 3)
+        assert len(guild_conf.entrants.stored["10"]) == record["entry_count"]
+        assert (1, 10) not in cog._entrants
+        channel.send.assert_awaited_once()
+
+        await cog.on_raw_reaction_add(_payload(77_777))
+        _updated, rerolled = await cog._reroll_giveaway(guild, 10, 2)
+        assert not {winner.id for winner in rerolled} & set(record["winner_ids"])
+        assert 77_777 not in guild_conf.entrants.stored["10"]
+
+    asyncio.run(check())
+
+
+def test_restart_reconciles_tracked_entrants_from_reactions_once() -> None:
+    async def check() -> None:
+        # Entrant 1 withdrew and entrant 4 joined while the cog was not loaded.
+        cog, guild_conf, _channel = _cog(_record(winner_count=5), {"10": [1, 2, 3]})
+        users = [SimpleNamespace(id=user_id, bot=False) for user_id in (2, 3, 4)] + [SimpleNamespace(id=900, bot=True)]
+
+        async def reaction_users():
+            for user in users:
+                yield user
+
+        reaction = SimpleNamespace(emoji=Giveaway.REACTION_EMOJI, users=reaction_users)
+        cog._fetch_giveaway_message = AsyncMock(return_value=SimpleNamespace(reactions=[reaction]))
+        await cog._load_deadlines()
+        assert cog._unreconciled == {(1, 10)}
+
+        record, winners = await cog._end_giveaway(_guild(departed=set()), 10)
+        assert sorted(winner.id for winner in winners) == [2, 3, 4]
+        assert record["entry_count"] == 3
+        assert guild_conf.entrants.stored["10"] == [2, 3, 4]
+        assert cog._unreconciled == set()
+
+    asyncio.run(check())
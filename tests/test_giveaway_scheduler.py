@@ -0,0 +1,108 @@
+"""Deadline-driven auto-ending for Giveaway."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from redbot.core import commands
+
+from giveaway.giveaway import Giveaway
+
+
+def _record(message_id: int, ends_at: float, status: str = "active") -> dict:
+    return {"message_id": message_id, "channel_id": 50, "ends_at": ends_at, "status": status}
+
+
+def _cog(stored: dict[int, dict]) -> Giveaway:
+    cog = object.__new__(Giveaway)
+    cog.bot = SimpleNamespace(get_guild=lambda guild_id: SimpleNamespace(id=guild_id) if guild_id != 404 else None)
+    cog.config = SimpleNamespace(all_guilds=AsyncMock(return_value=stored))
+    cog._deadline_heap = []
+    cog._deadlines = {}
+    cog._deadlines_loaded = False
+    cog._deadline_changed = asyncio.Event()
+    cog._end_budget = asyncio.Semaphore(Giveaway.END_CONCURRENCY)
+    return cog
+
+
+def test_startup_load_ends_due_giveaways_in_parallel_and_skips_history() -> None:
+    async def check() -> None:
+        now = time.time()
+        stored = {
+            1: {"giveaways": {str(message_id): _record(message_id, now - 5) for message_id in range(1, 5)}},
+            2: {
+                "giveaways": {
+                    "5": _record(5, now - 1),
+                    "6": _record(6, now - 1),
+                    "7": _record(7, now + 3600),
+                    **{str(message_id): _record(message_id, now - 86400, "ended") for message_id in range(100, 200)},
+                    "200": _record(200, now - 86400, "cancelled"),
+                }
+            },
+            404: {"giveaways": {"8": _record(8, now - 1)}},
+        }
+        cog = _cog(stored)
+        ended: list[int] = []
+        active = peak = 0
+
+        async def end(guild, message_id, announce=True):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+            if message_id == 6:
+                raise commands.CommandError("That giveaway is not active.")
+            ended.append(message_id)
+            return {}, []
+
+        cog._end_giveaway = end
+
+        await Giveaway.giveaway_loop.coro(cog)
+        assert sorted(ended) == [1, 2, 3, 4, 5]
+        assert peak == Giveaway.END_CONCURRENCY
+        cog.config.all_guilds.assert_awaited_once()
+
+        # Only the future giveaway and the retry for the unavailable guild remain queued.
+        assert set(cog._deadlines) == {(2, 7), (404, 8)}
+        assert cog._deadlines[(404, 8)] > now + Giveaway.END_RETRY_SECONDS - 1
+
+    asyncio.run(check())
+
+
+def test_scheduler_wakes_for_an_earlier_deadline_and_ignores_cancelled_ones() -> None:
+    async def check() -> None:
+        now = time.time()
+        cog = _cog({1: {"giveaways": {"1": _record(1, now + 3600)}}})
+        ended: list[tuple[int, float]] = []
+
+        async def end(guild, message_id, announce=True):
+            ended.append((message_id, time.time()))
+            return {}, []
+
+        cog._end_giveaway = end
+
+        async def run() -> None:
+            while True:
+                await Giveaway.giveaway_loop.coro(cog)
+
+        runner = asyncio.create_task(run())
+        try:
+            await asyncio.sleep(0.05)
+            assert ended == []
+
+            deadline = time.time() + 0.1
+            cog._schedule_deadline(1, 2, deadline)
+            cog._schedule_deadline(1, 3, deadline)
+            cog._unschedule_deadline(1, 3)
+            await asyncio.sleep(0.3)
+            # Ended at its deadline rather than on the next 30-second scan.
+            assert [message_id for message_id, _ended_at in ended] == [2]
+            assert set(cog._deadlines) == {(1, 1)}
+        finally:
+            runner.cancel()
+
+    asyncio.run(check())
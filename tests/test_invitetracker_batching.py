@@ -0,0 +1,241 @@
+"""Regression coverage for coalesced InviteTracker join attribution."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+import discord
+
+from invitetracker.invitetracker import InviteTracker
+from invitetracker.storage import MemberHistoryStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class FakeValue:
+    def __init__(self, group: FakeGuildGroup, name: str) -> None:
+        self.group = group
+        self.name = name
+
+    def __call__(self) -> FakeValue:
+        return self
+
+    def __await__(self):
+        async def read() -> object:
+            return self.group.data[self.name]
+
+        return read().__await__()
+
+    async def __aenter__(self) -> object:
+        return self.group.data[self.name]
+
+    async def __aexit__(self, *_args: object) -> None:
+        self.group.writes += 1
+
+
+class FakeAll:
+    def __init__(self, group: FakeGuildGroup) -> None:
+        self.group = group
+
+    def __await__(self):
+        async def read() -> dict[str, object]:
+            return dict(self.group.data)
+
+        return read().__await__()
+
+    async def __aenter__(self) -> dict[str, object]:
+        return self.group.data
+
+    async def __aexit__(self, *_args: object) -> None:
+        self.group.writes += 1
+
+
+class FakeGuildGroup:
+    def __init__(self, invite_cache: dict[str, dict[str, object]]) -> None:
+        self.writes = 0
+        self.data: dict[str, object] = {
+            "enabled": True,
+            "include_bots": False,
+            "fake_age_hours": 24,
+            "invite_cache": invite_cache,
+            "inviters": {},
+            "unknown_joins": 0,
+        }
+
+    def __getattr__(self, name: str) -> FakeValue:
+        return FakeValue(self, name)
+
+    def all(self) -> FakeAll:
+        return FakeAll(self)
+
+
+def _invite(code: str, uses: int, inviter_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        code=code,
+        uses=uses,
+        inviter=SimpleNamespace(id=inviter_id),
+        channel=SimpleNamespace(id=5),
+        created_at=None,
+        max_age=0,
+        max_uses=0,
+        temporary=False,
+    )
+
+
+def _member(member_id: int, guild: SimpleNamespace) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=member_id,
+        bot=False,
+        guild=guild,
+        mention=f"<@{member_id}>",
+        display_avatar=SimpleNamespace(url="https://cdn.discordapp.com/embed/avatars/0.png"),
+        created_at=datetime.now(timezone.utc) - timedelta(days=30),
+    )
+
+
+def _tracker(group: FakeGuildGroup, history_path: Path) -> InviteTracker:
+    cog = object.__new__(InviteTracker)
+    cog._history = MemberHistoryStore(history_path)
+    cog.config = SimpleNamespace(guild=lambda _guild: group)
+    cog._locks = {}
+    cog._pending_joins = {}
+    cog._unrecorded_joins = {}
+    cog._join_batchers = {}
+    cog._join_metrics = {}
+    cog._send_log = AsyncMock()
+    cog.JOIN_BATCH_SECONDS = 0.01
+    return cog
+
+
+def _sequential_reference(before_cache, after_cache, join_count):
+    """Attribute joins one at a time the way the per-join diff used to."""
+    attributions = []
+    cache = {code: dict(record) for code, record in before_cache.items()}
+    for _index in range(join_count):
+        candidates = []
+        for code, after_record in after_cache.items():
+            before_uses = int(cache.get(code, {}).get("uses") or 0)
+            after_uses = int(after_record["uses"])
+            if after_uses > before_uses:
+                candidates.append((after_uses - before_uses, after_uses, code, before_uses))
+        if not candidates:
+            attributions.append(None)
+            continue
+        candidates.sort(key=lambda item: (-item[0], -item[1], item[2]))
+        _delta, _after_uses, code, before_uses = candidates[0]
+        cache[code] = {**after_cache[code], "uses": before_uses + 1}
+        attributions.append(code)
+    return attributions
+
+
+def test_five_hundred_joins_share_one_invite_fetch_and_one_write(tmp_path: Path) -> None:
+    async def check() -> None:
+        before = {
+            "raid": {"code": "raid", "uses": 10, "inviter_id": 1},
+            "friend": {"code": "friend", "uses": 4, "inviter_id": 2},
+            "vanity": {"code": "vanity", "uses": 0, "inviter_id": None},
+        }
+        group = FakeGuildGroup(before)
+        guild = SimpleNamespace(id=99)
+        guild.invites = AsyncMock(
+            return_value=[_invite("raid", 410, 1), _invite("friend", 104, 2), _invite("vanity", 0, 3)],
+        )
+        cog = _tracker(group, tmp_path / "history.sqlite3")
+        await cog._history.initialize()
+
+        await asyncio.gather(*(cog._record_join(_member(1000 + index, guild)) for index in range(500)))
+
+        guild.invites.assert_awaited_once_with()
+        assert group.writes == 1
+        assert await cog._history.active_count(99) == 500
+        assert group.data["inviters"] == {
+            "1": {"joins": 400, "leaves": 0, "fake": 0},
+            "2": {"joins": 100, "leaves": 0, "fake": 0},
+        }
+        assert group.data["unknown_joins"] == 0
+        assert group.data["invite_cache"]["raid"]["uses"] == 410
+        assert cog._send_log.await_count == 500
+        metrics = cog._join_metrics[99]
+        assert metrics["batches"] == 1
+        assert metrics["joins"] == metrics["largest_batch"] == 500
+        assert metrics["latency_max"] >= cog.JOIN_BATCH_SECONDS
+        assert not cog._join_batchers
+
+    asyncio.run(check())
+
+
+def test_joins_beyond_observed_uses_are_counted_unknown(tmp_path: Path) -> None:
+    async def check() -> None:
+        group = FakeGuildGroup({"raid": {"code": "raid", "uses": 0, "inviter_id": 1}})
+        guild = SimpleNamespace(id=99, invites=AsyncMock(return_value=[_invite("raid", 2, 1)]))
+        cog = _tracker(group, tmp_path / "history.sqlite3")
+        await cog._history.initialize()
+
+        await asyncio.gather(*(cog._record_join(_member(index, guild)) for index in range(5)))
+
+        assert group.data["inviters"]["1"]["joins"] == 2
+        assert group.data["unknown_joins"] == 3
+        records, total = await cog._history.joins_page(99)
+        assert total == 5
+        assert sum(1 for record in records if record["invite_code"] is None) == 3
+
+    asyncio.run(check())
+
+
+def test_failed_invite_lookup_marks_the_whole_batch_unknown(tmp_path: Path) -> None:
+    async def check() -> None:
+        group = FakeGuildGroup({})
+        error = discord.Forbidden(SimpleNamespace(status=403, reason="Forbidden"), "Missing Permissions")
+        guild = SimpleNamespace(id=99, invites=AsyncMock(side_effect=error))
+        cog = _tracker(group, tmp_path / "history.sqlite3")
+        await cog._history.initialize()
+
+        await asyncio.gather(*(cog._record_join(_member(index, guild)) for index in range(20)))
+
+        guild.invites.assert_awaited_once_with()
+        assert group.data["unknown_joins"] == 20
+        assert group.writes == 1
+        assert group.data["invite_cache"] == {}
+
+    asyncio.run(check())
+
+
+def test_leave_inside_the_batch_window_closes_the_batched_join(tmp_path: Path) -> None:
+    async def check() -> None:
+        group = FakeGuildGroup({"raid": {"code": "raid", "uses": 0, "inviter_id": 1}})
+        guild = SimpleNamespace(id=99, invites=AsyncMock(return_value=[_invite("raid", 2, 1)]))
+        cog = _tracker(group, tmp_path / "history.sqlite3")
+        cog.JOIN_BATCH_SECONDS = 0.05
+        await cog._history.initialize()
+        leaver, stayer = _member(1, guild), _member(2, guild)
+
+        joins = [asyncio.create_task(cog._record_join(member)) for member in (leaver, stayer)]
+        await asyncio.sleep(0)
+        await cog._record_leave(leaver)
+        await asyncio.gather(*joins)
+
+        assert await cog._history.active_count(99) == 1
+        assert group.data["inviters"]["1"] == {"joins": 2, "leaves": 1, "fake": 0}
+        assert cog._unrecorded_joins == {}
+
+    asyncio.run(check())
+
+
+def test_batch_attribution_matches_one_join_at_a_time() -> None:
+    rng = random.Random(31)
+    for _case in range(50):
+        codes = [f"code{index}" for index in range(rng.randint(1, 6))]
+        before = {code: {"code": code, "uses": rng.randint(0, 20)} for code in codes}
+        after = {code: {"code": code, "uses": before[code]["uses"] + rng.randint(0, 8)} for code in codes}
+        joins = rng.randint(1, 30)
+        expected = _sequential_reference(before, after, joins)
+
+        attributions = InviteTracker._attribute_joins(before, after, joins)
+
+        assert [code for code, _record in attributions] == expected
@@ -0,0 +1,125 @@
+"""Regression coverage for the indexed InviteTracker join history."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+from invitetracker.invitetracker import InviteTracker
+from invitetracker.storage import MemberHistoryStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _join(member_id: int, inviter_id: int | None, code: str | None, joined_at: float) -> dict:
+    return {
+        "member_id": member_id,
+        "inviter_id": inviter_id,
+        "invite_code": code,
+        "joined_at": joined_at,
+        "left_at": None,
+        "fake": False,
+    }
+
+
+def test_rejoins_keep_history_and_leaves_close_the_newest_row(tmp_path: Path) -> None:
+    async def check() -> None:
+        store = MemberHistoryStore(tmp_path / "history.sqlite3")
+        await store.initialize()
+
+        await store.record_joins(1, [_join(10, 2, "abc", 100.0)])
+        await store.record_joins(1, [_join(10, 3, "xyz", 200.0)])
+        left = await store.record_leave(1, 10, 300.0)
+
+        assert left is not None
+        assert (left["inviter_id"], left["left_at"]) == (3, 300.0)
+        assert await store.record_leave(1, 10, 400.0) is None
+        records, total = await store.joins_page(1)
+        assert total == 2
+        assert [(record["invite_code"], record["left_at"]) for record in records] == [("xyz", 300.0), ("abc", 200.0)]
+        assert (await store.latest_join(1, 10))["invite_code"] == "xyz"
+
+    asyncio.run(check())
+
+
+def test_pages_filter_by_inviter_code_and_activity(tmp_path: Path) -> None:
+    async def check() -> None:
+        store = MemberHistoryStore(tmp_path / "history.sqlite3")
+        await store.initialize()
+        await store.record_joins(
+            1,
+            [_join(100 + index, 2 if index % 2 else 3, f"code{index % 3}", float(index)) for index in range(250)],
+        )
+        await store.record_joins(2, [_join(1, 2, "code0", 1.0)])
+        await store.record_leave(1, 349, 999.0)
+
+        first, total = await store.joins_page(1, inviter_id=2, active_only=True, limit=20)
+        second, _total = await store.joins_page(1, inviter_id=2, active_only=True, offset=20, limit=20)
+        by_code, code_total = await store.joins_page(1, invite_code="code1", limit=100)
+
+        assert total == 124
+        assert [record["member_id"] for record in first[:2]] == [347, 345]
+        assert second[0]["member_id"] == first[-1]["member_id"] - 2
+        assert code_total == 83
+        assert len(by_code) == 83
+        assert await store.active_count(1) == 249
+        assert await store.active_count(1, inviter_id=3) == 125
+
+    asyncio.run(check())
+
+
+def test_import_export_and_user_deletion(tmp_path: Path) -> None:
+    async def check() -> None:
+        store = MemberHistoryStore(tmp_path / "history.sqlite3")
+        await store.initialize()
+        legacy = {
+            "10": {"inviter_id": 2, "invite_code": "abc", "joined_at": 50.0, "left_at": 60.0, "fake": True},
+            "11": {"member_id": 11, "inviter_id": 10, "invite_code": "def", "joined_at": 70.0, "left_at": None},
+        }
+
+        assert await store.import_guild(1, legacy) == 2
+        # A migration interrupted before Config was cleared runs again without duplicating rows.
+        assert await store.import_guild(1, legacy) == 0
+        assert await store.export_csv(2) is None
+        export = await store.export_csv(1)
+        with export:
+            rows = list(csv.reader(io.TextIOWrapper(export, encoding="utf-8")))
+
+        assert rows[0] == ["member_id", "inviter_id", "invite_code", "joined_at", "left_at", "fake"]
+        assert [row[0] for row in rows[1:]] == ["10", "11"]
+        assert rows[1][5] == "yes"
+        assert rows[1][4].startswith("1970-01-01T00:01:00")
+
+        assert await store.delete_user(10) == 1
+        records, total = await store.joins_page(1)
+        assert total == 1
+        assert records[0]["inviter_id"] is None
+
+    asyncio.run(check())
+
+
+def test_joinedby_keeps_its_limit_argument_and_pages_by_it(tmp_path: Path) -> None:
+    async def check() -> None:
+        cog = object.__new__(InviteTracker)
+        cog._history = MemberHistoryStore(tmp_path / "history.sqlite3")
+        await cog._history.initialize()
+        await cog._history.record_joins(1, [_join(100 + index, 7, "abc", float(index)) for index in range(12)])
+        ctx = SimpleNamespace(guild=SimpleNamespace(id=1), send=AsyncMock())
+        inviter = SimpleNamespace(id=7, mention="<@7>")
+
+        await InviteTracker.invites_joined_by.callback(cog, ctx, inviter, 5)
+        first = ctx.send.await_args.args[0]
+        assert "12 total, page 1/3" in first
+        assert "<@111>" in first and "<@106>" not in first
+
+        await InviteTracker.invites_joined_by.callback(cog, ctx, inviter, 5, 3)
+        last = ctx.send.await_args.args[0]
+        assert "page 3/3" in last
+        assert "<@101>" in last and "<@102>" not in last
+
+    asyncio.run(check())
@@ -0,0 +1,142 @@
+"""Incrementally maintained BM25 search index for KnowledgeGarden."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import random
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from knowledgegarden.knowledgegarden import KnowledgeGarden
+from knowledgegarden.search import SearchIndex
+
+TOPICS = (
+    "account server role channel voice ticket backup restore invite webhook permission moderator",
+    "nickname emoji sticker thread forum event schedule reminder payment refund subscription",
+    "password authenticator recovery verification captcha appeal ban mute warning report",
+)
+WORDS = [word for topic in TOPICS for word in topic.split()]
+QUERIES = ("backup restore", "ticket refund", "lost authenticator recovery", "forum thread", "verif")
+
+
+def _entry(entry_id: int, title: str, body: str, **extra) -> dict:
+    return {
+        "entry_id": entry_id,
+        "title": title,
+        "body": body,
+        "tags": [],
+        "aliases": [],
+        "status": "published",
+        "updated_at": entry_id,
+        **extra,
+    }
+
+
+def _corpus(size: int, seed: int = 11) -> list[dict]:
+    rng = random.Random(seed)
+    # Answer bodies draw from a Zipf-like vocabulary, so a few words are everywhere and most are rare.
+    vocabulary = WORDS + ["".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(4, 9))) for _ in range(8000)]
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    rng.shuffle(vocabulary)
+    return [
+        _entry(
+            entry_id,
+            " ".join(rng.sample(WORDS, 3)),
+            " ".join(rng.choices(vocabulary, weights, k=rng.randint(40, 120))),
+            tags=rng.sample(WORDS, 2),
+            aliases=[" ".join(rng.sample(WORDS, 2))],
+        )
+        for entry_id in range(1, size + 1)
+    ]
+
+
+def test_bm25_prefers_rare_terms_and_matches_partial_words() -> None:
+    index = SearchIndex(
+        [
+            _entry(1, "Two-factor authentication", "Use a backup code from your authenticator app."),
+            _entry(2, "Server rules", "Be kind. Read the rules channel. The rules are enforced by the moderators."),
+            _entry(3, "Rules appeal", "Appeals are reviewed weekly.", tags=["moderation"]),
+            _entry(4, "Authentication draft", "Unreviewed", status="draft"),
+        ]
+    )
+    assert [doc["entry_id"] for _score, doc in index.search("auth")] == [1]
+    assert [doc["entry_id"] for _score, doc in index.search("auth", published_only=False)] == [4, 1]
+    # "appeal" occurs once in the collection and outweighs the common "rules".
+    assert index.search("rules appeal")[0][1]["entry_id"] == 3
+    assert [doc["entry_id"] for _score, doc in index.search("moder")] == [3, 2]
+    assert index.search("a") == [] and index.search("zzz") == []
+
+    index.update(_entry(3, "Rules appeal", "Appeals are reviewed weekly.", status="retired"))
+    assert [doc["entry_id"] for _score, doc in index.search("appeal")] == []
+    index.remove(1)
+    assert index.search("authenticator") == []
+    assert len(index) == 3
+
+
+class FakeEntries:
+    """Config value that returns copies, as Red's Config does, and counts reads."""
+
+    def __init__(self, stored: dict) -> None:
+        self.stored = stored
+        self.reads = 0
+
+    async def __call__(self) -> dict:
+        self.reads += 1
+        return copy.deepcopy(self.stored)
+
+    async def set(self, value: dict) -> None:
+        self.stored = copy.deepcopy(value)
+
+
+def test_index_is_built_once_and_follows_commands_without_rereading_config() -> None:
+    async def check() -> None:
+        entries = FakeEntries({"1": _entry(1, "Voice channels", "Join the lobby first.", created_by=5)})
+        guild_conf = SimpleNamespace(
+            entries=entries,
+            next_id=AsyncMock(return_value=2),
+            require_separate_publisher=AsyncMock(return_value=True),
+        )
+        guild_conf.next_id.set = AsyncMock()
+        cog = object.__new__(KnowledgeGarden)
+        cog.config = SimpleNamespace(guild=lambda guild: guild_conf)
+        cog._locks, cog._indexes, cog._index_versions = {}, {}, {}
+        guild = SimpleNamespace(id=1)
+        author = SimpleNamespace(guild=guild, author=SimpleNamespace(id=7), send=AsyncMock())
+        publisher = SimpleNamespace(guild=guild, author=SimpleNamespace(id=8), send=AsyncMock())
+
+        await KnowledgeGarden.search.callback(cog, author, query="voice")
+        await KnowledgeGarden.search.callback(cog, author, query="lobby")
+        assert entries.reads == 1
+        assert "Voice channels" in author.send.await_args.kwargs["embed"].description
+
+        await KnowledgeGarden.draft.callback(cog, author, "Stage events", answer="Ask an event host to open the stage.")
+        index = await cog._search_index(guild)
+        assert index.search("stage") == []
+        assert index.search("stage", published_only=False)[0][1]["entry_id"] == 2
+        await KnowledgeGarden.publish.callback(cog, publisher, 2)
+        await KnowledgeGarden.tags.callback(cog, author, 2, tags="podium, talks")
+        await KnowledgeGarden.aliases.callback(cog, author, 1, aliases="vc")
+        await KnowledgeGarden.edit.callback(cog, author, 1, answer="Use the waiting room first.")
+        assert index.search("podium")[0][1]["entry_id"] == 2
+        assert index.search("vc")[0][1]["entry_id"] == 1
+        assert index.search("lobby") == []
+
+        await KnowledgeGarden.retire.callback(cog, author, 2)
+        assert index.search("podium") == []
+        reads = entries.reads
+        await KnowledgeGarden.search.callback(cog, author, query="waiting")
+        assert "Voice channels" in author.send.await_args.kwargs["embed"].description
+        assert await cog._search_index(guild) is index
+        assert entries.reads == reads
+
+    asyncio.run(check())
+
+
+def test_ten_thousand_entry_corpus_returns_ranked_matches() -> None:
+    index = SearchIndex(_corpus(10_000))
+
+    for query in QUERIES:
+        scores = [score for score, _entry in index.search(query)]
+        assert scores and all(score > 0 for score in scores)
+        assert scores == sorted(scores, reverse=True)
@@ -0,0 +1,263 @@
+"""Shared, conditional link probes and concurrent scheduled scans for LinkSentinel."""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from linksentinel.linksentinel import LinkSentinel
+from linksentinel.probes import CertificateRecorder, DNSCache, ProbeCache, PublicResolver, probe_key
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _site(requests: list[tuple[str, str, str | None]]) -> web.AppRunner:
+    async def doc(request: web.Request) -> web.Response:
+        requests.append((request.method, request.path, request.headers.get("If-None-Match")))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.Response(text="docs", headers={"ETag": '"v1"'})
+
+    async def moved(request: web.Request) -> web.Response:
+        requests.append((request.method, request.path, None))
+        raise web.HTTPMovedPermanently("/doc")
+
+    async def get_only(request: web.Request) -> web.Response:
+        requests.append((request.method, request.path, None))
+        if request.method != "GET":
+            raise web.HTTPMethodNotAllowed(request.method, ["GET"])
+        return web.Response(text="store")
+
+    app = web.Application()
+    app.router.add_get("/doc", doc)
+    app.router.add_get("/moved", moved)
+    app.router.add_route("*", "/store", get_only)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner
+
+
+def _cog(session: aiohttp.ClientSession) -> LinkSentinel:
+    cog = object.__new__(LinkSentinel)
+    cog.session = session
+    cog._probe_budget = asyncio.Semaphore(16)
+    cog._probes = ProbeCache()
+    cog._dns = DNSCache()
+    cog._tls = CertificateRecorder()
+    # The local test server is on loopback, which the SSRF check rightly refuses.
+    cog._validate_public_target = AsyncMock()
+    return cog
+
+
+def test_probe_keys_ignore_case_default_ports_and_fragments() -> None:
+    assert probe_key("HTTPS://Wiki.Example.org:443/Guide#intro") == "https://wiki.example.org/Guide"
+    assert probe_key("http://example.org") == "http://example.org/"
+    assert probe_key("http://example.org:8080/a?b=1") == "http://example.org:8080/a?b=1"
+
+
+def test_guilds_share_one_head_probe_and_revalidate_with_etags() -> None:
+    async def check() -> None:
+        requests: list[tuple[str, str, str | None]] = []
+        runner = await _site(requests)
+        port = runner.addresses[0][1]
+        base = f"http://127.0.0.1:{port}"
+        async with aiohttp.ClientSession() as session:
+            cog = _cog(session)
+            link = {"url": f"{base}/doc", "failures": 0}
+
+            results = await asyncio.gather(*(cog._check_link(dict(link, guild=guild), 5) for guild in range(5)))
+            assert [result["status"] for result in results] == ["healthy"] * 5
+            assert requests == [("HEAD", "/doc", None)]
+
+            await cog._check_link({**link, "url": f"{base}/doc#top"}, 5)
+            assert len(requests) == 1
+
+            refreshed = await cog._check_link(link, 5, refresh=True)
+            assert requests[-1] == ("HEAD", "/doc", '"v1"')
+            assert (refreshed["status"], refreshed["status_code"]) == ("healthy", 200)
+
+            requests.clear()
+            store = await cog._check_link({"url": f"{base}/store", "failures": 0}, 5)
+            assert [method for method, *_ in requests] == ["HEAD", "GET"]
+            assert store["status_code"] == 200
+
+            moved = await cog._check_link({"url": f"{base}/moved", "failures": 0}, 5)
+            assert moved["final_url"] == f"{base}/doc"
+            assert cog._validate_public_target.await_count == 5
+        await runner.cleanup()
+
+    asyncio.run(check())
+
+
+def test_dns_lookups_are_cached_for_the_ssrf_check(monkeypatch) -> None:
+    async def check() -> None:
+        lookups = []
+
+        async def getaddrinfo(host, port, **kwargs):
+            lookups.append(host)
+            await asyncio.sleep(0.01)
+            address = "10.0.0.5" if host == "intranet.example" else "93.184.215.14"
+            return [(2, 1, 6, "", (address, port))] * 2
+
+        monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", getaddrinfo)
+        clock = FakeClock()
+        cog = object.__new__(LinkSentinel)
+        cog._dns = DNSCache(ttl=60, clock=clock)
+
+        await asyncio.gather(*(cog._validate_public_target("https://Example.org/page") for _ in range(10)))
+        assert lookups == ["example.org"]
+        assert await cog._dns.resolve("example.org", 443) == ("93.184.215.14",)
+
+        clock.now = 61
+        await cog._validate_public_target("https://example.org/other")
+        assert len(lookups) == 2
+
+        for _ in range(2):
+            try:
+                await cog._validate_public_target("http://intranet.example/")
+            except ValueError as error:
+                assert "Non-public target 10.0.0.5" in str(error)
+        assert lookups.count("intranet.example") == 1
+
+    asyncio.run(check())
+
+
+def test_connections_use_the_checked_lookup_and_refuse_rebinding(monkeypatch) -> None:
+    async def check() -> None:
+        runner = await _site([])
+        port = runner.addresses[0][1]
+        answers = {"docs.example": "93.184.215.14", "rebind.example": "127.0.0.1"}
+
+        async def getaddrinfo(host, port, **kwargs):
+            return [(2, 1, 6, "", (answers[host], port))]
+
+        monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", getaddrinfo)
+        clock = FakeClock()
+        dns = DNSCache(ttl=60, clock=clock)
+        resolver = PublicResolver(dns)
+
+        assert [host["host"] for host in await resolver.resolve("docs.example", 443)] == ["93.184.215.14"]
+        answers["docs.example"] = "10.0.0.5"
+        assert [host["host"] for host in await resolver.resolve("docs.example", 443)] == ["93.184.215.14"]
+        clock.now = 61
+        with pytest.raises(OSError, match="No public address"):
+            await resolver.resolve("docs.example", 443)
+
+        connector = aiohttp.TCPConnector(resolver=resolver, use_dns_cache=False)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            with pytest.raises(aiohttp.ClientConnectorError):
+                await session.get(f"http://rebind.example:{port}/doc")
+        await runner.cleanup()
+
+    asyncio.run(check())
+
+
+def test_due_guilds_scan_concurrently_and_failures_stay_isolated() -> None:
+    async def check() -> None:
+        guilds = [SimpleNamespace(id=guild_id) for guild_id in range(6)]
+        settings = {"links": {"1": {}}, "last_scan_at": 0, "interval_hours": 24}
+        cog = object.__new__(LinkSentinel)
+        cog.bot = SimpleNamespace(guilds=guilds)
+        cog.config = SimpleNamespace(guild=lambda guild: SimpleNamespace(all=AsyncMock(return_value=settings)))
+        cog._scan_lock = asyncio.Lock()
+        scanned = []
+        active = peak = 0
+
+        async def scan(guild):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            try:
+                await asyncio.sleep(0.05)
+            finally:
+                active -= 1
+            if guild.id == 3:
+                raise RuntimeError("broken guild")
+            scanned.append(guild.id)
+            return 1, 0
+
+        cog._scan_guild = scan
+        await LinkSentinel.scheduled_scan.coro(cog)
+
+        assert sorted(scanned) == [0, 1, 2, 4, 5]
+        assert peak == len(guilds)
+
+    asyncio.run(check())
+
+
+def _self_signed_certificate(tmp_path, days: int) -> tuple[str, str]:
+    x509 = pytest.importorskip("cryptography.x509")
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.now(timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=days))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName("localhost")]), critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = tmp_path / "cert.pem", tmp_path / "key.pem"
+    cert_path.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()),
+    )
+    return str(cert_path), str(key_path)
+
+
+def test_certificate_expiry_comes_from_the_probe_connection(tmp_path) -> None:
+    cert_path, key_path = _self_signed_certificate(tmp_path, days=10)
+
+    async def check() -> None:
+        requests: list[tuple[str, str, str | None]] = []
+        app = web.Application()
+
+        async def home(request: web.Request) -> web.Response:
+            requests.append((request.method, request.path, None))
+            return web.Response(text="home")
+
+        app.router.add_get("/", home)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        server_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        server_context.load_cert_chain(cert_path, key_path)
+        await web.TCPSite(runner, "127.0.0.1", 0, ssl_context=server_context).start()
+        port = runner.addresses[0][1]
+
+        recorder = CertificateRecorder()
+        recorder.load_verify_locations(cert_path)
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=recorder)) as session:
+            cog = _cog(session)
+            cog._tls = recorder
+            result = await cog._check_link({"url": f"https://localhost:{port}/", "failures": 0}, 5)
+
+        assert requests == [("HEAD", "/", None)]
+        assert result["status"] == "healthy"
+        assert 9 * 86400 < result["tls_expires_at"] - time.time() <= 10 * 86400
+        await runner.cleanup()
+
+    asyncio.run(check())
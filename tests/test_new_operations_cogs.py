@@ -146,11 +146,20 @@ def test_knowledge_search_uses_alternate_phrases() -> None:
             "aliases": ["lost phone", "new authenticator"],
             "status": "published",
             "updated_at": 1,
-        }
+        },
+        {
+            "entry_id": 2,
+            "title": "Changing your nickname",
+            "body": "If you lost access to your phone number, staff cannot change it.",
+            "tags": [],
+            "aliases": [],
+            "status": "published",
+            "updated_at": 2,
+        },
     ]
     ranked = rank_entries(entries, "lost phone")
-    assert ranked[0][1]["entry_id"] == 1
-    assert ranked[0][0] >= 10
+    assert [entry["entry_id"] for _score, entry in ranked] == [1, 2]
+    assert ranked[0][0] > 1.5 * ranked[1][0]
 
 
 def test_calendar_export_is_stable_and_escapes_text() -> None:
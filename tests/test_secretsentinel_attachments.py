@@ -0,0 +1,166 @@
+"""Concurrent, streamed, and size-capped attachment scanning for SecretSentinel."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import io
+import os
+import zipfile
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from secretsentinel.attachments import (
+    MAX_EXPANDED_BYTES,
+    AttachmentScanner,
+    attachment_format,
+    scan_gzip_chunks,
+    scan_text_chunks,
+    scan_zip,
+)
+from secretsentinel.secretsentinel import SecretSentinel
+
+GITHUB = "ghp_" + "A" * 36
+AWS = "AKIA" + "B" * 16
+
+
+def _split(payload: bytes, size: int) -> list[bytes]:
+    return [payload[index : index + size] for index in range(0, len(payload), size)]
+
+
+def _zip(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, payload in members.items():
+            archive.writestr(name, payload)
+    return buffer.getvalue()
+
+
+class FakeCDN:
+    def __init__(self, files: dict[str, bytes], delay: float = 0.0) -> None:
+        self.files = files
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.downloads = 0
+
+    async def fetch(self, url: str, chunk_size: int):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.downloads += 1
+        try:
+            await asyncio.sleep(self.delay)
+            for chunk in _split(self.files[url], chunk_size):
+                yield chunk
+        finally:
+            self.active -= 1
+
+
+def test_values_split_across_chunks_are_still_found() -> None:
+    payload = f"config:\n  note: café ✓\n  token: {GITHUB}\n  aws: {AWS}\n".encode()
+    for size in (1, 7, 16, 31):
+        assert scan_text_chunks(_split(payload, size)) == {"GitHub token", "AWS access key"}
+
+    assert attachment_format("server.log.gz") == "gzip"
+    assert attachment_format("photo.png.gz") is None
+    assert attachment_format("Logs.ZIP") == "zip"
+
+
+def test_compressed_attachments_are_scanned_within_size_and_ratio_caps() -> None:
+    log = b"boot ok\n" * 200 + f"key={AWS}\n".encode()
+    assert scan_gzip_chunks(_split(gzip.compress(log), 64)) == {"AWS access key"}
+
+    bomb = gzip.compress(b"\0" * (64 * MAX_EXPANDED_BYTES) + GITHUB.encode())
+    assert scan_gzip_chunks(_split(bomb, 4096)) == frozenset()
+
+    # Concatenated members are all scanned, and they share the one expansion budget.
+    members = gzip.compress(b"boot ok\n" * 200) + gzip.compress(f"key={AWS}\n".encode())
+    assert scan_gzip_chunks(_split(members, 64)) == {"AWS access key"}
+    filler = os.urandom(300_000).hex().encode()
+    assert scan_gzip_chunks([gzip.compress(filler) + gzip.compress(filler + AWS.encode())]) == frozenset()
+
+    archive = _zip(
+        {
+            "app/.env": f"GITHUB={GITHUB}\n".encode(),
+            "logo.png": AWS.encode(),
+            "notes/readme.md": b"nothing to see here",
+        },
+    )
+    assert scan_zip(_split(archive, 100)) == {"GitHub token"}
+    # A member that claims a ratio over the cap is skipped; the rest of the archive is still scanned.
+    assert scan_zip([_zip({"bomb.txt": b"a" * 2_000_000 + GITHUB.encode(), "late.txt": AWS.encode()})]) == {"AWS access key"}
+    # Members share one expansion budget, so text past it is never decompressed.
+    assert scan_zip([_zip({"one.log": filler, "two.log": filler + AWS.encode()})]) == frozenset()
+    assert scan_zip([b"not a zip"]) == frozenset()
+
+
+def test_attachments_stream_concurrently_and_reposted_content_is_not_rescanned() -> None:
+    async def check() -> None:
+        cdn = FakeCDN(
+            {
+                "a": f"token {GITHUB}".encode(),
+                "b": f"token {GITHUB}".encode(),
+                "c": b"clean",
+                "d": b"x" * 70_000,
+            },
+            delay=0.02,
+        )
+        scanner = AttachmentScanner(cdn.fetch, concurrency=2)
+        results = await asyncio.gather(
+            scanner.scan("a.txt", 10, "a"),
+            scanner.scan("b.log", 10, "b"),
+            scanner.scan("c.txt", 5, "c"),
+            # The declared size is small, but the real body is over the 64 KiB cap.
+            scanner.scan("d.txt", 10, "d"),
+            scanner.scan("e.exe", 10, "a"),
+        )
+        assert results == [{"GitHub token"}, {"GitHub token"}, frozenset(), frozenset(), frozenset()]
+        assert cdn.peak == 2
+        assert cdn.downloads == 4
+        assert scanner.scans == 3
+
+        assert await scanner.scan("again.txt", 10, "b") == {"GitHub token"}
+        assert (cdn.downloads, scanner.scans) == (5, 3)
+
+    asyncio.run(check())
+
+
+def test_listener_scans_all_attachments_in_parallel() -> None:
+    async def check() -> None:
+        cdn = FakeCDN({f"file{index}": f"row {index}".encode() for index in range(4)}, delay=0.05)
+        cdn.files["file3"] += f" {AWS}".encode()
+        cog = object.__new__(SecretSentinel)
+        cog.bot = SimpleNamespace(get_cog=lambda name: None)
+        cog._handled, cog._last_alert, cog._last_incident = set(), {}, {}
+        cog._settings_cache = {
+            1: {
+                "enabled": True,
+                "action": "report",
+                "log_channel_id": None,
+                "scan_attachments": True,
+                "disabled_kinds": frozenset(),
+                "monitored_bot_ids": frozenset(),
+                "alert_cooldown_seconds": 60,
+                "create_opsroom_incidents": False,
+                "ignored_channel_ids": frozenset(),
+                "ignored_role_ids": frozenset(),
+            },
+        }
+        cog._settings_versions = {}
+        cog._attachments = AttachmentScanner(cdn.fetch)
+        author = SimpleNamespace(id=3, bot=False, roles=[], send=AsyncMock())
+        message = SimpleNamespace(
+            id=99,
+            guild=SimpleNamespace(id=1, name="Test Server"),
+            author=author,
+            channel=SimpleNamespace(id=4),
+            content="see attached",
+            attachments=[SimpleNamespace(filename=f"part{index}.log", size=16, url=f"file{index}") for index in range(4)],
+        )
+
+        await cog.on_message(message)
+
+        assert cdn.peak == 4
+        assert "AWS access key" in author.send.await_args.args[0]
+
+    asyncio.run(check())
@@ -0,0 +1,110 @@
+"""Prefiltered single-pass secret scanning and cached listener settings for SecretSentinel."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from secretsentinel.detection import PATTERNS, SecretMatch, find_secrets, may_contain_secret
+from secretsentinel.secretsentinel import SecretSentinel
+
+SAMPLES = {
+    "Discord bot token": "A" * 24 + "." + "B" * 6 + "." + "C" * 27,
+    "Discord webhook URL": "https://discord.com/api/webhooks/" + "1" * 18 + "/" + "a" * 68,
+    "GitHub token": "ghp_" + "A" * 36,
+    "AWS access key": "AKIA" + "B" * 16,
+    "Google API key": "AIza" + "C" * 35,
+    "Stripe live key": "sk_live_" + "d" * 24,
+    "Private key": "-----BEGIN " + "PRIVATE KEY-----",
+}
+
+CHAT = (
+    "anyone around for raids tonight? starting at 9.30 server time",
+    "lol that was the best run we've had all week",
+    "the patch notes for v2.14.3 are up at https://example.com/news/patch-2-14-3",
+    "can someone explain how the crafting queue works, I keep losing mats",
+    "gg everyone, see you tomorrow. remember to vote for the next map!",
+    "try `pip install -U requests` then restart the bot. works for me.",
+    "my email is someone.person@example.org if you need the spreadsheet",
+    "Error: connection refused at 10.0.0.12:8080 — retrying in 5s...",
+    "ok so the plan is: tank pulls left, dps burn adds, healers stay mid.",
+    "https://docs.example.dev/guides/getting-started#install is out of date fyi",
+)
+
+
+def _reference_find_secrets(text: str) -> list[SecretMatch]:
+    """The previous per-pattern implementation, kept to check the combined scanner against."""
+    matches = [SecretMatch(kind, match.start(), match.end()) for kind, pattern in PATTERNS for match in pattern.finditer(text)]
+    matches.sort(key=lambda item: (item.start, -(item.end - item.start)))
+    accepted: list[SecretMatch] = []
+    for item in matches:
+        if not accepted or item.start >= accepted[-1].end:
+            accepted.append(item)
+    return accepted
+
+
+def _corpus(size: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.sample(CHAT, rng.randint(1, 3))) for _ in range(size)]
+
+
+def test_combined_scanner_matches_the_per_pattern_scan() -> None:
+    assert {match.kind for sample in SAMPLES.values() for match in find_secrets(sample)} == set(SAMPLES)
+    mixed = [f"before {sample} after {other}" for sample in SAMPLES.values() for other in SAMPLES.values()]
+    tricky = [
+        "ghp_short, AKIA lowercase akia" + "B" * 16,
+        "mfa." + "x" * 45,
+        "version 1.234567.89 and a.bcdefg.h",
+        "https://discordapp.com/api/webhooks/" + "2" * 19 + "/" + "Z" * 40 + " and AIza" + "x" * 34,
+    ]
+    for text in [*SAMPLES.values(), *mixed, *tricky, *_corpus(200)]:
+        assert find_secrets(text) == _reference_find_secrets(text), text
+
+
+def test_prefilter_rejects_clean_chat_and_keeps_every_detector() -> None:
+    assert not any(may_contain_secret(text) for text in _corpus(500))
+    assert all(may_contain_secret(f"note: {sample} ok") for sample in SAMPLES.values())
+    assert may_contain_secret("mfa." + "x" * 45)
+
+
+def test_listener_reads_settings_once_until_a_setter_invalidates_them() -> None:
+    async def check() -> None:
+        stored = {
+            "enabled": True,
+            "monitored_bot_ids": [],
+            "ignored_channel_ids": [5],
+            "ignored_role_ids": [9],
+            "disabled_kinds": [],
+            "scan_attachments": False,
+        }
+        reads = AsyncMock(side_effect=lambda: dict(stored))
+        cog = object.__new__(SecretSentinel)
+        cog.config = SimpleNamespace(guild=lambda guild: SimpleNamespace(all=reads))
+        cog._handled = set()
+        cog._settings_cache = {}
+        cog._settings_versions = {}
+        guild = SimpleNamespace(id=1)
+
+        for message_id in range(20):
+            author = SimpleNamespace(bot=False, id=3, roles=[SimpleNamespace(id=2)])
+            message = SimpleNamespace(
+                id=message_id,
+                guild=guild,
+                author=author,
+                channel=SimpleNamespace(id=4),
+                content=CHAT[message_id % len(CHAT)],
+                attachments=[],
+            )
+            await cog.on_message(message)
+        assert reads.await_count == 1
+        assert cog._handled == set()
+
+        settings = await cog._get_guild_settings(guild)
+        assert settings["ignored_channel_ids"] == frozenset({5})
+        cog._invalidate_settings_cache(guild.id)
+        await cog._get_guild_settings(guild)
+        assert reads.await_count == 2
+
+    asyncio.run(check())
@@ -0,0 +1,221 @@
+"""Per-suggestion vote state with batched writes and message edits for SuggestionBox."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+
+from suggestionbox.suggestionbox import SuggestionBox
+
+
+class FakeSuggestions:
+    """Suggestions group that returns copies on read, supports ``async with``, and counts full reads and record writes."""
+
+    def __init__(self, stored: dict) -> None:
+        self.stored = stored
+        self.full_reads = 0
+        self.writes: list[str] = []
+
+    def __call__(self) -> FakeSuggestions:
+        return self
+
+    def __await__(self):
+        async def read() -> dict:
+            self.full_reads += 1
+            await asyncio.sleep(0)
+            return copy.deepcopy(self.stored)
+
+        return read().__await__()
+
+    async def __aenter__(self) -> dict:
+        return self.stored
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    async def get_raw(self, key: str, default=None):
+        await asyncio.sleep(0)
+        return copy.deepcopy(self.stored.get(key, default))
+
+    async def set_raw(self, key: str, value) -> None:
+        self.writes.append(key)
+        self.stored[key] = copy.deepcopy(value)
+
+
+def _value(result):
+    async def read():
+        # Yield like a storage read would, so concurrent votes genuinely interleave.
+        await asyncio.sleep(0)
+        return result
+
+    return read
+
+
+def _record(suggestion_id: int, message_id: int) -> dict:
+    return {
+        "id": suggestion_id,
+        "author_id": 1,
+        "text": f"Suggestion {suggestion_id}",
+        "status": "open",
+        "channel_id": 50,
+        "message_id": message_id,
+        "created_at": 0,
+        "upvotes": [],
+        "downvotes": [],
+    }
+
+
+def _setup(interval: float = 0.2) -> tuple[SuggestionBox, FakeSuggestions, SimpleNamespace, dict[int, list]]:
+    suggestions = FakeSuggestions({"1": _record(1, 500), "2": _record(2, 501)})
+    guild_conf = SimpleNamespace(
+        enabled=_value(True),
+        allow_downvotes=_value(True),
+        allow_self_vote=_value(False),
+        embed_color=_value(SuggestionBox.DEFAULT_COLOR),
+        anonymous=_value(False),
+        suggestions=suggestions,
+    )
+    edits: dict[int, list] = {500: [], 501: []}
+    channel = MagicMock(spec=discord.TextChannel)
+
+    def partial(message_id: int) -> SimpleNamespace:
+        async def edit(**kwargs):
+            await asyncio.sleep(0.01)
+            edits[message_id].append(kwargs["embed"])
+
+        return SimpleNamespace(id=message_id, edit=edit)
+
+    channel.get_partial_message.side_effect = partial
+    guild = SimpleNamespace(id=1, name="Guild", icon=None, get_channel=lambda channel_id: channel)
+    cog = object.__new__(SuggestionBox)
+    cog.config = SimpleNamespace(guild=lambda guild: guild_conf, guild_from_id=lambda guild_id: guild_conf)
+    cog._locks, cog._message_keys, cog._votes = {}, {}, {}
+    cog._vote_view = None
+    cog.VOTE_SYNC_INTERVAL = interval
+    return cog, suggestions, guild, edits
+
+
+class Response:
+    """Interaction response that records the ephemeral replies it was asked to send."""
+
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    async def send_message(self, content: str, **kwargs) -> None:
+        self.sent.append(content)
+
+
+def _interaction(guild: SimpleNamespace, message_id: int, user_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        guild=guild,
+        message=SimpleNamespace(id=message_id),
+        user=SimpleNamespace(id=user_id, bot=False),
+        response=Response(),
+    )
+
+
+def _votes_field(embed: discord.Embed) -> str:
+    return next(embed_field.value for embed_field in embed.fields if embed_field.name == "Votes")
+
+
+async def _settle() -> None:
+    await asyncio.gather(*(asyncio.all_tasks() - {asyncio.current_task()}))
+
+
+def test_thousand_concurrent_votes_are_counted_with_batched_writes_and_edits() -> None:
+    async def check() -> None:
+        cog, suggestions, guild, edits = _setup()
+        interactions = [(_interaction(guild, 500, user_id), "up" if user_id <= 700 else "down") for user_id in range(2, 1002)]
+        other = [(_interaction(guild, 501, user_id), "up") for user_id in range(2, 102)]
+
+        started = time.perf_counter()
+        await asyncio.gather(*(cog.handle_vote(interaction, vote) for interaction, vote in interactions + other))
+        elapsed = time.perf_counter() - started
+        await _settle()
+
+        assert all(len(interaction.response.sent) == 1 for interaction, _vote in interactions + other)
+        assert len(suggestions.stored["1"]["upvotes"]) == 699
+        assert len(suggestions.stored["1"]["downvotes"]) == 301
+        assert len(suggestions.stored["2"]["upvotes"]) == 100
+        # The index is built from one full read; afterwards each suggestion is read and written on its own.
+        assert suggestions.full_reads == 1
+        # One write and one edit per suggestion per interval, however many votes arrived in it.
+        batches = int(elapsed / cog.VOTE_SYNC_INTERVAL) + 2
+        assert suggestions.writes.count("1") <= batches and suggestions.writes.count("2") <= batches
+        assert 1 <= len(edits[500]) <= batches
+        assert "Upvotes: **699**" in _votes_field(edits[500][-1])
+        assert "Downvotes: **301**" in _votes_field(edits[500][-1])
+
+        # Toggling back and switching sides lands in the next batch, no sooner than the interval allows.
+        last_sync = cog._votes[500].last_sync
+        await cog.handle_vote(_interaction(guild, 500, 2), "up")
+        await cog.handle_vote(_interaction(guild, 500, 1001), "up")
+        await _settle()
+        assert cog._votes[500].last_sync - last_sync >= cog.VOTE_SYNC_INTERVAL
+        assert "Upvotes: **699**" in _votes_field(edits[500][-1])
+        assert "Downvotes: **300**" in _votes_field(edits[500][-1])
+        assert "2" not in suggestions.stored["1"]["upvotes"]
+
+        author = _interaction(guild, 500, 1)
+        await cog.handle_vote(author, "up")
+        assert author.response.sent == ["You cannot vote on your own suggestion."]
+
+    asyncio.run(check())
+
+
+def test_pending_votes_are_flushed_on_unload_and_never_recreate_deleted_records() -> None:
+    async def check() -> None:
+        cog, suggestions, guild, edits = _setup(interval=60)
+        await cog.handle_vote(_interaction(guild, 500, 2), "up")
+        await cog.handle_vote(_interaction(guild, 501, 2), "up")
+        await _settle()
+        assert suggestions.stored["1"]["upvotes"] == ["2"]
+
+        # Both land inside the interval, so they wait for the next batch.
+        await cog.handle_vote(_interaction(guild, 500, 3), "up")
+        await cog.handle_vote(_interaction(guild, 501, 3), "down")
+        del suggestions.stored["2"]
+        await cog.cog_unload()
+
+        assert suggestions.stored["1"]["upvotes"] == ["2", "3"]
+        assert "2" not in suggestions.stored
+        assert 501 not in cog._votes
+        assert len(edits[500]) == 1
+
+    asyncio.run(check())
+
+
+def test_closing_or_deleting_a_suggestion_flushes_and_drops_its_vote_state() -> None:
+    async def check() -> None:
+        cog, suggestions, guild, _edits = _setup(interval=60)
+        cog.bot = SimpleNamespace(dispatch=MagicMock())
+        cog.config.guild(guild).all = _value({})
+        cog._sync_suggestion_message = AsyncMock()
+        cog._send_review_log = AsyncMock()
+        cog._send_thread_notice = AsyncMock()
+        cog._fetch_suggestion_message = AsyncMock(return_value=None)
+        ctx = SimpleNamespace(guild=guild, author=SimpleNamespace(id=9), send=AsyncMock())
+        await cog.handle_vote(_interaction(guild, 500, 2), "up")
+        await cog.handle_vote(_interaction(guild, 501, 2), "up")
+        await _settle()
+
+        # The second vote is still waiting for its batch when the suggestion is approved.
+        await cog.handle_vote(_interaction(guild, 500, 3), "up")
+        await SuggestionBox.suggestions_approve.callback(cog, ctx, 1)
+        assert suggestions.stored["1"]["status"] == "approved"
+        assert suggestions.stored["1"]["upvotes"] == ["2", "3"]
+        assert cog._sync_suggestion_message.await_args.args[1]["upvotes"] == ["2", "3"]
+        assert 500 not in cog._votes
+
+        await cog.handle_vote(_interaction(guild, 501, 3), "up")
+        await SuggestionBox.suggestions_delete.callback(cog, ctx, 2)
+        await _settle()
+        assert "2" not in suggestions.stored
+        assert cog._votes == {}
+
+    asyncio.run(check())
@@ -0,0 +1,225 @@
+"""Warm pool of standby channels for TempVoice join-to-create."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+
+from tempvoice.tempvoice import TempVoice
+
+
+class FakeValue:
+    """Config value that returns copies on read and supports the context manager and raw access."""
+
+    def __init__(self, stored) -> None:
+        self.stored = stored
+
+    def __call__(self) -> FakeValue:
+        return self
+
+    def __await__(self):
+        async def read():
+            return copy.deepcopy(self.stored)
+
+        return read().__await__()
+
+    async def __aenter__(self):
+        return self.stored
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    async def get_raw(self, key: str, default=None):
+        return copy.deepcopy(self.stored.get(key, default))
+
+    async def set(self, value) -> None:
+        self.stored = copy.deepcopy(value)
+
+
+class Member:
+    def __init__(self, member_id: int, guild: SimpleNamespace) -> None:
+        self.id = member_id
+        self.bot = False
+        self.name = self.display_name = f"member{member_id}"
+        self.guild = guild
+        self.move_to = AsyncMock()
+
+
+class Server:
+    """Guild with a hub category that records channel creations, edits, and deletions."""
+
+    def __init__(self) -> None:
+        self.channels: dict[int, MagicMock] = {}
+        self.created: list[str] = []
+        self.edited: list[int] = []
+        self.deleted: list[int] = []
+        self.next_id = 1000
+        self.category = MagicMock(spec=discord.CategoryChannel)
+        self.category.id = 30
+        self.category.create_voice_channel = self.create_voice_channel
+        self.trigger = MagicMock(spec=discord.VoiceChannel)
+        self.trigger.id = 1
+        self.trigger.overwrites = {}
+        self.trigger.category = self.category
+        self.channels.update({1: self.trigger, 30: self.category})
+        self.guild = SimpleNamespace(id=1, name="Guild", default_role=object(), me=object(), get_channel=self.channels.get)
+
+    def voice_channel(self, name: str) -> MagicMock:
+        channel = MagicMock(spec=discord.VoiceChannel)
+        channel.id, channel.name, channel.category_id, channel.members = self.next_id, name, 30, []
+        self.next_id += 1
+
+        async def edit(**kwargs):
+            await asyncio.sleep(0.005)
+            channel.name = kwargs["name"]
+            self.edited.append(channel.id)
+
+        async def delete(**kwargs):
+            self.deleted.append(channel.id)
+            del self.channels[channel.id]
+
+        channel.edit, channel.delete = edit, delete
+        self.channels[channel.id] = channel
+        return channel
+
+    async def create_voice_channel(self, *, name: str, overwrites: dict, reason: str, user_limit: int = 0):
+        await asyncio.sleep(0.02)
+        self.created.append(name)
+        return self.voice_channel(name)
+
+
+def _cog(server: Server, pool_size: int, warm_ids: list[int]) -> tuple[TempVoice, SimpleNamespace]:
+    settings = {
+        "enabled": True,
+        "join_channel_id": 1,
+        "category_id": None,
+        "panel_channel_id": None,
+        "channel_name_template": TempVoice.DEFAULT_TEMPLATE,
+        "default_user_limit": 0,
+        "auto_delete_delay": 3,
+        "clone_trigger_permissions": True,
+    }
+    guild_conf = SimpleNamespace(
+        **{key: FakeValue(value) for key, value in settings.items()},
+        warm_pool_size=FakeValue(pool_size),
+        warm_channels=FakeValue(warm_ids),
+        temp_channels=FakeValue({}),
+    )
+
+    async def all_settings() -> dict:
+        return {key: copy.deepcopy(value.stored) for key, value in vars(guild_conf).items() if key != "all"}
+
+    async def all_guilds() -> dict:
+        return {1: await all_settings()}
+
+    guild_conf.all = all_settings
+    cog = object.__new__(TempVoice)
+    cog.config = SimpleNamespace(guild=lambda guild: guild_conf, all_guilds=all_guilds)
+    cog.bot = SimpleNamespace(wait_until_ready=AsyncMock(), get_guild={1: server.guild}.get)
+    cog._locks, cog._refill_tasks, cog._warm_stats = {}, {}, {}
+    cog._cleanup_heap, cog._cleanup_due = [], {}
+    cog._reaper_task = cog._startup_task = None
+    cog._send_control_panel = AsyncMock(return_value=None)
+    cog.WARM_POOL_REFILL_INTERVAL = 60
+    return cog, guild_conf
+
+
+def _warm_pool_field(cog: TempVoice, guild: SimpleNamespace, settings: dict) -> str:
+    embed = cog._settings_embed(guild, settings)
+    return next(embed_field.value for embed_field in embed.fields if embed_field.name == "Warm Pool")
+
+
+def test_joins_take_standby_channels_and_fall_back_to_creation_when_the_pool_is_empty() -> None:
+    async def check() -> None:
+        server = Server()
+        standby = [server.voice_channel(TempVoice.WARM_CHANNEL_NAME).id for _ in range(3)]
+        cog, guild_conf = _cog(server, 3, list(standby))
+        members = [Member(member_id, server.guild) for member_id in range(1, 6)]
+
+        for member in members[:3]:
+            await cog._create_temp_channel_for(member, server.trigger)
+        assert server.edited == standby
+        for member, channel_id in zip(members, standby):
+            assert server.channels[channel_id].name == f"member{member.id}'s channel"
+            member.move_to.assert_awaited_once_with(server.channels[channel_id], reason="TempVoice channel created.")
+            assert guild_conf.temp_channels.stored[str(channel_id)]["owner_id"] == member.id
+
+        # One refill runs in the background, then waits out the refill interval before the next.
+        await asyncio.sleep(0.05)
+        assert server.created == [TempVoice.WARM_CHANNEL_NAME]
+        assert len(guild_conf.warm_channels.stored) == 1
+
+        await cog._create_temp_channel_for(members[3], server.trigger)
+        assert guild_conf.warm_channels.stored == []
+        await cog._create_temp_channel_for(members[4], server.trigger)
+        assert server.created == [TempVoice.WARM_CHANNEL_NAME, "member5's channel"]
+        assert len(guild_conf.temp_channels.stored) == 5
+
+        assert _warm_pool_field(cog, server.guild, await guild_conf.all()) == "0/3 ready, 80% hit rate (4 of 5 joins)"
+        await cog.cog_unload()
+        assert cog._refill_tasks == {}
+
+    asyncio.run(check())
+
+
+def test_startup_prunes_missing_standby_channels_and_resizing_deletes_the_surplus() -> None:
+    async def check() -> None:
+        server = Server()
+        standby = [server.voice_channel(TempVoice.WARM_CHANNEL_NAME).id for _ in range(3)]
+        cog, guild_conf = _cog(server, 3, [*standby, 999])
+        cog.WARM_POOL_REFILL_INTERVAL = 0
+
+        await cog._startup_cleanup()
+        assert guild_conf.warm_channels.stored == standby
+        await asyncio.gather(*cog._refill_tasks.values())
+        assert server.created == []
+
+        ctx = SimpleNamespace(guild=server.guild, author=SimpleNamespace(id=5), send=AsyncMock())
+        await TempVoice.tempvoice_warmpool.callback(cog, ctx, TempVoice.MAX_WARM_POOL + 1)
+        assert guild_conf.warm_pool_size.stored == 3
+
+        await TempVoice.tempvoice_warmpool.callback(cog, ctx, 1)
+        assert server.deleted == standby[1:]
+        assert guild_conf.warm_channels.stored == standby[:1]
+
+        await TempVoice.tempvoice_warmpool.callback(cog, ctx, 2)
+        await asyncio.gather(*cog._refill_tasks.values())
+        assert server.created == [TempVoice.WARM_CHANNEL_NAME]
+        assert len(guild_conf.warm_channels.stored) == 2
+
+        await TempVoice.tempvoice_warmpool.callback(cog, ctx, 0)
+        assert guild_conf.warm_channels.stored == []
+        assert server.channels.keys() == {1, 30}
+        assert _warm_pool_field(cog, server.guild, await guild_conf.all()) == "Off"
+
+    asyncio.run(check())
+
+
+def test_refill_outlives_unexpected_errors_and_restarts_when_tempvoice_is_enabled() -> None:
+    async def check() -> None:
+        server = Server()
+        cog, guild_conf = _cog(server, 2, [])
+        cog.WARM_POOL_REFILL_INTERVAL = 0
+        guild_conf.enabled.stored = False
+        failures = [RuntimeError("storage hiccup")]
+
+        async def create_voice_channel(**kwargs):
+            if failures:
+                raise failures.pop()
+            return await server.create_voice_channel(**kwargs)
+
+        server.category.create_voice_channel = create_voice_channel
+        ctx = SimpleNamespace(guild=server.guild, author=SimpleNamespace(id=5), send=AsyncMock())
+        await TempVoice.tempvoice_enable.callback(cog, ctx)
+        await asyncio.gather(*cog._refill_tasks.values())
+
+        assert guild_conf.enabled.stored is True
+        assert failures == []
+        assert server.created == [TempVoice.WARM_CHANNEL_NAME] * 2
+        assert len(guild_conf.warm_channels.stored) == 2
+
+    asyncio.run(check())
@@ -0,0 +1,153 @@
+"""Single deadline queue for TempVoice empty-channel cleanup."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+
+from tempvoice.tempvoice import TempVoice
+
+
+class FakeRecords:
+    """temp_channels value that returns copies on read and counts whole-map reads and writes."""
+
+    def __init__(self, stored: dict) -> None:
+        self.stored = stored
+        self.reads = 0
+        self.writes = 0
+
+    def __call__(self) -> FakeRecords:
+        return self
+
+    def __await__(self):
+        async def read() -> dict:
+            self.reads += 1
+            return copy.deepcopy(self.stored)
+
+        return read().__await__()
+
+    async def __aenter__(self) -> dict:
+        return self.stored
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.writes += 1
+
+    async def get_raw(self, key: str, default=None):
+        return copy.deepcopy(self.stored.get(key, default))
+
+
+class Deletions:
+    """Records channel deletions and how many ran at once."""
+
+    def __init__(self) -> None:
+        self.deleted: list[int] = []
+        self.active = 0
+        self.peak = 0
+
+    def channel(self, channel_id: int, members: list) -> MagicMock:
+        channel = MagicMock(spec=discord.VoiceChannel)
+        channel.id = channel_id
+        channel.members = members
+
+        async def delete(**kwargs):
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.02)
+            self.active -= 1
+            self.deleted.append(channel_id)
+
+        channel.delete = delete
+        return channel
+
+
+def _cog(guilds: dict[int, SimpleNamespace], records: dict[int, FakeRecords]) -> TempVoice:
+    cog = object.__new__(TempVoice)
+    cog.bot = SimpleNamespace(get_guild=guilds.get, cog_disabled_in_guild=AsyncMock(return_value=False))
+    cog.config = SimpleNamespace(
+        guild=lambda guild: SimpleNamespace(
+            temp_channels=records[guild.id],
+            auto_delete_delay=AsyncMock(return_value=0),
+            join_channel_id=AsyncMock(return_value=1),
+            enabled=AsyncMock(return_value=True),
+        )
+    )
+    cog._cleanup_heap, cog._cleanup_due = [], {}
+    cog._cleanup_changed = asyncio.Event()
+    cog._delete_budget = asyncio.Semaphore(TempVoice.DELETE_CONCURRENCY)
+    return cog
+
+
+def test_due_channels_are_deleted_in_parallel_with_one_record_write_per_guild() -> None:
+    async def check() -> None:
+        deletions = Deletions()
+        human = SimpleNamespace(bot=False)
+        channels: dict[int, dict[int, MagicMock]] = {}
+        records: dict[int, FakeRecords] = {}
+        for guild_id in (1, 2):
+            channel_ids = range(guild_id * 100, guild_id * 100 + 20)
+            channels[guild_id] = {channel_id: deletions.channel(channel_id, []) for channel_id in channel_ids}
+            records[guild_id] = FakeRecords({str(channel_id): {"channel_id": channel_id} for channel_id in channel_ids})
+        # Someone rejoined 101 before its deadline, 102 was deleted by hand, and 103 was cancelled.
+        channels[1][101].members = [human]
+        del channels[1][102]
+        guilds = {
+            guild_id: SimpleNamespace(
+                id=guild_id, get_channel=lambda channel_id, guild_id=guild_id: channels[guild_id].get(channel_id)
+            )
+            for guild_id in (1, 2)
+        }
+        cog = _cog(guilds, records)
+        for guild_id in (1, 2):
+            for channel_id in range(guild_id * 100, guild_id * 100 + 20):
+                cog._schedule_cleanup(guild_id, channel_id, 0)
+        cog._cancel_cleanup(103)
+        # Rescheduling replaces the earlier deadline instead of adding a second timer.
+        cog._schedule_cleanup(2, 219, 60)
+
+        reaper = asyncio.create_task(cog._run_reaper())
+        try:
+            await asyncio.sleep(0.3)
+        finally:
+            reaper.cancel()
+
+        expected = {channel_id for guild_id in (1, 2) for channel_id in range(guild_id * 100, guild_id * 100 + 20)}
+        assert set(deletions.deleted) == expected - {101, 102, 103, 219}
+        assert deletions.peak == TempVoice.DELETE_CONCURRENCY
+        assert records[1].writes == 1 and records[2].writes == 1
+        assert set(records[1].stored) == {"101", "103"}
+        assert set(records[2].stored) == {"219"}
+        assert cog._pending_cleanups(2) == 1 and cog._pending_cleanups(1) == 0
+
+        embed = cog._settings_embed(guilds[2], {"temp_channels": records[2].stored})
+        fields = {embed_field.name: embed_field.value for embed_field in embed.fields}
+        assert fields["Active Channels"] == "1"
+        assert fields["Pending Deletions"] == "1"
+
+    asyncio.run(check())
+
+
+def test_voice_state_changes_queue_and_cancel_without_reading_every_record() -> None:
+    async def check() -> None:
+        deletions = Deletions()
+        member = SimpleNamespace(id=7, bot=False)
+        temp = deletions.channel(500, [])
+        other = deletions.channel(9000, [])
+        guild = SimpleNamespace(id=1, get_channel={500: temp, 9000: other}.get)
+        temp.guild = other.guild = guild
+        member.guild = guild
+        records = {1: FakeRecords({str(channel_id): {"channel_id": channel_id} for channel_id in range(500, 5500)})}
+        cog = _cog({1: guild}, records)
+
+        await cog.on_voice_state_update(member, SimpleNamespace(channel=temp), SimpleNamespace(channel=other))
+        assert set(cog._cleanup_due) == {500}
+        await cog.on_voice_state_update(member, SimpleNamespace(channel=other), SimpleNamespace(channel=temp))
+        assert cog._cleanup_due == {}
+        assert records[1].reads == 0
+        assert len(cog._cleanup_heap) == 1  # stale, discarded when it reaches the top
+        assert cog._pop_due_cleanups() == {} and cog._cleanup_heap == []
+
+    asyncio.run(check())
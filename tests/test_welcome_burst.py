@@ -0,0 +1,142 @@
+"""Cached settings reads and join-wave batching for Welcome."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+from PIL import Image
+
+from welcome.welcome import Welcome
+
+
+def _stored_settings(**burst_mode) -> dict:
+    return {
+        "enabled": True,
+        "include_bots": False,
+        "channel_id": 50,
+        "message_template": "Welcome {member.mention}!",
+        "embed_json": "",
+        "image": Welcome._empty_image_data(),
+        "image_mode": "embed",
+        "avatar_overlay": Welcome._default_avatar_overlay(),
+        "burst_mode": {**Welcome._default_burst_mode(), **burst_mode},
+    }
+
+
+def _cog(stored: dict) -> Welcome:
+    cog = object.__new__(Welcome)
+    cog.bot = SimpleNamespace(cog_disabled_in_guild=AsyncMock(return_value=False))
+    cog.config = SimpleNamespace(guild=lambda guild: SimpleNamespace(all=AsyncMock(return_value=stored)))
+    cog._settings_cache = {}
+    cog._settings_versions = {}
+    cog._recent_joins = {}
+    cog._join_waves = {}
+    cog._join_wave_tasks = {}
+    cog._send_welcome_message = AsyncMock()
+    return cog
+
+
+def _guild(channel: MagicMock, members: dict[int, SimpleNamespace]) -> SimpleNamespace:
+    channel.guild = SimpleNamespace(
+        id=1,
+        name="Test Server",
+        me=object(),
+        get_channel=lambda channel_id: channel if channel_id == 50 else None,
+        get_member=members.get,
+    )
+    return channel.guild
+
+
+def _channel() -> MagicMock:
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.send = AsyncMock()
+    channel.permissions_for.return_value = SimpleNamespace(send_messages=True, attach_files=True, embed_links=True)
+    return channel
+
+
+def _join(guild: SimpleNamespace, members: dict[int, SimpleNamespace], member_id: int) -> SimpleNamespace:
+    member = SimpleNamespace(id=member_id, guild=guild, bot=False, mention=f"<@{member_id}>")
+    members[member_id] = member
+    return member
+
+
+def test_settings_come_from_one_cached_read_until_invalidated() -> None:
+    async def check() -> None:
+        stored = _stored_settings(threshold=5)
+        reads = AsyncMock(return_value=stored)
+        cog = _cog(stored)
+        cog.config = SimpleNamespace(guild=lambda guild: SimpleNamespace(all=reads))
+        guild = SimpleNamespace(id=1)
+
+        first = await cog._get_guild_settings(guild)
+        await cog._get_guild_settings(guild)
+        assert reads.await_count == 1
+        assert first["burst_mode"] == {"threshold": 5, "window": 10, "collage": False}
+
+        cog._invalidate_settings_cache(guild.id)
+        await cog._get_guild_settings(guild)
+        assert reads.await_count == 2
+
+        async def read_during_setter() -> dict:
+            cog._invalidate_settings_cache(guild.id)
+            return stored
+
+        reads.side_effect = read_during_setter
+        cog._invalidate_settings_cache(guild.id)
+        await cog._get_guild_settings(guild)
+        assert guild.id not in cog._settings_cache
+
+    asyncio.run(check())
+
+
+def test_joins_above_the_rate_are_greeted_in_one_message() -> None:
+    async def check() -> None:
+        cog = _cog(_stored_settings(threshold=3))
+        channel, members = _channel(), {}
+        guild = _guild(channel, members)
+        await cog._get_guild_settings(guild)
+        cog._settings_cache[guild.id]["burst_mode"]["window"] = 0.05
+
+        for member_id in range(100, 110):
+            await cog.on_member_join(_join(guild, members, member_id))
+        members.pop(109)
+        await asyncio.sleep(0.1)
+
+        assert cog._send_welcome_message.await_count == 3
+        channel.send.assert_awaited_once()
+        content = channel.send.await_args.kwargs["content"]
+        assert content == f"Welcome {', '.join(f'<@{member_id}>' for member_id in range(103, 109))} to **Test Server**!"
+        assert "file" not in channel.send.await_args.kwargs
+        assert cog._join_waves == {}
+        assert cog._join_wave_tasks == {}
+
+    asyncio.run(check())
+
+
+def test_join_wave_collage_tiles_member_avatars() -> None:
+    async def check() -> None:
+        cog = _cog(_stored_settings(threshold=1, collage=True))
+        avatar = io.BytesIO()
+        Image.new("RGB", (64, 64), (10, 200, 90)).save(avatar, format="PNG")
+        cog._download_member_avatar = AsyncMock(return_value=avatar.getvalue())
+        channel, members = _channel(), {}
+        guild = _guild(channel, members)
+        await cog._get_guild_settings(guild)
+        cog._settings_cache[guild.id]["burst_mode"]["window"] = 0.05
+
+        for member_id in range(200, 209):
+            await cog.on_member_join(_join(guild, members, member_id))
+        await asyncio.sleep(0.1)
+
+        file = channel.send.await_args.kwargs["file"]
+        collage = Image.open(file.fp)
+        assert file.filename == "welcome-wave.png"
+        assert collage.size == (6 * 96, 2 * 96)
+        assert collage.getpixel((10, 10))[:3] == (10, 200, 90)
+        assert cog._download_member_avatar.await_count == 8
+
+    asyncio.run(check())
@@ -0,0 +1,150 @@
+"""Cached, off-loop welcome image rendering."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import io
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from PIL import Image, ImageDraw
+
+from welcome import imaging
+from welcome.welcome import Welcome
+
+OVERLAY = {"enabled": True, "x_percent": 82.0, "y_percent": 52.0, "size_percent": 17.0}
+
+
+def _image_bytes(size: tuple[int, int], image_format: str, color: tuple[int, int, int] = (40, 90, 160)) -> bytes:
+    image = Image.new("RGB", size, color)
+    draw = ImageDraw.Draw(image)
+    for x in range(0, size[0], 8):
+        draw.line((x, 0, x, size[1]), fill=(x % 256, 120, 255 - x % 256))
+    buffer = io.BytesIO()
+    image.save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+def _image_data(data: bytes, filename: str = "banner.png") -> dict[str, str]:
+    return {
+        "source_url": "https://example.com/banner.png",
+        "filename": filename,
+        "content_type": "image/png",
+        "data_base64": base64.b64encode(data).decode("ascii"),
+    }
+
+
+def _cog(avatar: bytes) -> Welcome:
+    cog = object.__new__(Welcome)
+    cog._backgrounds = {}
+    cog._background_locks = {}
+    cog._background_digests = {}
+    cog._settings_cache = {}
+    cog._settings_versions = {}
+    cog._download_member_avatar = AsyncMock(return_value=avatar)
+    return cog
+
+
+def _member(member_id: int) -> SimpleNamespace:
+    return SimpleNamespace(id=member_id, guild=SimpleNamespace(id=1))
+
+
+def test_background_is_prepared_once_until_settings_change() -> None:
+    async def check() -> None:
+        avatar = io.BytesIO()
+        Image.new("RGB", (256, 256), (200, 40, 40)).save(avatar, format="PNG")
+        image_data = _image_data(_image_bytes((640, 360), "PNG"))
+        cog = _cog(avatar.getvalue())
+
+        with patch("welcome.welcome.prepare_background", wraps=imaging.prepare_background) as prepare:
+            files = await asyncio.gather(*(cog._build_image_file(image_data, _member(index), OVERLAY) for index in range(5)))
+            assert prepare.call_count == 1
+            await cog._build_image_file(image_data, _member(9), {**OVERLAY, "size_percent": 30.0})
+            assert prepare.call_count == 2
+            cog._invalidate_image_cache(1)
+            await cog._build_image_file(image_data, _member(9), OVERLAY)
+            assert prepare.call_count == 3
+
+        assert {file.filename for file in files} == {"banner-avatar.png"}
+        rendered = Image.open(files[0].fp)
+        left, top, diameter = cog._backgrounds[1].box
+        assert rendered.size == (640, 360)
+        assert rendered.getpixel((left + diameter // 2, top + diameter // 2))[:3] == (200, 40, 40)
+
+    asyncio.run(check())
+
+
+def test_backgrounds_sharing_a_size_and_header_are_not_confused() -> None:
+    async def check() -> None:
+        cog = _cog(_image_bytes((64, 64), "PNG"))
+        first = _image_bytes((320, 180), "PNG", (10, 200, 10))
+        second = first[:-64] + bytes(64)
+        assert len(first) == len(second) and first[:48] == second[:48]
+
+        await cog._build_image_file(_image_data(first), _member(1), {**OVERLAY, "enabled": False})
+        file = await cog._build_image_file(_image_data(second), _member(2), {**OVERLAY, "enabled": False})
+
+        assert file.fp.read() == second
+        assert cog._backgrounds[1].data == second
+
+    asyncio.run(check())
+
+
+def test_disabled_overlay_reuses_the_stored_bytes_without_decoding() -> None:
+    async def check() -> None:
+        stored = _image_bytes((64, 64), "PNG")
+        cog = _cog(b"")
+
+        file = await cog._build_image_file(_image_data(stored), _member(1), {**OVERLAY, "enabled": False})
+
+        assert file.fp.read() == stored
+        assert cog._backgrounds[1].base is None
+        cog._download_member_avatar.assert_not_awaited()
+
+    asyncio.run(check())
+
+
+def test_broken_background_falls_back_to_the_plain_file_once() -> None:
+    async def check() -> None:
+        cog = _cog(b"")
+        image_data = _image_data(b"not an image")
+
+        with patch("welcome.welcome.prepare_background", wraps=imaging.prepare_background) as prepare:
+            first = await cog._build_image_file(image_data, _member(1), OVERLAY)
+            second = await cog._build_image_file(image_data, _member(2), OVERLAY)
+
+        assert prepare.call_count == 1
+        assert first.fp.read() == second.fp.read() == b"not an image"
+
+    asyncio.run(check())
+
+
+def test_large_photographic_backgrounds_are_encoded_once_as_jpeg() -> None:
+    data = _image_bytes((2200, 2200), "JPEG")
+    prepared = imaging.prepare_background((), data, "photo.jpg", OVERLAY)
+    avatar = _image_bytes((128, 128), "PNG")
+
+    with patch.object(imaging, "_encode_jpeg", wraps=imaging._encode_jpeg) as encode_jpeg:
+        rendered, filename = imaging.compose_avatar(prepared, avatar)
+
+    assert imaging.estimate_png_size(prepared) > imaging.IMAGE_SIZE_LIMIT
+    assert filename == "photo-avatar.jpg"
+    encode_jpeg.assert_called_once()
+    assert Image.open(io.BytesIO(rendered)).format == "JPEG"
+
+
+def test_one_hundred_joins_share_one_prepared_background() -> None:
+    async def check() -> None:
+        avatar = _image_bytes((512, 512), "PNG", (220, 180, 30))
+        image_data = _image_data(_image_bytes((1280, 720), "PNG"))
+        cog = _cog(avatar)
+
+        with patch("welcome.welcome.prepare_background", wraps=imaging.prepare_background) as prepare:
+            files = await asyncio.gather(*(cog._build_image_file(image_data, _member(index), OVERLAY) for index in range(100)))
+
+        assert prepare.call_count == 1
+        assert len(files) == 100
+        assert all(file.filename == "banner-avatar.png" for file in files)
+
+    asyncio.run(check())
@@ -266,12 +266,14 @@ class DashboardIntegration:
 
         elif action == "clear_image":
             await self.config.guild(guild).image.set(self._empty_image_data())
+            self._invalidate_image_cache(guild.id)
             messages.append(
                 {"message": "Cached welcome image cleared.", "category": "success"},
             )
 
         elif action == "clear_embed":
             await self.config.guild(guild).embed_json.set("")
+            self._invalidate_settings_cache(guild.id)
             messages.append(
                 {"message": "Welcome embed JSON cleared.", "category": "success"},
             )
@@ -280,6 +282,7 @@ class DashboardIntegration:
             await self.config.guild(guild).avatar_overlay.set(
                 self._default_avatar_overlay(),
             )
+            self._invalidate_image_cache(guild.id)
             messages.append(
                 {"message": "Avatar overlay reset to defaults.", "category": "success"},
             )
@@ -325,9 +328,9 @@ class DashboardIntegration:
         if image_mode not in {"embed", "attachment"}:
             raise commands.BadArgument("Image mode must be `embed` or `attachment`.")
 
-        current_overlay = self._normalize_avatar_overlay(
-            await self.config.guild(guild).avatar_overlay(),
-        )
+        settings = await self._get_guild_settings(guild)
+        current_overlay = settings["avatar_overlay"]
+        current_burst = settings["burst_mode"]
         avatar_overlay = {
             "enabled": self._dash_bool(form_data, "avatar_overlay_enabled"),
             "x_percent": self._validate_percentage(
@@ -362,6 +365,24 @@ class DashboardIntegration:
             ),
         }
 
+        burst_threshold = self._validate_percentage(
+            "Join-wave threshold",
+            self._dash_float(form_data, "burst_threshold", default=float(current_burst["threshold"])),
+            0.0,
+            float(self.BURST_THRESHOLD_MAX),
+        )
+        burst_window = self._validate_percentage(
+            "Join-wave window",
+            self._dash_float(form_data, "burst_window", default=float(current_burst["window"])),
+            1.0,
+            float(self.BURST_WINDOW_MAX),
+        )
+        burst_mode = {
+            "threshold": int(burst_threshold),
+            "window": int(burst_window),
+            "collage": self._dash_bool(form_data, "burst_collage"),
+        }
+
         embed_json_text = self._dash_value(form_data, "embed_json").strip()
         stored_embed = ""
         if embed_json_text:
@@ -384,6 +405,8 @@ class DashboardIntegration:
         await guild_conf.embed_json.set(stored_embed)
         await guild_conf.image_mode.set(image_mode)
         await guild_conf.avatar_overlay.set(avatar_overlay)
+        await guild_conf.burst_mode.set(burst_mode)
+        self._invalidate_image_cache(guild.id)
 
     async def _dashboard_download_image(
         self,
@@ -395,6 +418,7 @@ class DashboardIntegration:
             raise commands.BadArgument("Provide an image URL.")
         image_data = await self._download_image(url)
         await self.config.guild(guild).image.set(image_data)
+        self._invalidate_image_cache(guild.id)
         return image_data
 
     async def _dashboard_test_welcome(
@@ -528,6 +552,7 @@ class DashboardIntegration:
         embed_json_text: str,
         csrf: str,
     ) -> str:
+        burst_mode = settings.get("burst_mode") or self._default_burst_mode()
         return f"""
         <div id="settings" class="wel-card">
             <h3>Settings</h3>
@@ -542,6 +567,8 @@ class DashboardIntegration:
                         {self._checked(settings.get("include_bots"))}> Include Bots</label>
                         <label class="wel-check"><input type="checkbox" name="avatar_overlay_enabled" value="1"
                         {self._checked(avatar_overlay.get("enabled"))}> Avatar Overlay</label>
+                        <label class="wel-check"><input type="checkbox" name="burst_collage" value="1"
+                        {self._checked(burst_mode.get("collage"))}> Join-Wave Collage</label>
                     </div>
                     <div class="wel-row">
                         {self._channel_select(guild, "channel_id", "Welcome Channel", settings.get("channel_id"))}
@@ -584,6 +611,30 @@ class DashboardIntegration:
                 max_value=100,
                 step="0.1",
             )
+        }
+                </div>
+                <div class="wel-row">
+                    {
+            self._input(
+                "burst_threshold",
+                "Join-Wave Threshold (0 = off)",
+                burst_mode.get("threshold", 0),
+                "number",
+                min_value=0,
+                max_value=self.BURST_THRESHOLD_MAX,
+                step="1",
+            )
+        }
+                    {
+            self._input(
+                "burst_window",
+                "Join-Wave Window Seconds",
+                burst_mode.get("window", 10),
+                "number",
+                min_value=1,
+                max_value=self.BURST_WINDOW_MAX,
+                step="1",
+            )
         }
                 </div>
                 <div id="embed" class="wel-field">
@@ -0,0 +1,199 @@
+"""Off-loop welcome image rendering with per-guild prepared backgrounds."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+try:
+    from PIL import Image, ImageDraw, ImageOps, UnidentifiedImageError
+except ImportError:
+    Image = ImageDraw = ImageOps = None
+    UnidentifiedImageError = OSError
+
+IMAGE_SIZE_LIMIT = 8 * 1024 * 1024
+# Rough compressed PNG cost per pixel for images whose size cannot be read from the source.
+PNG_BYTES_PER_PIXEL = 1.8
+# Bytes per pixel a JPEG needs at each quality, from lowest budget to highest.
+JPEG_QUALITY_BUDGETS = ((0.0, 68), (0.35, 74), (0.45, 80), (0.6, 86), (0.9, 92))
+COLLAGE_TILE = 96
+COLLAGE_COLUMNS = 6
+
+
+class WelcomeImageError(Exception):
+    """A welcome image could not be decoded or rendered."""
+
+
+@dataclass(slots=True)
+class PreparedBackground:
+    """A decoded welcome background ready for repeated avatar composition."""
+
+    fingerprint: tuple[Any, ...]
+    filename: str
+    data: bytes
+    source_format: str | None = None
+    base: Any = None
+    mask: Any = None
+    box: tuple[int, int, int] = (0, 0, 0)
+
+
+def background_digest(data: bytes) -> str:
+    """Return a content hash of the decoded background bytes."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def background_fingerprint(image_data: dict[str, Any], avatar_overlay: dict[str, Any], digest: str) -> tuple[Any, ...]:
+    """Return an identity for the stored image content and overlay geometry."""
+    return (
+        image_data.get("source_url"),
+        image_data.get("filename"),
+        digest,
+        bool(avatar_overlay.get("enabled")),
+        float(avatar_overlay.get("x_percent", 0.0)),
+        float(avatar_overlay.get("y_percent", 0.0)),
+        float(avatar_overlay.get("size_percent", 0.0)),
+    )
+
+
+def _resampling_filter() -> Any:
+    resampling = getattr(Image, "Resampling", Image)
+    return resampling.LANCZOS
+
+
+def _open_rgba(data: bytes) -> tuple[Any, str | None]:
+    with Image.open(io.BytesIO(data)) as image:
+        with contextlib.suppress(EOFError):
+            image.seek(0)
+        source_format = image.format
+        return ImageOps.exif_transpose(image).convert("RGBA"), source_format
+
+
+def prepare_background(
+    fingerprint: tuple[Any, ...],
+    data: bytes,
+    filename: str,
+    avatar_overlay: dict[str, Any],
+) -> PreparedBackground:
+    """Decode the background and build the avatar mask once.
+
+    Without an enabled overlay the stored bytes are reused as they are.
+    """
+    prepared = PreparedBackground(fingerprint=fingerprint, filename=filename, data=data)
+    if not avatar_overlay.get("enabled"):
+        return prepared
+    if Image is None or ImageDraw is None or ImageOps is None:
+        raise WelcomeImageError("Pillow is required to render welcome avatar overlays.")
+
+    try:
+        base, source_format = _open_rgba(data)
+    except (UnidentifiedImageError, OSError) as exc:
+        raise WelcomeImageError("The welcome image could not be processed.") from exc
+
+    width, height = base.size
+    diameter = round(width * float(avatar_overlay["size_percent"]) / 100)
+    diameter = max(1, min(diameter, width, height))
+    center_x = round(width * float(avatar_overlay["x_percent"]) / 100)
+    center_y = round(height * float(avatar_overlay["y_percent"]) / 100)
+    left = max(0, min(width - diameter, center_x - diameter // 2))
+    top = max(0, min(height - diameter, center_y - diameter // 2))
+
+    mask = Image.new("L", (diameter, diameter), 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, diameter - 1, diameter - 1), fill=255)
+
+    prepared.source_format = source_format
+    prepared.base = base
+    prepared.mask = mask
+    prepared.box = (left, top, diameter)
+    return prepared
+
+
+def overlay_filename(original_filename: str, extension: str) -> str:
+    name = Path(original_filename or "welcome-image").stem
+    safe_name = re.sub(r"[^a-zA-Z0-9._-]", "-", name).strip("-") or "welcome-image"
+    return f"{safe_name[:32]}-avatar{extension}"
+
+
+def estimate_png_size(prepared: PreparedBackground) -> int:
+    """Estimate the composited PNG size from the source file and the pasted area."""
+    width, height = prepared.base.size
+    diameter = prepared.box[2]
+    avatar_bytes = int(diameter * diameter * PNG_BYTES_PER_PIXEL)
+    if prepared.source_format == "PNG":
+        return len(prepared.data) + avatar_bytes
+    return int(width * height * PNG_BYTES_PER_PIXEL) + avatar_bytes
+
+
+def jpeg_quality_for(prepared: PreparedBackground) -> int:
+    width, height = prepared.base.size
+    budget = IMAGE_SIZE_LIMIT / max(1, width * height)
+    return next(quality for threshold, quality in reversed(JPEG_QUALITY_BUDGETS) if budget >= threshold)
+
+
+def _encode_jpeg(image: Any, quality: int) -> bytes:
+    rgb_image = Image.new("RGB", image.size, (255, 255, 255))
+    rgb_image.paste(image, mask=image.getchannel("A"))
+    buffer = io.BytesIO()
+    rgb_image.save(buffer, format="JPEG", quality=quality, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def encode_composited(image: Any, prepared: PreparedBackground) -> tuple[bytes, str]:
+    """Encode once in the format the size estimate picks, with one JPEG fallback."""
+    if estimate_png_size(prepared) <= IMAGE_SIZE_LIMIT:
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        data = buffer.getvalue()
+        if len(data) <= IMAGE_SIZE_LIMIT:
+            return data, overlay_filename(prepared.filename, ".png")
+
+    quality = jpeg_quality_for(prepared)
+    data = _encode_jpeg(image, quality)
+    if len(data) > IMAGE_SIZE_LIMIT and quality > JPEG_QUALITY_BUDGETS[0][1]:
+        data = _encode_jpeg(image, JPEG_QUALITY_BUDGETS[0][1])
+    if len(data) > IMAGE_SIZE_LIMIT:
+        raise WelcomeImageError("The rendered welcome image is larger than 8 MB after adding the avatar.")
+    return data, overlay_filename(prepared.filename, ".jpg")
+
+
+def compose_avatar(prepared: PreparedBackground, avatar_data: bytes) -> tuple[bytes, str]:
+    """Paste a member avatar onto a prepared background and encode the result."""
+    try:
+        avatar, _source_format = _open_rgba(avatar_data)
+    except (UnidentifiedImageError, OSError) as exc:
+        raise WelcomeImageError("The member avatar could not be processed.") from exc
+
+    left, top, diameter = prepared.box
+    avatar = ImageOps.fit(avatar, (diameter, diameter), method=_resampling_filter())
+    image = prepared.base.copy()
+    image.paste(avatar, (left, top), prepared.mask)
+    return encode_composited(image, prepared)
+
+
+def compose_collage(avatars: list[bytes], *, tile: int = COLLAGE_TILE, columns: int = COLLAGE_COLUMNS) -> bytes:
+    """Tile member avatars into one PNG for a join-wave greeting, skipping unreadable ones."""
+    if Image is None or ImageOps is None:
+        raise WelcomeImageError("Pillow is required to render welcome collages.")
+
+    tiles = []
+    for avatar_data in avatars:
+        try:
+            avatar, _source_format = _open_rgba(avatar_data)
+        except (UnidentifiedImageError, OSError):
+            continue
+        tiles.append(ImageOps.fit(avatar, (tile, tile), method=_resampling_filter()))
+    if not tiles:
+        raise WelcomeImageError("None of the member avatars could be processed.")
+
+    columns = min(columns, len(tiles))
+    rows = -(-len(tiles) // columns)
+    collage = Image.new("RGBA", (columns * tile, rows * tile), (0, 0, 0, 0))
+    for index, avatar in enumerate(tiles):
+        collage.paste(avatar, ((index % columns) * tile, (index // columns) * tile))
+    buffer = io.BytesIO()
+    collage.save(buffer, format="PNG")
+    return buffer.getvalue()
@@ -9,6 +9,8 @@ import io
 import json
 import logging
 import re
+import time
+from collections import deque
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -18,6 +20,17 @@ from redbot.core import Config, commands
 from redbot.core.utils.chat_formatting import box, pagify
 
 from .dashboard_integration import DashboardIntegration
+from .imaging import (
+    COLLAGE_TILE,
+    IMAGE_SIZE_LIMIT,
+    PreparedBackground,
+    WelcomeImageError,
+    background_digest,
+    background_fingerprint,
+    compose_avatar,
+    compose_collage,
+    prepare_background,
+)
 from .url_safety import (
     RemoteHTTPError,
     URLSafetyError,
@@ -28,12 +41,6 @@ from .url_safety import (
 if TYPE_CHECKING:
     from datetime import datetime
 
-try:
-    from PIL import Image, ImageDraw, ImageOps, UnidentifiedImageError
-except ImportError:
-    Image = ImageDraw = ImageOps = None
-    UnidentifiedImageError = OSError
-
 log = logging.getLogger("red.taakoscogs.welcome")
 
 RECOVERABLE_EXCEPTIONS = (
@@ -47,11 +54,17 @@ RECOVERABLE_EXCEPTIONS = (
     AttributeError,
 )
 
+# Keeps a join-wave greeting well under Discord's 2000 character message limit.
+BURST_MENTION_LIMIT = 40
+BURST_COLLAGE_LIMIT = 24
+
 
 class Welcome(DashboardIntegration, commands.Cog):
     """Custom welcome messages with placeholders, JSON embeds, and cached images."""
 
-    IMAGE_SIZE_LIMIT = 8 * 1024 * 1024
+    IMAGE_SIZE_LIMIT = IMAGE_SIZE_LIMIT
+    BURST_THRESHOLD_MAX = 100
+    BURST_WINDOW_MAX = 300
     PLACEHOLDER_PATTERN = re.compile(r"\{(member|guild)\.([a-zA-Z0-9_]+)\}")
 
     MEMBER_PLACEHOLDERS: ClassVar[dict[str, str]] = {
@@ -116,7 +129,21 @@ class Welcome(DashboardIntegration, commands.Cog):
             image=self._empty_image_data(),
             image_mode="embed",
             avatar_overlay=self._default_avatar_overlay(),
+            burst_mode=self._default_burst_mode(),
         )
+        self._backgrounds: dict[int, PreparedBackground] = {}
+        self._background_locks: dict[int, asyncio.Lock] = {}
+        self._background_digests: dict[int, tuple[str, str]] = {}
+        self._settings_cache: dict[int, dict[str, Any]] = {}
+        self._settings_versions: dict[int, int] = {}
+        self._recent_joins: dict[int, deque[float]] = {}
+        self._join_waves: dict[int, list[discord.Member]] = {}
+        self._join_wave_tasks: dict[int, asyncio.Task] = {}
+
+    async def cog_unload(self) -> None:
+        """Cancel pending join-wave greetings when the cog unloads."""
+        for task in list(self._join_wave_tasks.values()):
+            task.cancel()
 
     @staticmethod
     def _empty_image_data() -> dict[str, str | None]:
@@ -168,6 +195,32 @@ class Welcome(DashboardIntegration, commands.Cog):
             )
         return overlay
 
+    @staticmethod
+    def _default_burst_mode() -> dict[str, Any]:
+        return {
+            "threshold": 0,
+            "window": 10,
+            "collage": False,
+        }
+
+    @classmethod
+    def _normalize_burst_mode(cls, raw_value: Any) -> dict[str, Any]:
+        burst_mode = cls._default_burst_mode()
+        if isinstance(raw_value, dict):
+            burst_mode.update(raw_value)
+
+        burst_mode["collage"] = bool(burst_mode.get("collage"))
+        for key, minimum, maximum in (
+            ("threshold", 0, cls.BURST_THRESHOLD_MAX),
+            ("window", 1, cls.BURST_WINDOW_MAX),
+        ):
+            try:
+                value = int(burst_mode[key])
+            except (TypeError, ValueError):
+                value = cls._default_burst_mode()[key]
+            burst_mode[key] = max(minimum, min(maximum, value))
+        return burst_mode
+
     @staticmethod
     def _validate_percentage(
         label: str,
@@ -544,8 +597,8 @@ class Welcome(DashboardIntegration, commands.Cog):
         separator = "&" if "?" in url else "?"
         return f"{url}{separator}size={normalized_size}"
 
-    async def _download_member_avatar(self, member: discord.Member) -> bytes:
-        url = self._member_avatar_url(member)
+    async def _download_member_avatar(self, member: discord.Member, size: int = 1024) -> bytes:
+        url = self._member_avatar_url(member, size)
         timeout = aiohttp.ClientTimeout(total=30)
         try:
             async with public_client_session() as session:
@@ -560,97 +613,54 @@ class Welcome(DashboardIntegration, commands.Cog):
             raise commands.CommandError(f"The member avatar could not be downloaded: {exc}") from exc
         return data
 
-    @staticmethod
-    def _resampling_filter() -> Any:
-        resampling = getattr(Image, "Resampling", Image)
-        return resampling.LANCZOS
-
-    @classmethod
-    def _avatar_overlay_filename(cls, original_filename: str, extension: str) -> str:
-        name = Path(original_filename or "welcome-image").stem
-        safe_name = re.sub(r"[^a-zA-Z0-9._-]", "-", name).strip("-") or "welcome-image"
-        return f"{safe_name[:32]}-avatar{extension}"
-
-    @classmethod
-    def _save_composited_image(
-        cls,
-        image: Any,
-        original_filename: str,
-    ) -> tuple[bytes, str]:
-        png_buffer = io.BytesIO()
-        image.save(png_buffer, format="PNG", optimize=True)
-        png_data = png_buffer.getvalue()
-        if len(png_data) <= cls.IMAGE_SIZE_LIMIT:
-            return png_data, cls._avatar_overlay_filename(original_filename, ".png")
-
-        rgb_image = Image.new("RGB", image.size, (255, 255, 255))
-        rgb_image.paste(image, mask=image.getchannel("A"))
-        for quality in (92, 86, 80, 74, 68):
-            jpeg_buffer = io.BytesIO()
-            rgb_image.save(
-                jpeg_buffer,
-                format="JPEG",
-                quality=quality,
-                optimize=True,
-                progressive=True,
-            )
-            jpeg_data = jpeg_buffer.getvalue()
-            if len(jpeg_data) <= cls.IMAGE_SIZE_LIMIT:
-                return jpeg_data, cls._avatar_overlay_filename(
-                    original_filename,
-                    ".jpg",
-                )
+    def _invalidate_settings_cache(self, guild_id: int) -> None:
+        self._settings_cache.pop(guild_id, None)
+        self._settings_versions[guild_id] = self._settings_versions.get(guild_id, 0) + 1
 
-        raise commands.CommandError(
-            "The rendered welcome image is larger than 8 MB after adding the avatar.",
-        )
+    def _invalidate_image_cache(self, guild_id: int) -> None:
+        self._invalidate_settings_cache(guild_id)
+        self._backgrounds.pop(guild_id, None)
+        self._background_digests.pop(guild_id, None)
 
-    def _compose_avatar_overlay(
+    async def _prepared_background(
         self,
-        image_data: bytes,
-        avatar_data: bytes,
-        filename: str,
+        guild_id: int,
+        image_data: dict[str, str | None],
         avatar_overlay: dict[str, Any],
-    ) -> tuple[bytes, str]:
-        if Image is None or ImageDraw is None or ImageOps is None:
-            raise commands.CommandError(
-                "Pillow is required to render welcome avatar overlays.",
-            )
-
-        try:
-            with Image.open(io.BytesIO(image_data)) as base_image:
-                with contextlib.suppress(EOFError):
-                    base_image.seek(0)
-                base = ImageOps.exif_transpose(base_image).convert("RGBA")
-
-            with Image.open(io.BytesIO(avatar_data)) as avatar_image:
-                with contextlib.suppress(EOFError):
-                    avatar_image.seek(0)
-                avatar = ImageOps.exif_transpose(avatar_image).convert("RGBA")
-        except (UnidentifiedImageError, OSError) as exc:
-            raise commands.CommandError(
-                "The welcome image or member avatar could not be processed.",
-            ) from exc
-
-        width, height = base.size
-        diameter = round(width * float(avatar_overlay["size_percent"]) / 100)
-        diameter = max(1, min(diameter, width, height))
-        center_x = round(width * float(avatar_overlay["x_percent"]) / 100)
-        center_y = round(height * float(avatar_overlay["y_percent"]) / 100)
-        left = max(0, min(width - diameter, center_x - diameter // 2))
-        top = max(0, min(height - diameter, center_y - diameter // 2))
-
-        avatar = ImageOps.fit(
-            avatar,
-            (diameter, diameter),
-            method=self._resampling_filter(),
-        )
-        mask = Image.new("L", (diameter, diameter), 0)
-        draw = ImageDraw.Draw(mask)
-        draw.ellipse((0, 0, diameter - 1, diameter - 1), fill=255)
-        base.paste(avatar, (left, top), mask)
+    ) -> PreparedBackground | None:
+        """Return the guild's decoded background, preparing it off the event loop once."""
+        encoded = image_data.get("data_base64")
+        filename = image_data.get("filename")
+        if not encoded or not filename:
+            return None
 
-        return self._save_composited_image(base, filename)
+        async with self._background_locks.setdefault(guild_id, asyncio.Lock()):
+            data = None
+            digest = self._background_digests.get(guild_id)
+            if digest is None or digest[0] != encoded:
+                # Hash the decoded image once per stored payload; later joins only compare the string.
+                data = await asyncio.to_thread(base64.b64decode, encoded)
+                digest = self._background_digests[guild_id] = (encoded, await asyncio.to_thread(background_digest, data))
+            fingerprint = background_fingerprint(image_data, avatar_overlay, digest[1])
+            prepared = self._backgrounds.get(guild_id)
+            if prepared is not None and prepared.fingerprint == fingerprint:
+                return prepared
+            if data is None:
+                data = await asyncio.to_thread(base64.b64decode, encoded)
+            try:
+                prepared = await asyncio.to_thread(
+                    prepare_background,
+                    fingerprint,
+                    data,
+                    filename,
+                    avatar_overlay,
+                )
+            except WelcomeImageError:
+                log.exception("Failed to prepare the welcome image overlay in guild %s", guild_id)
+                # Cache the plain image so every join does not retry a broken background.
+                prepared = PreparedBackground(fingerprint=fingerprint, filename=filename, data=data)
+            self._backgrounds[guild_id] = prepared
+        return prepared
 
     def _deserialize_embed_json(self, raw_value: Any) -> dict[str, Any] | None:
         if not raw_value:
@@ -676,24 +686,31 @@ class Welcome(DashboardIntegration, commands.Cog):
             return None
 
     async def _get_guild_settings(self, guild: discord.Guild) -> dict[str, Any]:
-        guild_conf = self.config.guild(guild)
-        image_data = await guild_conf.image()
+        """Return the guild settings from one Config read, cached until a setter invalidates them."""
+        cached = self._settings_cache.get(guild.id)
+        if cached is not None:
+            return dict(cached)
+
+        version = self._settings_versions.get(guild.id, 0)
+        raw = await self.config.guild(guild).all()
+        image_data = raw.get("image")
         image_data = self._empty_image_data() if not isinstance(image_data, dict) else {**self._empty_image_data(), **image_data}
 
-        avatar_overlay = self._normalize_avatar_overlay(
-            await guild_conf.avatar_overlay(),
-        )
-
-        return {
-            "enabled": await guild_conf.enabled(),
-            "include_bots": await guild_conf.include_bots(),
-            "channel_id": await guild_conf.channel_id(),
-            "message_template": await guild_conf.message_template(),
-            "embed_json": self._deserialize_embed_json(await guild_conf.embed_json()),
+        settings = {
+            "enabled": raw["enabled"],
+            "include_bots": raw["include_bots"],
+            "channel_id": raw["channel_id"],
+            "message_template": raw["message_template"],
+            "embed_json": self._deserialize_embed_json(raw["embed_json"]),
             "image": image_data,
-            "image_mode": await guild_conf.image_mode(),
-            "avatar_overlay": avatar_overlay,
+            "image_mode": raw["image_mode"],
+            "avatar_overlay": self._normalize_avatar_overlay(raw.get("avatar_overlay")),
+            "burst_mode": self._normalize_burst_mode(raw.get("burst_mode")),
         }
+        # A setter that ran during the read leaves the cache empty rather than stale.
+        if self._settings_versions.get(guild.id, 0) == version:
+            self._settings_cache[guild.id] = settings
+        return dict(settings)
 
     async def _build_image_file(
         self,
@@ -701,22 +718,16 @@ class Welcome(DashboardIntegration, commands.Cog):
         member: discord.Member,
         avatar_overlay: dict[str, Any],
     ) -> discord.File | None:
-        encoded = image_data.get("data_base64")
-        filename = image_data.get("filename")
-        if not encoded or not filename:
+        prepared = await self._prepared_background(member.guild.id, image_data, avatar_overlay)
+        if prepared is None:
             return None
 
-        data = base64.b64decode(encoded)
-        if avatar_overlay.get("enabled"):
+        data, filename = prepared.data, prepared.filename
+        if prepared.base is not None:
             try:
                 avatar_data = await self._download_member_avatar(member)
-                data, filename = self._compose_avatar_overlay(
-                    data,
-                    avatar_data,
-                    filename,
-                    avatar_overlay,
-                )
-            except RECOVERABLE_EXCEPTIONS:
+                data, filename = await asyncio.to_thread(compose_avatar, prepared, avatar_data)
+            except (WelcomeImageError, *RECOVERABLE_EXCEPTIONS):
                 log.exception(
                     "Failed to render welcome avatar overlay in guild %s for member %s",
                     member.guild.id,
@@ -787,6 +798,98 @@ class Welcome(DashboardIntegration, commands.Cog):
 
         await channel.send(**kwargs)
 
+    def _join_wave_active(self, guild_id: int, burst_mode: dict[str, Any]) -> bool:
+        """Record a join and report whether the guild is above its burst join rate."""
+        threshold = burst_mode["threshold"]
+        if threshold <= 0:
+            return False
+
+        now = time.monotonic()
+        joins = self._recent_joins.get(guild_id)
+        if joins is None or joins.maxlen != threshold + 1:
+            joins = self._recent_joins[guild_id] = deque(joins or (), maxlen=threshold + 1)
+        joins.append(now)
+        if guild_id in self._join_waves:
+            return True
+        return len(joins) > threshold and now - joins[0] <= burst_mode["window"]
+
+    def _queue_join_wave(self, member: discord.Member, burst_mode: dict[str, Any]) -> None:
+        guild_id = member.guild.id
+        self._join_waves.setdefault(guild_id, []).append(member)
+        if guild_id not in self._join_wave_tasks:
+            self._join_wave_tasks[guild_id] = asyncio.create_task(
+                self._flush_join_wave(member.guild, burst_mode["window"]),
+            )
+
+    async def _flush_join_wave(self, guild: discord.Guild, delay: float) -> None:
+        """Greet every member queued during one burst window with a single message."""
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._join_wave_tasks.pop(guild.id, None)
+            members = self._join_waves.pop(guild.id, [])
+
+        # Raid members removed before the flush are not greeted.
+        members = [member for member in members if guild.get_member(member.id) is not None]
+        settings = await self._get_guild_settings(guild)
+        channel_id = settings.get("channel_id")
+        channel = guild.get_channel(channel_id) if channel_id else None
+        if not members or not settings.get("enabled") or not isinstance(channel, discord.TextChannel):
+            return
+
+        try:
+            await self._send_join_wave_message(channel, members, settings)
+        except RECOVERABLE_EXCEPTIONS:
+            log.exception(
+                "Failed to send a welcome join wave in guild %s for %s members",
+                guild.id,
+                len(members),
+            )
+
+    async def _build_collage_file(self, members: list[discord.Member]) -> discord.File | None:
+        results = await asyncio.gather(
+            *(self._download_member_avatar(member, COLLAGE_TILE) for member in members),
+            return_exceptions=True,
+        )
+        avatars = [result for result in results if isinstance(result, bytes)]
+        if not avatars:
+            return None
+        try:
+            data = await asyncio.to_thread(compose_collage, avatars)
+        except WelcomeImageError:
+            log.warning("Failed to render a welcome join-wave collage in guild %s", members[0].guild.id)
+            return None
+        return discord.File(io.BytesIO(data), filename="welcome-wave.png")
+
+    async def _send_join_wave_message(
+        self,
+        channel: discord.TextChannel,
+        members: list[discord.Member],
+        settings: dict[str, Any],
+    ) -> None:
+        shown = members[:BURST_MENTION_LIMIT]
+        mentions = ", ".join(member.mention for member in shown)
+        if len(members) > len(shown):
+            mentions += f" and {len(members) - len(shown)} more"
+
+        kwargs: dict[str, Any] = {
+            "content": f"Welcome {mentions} to **{channel.guild.name}**!",
+            "allowed_mentions": discord.AllowedMentions(
+                users=True,
+                roles=False,
+                everyone=False,
+            ),
+        }
+        me = channel.guild.me
+        permissions = channel.permissions_for(me) if me else None
+        burst_mode = settings.get("burst_mode") or self._default_burst_mode()
+        if burst_mode.get("collage") and permissions and permissions.attach_files:
+            file = await self._build_collage_file(members[:BURST_COLLAGE_LIMIT])
+            if file:
+                kwargs["file"] = file
+
+        await channel.send(**kwargs)
+
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member) -> None:
         if await self.bot.cog_disabled_in_guild(self, member.guild):
@@ -813,6 +916,11 @@ class Welcome(DashboardIntegration, commands.Cog):
         if not permissions.send_messages:
             return
 
+        burst_mode = settings.get("burst_mode") or self._default_burst_mode()
+        if self._join_wave_active(member.guild.id, burst_mode):
+            self._queue_join_wave(member, burst_mode)
+            return
+
         try:
             await self._send_welcome_message(channel, member, settings)
         except RECOVERABLE_EXCEPTIONS:
@@ -833,6 +941,7 @@ class Welcome(DashboardIntegration, commands.Cog):
     async def welcome_enable(self, ctx: commands.Context, enabled: bool) -> None:
         """Enable or disable the welcome message."""
         await self.config.guild(ctx.guild).enabled.set(enabled)
+        self._invalidate_settings_cache(ctx.guild.id)
         state = "enabled" if enabled else "disabled"
         await ctx.send(f"Welcome messages are now {state}.")
 
@@ -840,6 +949,7 @@ class Welcome(DashboardIntegration, commands.Cog):
     async def welcome_bots(self, ctx: commands.Context, include_bots: bool) -> None:
         """Choose whether bot accounts should trigger the welcome message."""
         await self.config.guild(ctx.guild).include_bots.set(include_bots)
+        self._invalidate_settings_cache(ctx.guild.id)
         state = "included" if include_bots else "ignored"
         await ctx.send(f"Bot accounts will now be {state} by the welcome listener.")
 
@@ -852,10 +962,12 @@ class Welcome(DashboardIntegration, commands.Cog):
         """Set the channel for welcome messages. Leave blank to clear it."""
         if channel is None:
             await self.config.guild(ctx.guild).channel_id.set(None)
+            self._invalidate_settings_cache(ctx.guild.id)
             await ctx.send("The welcome channel has been cleared.")
             return
 
         await self.config.guild(ctx.guild).channel_id.set(channel.id)
+        self._invalidate_settings_cache(ctx.guild.id)
         await ctx.send(f"Welcome messages will be sent in {channel.mention}.")
 
     @welcome.command(name="message")
@@ -867,12 +979,14 @@ class Welcome(DashboardIntegration, commands.Cog):
             raise commands.BadArgument(f"Unknown placeholders: {unknown_text}")
 
         await self.config.guild(ctx.guild).message_template.set(template)
+        self._invalidate_settings_cache(ctx.guild.id)
         await ctx.send("The welcome message template has been updated.")
 
     @welcome.command(name="clearmessage")
     async def welcome_clear_message(self, ctx: commands.Context) -> None:
         """Clear the plain welcome message template."""
         await self.config.guild(ctx.guild).message_template.set("")
+        self._invalidate_settings_cache(ctx.guild.id)
         await ctx.send("The plain welcome message has been cleared.")
 
     @welcome.command(name="embedjson")
@@ -901,12 +1015,14 @@ class Welcome(DashboardIntegration, commands.Cog):
             )
 
         await self.config.guild(ctx.guild).embed_json.set(json.dumps(embed_json))
+        self._invalidate_settings_cache(ctx.guild.id)
         await ctx.send(f"Welcome embed JSON saved from {source}.")
 
     @welcome.command(name="clearembed")
     async def welcome_clear_embed(self, ctx: commands.Context) -> None:
         """Remove the stored custom embed."""
         await self.config.guild(ctx.guild).embed_json.set("")
+        self._invalidate_settings_cache(ctx.guild.id)
         await ctx.send("The stored welcome embed has been cleared.")
 
     @welcome.command(name="image")
@@ -914,6 +1030,7 @@ class Welcome(DashboardIntegration, commands.Cog):
         """Download an image from a URL, save it, and re-upload it on welcome."""
         image_data = await self._download_image(url)
         await self.config.guild(ctx.guild).image.set(image_data)
+        self._invalidate_image_cache(ctx.guild.id)
         await ctx.send(
             "The welcome image has been downloaded and cached. "
             "Use `welcome imagemode attachment` to post it above the embed, or "
@@ -924,6 +1041,7 @@ class Welcome(DashboardIntegration, commands.Cog):
     async def welcome_clear_image(self, ctx: commands.Context) -> None:
         """Remove the cached welcome image."""
         await self.config.guild(ctx.guild).image.set(self._empty_image_data())
+        self._invalidate_image_cache(ctx.guild.id)
         await ctx.send("The cached welcome image has been cleared.")
 
     @welcome.command(name="imagemode")
@@ -934,6 +1052,7 @@ class Welcome(DashboardIntegration, commands.Cog):
             raise commands.BadArgument("Use `embed` or `attachment`.")
 
         await self.config.guild(ctx.guild).image_mode.set(normalized)
+        self._invalidate_settings_cache(ctx.guild.id)
         if normalized == "attachment":
             await ctx.send(
                 "The cached image will now be posted as a separate attachment above the embed.",
@@ -980,6 +1099,7 @@ class Welcome(DashboardIntegration, commands.Cog):
 
         avatar_overlay["enabled"] = enabled
         await self.config.guild(ctx.guild).avatar_overlay.set(avatar_overlay)
+        self._invalidate_image_cache(ctx.guild.id)
 
         state = "enabled" if enabled else "disabled"
         message = (
@@ -995,6 +1115,42 @@ class Welcome(DashboardIntegration, commands.Cog):
 
         await ctx.send(message)
 
+    @welcome.command(name="burst", aliases=["joinwave"])
+    async def welcome_burst(
+        self,
+        ctx: commands.Context,
+        threshold: int,
+        window: int | None = None,
+        collage: bool | None = None,
+    ) -> None:
+        """Batch greetings when more than `threshold` members join within `window` seconds.
+
+        Use a threshold of 0 to greet every member individually.
+        """
+        if not 0 <= threshold <= self.BURST_THRESHOLD_MAX:
+            raise commands.BadArgument(f"Threshold must be between 0 and {self.BURST_THRESHOLD_MAX}.")
+        if window is not None and not 1 <= window <= self.BURST_WINDOW_MAX:
+            raise commands.BadArgument(f"Window must be between 1 and {self.BURST_WINDOW_MAX} seconds.")
+
+        current = await self.config.guild(ctx.guild).burst_mode()
+        burst_mode = self._normalize_burst_mode(current)
+        burst_mode["threshold"] = threshold
+        if window is not None:
+            burst_mode["window"] = window
+        if collage is not None:
+            burst_mode["collage"] = collage
+        await self.config.guild(ctx.guild).burst_mode.set(burst_mode)
+        self._invalidate_settings_cache(ctx.guild.id)
+
+        if not threshold:
+            await ctx.send("Join-wave batching is disabled. Every member will be greeted individually.")
+            return
+        collage_text = " with an avatar collage" if burst_mode["collage"] else ""
+        await ctx.send(
+            f"When more than {threshold} members join within {burst_mode['window']} seconds, "
+            f"further greetings will be combined into one message{collage_text}.",
+        )
+
     @welcome.command(name="placeholders")
     async def welcome_placeholders(self, ctx: commands.Context) -> None:
         """Show the available member and guild placeholders."""
@@ -1091,6 +1247,17 @@ class Welcome(DashboardIntegration, commands.Cog):
             ),
             inline=True,
         )
+        burst_mode = settings.get("burst_mode") or self._default_burst_mode()
+        embed.add_field(
+            name="Join-Wave Batching",
+            value=(
+                f"Above {burst_mode['threshold']} joins per {burst_mode['window']}s"
+                f"{', with collage' if burst_mode['collage'] else ''}"
+                if burst_mode["threshold"]
+                else "Off"
+            ),
+            inline=True,
+        )
         embed.add_field(
             name="Image Source",
             value=(image_data.get("source_url") or "Not set")[:1024],